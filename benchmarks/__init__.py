@@ -0,0 +1,28 @@
+"""
+Benchmarks for the preprocess, assess, and export pipeline
+----------
+The benchmark suite generates synthetic projects at several sizes, and then runs
+the complete preprocess -> assess -> export pipeline for each project. Every
+public function in the command subpackages (for example,
+_watershed.characterize, _network.filter, _network.locate_basins, and
+_save.results) is timed, along with the peak resident set size (RSS) of the
+process after each step. Each project size runs in a fresh process, so that peak
+RSS values are not affected by earlier runs. Reports can be saved as JSON, so
+that results from different pfdf or GDAL versions can be compared.
+
+Run the suite from the root of the repository using:
+
+    python -m benchmarks [--sizes N [N ...]] [--folder PATH] [--output FILE]
+
+The accumulation module separately benchmarks the assessment's flow accumulation
+kernel against pfdf. Run it using:
+
+    python -m benchmarks.accumulation [--size N] [--seed SEED] [--repeats N]
+----------
+Modules:
+    __main__        - Command line interface for the benchmark suite
+    accumulation    - Benchmarks the flow accumulation kernel
+    _suite          - Runs the pipeline for a synthetic project
+    _synthetic      - Generates synthetic input datasets
+    _timing         - Times pipeline steps and measures peak memory use
+"""
@@ -0,0 +1,103 @@
+"""
+Command line interface for the benchmark suite
+----------
+Runs the preprocess -> assess -> export pipeline for synthetic projects of each
+requested size, and prints the runtime and peak memory use of every step. Each
+size runs in a fresh process, so that peak RSS values are independent.
+----------
+Functions:
+    main        - Runs the benchmark suite from the command line
+    _parser     - Returns the argument parser for the benchmark suite
+    _print      - Prints a benchmark report
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks import _suite
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Optional
+
+# Default project sizes (pixels along each side of the DEM)
+SIZES = [1000, 4000, 10000]
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    "Runs the benchmark suite from the command line"
+
+    args = _parser().parse_args(args)
+    with TemporaryDirectory() as temporary:
+        folder = Path(temporary) if args.folder is None else args.folder
+        folder.mkdir(parents=True, exist_ok=True)
+
+        # Run each size in a fresh process so peak memory use is independent
+        reports = []
+        for size in args.sizes:
+            context = get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                report = pool.submit(_suite.run, folder, size, args.seed).result()
+            _print(report)
+            reports.append(report)
+
+    # Optionally save the reports
+    if args.output is not None:
+        args.output.write_text(json.dumps(reports, indent=4))
+        print(f"Saved benchmark reports to {args.output}")
+
+
+def _parser() -> ArgumentParser:
+    "Returns the argument parser for the benchmark suite"
+
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Times the wildcat preprocess, assess, and export pipeline",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SIZES,
+        metavar="N",
+        help="The number of DEM pixels along each side of the synthetic projects",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="The random seed used to generate the synthetic datasets",
+    )
+    parser.add_argument(
+        "--folder",
+        type=Path,
+        help="Folder for the synthetic projects. Defaults to a temporary folder",
+    )
+    parser.add_argument(
+        "--output", type=Path, metavar="FILE", help="Saves the reports to a JSON file"
+    )
+    return parser
+
+
+def _print(report: dict[str, Any]) -> None:
+    "Prints the runtime and peak memory use of each step in a report"
+
+    size = report["size"]
+    print(f"\n----- {size} x {size} pixels -----")
+    print(f"Generated synthetic datasets in {report['generate_seconds']:.2f} s")
+    print(f"{'Step':<60}{'Seconds':>10}{'Peak RSS (MB)':>16}")
+    for step in report["steps"]:
+        name = "  " * step["depth"] + step["step"]
+        rss = step["peak_rss_mb"]
+        rss = "" if rss is None else f"{rss:.1f}"
+        print(f"{name:<60}{step['seconds']:>10.2f}{rss:>16}")
+
+
+if __name__ == "__main__":
+    main()
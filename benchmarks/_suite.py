@@ -0,0 +1,77 @@
+"""
+Functions that run the benchmark pipeline for a synthetic project
+----------
+Functions:
+    run         - Runs the preprocess -> assess -> export pipeline for a project size
+    versions    - Returns the versions of wildcat and its main dependencies
+"""
+
+from __future__ import annotations
+
+import shutil
+import typing
+from importlib.metadata import PackageNotFoundError, version
+from time import perf_counter
+
+import rasterio
+
+import wildcat
+from benchmarks import _synthetic
+from benchmarks._timing import Timer, instrument
+from wildcat._utils._profile import peak_rss
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+# The benchmarked commands, in pipeline order
+COMMANDS = ["preprocess", "assess", "export"]
+
+
+def run(folder: Path, size: int, seed: int) -> dict[str, Any]:
+    """Generates a synthetic project with a grid of "size" x "size" pixels, and
+    then times each step of the pipeline. Returns a report dict"""
+
+    # Generate the synthetic input datasets in an empty project folder
+    project = folder / f"size-{size}"
+    if project.exists():
+        shutil.rmtree(project)
+    start = perf_counter()
+    _synthetic.project(project, size, seed)
+    generate = perf_counter() - start
+
+    # Settings for each command. The buffer keeps the fire within the grid
+    kwargs = {
+        "preprocess": {"buffer_km": _synthetic.buffer_km(size)},
+        "assess": {},
+        "export": {},
+    }
+
+    # Time each command and its steps
+    timer = Timer()
+    for command in COMMANDS:
+        with instrument(timer, command):
+            getattr(wildcat, command)(project, **kwargs[command])
+
+    return {
+        "size": size,
+        "pixels": size**2,
+        "seed": seed,
+        "generate_seconds": generate,
+        "peak_rss_mb": peak_rss(),
+        "versions": versions(),
+        "steps": timer.steps,
+    }
+
+
+def versions() -> dict[str, str]:
+    "Returns the versions of wildcat and the libraries that affect its performance"
+
+    output = {}
+    for package in ["wildcat", "pfdf", "numpy", "rasterio", "fiona", "pysheds"]:
+        try:
+            output[package] = version(package)
+        except PackageNotFoundError:
+            output[package] = None
+    output["gdal"] = rasterio.__gdal_version__
+    return output
@@ -0,0 +1,151 @@
+"""
+Functions that generate synthetic input datasets for benchmarking
+----------
+The synthetic datasets use a 10 meter grid in UTM Zone 11N (EPSG:26911), which
+satisfies the default DEM resolution check. The DEM is a tilted surface with
+sinusoidal ridges and valleys, so that flow routing produces a realistic stream
+network. The fire perimeter is a circle in the center of the grid, and dNBR
+values are highest near the center of the fire. The EVT dataset includes water
+bodies in the lowest valleys and a band of developed land along the southern
+edge of the grid. The datasets are generated reproducibly from a random seed.
+----------
+Main Functions:
+    project     - Generates the input datasets for a synthetic project
+    buffer_km   - Returns a perimeter buffer that keeps the fire within the grid
+
+Datasets:
+    dem         - Generates a synthetic DEM
+    perimeter   - Generates a circular fire perimeter mask
+    dnbr        - Generates dNBR values
+    kf          - Generates KF-factors
+    evt         - Generates EVT classes
+
+Utilities:
+    _coordinates    - Returns normalized grid coordinates
+    _save           - Saves a dataset as a GeoTIFF
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+from pfdf.raster import Raster
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy import ndarray
+    from numpy.random import Generator
+
+# Grid metadata
+CRS = 26911
+RESOLUTION = 10
+LEFT = 500000
+TOP = 4000000
+
+# Relative size of the fire perimeter
+RADIUS = 0.3
+
+# EVT classes
+EVT_VEGETATION = 7011
+EVT_WATER = 7292
+EVT_DEVELOPED = 7297
+
+
+#####
+# Main Functions
+#####
+
+
+def project(folder: Path, size: int, seed: int = 0) -> Path:
+    """Generates the input datasets for a synthetic project with a square grid of
+    "size" pixels along each side. Returns the path to the project folder"""
+
+    inputs = folder / "inputs"
+    inputs.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    elevation = dem(size, rng)
+    _save(inputs / "dem.tif", elevation)
+    _save(inputs / "perimeter.tif", perimeter(size))
+    _save(inputs / "dnbr.tif", dnbr(size, rng))
+    _save(inputs / "kf.tif", kf(size, rng))
+    _save(inputs / "evt.tif", evt(elevation))
+    return folder
+
+
+def buffer_km(size: int) -> float:
+    "Returns a perimeter buffer (in kilometers) that keeps the fire within the grid"
+
+    width_km = size * RESOLUTION / 1000
+    return round(width_km * (0.5 - RADIUS) * 0.75, 3)
+
+
+#####
+# Datasets
+#####
+
+
+def dem(size: int, rng: Generator) -> ndarray:
+    "Generates a DEM (in meters) that drains from north to south"
+
+    x, y = _coordinates(size)
+    elevation = 2000 - 800 * y
+    elevation = elevation + 120 * np.sin(2 * np.pi * 5 * x) * np.cos(np.pi * y)
+    elevation = elevation + 40 * np.sin(2 * np.pi * 17 * x + 3 * y)
+    return elevation + rng.standard_normal((size, size), dtype="float32")
+
+
+def perimeter(size: int) -> ndarray:
+    "Generates a circular fire perimeter in the center of the grid"
+
+    x, y = _coordinates(size)
+    return (x - 0.5) ** 2 + (y - 0.5) ** 2 <= RADIUS**2
+
+
+def dnbr(size: int, rng: Generator) -> ndarray:
+    "Generates dNBR values that are highest near the center of the fire"
+
+    x, y = _coordinates(size)
+    distance = np.sqrt((x - 0.5) ** 2 + (y - 0.5) ** 2) / RADIUS
+    values = 50 + 700 * np.exp(-2 * distance**2)
+    return values + 50 * rng.standard_normal((size, size), dtype="float32")
+
+
+def kf(size: int, rng: Generator) -> ndarray:
+    "Generates KF-factors between 0.05 and 0.55"
+
+    x, y = _coordinates(size)
+    values = 0.3 + 0.15 * np.sin(2 * np.pi * 3 * x) * np.sin(2 * np.pi * 2 * y)
+    return values + 0.2 * rng.random((size, size), dtype="float32") - 0.1
+
+
+def evt(elevation: ndarray) -> ndarray:
+    "Generates EVT classes with water in low valleys and development in the south"
+
+    codes = np.full(elevation.shape, EVT_VEGETATION, dtype="int16")
+    south = elevation.shape[0] - max(elevation.shape[0] // 20, 1)
+    codes[south:, :] = EVT_DEVELOPED
+    codes[elevation <= np.percentile(elevation, 0.5)] = EVT_WATER
+    return codes
+
+
+#####
+# Utilities
+#####
+
+
+def _coordinates(size: int) -> tuple[ndarray, ndarray]:
+    "Returns normalized x and y coordinates that broadcast across the grid"
+
+    coordinates = np.linspace(0, 1, size, dtype="float32")
+    return coordinates.reshape(1, -1), coordinates.reshape(-1, 1)
+
+
+def _save(path: Path, values: ndarray) -> None:
+    "Saves a synthetic dataset as a GeoTIFF on the benchmark grid"
+
+    transform = (RESOLUTION, -RESOLUTION, LEFT, TOP)
+    raster = Raster.from_array(values, crs=CRS, transform=transform)
+    raster.save(path, overwrite=True)
@@ -0,0 +1,93 @@
+"""
+Functions that time pipeline steps and measure peak memory use
+----------
+Steps are timed by temporarily replacing the public functions of a command
+subpackage with timed wrappers. Functions that are imported into other modules of
+the subpackage are replaced in those modules as well, so every call is timed.
+Steps that run within other steps are recorded with a greater depth, so reports
+preserve the nesting of the pipeline.
+----------
+Classes:
+    Timer       - Records the runtime and peak memory use of pipeline steps
+
+Functions:
+    instrument  - Context manager that times the steps of a wildcat command
+"""
+
+from __future__ import annotations
+
+import typing
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+from inspect import isfunction
+from pkgutil import iter_modules
+from time import perf_counter
+
+from wildcat._utils._profile import peak_rss
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
+
+
+class Timer:
+    "Records the runtime and peak memory use of pipeline steps"
+
+    def __init__(self) -> None:
+        self.steps: list[dict[str, Any]] = []
+        self._depth = 0
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        "Returns a wrapper that records the runtime of a function as a step"
+
+        @wraps(function)
+        def timed(*args, **kwargs):
+            step = {"step": name, "depth": self._depth}
+            self.steps.append(step)
+            self._depth += 1
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                step["seconds"] = perf_counter() - start
+                step["peak_rss_mb"] = peak_rss()
+                self._depth -= 1
+
+        return timed
+
+
+@contextmanager
+def instrument(timer: Timer, command: str) -> Iterator[None]:
+    "Times the public functions of a command subpackage within the context"
+
+    # Load the modules of the command subpackage
+    package = import_module(f"wildcat._commands.{command}")
+    modules = [package] + [
+        import_module(f"{package.__name__}.{info.name}")
+        for info in iter_modules(package.__path__)
+    ]
+
+    # Build a timed wrapper for each public function defined in the subpackage
+    wrappers = {}
+    for module in modules:
+        name = module.__name__.rsplit(".", 1)[-1]
+        for field, value in vars(module).items():
+            if (
+                isfunction(value)
+                and value.__module__ == module.__name__
+                and not field.startswith("_")
+            ):
+                wrappers[value] = timer.wrap(f"{command}.{name}.{field}", value)
+
+    # Replace each function wherever it is referenced, and restore when finished
+    replaced = []
+    for module in modules:
+        for field, value in list(vars(module).items()):
+            if isfunction(value) and value in wrappers:
+                replaced.append((module, field, value))
+                setattr(module, field, wrappers[value])
+    try:
+        yield
+    finally:
+        for module, field, value in replaced:
+            setattr(module, field, value)
@@ -0,0 +1,139 @@
+"""
+Benchmarks the flow accumulation kernel used by the assessment
+----------
+The assessment accumulates catchment area, burned area, and (optionally) the
+number of upstream retainment features down the D8 flow network. This benchmark
+times wildcat's multi-weight accumulation kernel against the per-weight pfdf
+(pysheds) accumulations that it replaces, using a synthetic flow network in which
+every pixel drains to a random pixel in the row below. Both methods are compiled
+before timing, so the times do not include JIT compilation.
+
+Run the benchmark from the root of the repository using:
+
+    python -m benchmarks.accumulation [--size N] [--seed SEED] [--repeats N]
+----------
+Functions:
+    main        - Runs the accumulation benchmark from the command line
+    run         - Times both accumulation methods and returns a report
+    network     - Builds a synthetic D8 flow network and accumulation weights
+    _pfdf       - Accumulates each weight using a separate pfdf accumulation
+    _wildcat    - Accumulates every weight using wildcat's kernel
+    _time       - Returns the fastest runtime of a function
+"""
+
+from __future__ import annotations
+
+import typing
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+from pfdf import watershed
+from pfdf.raster import Raster
+
+from wildcat._commands.assess import _watershed
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable, Optional
+
+    from numpy import ndarray
+
+# Default grid size (pixels along each side) and number of timed repeats
+SIZE = 4000
+REPEATS = 3
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    "Runs the accumulation benchmark from the command line"
+
+    parser = ArgumentParser(
+        prog="python -m benchmarks.accumulation",
+        description="Times wildcat's flow accumulation kernel against pfdf",
+    )
+    parser.add_argument("--size", type=int, default=SIZE, metavar="N")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=REPEATS, metavar="N")
+    args = parser.parse_args(args)
+
+    report = run(args.size, args.seed, args.repeats)
+    print(f"\n----- {args.size} x {args.size} pixels, 3 weights -----")
+    print(f"pfdf (one accumulation per weight):  {report['pfdf_seconds']:.2f} s")
+    print(f"wildcat (one traversal):             {report['wildcat_seconds']:.2f} s")
+    print(f"Speedup: {report['speedup']:.1f}x")
+    print(f"Results match: {report['match']}")
+
+
+def run(size: int, seed: int, repeats: int) -> dict[str, Any]:
+    """Times the pfdf and wildcat accumulations of a synthetic network with
+    "size" x "size" pixels. Returns a report dict"""
+
+    # Compile both methods on a small network before timing
+    flow, weights = network(16, seed)
+    _pfdf(flow, weights)
+    _wildcat(flow, weights)
+
+    # Time each method and check the results agree
+    flow, weights = network(size, seed)
+    pfdf, expected = _time(_pfdf, flow, weights, repeats)
+    wildcat, output = _time(_wildcat, flow, weights, repeats)
+    match = all(
+        np.allclose(values, target, equal_nan=True)
+        for values, target in zip(output, expected)
+    )
+    return {
+        "size": size,
+        "pixels": size**2,
+        "seed": seed,
+        "pfdf_seconds": pfdf,
+        "wildcat_seconds": wildcat,
+        "speedup": pfdf / wildcat,
+        "match": match,
+    }
+
+
+def network(size: int, seed: int) -> tuple[Raster, list[ndarray]]:
+    """Builds a D8 flow network in which every pixel drains southwest, south, or
+    southeast. Returns the flow raster, along with the area, burned, and
+    retainment weights used by the assessment"""
+
+    rng = np.random.default_rng(seed)
+    flow = rng.integers(6, 9, size=(size, size), dtype="int8")
+    flow = Raster.from_array(flow, nodata=0, crs=26911, transform=(10, -10, 0, 0))
+    weights = [
+        np.ones(flow.shape, bool),
+        rng.random(flow.shape) < 0.5,
+        rng.random(flow.shape) < 0.01,
+    ]
+    return flow, weights
+
+
+def _pfdf(flow: Raster, weights: list[ndarray]) -> list[ndarray]:
+    "Accumulates each weight using a separate pfdf accumulation"
+
+    return [
+        watershed.accumulation(flow, mask=mask, check_flow=False).values
+        for mask in weights
+    ]
+
+
+def _wildcat(flow: Raster, weights: list[ndarray]) -> list[ndarray]:
+    "Accumulates every weight in one traversal using wildcat's kernel"
+
+    return _watershed.accumulate(flow.values, weights)
+
+
+def _time(
+    function: Callable, flow: Raster, weights: list[ndarray], repeats: int
+) -> tuple[float, list[ndarray]]:
+    "Returns the fastest runtime of a function, along with its output"
+
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        output = function(flow, weights)
+        times.append(perf_counter() - start)
+    return min(times), output
+
+
+if __name__ == "__main__":
+    main()
@@ -67,6 +67,16 @@ class TestPreprocess:
             "water": None,
             "developed": None,
             "excluded_evt": None,
+            "tiled": None,
+            "tile_size": None,
+            "max_workers": None,
+            "cache_datasets": None,
+            "raster_compression": None,
+            "raster_predictor": None,
+            "raster_layout": None,
+            "raster_bigtiff": None,
+            "raster_stack": None,
+            "raster_precision": None,
         }
         self.run([], expected)
 
@@ -108,6 +118,46 @@ class TestPreprocess:
             {"water": [], "developed": [], "excluded_evt": []},
         )
 
+    def test_tiled(self):
+        self.run(
+            ["--tiled", "--tile-size", "512", "--max-workers", "4"],
+            {"tiled": True, "tile_size": 512, "max_workers": 4},
+        )
+
+    def test_cache_datasets(self):
+        self.run(
+            ["--cache-datasets"],
+            {"cache_datasets": True},
+        )
+
+    def test_raster_options(self):
+        self.run(
+            [
+                "--raster-compression",
+                "zstd",
+                "--raster-predictor",
+                "--raster-layout",
+                "cog",
+                "--raster-bigtiff",
+                "if_safer",
+            ],
+            {
+                "raster_compression": "zstd",
+                "raster_predictor": True,
+                "raster_layout": "cog",
+                "raster_bigtiff": "if_safer",
+            },
+        )
+
+    def test_raster_stack(self):
+        self.run(
+            ["--raster-stack"],
+            {"raster_stack": True},
+        )
+
+    def test_raster_precision(self):
+        self.run(["--raster-precision", "compact"], {"raster_precision": "compact"})
+
 
 class TestAssess:
     def run(_, args, expected):
@@ -121,7 +171,13 @@ class TestAssess:
             "flow_continuous": True,
             "locate_basins": True,
             "parallelize_basins": False,
+            "basin_workers": None,
             "max_exterior_ratio": None,
+            "cache_watershed": None,
+            "models_only": None,
+            "assessment_format": None,
+            "memory_map": None,
+            "watershed_precision": None,
         }
         self.run([], expected)
 
@@ -138,6 +194,28 @@ class TestAssess:
     def test_parallel(self):
         self.run(["--parallel"], {"locate_basins": True, "parallelize_basins": True})
 
+    def test_basin_workers(self):
+        self.run(
+            ["--parallel", "--basin-workers", "4"],
+            {"parallelize_basins": True, "basin_workers": 4},
+        )
+
+    def test_cache_watershed(self):
+        self.run(["--cache-watershed"], {"cache_watershed": True})
+
+    def test_models_only(self):
+        self.run(["--models-only"], {"models_only": True})
+
+    def test_assessment_format(self):
+        self.run(["--assessment-format", "gpkg"], {"assessment_format": "gpkg"})
+
+    def test_memory_map(self):
+        self.run(["--memory-map"], {"memory_map": True})
+
+    def test_watershed_precision(self):
+        options = ["--watershed-precision", "compact"]
+        self.run(options, {"watershed_precision": "compact"})
+
     def test_filter_in_perimeter(self):
         self.run(
             ["--filter-in-perimeter", "--max-exterior-ratio", "0.95"],
@@ -243,3 +321,44 @@ class TestExport:
             "volume_CI": ["90%", "95%"],
         }
         self.run(args, {"rename": rename})
+
+
+class TestWarmup:
+    def run(_, args, expected):
+        run("warmup", args, expected)
+
+    def test_default(self):
+        self.run([], {"folder": None})
+
+    def test_folder(self):
+        self.run(["cache"], {"folder": Path("cache")})
+
+
+class TestServe:
+    def run(_, args, expected):
+        run("serve", args, expected)
+
+    def test_default(self):
+        self.run([], {"host": "127.0.0.1", "port": 8910})
+
+    def test_options(self):
+        self.run(
+            ["--host", "0.0.0.0", "--port", "8000"], {"host": "0.0.0.0", "port": 8000}
+        )
+
+
+class TestBatch:
+    def run(_, args, expected):
+        run("batch", args, expected)
+
+    def test_default(self):
+        self.run(
+            ["manifest.toml"],
+            {"manifest": Path("manifest.toml"), "workers": 1, "max_memory_gb": None},
+        )
+
+    def test_options(self):
+        self.run(
+            ["manifest.toml", "-w", "4", "--max-memory-gb", "2.5"],
+            {"manifest": Path("manifest.toml"), "workers": 4, "max_memory_gb": 2.5},
+        )
@@ -1,3 +1,5 @@
+import json
+import pstats
 import traceback as tb
 
 import pytest
@@ -76,3 +78,33 @@ class TestMain:
         ]
         for message in expected:
             assert message in output
+
+    def test_profile(_, project, CleanCLI, capsys):
+        path = project.parent / "profile.out"
+        with CleanCLI:
+            main(["initialize", str(project), "--profile", str(path)])
+        assert path.exists()
+        pstats.Stats(str(path))
+
+        output = capsys.readouterr().err
+        assert output.startswith("Initializing project\n")
+        assert f"Saved pstats profile to {path}\n" in output
+        assert "Self time by module:\n" in output
+        assert "wildcat._commands.initialize._initialize" in output
+
+    def test_profile_format(_, project, CleanCLI):
+        path = project.parent / "profile.json"
+        args = ["initialize", str(project), "--profile", str(path)]
+        args += ["--profile-format", "speedscope"]
+        with CleanCLI:
+            main(args)
+        with open(path) as file:
+            profile = json.load(file)
+        assert profile["profiles"][0]["type"] == "sampled"
+
+    def test_profile_error(_, CleanCLI, bad_project):
+        path = bad_project.parent / "profile.out"
+        with CleanCLI:
+            with pytest.raises(FileExistsError):
+                main(["initialize", str(bad_project), "--profile", str(path)])
+        assert path.exists()
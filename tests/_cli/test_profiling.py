@@ -0,0 +1,253 @@
+import cProfile
+import json
+import logging
+import pstats
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from wildcat._cli import _profiling
+
+
+def _sleep():
+    time.sleep(0.02)
+
+
+def _outer():
+    _sleep()
+    _inner()
+
+
+def _inner():
+    _sleep()
+
+
+def _recursive(n):
+    if n > 0:
+        _recursive(n - 1)
+    else:
+        _sleep()
+
+
+def _ping(n):
+    _sleep()
+    if n > 0:
+        _pong(n - 1)
+
+
+def _pong(n):
+    _sleep()
+    if n > 0:
+        _ping(n - 1)
+
+
+def _chain(length):
+    "Stats for a chain of functions, in which each function calls the next"
+    functions = [("chain.py", k, f"f{k}") for k in range(length)]
+    stats = {}
+    for k, function in enumerate(functions):
+        cumtime = length - k
+        callers = {} if k == 0 else {functions[k - 1]: (1, 1, 1, cumtime)}
+        stats[function] = (1, 1, 1, cumtime, callers)
+    return SimpleNamespace(stats=stats)
+
+
+def _fail():
+    raise ValueError("failed")
+
+
+def _stats(function, *args):
+    profiler = cProfile.Profile()
+    profiler.runcall(function, *args)
+    return pstats.Stats(profiler)
+
+
+def _names(stack):
+    return [name for _, _, name in stack]
+
+
+def _sleep_stacks(stats):
+    output = {}
+    for stack, seconds in _profiling.stacks(stats).items():
+        names = _names(stack)
+        if names[-1] == "_sleep":
+            output[tuple(names)] = seconds
+    return output
+
+
+@pytest.fixture
+def log(logcheck):
+    logcheck.start("test.log")
+    return logging.getLogger("test.log")
+
+
+class TestRun:
+    def test_pstats(_, tmp_path, log, logcheck):
+        path = tmp_path / "profile.out"
+        _profiling.run(_outer, {}, path, "pstats", log)
+        stats = pstats.Stats(str(path))
+        assert any(name == "_outer" for _, _, name in stats.stats)
+
+        records = logcheck.caplog.record_tuples
+        assert records[0] == ("test.log", 20, f"Saved pstats profile to {path}")
+        assert records[1] == ("test.log", 20, "Self time by module:")
+        assert len(records) > 2
+
+    def test_collapsed(_, tmp_path, log):
+        path = tmp_path / "profile.txt"
+        _profiling.run(_outer, {}, path, "collapsed", log)
+        lines = path.read_text().splitlines()
+        stacks = [line.rsplit(" ", 1)[0] for line in lines]
+        assert any(
+            stack.startswith("_outer (test_profiling.py:")
+            and ";_inner (test_profiling.py:" in stack
+            for stack in stacks
+        )
+        for line in lines:
+            assert int(line.rsplit(" ", 1)[1]) > 0
+
+    def test_speedscope(_, tmp_path, log):
+        path = tmp_path / "profile.json"
+        _profiling.run(_outer, {}, path, "speedscope", log)
+        with open(path) as file:
+            output = json.load(file)
+
+        assert output["$schema"] == (
+            "https://www.speedscope.app/file-format-schema.json"
+        )
+        profile = output["profiles"][0]
+        assert profile["type"] == "sampled"
+        assert profile["unit"] == "seconds"
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert profile["endValue"] == pytest.approx(sum(profile["weights"]))
+        assert profile["endValue"] >= 0.04
+
+        frames = output["shared"]["frames"]
+        names = [frame["name"] for frame in frames]
+        assert any(name.startswith("_outer (test_profiling.py:") for name in names)
+        for sample in profile["samples"]:
+            assert all(0 <= index < len(frames) for index in sample)
+
+    def test_kwargs(_, tmp_path, log):
+        path = tmp_path / "profile.out"
+        _profiling.run(_recursive, {"n": 2}, path, "pstats", log)
+        assert path.exists()
+
+    def test_error(_, tmp_path, log, logcheck):
+        path = tmp_path / "profile.out"
+        with pytest.raises(ValueError, match="failed"):
+            _profiling.run(_fail, {}, path, "pstats", log)
+        assert path.exists()
+        assert logcheck.caplog.record_tuples[0] == (
+            "test.log",
+            20,
+            f"Saved pstats profile to {path}",
+        )
+
+
+class TestStacks:
+    def test(_):
+        stats = _stats(_outer)
+        output = _sleep_stacks(stats)
+        assert len(output) == 2
+        direct = output[("_outer", "_sleep")]
+        nested = output[("_outer", "_inner", "_sleep")]
+        assert direct == pytest.approx(nested, rel=0.5)
+
+    def test_total(_):
+        stats = _stats(_outer)
+        output = _profiling.stacks(stats)
+        total = sum(tottime for _, _, tottime, _, _ in stats.stats.values())
+        assert sum(output.values()) == pytest.approx(total, rel=1e-3, abs=1e-4)
+
+    def test_recursive(_):
+        stats = _stats(_recursive, 3)
+        output = _sleep_stacks(stats)
+        assert list(output.keys()) == [("_recursive", "_sleep")]
+
+    def test_mutual_recursion(_):
+        stats = _stats(_ping, 6)
+        output = _profiling.stacks(stats)
+        total = sum(tottime for _, _, tottime, _, _ in stats.stats.values())
+        assert sum(output.values()) <= total * (1 + 1e-3) + 1e-4
+        for stack in output:
+            assert len(set(stack)) == len(stack)
+
+        sleeps = _sleep_stacks(stats)
+        assert set(sleeps) == {("_ping", "_sleep"), ("_ping", "_pong", "_sleep")}
+        assert all(seconds <= total for seconds in sleeps.values())
+
+    def test_deep(_, monkeypatch):
+        monkeypatch.setattr(_profiling, "MAX_DEPTH", 10000)
+        output = _profiling.stacks(_chain(5000))
+        assert len(output) == 5000
+        assert max(len(stack) for stack in output) == 5000
+        assert sum(output.values()) == 5000
+
+    def test_max_depth(_):
+        output = _profiling.stacks(_chain(500))
+        assert max(len(stack) for stack in output) == _profiling.MAX_DEPTH
+        assert sum(output.values()) == _profiling.MAX_DEPTH
+
+    def test_max_stacks(_, monkeypatch):
+        monkeypatch.setattr(_profiling, "MAX_STACKS", 10)
+        output = _profiling.stacks(_chain(500))
+        assert len(output) == 10
+        assert sum(output.values()) == 10
+
+
+class TestModules:
+    def test(_):
+        stats = _stats(_outer)
+        output = _profiling.modules(stats)
+        assert "<built-in>" in output
+        times = list(output.values())
+        assert times == sorted(times, reverse=True)
+
+
+class TestModule:
+    @pytest.mark.parametrize(
+        "file, expected",
+        (
+            ("/root/wildcat/wildcat/_cli/_main.py", "wildcat._cli._main"),
+            ("/root/wildcat/wildcat/__init__.py", "wildcat"),
+            (
+                "/env/lib/python3.11/site-packages/pfdf/segments/_segments.py",
+                "pfdf.segments._segments",
+            ),
+            (
+                "/wildcat/env/lib/python3.11/site-packages/pysheds/sgrid.py",
+                "pysheds.sgrid",
+            ),
+            (
+                "/wildcat/env/lib/python3.11/site-packages/rasterio/io.py",
+                "rasterio",
+            ),
+            ("/usr/lib/python3/dist-packages/numpy/core/numeric.py", "numpy"),
+            ("/usr/lib/python3.11/json/encoder.py", "<python>"),
+        ),
+    )
+    def test_file(_, file, expected):
+        assert _profiling.module((file, 1, "function")) == expected
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        (
+            ("<method 'read' of 'rasterio._io.DatasetReaderBase' objects>", "rasterio"),
+            ("<built-in method numpy.core._multiarray_umath.dot>", "numpy"),
+            ("<built-in method builtins.exec>", "<built-in>"),
+        ),
+    )
+    def test_builtin(_, name, expected):
+        assert _profiling.module(("~", 0, name)) == expected
+
+
+class TestLabel:
+    def test_file(_):
+        function = ("/root/wildcat/wildcat/_cli/_main.py", 12, "main")
+        assert _profiling._label(function) == "main (_main.py:12)"
+
+    def test_builtin(_):
+        function = ("~", 0, "<built-in method builtins.exec>")
+        assert _profiling._label(function) == "<built-in method builtins.exec>"
@@ -455,6 +455,13 @@ def config():
         # Basins
         "locate_basins": True,
         "parallelize_basins": False,
+        "basin_workers": None,
+        # Performance
+        "cache_watershed": False,
+        "models_only": False,
+        "assessment_format": "geojson",
+        "memory_map": False,
+        "watershed_precision": "double",
         # Modeling
         "I15_mm_hr": [16, 20, 24],
         "volume_CI": [0.9, 0.95],
@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 
@@ -10,7 +11,8 @@ import wildcat
 from wildcat import version
 from wildcat._cli import main
 from wildcat._commands.assess import _assess
-from wildcat._utils import _args
+from wildcat._commands.preprocess import _geotiff
+from wildcat._utils import _args, _precision
 
 
 @pytest.fixture
@@ -78,6 +80,34 @@ def paths(preprocessed, trues, dem, dnbr, severity, kf, excluded):
     return paths
 
 
+def check_profile(assessment):
+    with open(assessment / "profile.json") as file:
+        profile = json.load(file)
+    assert profile["command"] == "assess"
+    assert profile["wildcat"] == version()
+    assert [step["step"] for step in profile["steps"]] == [
+        "_load.datasets",
+        "_watershed.severity_masks",
+        "_watershed.analyze",
+        "_network.delineate",
+        "_network.filter",
+        "_network.remove_ids",
+        "_network.locate_basins",
+        "_model.i15_hazard",
+        "_model.thresholds",
+        "_save.results",
+        "_save.config",
+    ]
+    steps = {step["step"]: step for step in profile["steps"]}
+    assert steps["_load.datasets"]["raster_shape"] is None
+    assert steps["_watershed.analyze"]["raster_shape"] == [12, 12]
+    assert steps["_watershed.analyze"]["segments"] is None
+    assert isinstance(steps["_network.delineate"]["segments"], int)
+    for step in profile["steps"]:
+        assert step["wall_seconds"] >= 0
+        assert step["tracemalloc_peak_mb"] is None
+
+
 def prop_keys(record) -> list[str]:
     return list(sorted(record["properties"].keys()))
 
@@ -111,18 +141,20 @@ class TestAssess:
             # The configuration file from config tests the use of config values,
             # while min_area_km2 tests the use of kwargs. Everything else tests defaults
             logcheck.start("wildcat.assess")
-            _assess.assess(locals)
+            output = _assess.assess(locals)
 
         finally:
             watershed.flow = original
 
         # Check the files exists
         assessment = project / "assessment"
+        assert output == assessment
         assert assessment.exists()
         contents = os.listdir(assessment)
         assert sorted(contents) == sorted(
             [
                 "configuration.txt",
+                "profile.json",
                 "segments.geojson",
                 "basins.geojson",
                 "outlets.geojson",
@@ -135,6 +167,7 @@ class TestAssess:
         check_outlets(assessment)
         check_config(assessment, paths)
         check_log(logcheck, paths)
+        check_profile(assessment)
 
     def test_cli(_, project, flow, paths, config, CleanCLI, logcheck):
         assert config.exists()
@@ -166,6 +199,7 @@ class TestAssess:
         assert sorted(contents) == sorted(
             [
                 "configuration.txt",
+                "profile.json",
                 "segments.geojson",
                 "basins.geojson",
                 "outlets.geojson",
@@ -178,6 +212,192 @@ class TestAssess:
         check_outlets(assessment)
         check_config(assessment, paths)
         check_log(logcheck, paths)
+        check_profile(assessment)
+
+    def test_cache(_, project, flow, paths, locals, config, logcheck):
+        locals["cache_watershed"] = True
+        try:
+
+            def flow_patch(*args, **kwargs):
+                return flow
+
+            original = watershed.flow
+            watershed.flow = flow_patch
+            _assess.assess(locals)
+
+            # The rerun should reuse the cached watershed rasters
+            logcheck.start("wildcat.assess")
+            _assess.assess(locals)
+
+        finally:
+            watershed.flow = original
+
+        assessment = project / "assessment"
+        cache = assessment / ".cache"
+        assert len(os.listdir(cache)) == 5
+        check_segments(assessment)
+        check_basins(assessment)
+        check_outlets(assessment)
+
+        messages = [record[2] for record in logcheck.caplog.record_tuples]
+        assert "Loading cached watershed rasters" in messages
+        assert "Characterizing watershed" not in messages
+        assert "Computing flow accumulations" not in messages
+        assert "Caching watershed rasters" not in messages
+
+    def test_compact(_, project, flow, paths, locals, config, logcheck):
+        "Compares compact precision results to the default float64 results"
+
+        try:
+
+            def flow_patch(*args, **kwargs):
+                return flow
+
+            original = watershed.flow
+            watershed.flow = flow_patch
+            _assess.assess(locals)
+
+            locals["assessment"] = project / "compact"
+            locals["watershed_precision"] = "compact"
+            _assess.assess(locals)
+
+        finally:
+            watershed.flow = original
+
+        for name in ["segments", "basins", "outlets"]:
+            double = read(project / "assessment", name)
+            compact = read(project / "compact", name)
+            assert len(compact) == len(double)
+            for output, expected in zip(compact, double):
+                assert output["geometry"] == expected["geometry"]
+                assert prop_keys(output) == prop_keys(expected)
+                for field, value in expected["properties"].items():
+                    assert np.allclose(
+                        output["properties"][field], value, rtol=1e-5, equal_nan=True
+                    )
+
+        with open(project / "compact" / "configuration.txt") as file:
+            assert 'watershed_precision = "compact"\n' in file.read()
+
+    def test_raster_precision(
+        _,
+        project,
+        flow,
+        paths,
+        locals,
+        config,
+        trues,
+        dem,
+        dnbr,
+        severity,
+        kf,
+        excluded,
+    ):
+        """Compares results from rasters saved with raster_precision="compact" to
+        the default float64 results. Hazard classes match exactly, and likelihoods,
+        volumes, and rainfall thresholds agree to a relative tolerance of 1e-5"""
+
+        # Save the preprocessed rasters as the compact preprocessor would
+        folder = project / "compact-preprocessed"
+        folder.mkdir()
+        rasters = {
+            "perimeter": trues,
+            "dem": dem,
+            "dnbr": dnbr,
+            "severity": severity,
+            "kf": kf,
+            "excluded": excluded,
+        }
+        assert _precision.compact(rasters) == ["dem", "dnbr", "severity", "kf"]
+        gconfig = {
+            "raster_compression": "none",
+            "raster_predictor": False,
+            "raster_layout": "striped",
+            "raster_bigtiff": "if_needed",
+            "raster_precision": "compact",
+        }
+        for name, raster in rasters.items():
+            _geotiff.write(folder / f"{name}.tif", raster, gconfig)
+
+        # Assess the default and compact rasters
+        try:
+
+            def flow_patch(*args, **kwargs):
+                return flow
+
+            original = watershed.flow
+            watershed.flow = flow_patch
+            _assess.assess(dict(locals))
+
+            locals["preprocessed"] = folder
+            locals["assessment"] = project / "compact"
+            _assess.assess(locals)
+
+        finally:
+            watershed.flow = original
+
+        # Hazard classes are exact. Other results are within the tolerance
+        for name in ["segments", "basins", "outlets"]:
+            double = read(project / "assessment", name)
+            compact = read(project / "compact", name)
+            assert len(compact) == len(double)
+            for output, expected in zip(compact, double):
+                assert output["geometry"] == expected["geometry"]
+                assert prop_keys(output) == prop_keys(expected)
+                for field, value in expected["properties"].items():
+                    if field.startswith("H_"):
+                        assert output["properties"][field] == value
+                    else:
+                        assert np.allclose(
+                            output["properties"][field],
+                            value,
+                            rtol=1e-5,
+                            equal_nan=True,
+                        )
+
+        # Check the comparison covered hazard, volumes, and thresholds
+        fields = read(project / "compact", "segments")[0]["properties"]
+        for field in ["H_0", "P_0", "V_0", "Vmin_0_0", "Vmax_0_0", "I_0_0", "R_0_0"]:
+            assert field in fields
+
+    def test_models_only(_, project, flow, paths, locals, config, logcheck):
+        try:
+
+            def flow_patch(*args, **kwargs):
+                return flow
+
+            original = watershed.flow
+            watershed.flow = flow_patch
+            _assess.assess(locals)
+
+        finally:
+            watershed.flow = original
+
+        # Rerun the models with new rainfall intensities
+        locals["models_only"] = True
+        locals["I15_mm_hr"] = [30, 40]
+        logcheck.start("wildcat.assess")
+        output = _assess.assess(locals)
+
+        assessment = project / "assessment"
+        assert output == assessment
+        for name in ["segments", "basins"]:
+            with fiona.open(assessment / f"{name}.geojson") as file:
+                fields = list(file.schema["properties"].keys())
+            assert "H_1" in fields
+            assert "H_2" not in fields
+            assert "Terrain_M1" in fields
+
+        with open(assessment / "configuration.txt") as file:
+            record = file.read()
+        assert "I15_mm_hr = [30, 40]\n" in record
+        assert "models_only = True\n" in record
+
+        messages = [record[2] for record in logcheck.caplog.record_tuples]
+        assert "Loading saved assessment results" in messages
+        assert "Estimating debris-flow likelihood" in messages
+        assert "Characterizing watershed" not in messages
+        assert "Delineating initial network" not in messages
 
 
 def read(folder, name):
@@ -1047,6 +1267,14 @@ def check_config(folder, paths):
         "# Basins\n"
         "locate_basins = True\n"
         "parallelize_basins = False\n"
+        "basin_workers = None\n"
+        "\n"
+        "# Performance\n"
+        "cache_watershed = False\n"
+        "models_only = False\n"
+        'assessment_format = "geojson"\n'
+        "memory_map = False\n"
+        'watershed_precision = "double"\n'
         "\n"
     )
 
@@ -1102,14 +1330,8 @@ def check_log(logcheck, paths):
             ("DEBUG", "    Removing filtered segments"),
             ("INFO", "Locating outlet basins"),
             ("INFO", "Estimating debris-flow likelihood"),
-            ("DEBUG", "    Computing M1 variables"),
             ("DEBUG", "    Running model"),
             ("INFO", "Estimating potential sediment volume"),
-            (
-                "DEBUG",
-                "    Computing catchment area burned at moderate-or-high severity",
-            ),
-            ("DEBUG", "    Computing vertical relief"),
             ("DEBUG", "    Running model"),
             ("INFO", "Classifying combined hazard"),
             ("INFO", "Estimating rainfall thresholds"),
@@ -1,9 +1,40 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
+import rasterio
 from pfdf.raster import Raster
 
 from wildcat._commands.assess import _load
+from wildcat._commands.preprocess import _geotiff
+
+
+@pytest.fixture
+def config():
+    return {
+        "raster_compression": "none",
+        "raster_predictor": False,
+        "raster_layout": "striped",
+        "raster_bigtiff": "if_needed",
+        "watershed_precision": "double",
+    }
+
+
+def lconfig(memory_map, precision="double"):
+    return {"memory_map": memory_map, "watershed_precision": precision}
+
+
+def memmap(array):
+    "Returns the memory map that backs an array, or None if there is no map"
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return array
+        array = array.base
+    return None
+
+
+def mapped(array):
+    return memmap(array) is not None
 
 
 def rasterize(array, path):
@@ -44,7 +75,7 @@ class TestDatasets:
             "iswater_p": None,
             "included_p": None,
         }
-        rasters = _load.datasets(paths, logcheck.log)
+        rasters = _load.datasets(lconfig(False), paths, logcheck.log)
 
         assert isinstance(rasters, dict)
         assert list(rasters.keys()) == ["perimeter", "dem", "dnbr", "excluded"]
@@ -72,3 +103,243 @@ class TestDatasets:
                 ("DEBUG", "    Loading excluded"),
             ]
         )
+
+    def test_stack(_, tmp_path, logcheck):
+        folder = Path(tmp_path) / "preprocessed"
+        folder.mkdir(parents=True)
+
+        # Build a stack with a mask, integers, and floats
+        perimeter = np.zeros((10, 10), bool)
+        perimeter[2:4, :] = True
+        dem = np.arange(100, dtype="int16").reshape(10, 10)
+        dnbr = np.arange(100, dtype=float).reshape(10, 10) / 3
+        dnbr[0, 0] = np.nan
+        rasters = {
+            "perimeter": Raster.from_array(
+                perimeter, isbool=True, crs=26911, bounds=(0, 0, 100, 100)
+            ),
+            "dem": Raster.from_array(
+                dem, nodata=-1, crs=26911, bounds=(0, 0, 100, 100)
+            ),
+            "dnbr": Raster.from_array(
+                dnbr, nodata=np.nan, crs=26911, bounds=(0, 0, 100, 100)
+            ),
+        }
+        config = {
+            "raster_compression": "none",
+            "raster_predictor": False,
+            "raster_layout": "striped",
+            "raster_bigtiff": "if_needed",
+            "watershed_precision": "double",
+        }
+        stack = folder / "stack.tif"
+        _geotiff.stack(stack, rasters, config)
+
+        paths = {
+            "perimeter_p": stack,
+            "dem_p": stack,
+            "dnbr_p": stack,
+            "iswater_p": None,
+        }
+        output = _load.datasets(lconfig(False), paths, logcheck.log)
+        assert list(output.keys()) == ["perimeter", "dem", "dnbr"]
+
+        assert output["perimeter"].dtype == bool
+        assert np.array_equal(output["perimeter"].values, perimeter)
+        assert output["dem"].dtype == "int16"
+        assert output["dem"].nodata == -1
+        assert np.array_equal(output["dem"].values, dem)
+        assert output["dnbr"].dtype == float
+        assert np.isnan(output["dnbr"].nodata)
+        assert np.array_equal(output["dnbr"].values, dnbr, equal_nan=True)
+        for raster in output.values():
+            assert raster.crs == 26911
+            assert raster.bounds.tolist(crs=False) == [0, 0, 100, 100]
+
+        logcheck.check(
+            [
+                ("INFO", "Loading preprocessed rasters"),
+                ("DEBUG", "    Loading perimeter"),
+                ("DEBUG", "    Loading dem"),
+                ("DEBUG", "    Loading dnbr"),
+            ]
+        )
+
+    def test_memory_map(_, tmp_path, config, logcheck):
+        folder = Path(tmp_path) / "preprocessed"
+        folder.mkdir(parents=True)
+
+        # A striped DEM and mask, and a compressed dNBR
+        dem = np.arange(300 * 200, dtype=float).reshape(300, 200)
+        perimeter = np.zeros((300, 200), bool)
+        perimeter[20:40, :] = True
+        dnbr = dem * 100
+        bounds = (0, 0, 2000, 3000)
+        rasters = {
+            "perimeter": Raster.from_array(
+                perimeter, isbool=True, crs=26911, bounds=bounds
+            ),
+            "dem": Raster.from_array(dem, nodata=-1, crs=26911, bounds=bounds),
+            "dnbr": Raster.from_array(dnbr, nodata=-1, crs=26911, bounds=bounds),
+        }
+        for name in ["perimeter", "dem"]:
+            _geotiff.write(folder / f"{name}.tif", rasters[name], config)
+        config["raster_compression"] = "deflate"
+        _geotiff.write(folder / "dnbr.tif", rasters["dnbr"], config)
+
+        paths = {f"{name}_p": folder / f"{name}.tif" for name in rasters}
+        output = _load.datasets(lconfig(True), paths, logcheck.log)
+        assert mapped(output["dem"].values)
+        assert not mapped(output["dnbr"].values)
+        assert output["perimeter"].dtype == bool
+        assert np.array_equal(output["perimeter"].values, perimeter)
+        assert np.array_equal(output["dem"].values, dem)
+        assert np.array_equal(output["dnbr"].values, dnbr)
+        assert output["dem"].nodata == -1
+
+    def test_memory_map_stack(_, tmp_path, config, logcheck):
+        folder = Path(tmp_path) / "preprocessed"
+        folder.mkdir(parents=True)
+
+        dem = np.arange(300 * 200, dtype=float).reshape(300, 200)
+        dnbr = dem * 100
+        bounds = (0, 0, 2000, 3000)
+        rasters = {
+            "dem": Raster.from_array(dem, nodata=-1, crs=26911, bounds=bounds),
+            "dnbr": Raster.from_array(dnbr, nodata=-2, crs=26911, bounds=bounds),
+        }
+        stack = folder / "stack.tif"
+        _geotiff.stack(stack, rasters, config)
+
+        paths = {"dem_p": stack, "dnbr_p": stack}
+        output = _load.datasets(lconfig(True), paths, logcheck.log)
+        for name, values in {"dem": dem, "dnbr": dnbr}.items():
+            map = memmap(output[name].values)
+            assert isinstance(map, np.memmap)
+            assert map.filename == str(stack)
+            assert output[name].values.shape == (300, 200)
+            assert np.array_equal(output[name].values, values)
+        assert output["dnbr"].nodata == -2
+
+    def test_memory_map_promoted(_, tmp_path, config, logcheck):
+        folder = Path(tmp_path) / "preprocessed"
+        folder.mkdir(parents=True)
+
+        # The int16 DEM is promoted to the float64 band type of the stack
+        dem = np.arange(300 * 200, dtype="int16").reshape(300, 200)
+        dnbr = dem * 100.0
+        bounds = (0, 0, 2000, 3000)
+        rasters = {
+            "dem": Raster.from_array(dem, nodata=-1, crs=26911, bounds=bounds),
+            "dnbr": Raster.from_array(dnbr, nodata=-2, crs=26911, bounds=bounds),
+        }
+        stack = folder / "stack.tif"
+        assert _geotiff.stack(stack, rasters, config) == ["dem"]
+
+        logcheck.start("wildcat.assess")
+        paths = {"dem_p": stack, "dnbr_p": stack}
+        output = _load.datasets(lconfig(True), paths, logcheck.log)
+        assert not mapped(output["dem"].values)
+        assert output["dem"].dtype == "int16"
+        assert np.array_equal(output["dem"].values, dem)
+        assert isinstance(memmap(output["dnbr"].values), np.memmap)
+        assert np.array_equal(output["dnbr"].values, dnbr)
+        logcheck.check(
+            [
+                ("INFO", "Loading preprocessed rasters"),
+                ("DEBUG", "    Loading dem"),
+                ("DEBUG", "    Reading dem into memory (promoted stack data type)"),
+                ("DEBUG", "    Loading dnbr"),
+            ]
+        )
+
+    def test_constants(_, tmp_path, logcheck):
+        folder = Path(tmp_path) / "preprocessed"
+        folder.mkdir(parents=True)
+
+        dem = np.arange(100).reshape(10, 10)
+        rasterize(dem, folder / "dem.tif")
+        constants = folder / "constants.json"
+        constants.write_text('{"kf": 5, "dnbr": 2.5}')
+
+        paths = {
+            "kf_p": constants,
+            "dem_p": folder / "dem.tif",
+            "dnbr_p": constants,
+        }
+        output = _load.datasets(lconfig(False), paths, logcheck.log)
+        assert sorted(output.keys()) == ["dem", "dnbr", "kf"]
+        assert np.array_equal(output["kf"].values, np.full((10, 10), 5))
+        assert np.array_equal(output["dnbr"].values, np.full((10, 10), 2.5))
+        for name in ["kf", "dnbr"]:
+            assert output[name].values.strides == (0, 0)
+            assert output[name].crs == 26911
+            assert output[name].bounds.tolist(crs=False) == [0, 0, 100, 100]
+
+        logcheck.check(
+            [
+                ("INFO", "Loading preprocessed rasters"),
+                ("DEBUG", "    Loading dem"),
+                ("DEBUG", "    Building constant kf"),
+                ("DEBUG", "    Building constant dnbr"),
+            ]
+        )
+
+    def test_compact(_, tmp_path, logcheck):
+        folder = Path(tmp_path) / "preprocessed"
+        folder.mkdir(parents=True)
+
+        perimeter = np.zeros((10, 10), bool)
+        perimeter[2:4, :] = True
+        rasterize(perimeter, folder / "perimeter.tif")
+        dem = np.arange(100, dtype=float).reshape(10, 10)
+        rasterize(dem, folder / "dem.tif")
+        dnbr = dem * 100 + 0.4
+        rasterize(dnbr, folder / "dnbr.tif")
+
+        paths = {
+            "perimeter_p": folder / "perimeter.tif",
+            "dem_p": folder / "dem.tif",
+            "dnbr_p": folder / "dnbr.tif",
+        }
+        output = _load.datasets(lconfig(False, "compact"), paths, logcheck.log)
+        assert output["perimeter"].dtype == bool
+        assert output["dem"].dtype == "float32"
+        assert output["dnbr"].dtype == "int16"
+        assert np.array_equal(output["dem"].values, dem)
+        assert np.array_equal(output["dnbr"].values, dem * 100)
+
+        logcheck.check(
+            [
+                ("INFO", "Loading preprocessed rasters"),
+                ("DEBUG", "    Loading perimeter"),
+                ("DEBUG", "    Loading dem"),
+                ("DEBUG", "    Loading dnbr"),
+                ("DEBUG", "    Converting dem to float32"),
+                ("DEBUG", "    Converting dnbr to int16"),
+            ]
+        )
+
+
+class TestMemmap:
+    def test_striped(_, tmp_path, config):
+        values = np.arange(300 * 200, dtype="int16").reshape(300, 200)
+        raster = Raster.from_array(values, nodata=-1, crs=26911)
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, raster, config)
+        with rasterio.open(path) as file:
+            output = _load._memmap(file, 1)
+        assert isinstance(output, np.memmap)
+        assert np.array_equal(output, values)
+
+    @pytest.mark.parametrize(
+        "option, value", (("raster_compression", "zstd"), ("raster_layout", "tiled"))
+    )
+    def test_not_mappable(_, tmp_path, config, option, value):
+        config[option] = value
+        values = np.arange(300 * 200, dtype="int16").reshape(300, 200)
+        raster = Raster.from_array(values, nodata=-1, crs=26911)
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, raster, config)
+        with rasterio.open(path) as file:
+            assert _load._memmap(file, 1) is None
@@ -6,6 +6,7 @@ import pytest
 
 from wildcat import version
 from wildcat._commands.assess import _save
+from wildcat._utils import _saved
 
 
 @pytest.fixture
@@ -1471,6 +1472,28 @@ class TestResults:
             ]
         )
 
+    @pytest.mark.parametrize(
+        "format, driver", (("flatgeobuf", "FlatGeobuf"), ("gpkg", "GPKG"))
+    )
+    def test_format(
+        _, assessment, config, segments, all_props, format, driver, logcheck
+    ):
+        for name in ["segments", "outlets", "basins"]:
+            (assessment / f"{name}.geojson").write_text("stale")
+        config["assessment_format"] = format
+        _save.results(assessment, config, segments, all_props, logcheck.log)
+
+        ext = _saved.FORMATS[format]
+        assert sorted(path.name for path in assessment.iterdir()) == [
+            f"basins{ext}",
+            f"outlets{ext}",
+            f"segments{ext}",
+        ]
+        with fiona.open(assessment / f"segments{ext}") as file:
+            assert file.driver == driver
+            assert len(file) == 8
+            assert "H_0" in file.schema["properties"]
+
 
 class TestConfig:
     def test(_, assessment, paths, logcheck):
@@ -1511,6 +1534,13 @@ class TestConfig:
             # Basins
             "locate_basins": True,
             "parallelize_basins": False,
+            "basin_workers": None,
+            # Performance
+            "cache_watershed": False,
+            "models_only": False,
+            "assessment_format": "geojson",
+            "memory_map": False,
+            "watershed_precision": "double",
         }
 
         path = assessment / "configuration.txt"
@@ -1569,5 +1599,13 @@ class TestConfig:
             "# Basins\n"
             "locate_basins = True\n"
             "parallelize_basins = False\n"
+            "basin_workers = None\n"
+            "\n"
+            "# Performance\n"
+            "cache_watershed = False\n"
+            "models_only = False\n"
+            'assessment_format = "geojson"\n'
+            "memory_map = False\n"
+            'watershed_precision = "double"\n'
             "\n"
         )
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from pfdf.raster import Raster
+
+from wildcat._commands.assess import _cache
+
+
+def _write(path, text="test"):
+    with open(path, "w") as file:
+        file.write(text)
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = {}
+    for name in ["dem", "severity", "retainments"]:
+        path = tmp_path / f"{name}.tif"
+        _write(path)
+        paths[f"{name}_p"] = path
+    return paths
+
+
+@pytest.fixture
+def config():
+    return {"dem_per_m": 1, "watershed_precision": "double"}
+
+
+@pytest.fixture
+def rasters():
+    rasters = {}
+    for name in ["flow", "slopes", "relief", "area", "burned-area"]:
+        rasters[name] = Raster.from_array(
+            np.arange(9).reshape(3, 3), nodata=-1, crs=26911
+        )
+    return rasters
+
+
+class TestNames:
+    def test(_, rasters):
+        assert _cache.names(rasters) == [
+            "flow",
+            "slopes",
+            "relief",
+            "area",
+            "burned-area",
+        ]
+
+    def test_retainments(_, rasters):
+        rasters["retainments"] = None
+        assert _cache.names(rasters)[-1] == "nretainments"
+
+
+class TestKey:
+    def test_stable(_, config, paths):
+        assert _cache.key(config, paths) == _cache.key(config, paths)
+
+    def test_units(_, config, paths):
+        initial = _cache.key(config, paths)
+        config["dem_per_m"] = 3.28
+        assert _cache.key(config, paths) != initial
+
+    def test_precision(_, config, paths):
+        initial = _cache.key(config, paths)
+        config["watershed_precision"] = "compact"
+        assert _cache.key(config, paths) != initial
+
+    def test_modified(_, config, paths):
+        initial = _cache.key(config, paths)
+        _write(paths["severity_p"], "modified file")
+        assert _cache.key(config, paths) != initial
+
+    def test_missing(_, config, paths):
+        initial = _cache.key(config, paths)
+        paths["retainments_p"] = None
+        assert _cache.key(config, paths) != initial
+
+
+class TestSaveLoad:
+    def test(_, tmp_path, rasters, logcheck):
+        _cache.save(tmp_path, "a", rasters, logcheck.log)
+        for name in rasters:
+            assert (tmp_path / ".cache" / f"{name}-a.tif").exists()
+
+        output = {}
+        assert _cache.load(tmp_path, "a", output, logcheck.log) == True
+        assert list(output.keys()) == list(rasters.keys())
+        for name, raster in output.items():
+            assert raster == rasters[name]
+
+        logcheck.check(
+            [
+                ("INFO", "Caching watershed rasters"),
+                ("DEBUG", "    Caching flow"),
+                ("DEBUG", "    Caching slopes"),
+                ("DEBUG", "    Caching relief"),
+                ("DEBUG", "    Caching area"),
+                ("DEBUG", "    Caching burned-area"),
+                ("INFO", "Loading cached watershed rasters"),
+                ("DEBUG", "    Loading cached flow"),
+                ("DEBUG", "    Loading cached slopes"),
+                ("DEBUG", "    Loading cached relief"),
+                ("DEBUG", "    Loading cached area"),
+                ("DEBUG", "    Loading cached burned-area"),
+            ]
+        )
+
+    def test_missing(_, tmp_path, rasters, logcheck):
+        _cache.save(tmp_path, "a", rasters, logcheck.log)
+        (tmp_path / ".cache" / "relief-a.tif").unlink()
+        logcheck.caplog.clear()
+        output = {}
+        assert _cache.load(tmp_path, "a", output, logcheck.log) == False
+        assert output == {}
+        logcheck.check([])
+
+    def test_stale(_, tmp_path, rasters, logcheck):
+        _cache.save(tmp_path, "a", rasters, logcheck.log)
+        _cache.save(tmp_path, "b", rasters, logcheck.log)
+        for name in rasters:
+            assert not (tmp_path / ".cache" / f"{name}-a.tif").exists()
+            assert (tmp_path / ".cache" / f"{name}-b.tif").exists()
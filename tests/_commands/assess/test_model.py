@@ -144,6 +144,34 @@ class TestLikelihood:
         )
 
 
+class TestG14Variables:
+    def test_already_computed(_, logcheck):
+        properties = {"Bmh_km2": 1, "Relief_m": 2}
+        _model._g14_variables(None, None, None, properties, logcheck.log)
+        assert properties == {"Bmh_km2": 1, "Relief_m": 2}
+        logcheck.check([])
+
+    def test(_, config, segments, rasters, logcheck):
+        properties = {}
+        _model._g14_variables(config, segments, rasters, properties, logcheck.log)
+        assert list(properties.keys()) == ["Bmh_km2", "Relief_m"]
+        expected = {
+            "Bmh_km2": [0.0004, 0.0004, 0.0019, 0.0009, 0.0028, 0.0001, 0.0001, 0.0002],
+            "Relief_m": [64.0, 53.0, 115.0, 105.0, 128.0, 110.0, 123.0, 121.0],
+        }
+        for field, values in expected.items():
+            assert np.allclose(properties[field], values)
+        logcheck.check(
+            [
+                (
+                    "DEBUG",
+                    "    Computing catchment area burned at moderate-or-high severity",
+                ),
+                ("DEBUG", "    Computing vertical relief"),
+            ]
+        )
+
+
 class TestVolume:
     def test(_, config, segments, rasters, logcheck):
         properties = {}
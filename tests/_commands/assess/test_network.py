@@ -2,12 +2,15 @@
 Tests for the "delineate" function in the network module
 """
 
+import logging
+import re
+
 import numpy as np
 import pytest
 from pfdf.raster import Raster
 from pfdf.segments import Segments
 
-from wildcat._commands.assess import _network
+from wildcat._commands.assess import _network, _watershed
 
 
 class TestMask:
@@ -128,30 +131,9 @@ class TestDelineate:
         )
 
 
-class TestDevelopedArea:
-    def test_missing(_, segments):
-        output = _network._developed_area(segments, {})
-        expected = np.zeros(segments.size)
-        assert np.array_equal(output, expected)
-
-    def test(_, segments, rasters, mask):
-        rasters["isdeveloped"] = mask
-        output = _network._developed_area(segments, rasters)
-        expected = [0, 0, 0, 0, 0, 0.0004, 0.0008, 0.0014]
-        assert np.array_equal(output, expected)
-
-
-class TestIncluded:
-    def test_missing(_, segments):
-        output = _network._included(segments, {})
-        assert output.dtype == bool
-        assert np.array_equal(output, np.zeros(segments.size))
-
-    def test(_, segments, rasters, mask):
-        rasters["included"] = mask
-        output = _network._included(segments, rasters)
-        assert output.dtype == bool
-        assert np.array_equal(output, [0, 0, 0, 0, 0, 1, 1, 1])
+def accumulate(config, rasters):
+    "Accumulates the catchment areas sampled by the segment statistics"
+    _watershed.accumulation(config, rasters, logging.getLogger(__name__))
 
 
 def check_props(output, expected):
@@ -177,6 +159,12 @@ def check_props(output, expected):
         "IsConfined",
         "IsUndev",
         "IsFlowSave",
+        # Model inputs
+        "Terrain_M1",
+        "Fire_M1",
+        "Soil_M1",
+        "Bmh_km2",
+        "Relief_m",
     ]
     for key, values in expected.items():
         assert np.allclose(output[key], values)
@@ -204,6 +192,7 @@ class TestFilter:
         rasters["perimeter"] = trues
         config["max_area_km2"] = 0.007
 
+        accumulate(config, rasters)
         output = _network.filter(config, segments, rasters, logcheck.log)
         check_removed(segments, stream, 5)
         check_props(
@@ -245,6 +234,7 @@ class TestFilter:
         rasters["perimeter"] = trues
         config["min_slope"] = 0.5
 
+        accumulate(config, rasters)
         output = _network.filter(config, segments, rasters, logcheck.log)
         assert segments.raster() == stream
         check_props(
@@ -295,6 +285,7 @@ class TestFilter:
         rasters["slopes"] = Raster.from_array(slopes, spatial=stream)
         config["min_slope"] = 0.5
 
+        accumulate(config, rasters)
         output = _network.filter(config, segments, rasters, logcheck.log)
         check_removed(segments, stream, 4)
         check_props(
@@ -335,6 +326,7 @@ class TestFilter:
         config["max_area_km2"] = 0.007
         config["flow_continuous"] = False
 
+        accumulate(config, rasters)
         output = _network.filter(config, segments, rasters, logcheck.log)
         assert segments.raster() == stream
         check_props(
@@ -383,6 +375,7 @@ class TestFilter:
         rasters["perimeter"] = falses
         config["min_slope"] = 0.5
 
+        accumulate(config, rasters)
         output = _network.filter(config, segments, rasters, logcheck.log)
         assert segments.raster() == stream
         check_props(
@@ -432,6 +425,7 @@ class TestFilter:
         config["min_slope"] = 0.5
         config["flow_continuous"] = False
 
+        accumulate(config, rasters)
         output = _network.filter(config, segments, rasters, logcheck.log)
         stream = stream.values.copy()
         stream[stream == 3] = 0
@@ -508,6 +502,20 @@ class TestLocateBasins:
         assert segments._basins is not None
         logcheck.check([("INFO", "Locating outlet basins")])
 
+    def test_parallel(_, config, segments, logcheck):
+        config["parallelize_basins"] = True
+        config["basin_workers"] = 2
+        _network.locate_basins(config, segments, logcheck.log)
+        assert segments._basins is not None
+
+        records = logcheck.caplog.record_tuples
+        assert records[:2] == [
+            ("test.log", logging.INFO, "Locating outlet basins"),
+            ("test.log", logging.DEBUG, "    Using 2 worker processes"),
+        ]
+        assert len(records) == 3
+        assert re.fullmatch(r"    Located basins in \d+\.\d\d seconds", records[2][2])
+
     def test_disabled(_, config, segments, logcheck):
         config["locate_basins"] = False
         assert segments._basins is None
@@ -0,0 +1,260 @@
+import fiona
+import numpy as np
+import pytest
+
+from wildcat._commands.assess import _rerun
+
+#####
+# Fixtures
+#####
+
+
+@pytest.fixture
+def config():
+    return {
+        "I15_mm_hr": [16, 20],
+        "volume_CI": [0.95],
+        "durations": [15, 30],
+        "probabilities": [0.5],
+        "dem_per_m": 1,
+        "models_only": True,
+    }
+
+
+def _properties(k):
+    return {
+        "Segment_ID": k + 1,
+        "Area_km2": 0.5,
+        "Terrain_M1": 0.25 + 0.1 * k,
+        "Fire_M1": 0.2 + 0.1 * k,
+        "Soil_M1": 0.3,
+        "Bmh_km2": 0.1 * (k + 1),
+        "Relief_m": 100 + 10 * k,
+        "H_0": 1,
+        "P_0": 0.5,
+        "V_0": 100.0,
+        "I_0_0": 20.0,
+    }
+
+
+def _write(path, nfeatures, omit=[], driver="GeoJSON"):
+    properties = {
+        field: "float" for field in _properties(0).keys() if field not in omit
+    }
+    properties["Segment_ID"] = "int"
+    properties["H_0"] = "int"
+    schema = {"geometry": "LineString", "properties": properties}
+    crs = "EPSG:26911"
+    with fiona.open(path, "w", driver=driver, crs=crs, schema=schema) as file:
+        for k in range(nfeatures):
+            values = {
+                field: value
+                for field, value in _properties(k).items()
+                if field not in omit
+            }
+            file.write(
+                fiona.Feature.from_dict(
+                    {
+                        "geometry": {
+                            "type": "LineString",
+                            "coordinates": [(k, 0), (k, 1)],
+                        },
+                        "properties": values,
+                    }
+                )
+            )
+
+
+@pytest.fixture
+def assessment(tmp_path):
+    _write(tmp_path / "segments.geojson", 3)
+    _write(tmp_path / "basins.geojson", 2)
+    with open(tmp_path / "configuration.txt", "w") as file:
+        file.write(
+            "# Hazard Modeling\n"
+            "I15_mm_hr = [24]\n"
+            "volume_CI = [0.9]\n"
+            "durations = [60]\n"
+            "probabilities = [0.75]\n"
+            "\n"
+            "# Performance\n"
+            "cache_watershed = False\n"
+            "models_only = False\n"
+        )
+    return tmp_path
+
+
+def read(path):
+    with fiona.open(path) as file:
+        fields = list(file.schema["properties"].keys())
+        records = [record.__geo_interface__ for record in file]
+    return fields, records
+
+
+#####
+# Main Functions
+#####
+
+
+class TestLoad:
+    def test(_, assessment, logcheck):
+        results = _rerun.load(assessment, logcheck.log)
+        assert list(results.keys()) == ["segments", "basins"]
+        assert len(results["segments"][1]) == 3
+        assert len(results["basins"][1]) == 2
+        logcheck.check(
+            [
+                ("INFO", "Loading saved assessment results"),
+                ("DEBUG", "    Loading segments"),
+                ("DEBUG", "    Loading basins"),
+            ]
+        )
+
+    def test_no_basins(_, assessment, logcheck):
+        (assessment / "basins.geojson").unlink()
+        results = _rerun.load(assessment, logcheck.log)
+        assert list(results.keys()) == ["segments"]
+
+    def test_flatgeobuf(_, tmp_path, logcheck):
+        _write(tmp_path / "segments.fgb", 3, driver="FlatGeobuf")
+        results = _rerun.load(tmp_path, logcheck.log)
+        assert list(results.keys()) == ["segments"]
+        assert results["segments"][0]["driver"] == "FlatGeobuf"
+        assert len(results["segments"][1]) == 3
+
+    def test_missing_segments(_, tmp_path, logcheck):
+        with pytest.raises(FileNotFoundError) as error:
+            _rerun.load(tmp_path, logcheck.log)
+        assert "You must run a full assessment" in str(error.value)
+
+
+class TestModels:
+    def test(_, assessment, config, logcheck):
+        results = _rerun.load(assessment, logcheck.log)
+        output = _rerun.models(config, results, logcheck.log)
+        assert len(output) == 2
+        assert len(output[0]["H_0"]) == 3
+        assert len(output[1]["H_0"]) == 2
+        for properties in output:
+            for field in ["H_1", "P_1", "V_1", "Vmin_1_0", "I_1_0", "R_1_0"]:
+                assert field in properties
+            assert "likelihood" not in properties
+        assert np.array_equal(output[0]["Relief_m"], [100, 110, 120])
+
+    def test_missing_inputs(_, tmp_path, config, logcheck):
+        _write(tmp_path / "segments.geojson", 3, omit=["Bmh_km2"])
+        results = _rerun.load(tmp_path, logcheck.log)
+        with pytest.raises(ValueError) as error:
+            _rerun.models(config, results, logcheck.log)
+        assert 'does not include the "Bmh_km2" model input' in str(error.value)
+
+    def test_thresholds_only(_, tmp_path, config, logcheck):
+        _write(tmp_path / "segments.geojson", 3, omit=["Bmh_km2", "Relief_m"])
+        results = _rerun.load(tmp_path, logcheck.log)
+        config["I15_mm_hr"] = []
+        output = _rerun.models(config, results, logcheck.log)
+        assert "I_1_0" in output[0]
+        assert "H_0" not in output[0]
+
+
+class TestSave:
+    def test(_, assessment, config, logcheck):
+        results = _rerun.load(assessment, logcheck.log)
+        properties = _rerun.models(config, results, logcheck.log)
+        logcheck.caplog.clear()
+        _rerun.save(assessment, results, properties, logcheck.log)
+
+        fields, records = read(assessment / "segments.geojson")
+        assert fields[:7] == [
+            "Segment_ID",
+            "Area_km2",
+            "Terrain_M1",
+            "Fire_M1",
+            "Soil_M1",
+            "Bmh_km2",
+            "Relief_m",
+        ]
+        assert "H_1" in fields
+        assert "I_1_0" in fields
+        assert len(records) == 3
+        for k, record in enumerate(records):
+            assert record["properties"]["Segment_ID"] == k + 1
+            assert np.isclose(record["properties"]["P_1"], properties[0]["P_1"][k])
+
+        _, records = read(assessment / "basins.geojson")
+        assert len(records) == 2
+        logcheck.check(
+            [
+                ("INFO", "Saving results"),
+                ("DEBUG", "    Saving segments"),
+                ("DEBUG", "    Saving basins"),
+            ]
+        )
+
+    def test_gpkg(_, tmp_path, config, logcheck):
+        _write(tmp_path / "segments.gpkg", 3, driver="GPKG")
+        results = _rerun.load(tmp_path, logcheck.log)
+        properties = _rerun.models(config, results, logcheck.log)
+        _rerun.save(tmp_path, results, properties, logcheck.log)
+
+        assert list(tmp_path.iterdir()) == [tmp_path / "segments.gpkg"]
+        fields, records = read(tmp_path / "segments.gpkg")
+        assert "H_1" in fields
+        assert len(records) == 3
+
+
+class TestConfig:
+    def test(_, assessment, config, logcheck):
+        _rerun.config(assessment, config, logcheck.log)
+        with open(assessment / "configuration.txt") as file:
+            output = file.read()
+        assert output == (
+            "# Hazard Modeling\n"
+            "I15_mm_hr = [16, 20]\n"
+            "volume_CI = [0.95]\n"
+            "durations = [15, 30]\n"
+            "probabilities = [0.5]\n"
+            "\n"
+            "# Performance\n"
+            "cache_watershed = False\n"
+            "models_only = True\n"
+        )
+        logcheck.check([("DEBUG", "    Updating configuration.txt")])
+
+    def test_missing(_, tmp_path, config, logcheck):
+        with pytest.raises(FileNotFoundError):
+            _rerun.config(tmp_path, config, logcheck.log)
+
+
+#####
+# Utilities
+#####
+
+
+class TestInputs:
+    def test(_):
+        records = [{"properties": _properties(0)}, {"properties": {"Fire_M1": 2}}]
+        output = _rerun._inputs(records)
+        assert list(output.keys()) == [
+            "Terrain_M1",
+            "Fire_M1",
+            "Soil_M1",
+            "Bmh_km2",
+            "Relief_m",
+        ]
+        assert np.array_equal(output["Fire_M1"], [0.2, 2])
+        assert np.isnan(output["Terrain_M1"][1])
+
+
+class TestIsResult:
+    @pytest.mark.parametrize(
+        "field", ["H_0", "P_1", "V_0", "Vmin_0_1", "Vmax_1_0", "I_0_0", "R_1_1"]
+    )
+    def test_result(_, field):
+        assert _rerun._isresult(field) == True
+
+    @pytest.mark.parametrize(
+        "field", ["Segment_ID", "Terrain_M1", "IsIncluded", "Relief_m", "Bmh_km2"]
+    )
+    def test_other(_, field):
+        assert _rerun._isresult(field) == False
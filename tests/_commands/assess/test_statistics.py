@@ -0,0 +1,168 @@
+from logging import getLogger
+
+import numpy as np
+import pytest
+from pfdf.raster import Raster
+
+from wildcat._commands.assess import _statistics, _watershed
+
+
+def accumulate(config, rasters):
+    "Accumulates the catchment areas sampled by the segment statistics"
+    _watershed.accumulation(config, rasters, getLogger(__name__))
+
+
+#####
+# Main Function
+#####
+
+
+class TestCompute:
+    def test_filtering(_, config, segments, rasters):
+        config["I15_mm_hr"] = []
+        config["durations"] = []
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        assert list(output.keys()) == [
+            "Area_km2",
+            "ExtRatio",
+            "BurnRatio",
+            "DevAreaKm2",
+            "Slope",
+            "IsXPerim",
+            "IsIncluded",
+        ]
+        expected = {
+            "Area_km2": [
+                0.0016,
+                0.0011,
+                0.0041,
+                0.0027,
+                0.0075,
+                0.0005,
+                0.0009,
+                0.0016,
+            ],
+            "ExtRatio": [
+                0.75,
+                0.63636364,
+                0.53658537,
+                0.66666667,
+                0.62666667,
+                0,
+                0.33333333,
+                0.1875,
+            ],
+            "BurnRatio": [1, 1, 1, 1, 1, 1, 1, 1],
+            "DevAreaKm2": [0, 0, 0, 0, 0, 0, 0, 0],
+            "Slope": [1, 1, 1, 1, 1, 1, 1, 1],
+            "IsXPerim": [1, 1, 1, 1, 0, 1, 0, 1],
+            "IsIncluded": [0, 0, 0, 0, 0, 0, 0, 0],
+        }
+        for field, values in expected.items():
+            assert np.allclose(output[field], values)
+
+    def test_matches_segments(_, config, segments, rasters, slope23):
+        rasters["slopes"] = slope23
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        perimeter = rasters["perimeter"]
+        expected = {
+            "Area_km2": segments.area(units="kilometers"),
+            "ExtRatio": segments.catchment_ratio(~perimeter.values),
+            "BurnRatio": segments.burn_ratio(rasters["burned"]),
+            "Slope": segments.slope(rasters["slopes"]),
+            "IsXPerim": segments.in_perimeter(perimeter),
+        }
+        for field, values in expected.items():
+            assert np.allclose(output[field], values)
+
+    def test_developed(_, config, segments, rasters, mask):
+        rasters["isdeveloped"] = mask
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        expected = [0, 0, 0, 0, 0, 0.0004, 0.0008, 0.0014]
+        assert np.allclose(output["DevAreaKm2"], expected)
+
+    def test_included(_, config, segments, rasters, mask):
+        rasters["included"] = mask
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        assert output["IsIncluded"].dtype == bool
+        assert np.array_equal(output["IsIncluded"], [0, 0, 0, 0, 0, 1, 1, 1])
+
+    def test_m1(_, config, segments, rasters, slope23, m1_vars):
+        config["I15_mm_hr"] = []
+        rasters["slopes"] = slope23
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        assert "Bmh_km2" not in output
+        for field, values in m1_vars.items():
+            assert np.allclose(output[field], values)
+
+    def test_all_models(_, config, segments, rasters, slope23, model_inputs):
+        rasters["slopes"] = slope23
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        for field, values in model_inputs.items():
+            assert np.allclose(output[field], values)
+
+    def test_dem_per_m(_, config, segments, rasters):
+        config["dem_per_m"] = 2
+        accumulate(config, rasters)
+        output = _statistics.compute(config, segments, rasters)
+        expected = [32, 26.5, 57.5, 52.5, 64, 55, 61.5, 60.5]
+        assert np.allclose(output["Relief_m"], expected)
+
+
+#####
+# Segment Geometry
+#####
+
+
+class TestPixels:
+    def test(_, segments, stream):
+        pixels, labels = _statistics._pixels(segments, stream.shape)
+        assert pixels.size == np.sum(stream.values > 0)
+        assert np.array_equal(stream.values.ravel()[pixels], segments.ids[labels])
+
+
+class TestOutlets:
+    def test(_, segments, flow, stream):
+        pixels, labels = _statistics._pixels(segments, stream.shape)
+        downstream = _watershed.downstream(flow.values)
+        output = _statistics._outlets(pixels, labels, downstream, segments.size)
+        rows, cols = np.unravel_index(output, stream.shape)
+        assert np.array_equal(rows, [5, 4, 9, 8, 10, 9, 10, 10])
+        assert np.array_equal(cols, [4, 5, 7, 9, 8, 2, 3, 1])
+
+
+#####
+# Statistics
+#####
+
+
+class TestModels:
+    @pytest.mark.parametrize(
+        "I15, durations, expected",
+        (
+            ([16], [15], ["Terrain_M1", "Fire_M1", "Soil_M1", "Bmh_km2", "Relief_m"]),
+            ([], [15], ["Terrain_M1", "Fire_M1", "Soil_M1"]),
+            ([], [], []),
+        ),
+    )
+    def test(_, I15, durations, expected):
+        config = {"I15_mm_hr": I15, "durations": durations, "probabilities": [0.5]}
+        assert _statistics._models(config) == expected
+
+
+class TestSegmentStats:
+    def test_nodata_slope(_, segments, rasters, stream):
+        slopes = np.ones(stream.shape)
+        slopes[stream.values == 3] = -1
+        rasters["slopes"] = Raster.from_array(slopes, nodata=-1, spatial=stream)
+        pixels, labels = _statistics._pixels(segments, stream.shape)
+        output = _statistics._segment_stats(segments, rasters, pixels, labels)
+        assert np.array_equal(
+            output["Slope"], [1, 1, np.nan, 1, 1, 1, 1, 1], equal_nan=True
+        )
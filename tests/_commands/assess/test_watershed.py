@@ -2,6 +2,7 @@ from math import nan
 
 import numpy as np
 import pytest
+from pfdf import watershed
 from pfdf.raster import Raster
 
 from wildcat._commands.assess import _watershed
@@ -2392,7 +2393,7 @@ class TestSeverityMasks:
 
 class TestCharacterize:
     def test(_, rasters, flow, slopes, relief, logcheck):
-        config = {"dem_per_m": 1}
+        config = {"dem_per_m": 1, "watershed_precision": "double"}
         _watershed.characterize(config, rasters, logcheck.log)
 
         assert "flow" in rasters
@@ -2415,13 +2416,23 @@ class TestCharacterize:
             ]
         )
 
+    def test_compact(_, rasters, slopes, relief, logcheck):
+        config = {"dem_per_m": 1, "watershed_precision": "compact"}
+        _watershed.characterize(config, rasters, logcheck.log)
+        assert rasters["slopes"].dtype == "float32"
+        assert rasters["relief"].dtype == "float32"
+        assert np.allclose(rasters["slopes"].values, slopes.values, equal_nan=True)
+        assert np.allclose(rasters["relief"].values, relief.values, equal_nan=True)
+
 
 class TestAccumulation:
     def test(_, rasters, flow, isburned, area, burned_area, logcheck):
         rasters["flow"] = flow
         rasters["burned"] = isburned
 
-        _watershed.accumulation(rasters, logcheck.log)
+        _watershed.accumulation(
+            {"watershed_precision": "double"}, rasters, logcheck.log
+        )
 
         assert "area" in rasters
         assert "burned-area" in rasters
@@ -2453,7 +2464,9 @@ class TestAccumulation:
         rasters["burned"] = isburned
         rasters["retainments"] = retainments
 
-        _watershed.accumulation(rasters, logcheck.log)
+        _watershed.accumulation(
+            {"watershed_precision": "double"}, rasters, logcheck.log
+        )
 
         assert "area" in rasters
         assert "burned-area" in rasters
@@ -2471,3 +2484,76 @@ class TestAccumulation:
                 ("DEBUG", "    Areas below retainment features"),
             ]
         )
+
+    def test_compact(_, rasters, flow, isburned, area, burned_area, logcheck):
+        rasters["flow"] = flow
+        rasters["burned"] = isburned
+
+        _watershed.accumulation(
+            {"watershed_precision": "compact"}, rasters, logcheck.log
+        )
+        assert rasters["area"].dtype == "float64"
+        assert rasters["burned-area"].dtype == "float64"
+        assert np.allclose(rasters["area"].values, area.values, equal_nan=True)
+        assert np.allclose(rasters["burned-area"].values, burned_area.values)
+
+
+class TestDownstream:
+    def test(_):
+        flow = np.array([[0, 5, 1], [9, 3, 2]])
+        output = _watershed.downstream(flow)
+        assert np.array_equal(output, [-1, 0, -1, -1, 1, -1])
+
+
+class TestAccumulate:
+    def test(_):
+        flow = np.array(
+            [
+                [8, 7, 6],
+                [1, 7, 5],
+                [1, 0, 5],
+            ]
+        )
+        weights = np.arange(9).reshape(3, 3)
+        mask = np.zeros((3, 3), bool)
+        mask[0, 0] = True
+
+        ones, weighted, masked = _watershed.accumulate(
+            flow, [np.ones((3, 3)), weights, mask]
+        )
+        assert np.array_equal(ones, [[1, 1, 1], [1, 6, 1], [1, 9, 1]])
+        assert np.array_equal(weighted, [[0, 1, 2], [3, 15, 5], [6, 36, 8]])
+        assert np.array_equal(masked, [[1, 0, 0], [0, 1, 0], [0, 1, 0]])
+
+    def test_sinks(_):
+        flow = np.array([[0, 5, 1], [9, 5, 5]])
+        (output,) = _watershed.accumulate(flow, [np.ones(flow.shape)])
+        assert np.array_equal(output, [[2, 1, 1], [3, 2, 1]])
+
+    def test_dtype(_):
+        flow = np.array([[0, 5, 1], [9, 5, 5]])
+        (output,) = _watershed.accumulate(flow, [np.ones(flow.shape, bool)])
+        assert output.dtype == "float64"
+        assert np.array_equal(output, [[2, 1, 1], [3, 2, 1]])
+
+    def test_large_catchment(_):
+        # Every pixel drains south to the bottom row, which drains east. The
+        # outlet count exceeds 2^24, so is not exact as a 32-bit float
+        flow = np.full((4097, 4097), 7, "int8")
+        flow[-1, :] = 1
+        (output,) = _watershed.accumulate(flow, [np.ones(flow.shape, bool)])
+        assert flow.size > 2**24
+        assert output[-1, -1] == flow.size
+        assert np.array_equal(output[-1, :3], [4097, 8194, 12291])
+
+    def test_pfdf(_):
+        rng = np.random.default_rng(0)
+        values = rng.integers(6, 9, size=(50, 50))
+        values[rng.random(values.shape) < 0.05] = 0
+        flow = Raster.from_array(values, nodata=0, crs=26911, transform=(10, -10, 0, 0))
+        weights = rng.random(values.shape)
+
+        (output,) = _watershed.accumulate(values, [weights])
+        expected = watershed.accumulation(flow, weights, check_flow=False)
+        valid = values != 0
+        assert np.allclose(output[valid], expected.values[valid])
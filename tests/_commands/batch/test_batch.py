@@ -0,0 +1,252 @@
+import json
+import os
+import sys
+from functools import wraps
+from pathlib import Path
+from time import sleep
+
+import numpy as np
+import pytest
+
+import wildcat
+from wildcat._commands.batch import _batch, _worker
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    """Replaces the commands with functions that save their kwargs. The assess
+    command fails for projects named "fail". Worker processes are forked, so
+    inherit the replaced commands"""
+
+    for command in ["preprocess", "assess", "export"]:
+        original = getattr(wildcat, command)
+
+        def fake(project, *, _command=command, **kwargs):
+            if _command == "assess" and project.name == "fail":
+                raise ValueError("Could not assess")
+            path = project / f"{_command}.json"
+            path.write_text(json.dumps(kwargs))
+            return project
+
+        monkeypatch.setattr(wildcat, command, wraps(original)(fake))
+    monkeypatch.setattr(_worker, "initialize", lambda max_memory_gb: None)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    path = tmp_path / "manifest.toml"
+    path.write_text(
+        "[settings]\n"
+        "I15_mm_hr = [16, 20]\n"
+        "\n"
+        "[[projects]]\n"
+        'project = "fire-a"\n'
+        "\n"
+        "[[projects]]\n"
+        'project = "fire-b"\n'
+        "export_crs = 4326\n"
+    )
+    for name in ["fire-a", "fire-b", "fail", "crash"]:
+        (tmp_path / name).mkdir()
+    return path
+
+
+def _crash(project, commands):
+    os._exit(1)
+
+
+_run = _worker.run
+_initialize = _worker.initialize
+
+
+def _crash_one(project, commands):
+    "Kills the worker process running the project named crash"
+    if project.name == "crash":
+        os._exit(1)
+    return _run(project, commands)
+
+
+def _allocate(project, commands):
+    "Uses 512 MB of resident memory when running the project named crash"
+    if project.name == "crash":
+        data = np.ones(512 * 1024**2 // 8)
+        sleep(10)
+        return data.size
+    return _run(project, commands)
+
+
+class TestBatch:
+    def test(_, commands, manifest, tmp_path, logcheck):
+        logcheck.start("wildcat.batch")
+        output = _batch.batch(manifest, workers=2)
+        assert output == tmp_path / "manifest-summary.json"
+
+        # Check the commands ran with the overrides
+        fire_a, fire_b = tmp_path / "fire-a", tmp_path / "fire-b"
+        with open(fire_a / "assess.json") as file:
+            assert json.load(file) == {"I15_mm_hr": [16, 20]}
+        with open(fire_b / "export.json") as file:
+            assert json.load(file) == {"export_crs": 4326}
+        with open(fire_b / "preprocess.json") as file:
+            assert json.load(file) == {}
+
+        # Check the summary
+        with open(output) as file:
+            summary = json.load(file)
+        assert list(summary.keys()) == [
+            "manifest",
+            "wildcat",
+            "workers",
+            "max_memory_gb",
+            "wall_seconds",
+            "succeeded",
+            "failed",
+            "projects",
+        ]
+        assert summary["manifest"] == str(manifest)
+        assert summary["wildcat"] == wildcat.version()
+        assert summary["workers"] == 2
+        assert summary["max_memory_gb"] is None
+        assert summary["succeeded"] == 2
+        assert summary["failed"] == 0
+        projects = summary["projects"]
+        assert [project["project"] for project in projects] == [
+            str(fire_a),
+            str(fire_b),
+        ]
+        assert all(project["status"] == "succeeded" for project in projects)
+
+        # Check the log
+        records = logcheck.caplog.record_tuples
+        assert records[:3] == [
+            ("wildcat.batch", 20, "----- Batch -----"),
+            ("wildcat.batch", 20, "Loading batch manifest"),
+            ("wildcat.batch", 10, "    Projects: 2"),
+        ]
+        assert records[3] == (
+            "wildcat.batch",
+            20,
+            "Running 2 projects using 2 worker processes",
+        )
+        assert sorted(record[2].split(" in ")[0] for record in records[4:6]) == [
+            f"Finished {fire_a}",
+            f"Finished {fire_b}",
+        ]
+        assert records[6] == ("wildcat.batch", 20, f"Saved batch summary to {output}")
+        assert len(records) == 7
+
+    def test_failed(_, commands, manifest, tmp_path, logcheck):
+        manifest.write_text('[[projects]]\nproject = "fail"\n')
+        logcheck.start("wildcat.batch")
+        output = _batch.batch(manifest)
+
+        with open(output) as file:
+            summary = json.load(file)
+        assert summary["succeeded"] == 0
+        assert summary["failed"] == 1
+        project = summary["projects"][0]
+        assert project["status"] == "failed"
+        assert project["failed_command"] == "assess"
+        assert project["error"] == "ValueError: Could not assess"
+        assert not (tmp_path / "fail" / "export.json").exists()
+
+        records = logcheck.caplog.record_tuples
+        folder = tmp_path / "fail"
+        assert records[4] == (
+            "wildcat.batch",
+            30,
+            f"\nWARNING: Failed {folder}\nValueError: Could not assess\n",
+        )
+        assert records[-1] == (
+            "wildcat.batch",
+            30,
+            f"\nWARNING: 1 of 1 projects failed. See {output} for details.\n",
+        )
+
+    def test_crash(_, commands, manifest, monkeypatch):
+        monkeypatch.setattr(_worker, "run", _crash)
+        output = _batch.batch(manifest)
+        with open(output) as file:
+            summary = json.load(file)
+        assert summary["failed"] == 2
+        for project in summary["projects"]:
+            assert project["status"] == "failed"
+            assert project["failed_command"] is None
+            assert project["error"].startswith("BrokenProcessPool: ")
+
+    def test_crash_one(_, commands, manifest, tmp_path, monkeypatch, logcheck):
+        manifest.write_text(
+            '[[projects]]\nproject = "fire-a"\n\n'
+            '[[projects]]\nproject = "crash"\n\n'
+            '[[projects]]\nproject = "fire-b"\n'
+        )
+        monkeypatch.setattr(_worker, "run", _crash_one)
+        logcheck.start("wildcat.batch")
+        output = _batch.batch(manifest, workers=2)
+
+        with open(output) as file:
+            summary = json.load(file)
+        assert summary["succeeded"] == 2
+        assert summary["failed"] == 1
+        fire_a, crash, fire_b = summary["projects"]
+        assert fire_a["status"] == "succeeded"
+        assert fire_b["status"] == "succeeded"
+        assert crash["status"] == "failed"
+        assert crash["failed_command"] is None
+        assert crash["error"].startswith("BrokenProcessPool: ")
+        for name in ["fire-a", "fire-b"]:
+            assert (tmp_path / name / "export.json").exists()
+
+        messages = [record[2] for record in logcheck.caplog.record_tuples]
+        assert any(message.startswith("A worker process died") for message in messages)
+
+    def test_memory_limit(_, commands, manifest, tmp_path, monkeypatch):
+        manifest.write_text(
+            '[[projects]]\nproject = "fire-a"\n\n' '[[projects]]\nproject = "crash"\n'
+        )
+        monkeypatch.setattr(_worker, "initialize", _initialize)
+        monkeypatch.setattr(_worker, "import_module", lambda name: None)
+        monkeypatch.setattr(_worker, "run", _allocate)
+        output = _batch.batch(manifest, max_memory_gb=0.25)
+
+        with open(output) as file:
+            summary = json.load(file)
+        fire_a, crash = summary["projects"]
+        assert fire_a["status"] == "succeeded"
+        assert crash["status"] == "failed"
+        assert crash["error"].startswith("BrokenProcessPool: ")
+        assert (tmp_path / "fire-a" / "export.json").exists()
+
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _batch.batch("manifest.toml", workers=0)
+        errcheck(error, 'The "workers" setting must be greater than 0')
+
+    def test_windows_memory(_, monkeypatch, errcheck):
+        monkeypatch.setattr(sys, "platform", "win32")
+        with pytest.raises(ValueError) as error:
+            _batch.batch("manifest.toml", max_memory_gb=4)
+        errcheck(error, "The max_memory_gb setting is not supported on Windows")
+
+
+class TestSave:
+    def test(_, tmp_path, logcheck):
+        manifest = tmp_path / "fires.toml"
+        settings = {"workers": 3, "max_memory_gb": 4.0}
+        records = [
+            {"status": "succeeded"},
+            {"status": "failed"},
+            {"status": "succeeded"},
+        ]
+        output = _batch._save(manifest, settings, 5.5, records, logcheck.log)
+        assert output == Path(tmp_path / "fires-summary.json")
+
+        with open(output) as file:
+            summary = json.load(file)
+        assert summary["workers"] == 3
+        assert summary["max_memory_gb"] == 4.0
+        assert summary["wall_seconds"] == 5.5
+        assert summary["succeeded"] == 2
+        assert summary["failed"] == 1
+        assert summary["projects"] == records
+        logcheck.check([("INFO", f"Saved batch summary to {output}")])
@@ -0,0 +1,146 @@
+import pytest
+
+from wildcat._commands.batch import _manifest
+from wildcat.errors import ManifestError
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return tmp_path / "manifest.toml"
+
+
+def load(manifest, text):
+    manifest.write_text(text)
+    return _manifest.load(manifest)
+
+
+def check_error(manifest, text, errcheck, *strings):
+    with pytest.raises(ManifestError) as error:
+        load(manifest, text)
+    errcheck(error, *strings)
+
+
+class TestLoad:
+    def test(_, manifest, tmp_path):
+        text = (
+            "[settings]\n"
+            "I15_mm_hr = [16, 20]\n"
+            'export_crs = "base"\n'
+            "\n"
+            "[[projects]]\n"
+            'project = "fires/fire-a"\n'
+            "\n"
+            "[[projects]]\n"
+            f'project = "{tmp_path / "fire-b"}"\n'
+            "buffer_km = 2\n"
+            "export_crs = 4326\n"
+        )
+        output = load(manifest, text)
+
+        fire_a = tmp_path / "fires" / "fire-a"
+        fire_b = tmp_path / "fire-b"
+        assert output == [
+            (
+                fire_a,
+                {
+                    "preprocess": {"project": fire_a},
+                    "assess": {"project": fire_a, "I15_mm_hr": [16, 20]},
+                    "export": {"project": fire_a, "export_crs": "base"},
+                },
+            ),
+            (
+                fire_b,
+                {
+                    "preprocess": {"project": fire_b, "buffer_km": 2},
+                    "assess": {"project": fire_b, "I15_mm_hr": [16, 20]},
+                    "export": {"project": fire_b, "export_crs": 4326},
+                },
+            ),
+        ]
+
+    def test_shared_setting(_, manifest, tmp_path):
+        text = '[[projects]]\nproject = "fire"\nconfig = "alternate.py"\n'
+        output = load(manifest, text)
+        folder = tmp_path / "fire"
+        for command in ["preprocess", "assess", "export"]:
+            expected = {"project": folder, "config": "alternate.py"}
+            assert output[0][1][command] == expected
+
+    def test_missing(_, manifest, errcheck):
+        with pytest.raises(ManifestError) as error:
+            _manifest.load(manifest)
+        errcheck(error, "Could not read the batch manifest")
+
+    def test_invalid_toml(_, manifest, errcheck):
+        check_error(
+            manifest, "[[projects]\n", errcheck, "Could not parse the batch manifest"
+        )
+
+    def test_unrecognized_field(_, manifest, errcheck):
+        check_error(
+            manifest,
+            'workers = 4\n[[projects]]\nproject = "fire"\n',
+            errcheck,
+            'Unrecognized field in the batch manifest: "workers"',
+        )
+
+    def test_settings_not_table(_, manifest, errcheck):
+        check_error(
+            manifest,
+            'settings = 5\n[[projects]]\nproject = "fire"\n',
+            errcheck,
+            "The settings field of the batch manifest must be a table",
+        )
+
+    def test_unrecognized_setting(_, manifest, errcheck):
+        check_error(
+            manifest,
+            '[settings]\ninvalid = 5\n[[projects]]\nproject = "fire"\n',
+            errcheck,
+            "The settings table of the batch manifest",
+            'unrecognized setting: "invalid"',
+        )
+
+    def test_project_setting(_, manifest, errcheck):
+        check_error(
+            manifest,
+            '[settings]\nproject = "fire"\n[[projects]]\nproject = "fire"\n',
+            errcheck,
+            'The [settings] table of the batch manifest cannot include "project"',
+        )
+
+    @pytest.mark.parametrize("text", ("", "projects = []\n", "projects = 5\n"))
+    def test_no_projects(_, manifest, text, errcheck):
+        check_error(
+            manifest,
+            text,
+            errcheck,
+            "The batch manifest must include at least one [[projects]] table",
+        )
+
+    def test_project_not_table(_, manifest, errcheck):
+        check_error(
+            manifest,
+            "projects = [5]\n",
+            errcheck,
+            "The projects[0] field of the batch manifest must be a table",
+        )
+
+    def test_unrecognized_project_setting(_, manifest, errcheck):
+        check_error(
+            manifest,
+            '[[projects]]\nproject = "fire"\n[[projects]]\nproject = "b"\nbad = 1\n',
+            errcheck,
+            "The projects[1] table of the batch manifest",
+            'unrecognized setting: "bad"',
+        )
+
+    @pytest.mark.parametrize("text", ("buffer_km = 2\n", "project = 5\n"))
+    def test_invalid_project(_, manifest, text, errcheck):
+        check_error(
+            manifest,
+            f"[[projects]]\n{text}",
+            errcheck,
+            "The projects[0] table of the batch manifest",
+            'must include a "project" field',
+        )
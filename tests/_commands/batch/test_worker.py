@@ -0,0 +1,167 @@
+import os
+import resource
+import sys
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import wildcat
+from wildcat._commands.batch import _worker
+from wildcat._utils import _jit
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    "Replaces the commands with functions that record their kwargs"
+
+    calls = []
+    for command in ["preprocess", "assess", "export"]:
+        original = getattr(wildcat, command)
+
+        def fake(*, _command=command, **kwargs):
+            calls.append((_command, kwargs))
+            if kwargs.get("fail") == _command:
+                raise ValueError(f"Failed {_command}")
+            return Path(kwargs["project"]) / _command
+
+        fake = wraps(original)(fake)
+        monkeypatch.setattr(wildcat, command, fake)
+    return calls
+
+
+class TestInitialize:
+    def test(_, monkeypatch, tmp_path):
+        modules = []
+        monkeypatch.setattr(_worker, "import_module", modules.append)
+        monkeypatch.setenv(_jit.CACHE_VARIABLE, str(tmp_path))
+        threads = []
+        monkeypatch.setattr(_worker, "Thread", lambda **kwargs: threads.append(kwargs))
+
+        _worker.initialize(None)
+        assert modules == [
+            "wildcat._commands.preprocess",
+            "wildcat._commands.assess",
+            "wildcat._commands.export",
+        ]
+        assert os.environ[_jit.CACHE_VARIABLE] == str(tmp_path)
+        assert threads == []
+
+    def test_memory(_, monkeypatch, tmp_path):
+        monkeypatch.setattr(_worker, "import_module", lambda name: None)
+        monkeypatch.setenv(_jit.CACHE_VARIABLE, str(tmp_path))
+        threads = []
+
+        class Thread:
+            def __init__(self, **kwargs):
+                threads.append(kwargs)
+
+            def start(self):
+                threads.append("started")
+
+        monkeypatch.setattr(_worker, "Thread", Thread)
+        _worker.initialize(1.5)
+        assert threads == [
+            {"target": _worker._watch, "args": (int(1.5 * 1024**3),), "daemon": True},
+            "started",
+        ]
+
+
+class _Killed(Exception):
+    pass
+
+
+def _kill(status):
+    raise _Killed(status)
+
+
+class TestWatch:
+    def test(_, monkeypatch, capsys):
+        rss = iter([1, 5, 10, 11, 12])
+        sleeps = []
+        monkeypatch.setattr(_worker, "_rss", lambda: next(rss) * 1024**3)
+        monkeypatch.setattr(_worker, "sleep", sleeps.append)
+        monkeypatch.setattr(_worker.os, "_exit", _kill)
+
+        with pytest.raises(_Killed):
+            _worker._watch(10 * 1024**3)
+        assert sleeps == [_worker.POLL_SECONDS] * 3
+        assert next(rss) == 12
+        assert capsys.readouterr().err == (
+            "Killing the batch worker because its memory (11.00 GB) exceeded the "
+            "max_memory_gb limit (10.00 GB)\n"
+        )
+
+
+class TestRss:
+    @pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="Requires /proc")
+    def test(_):
+        before = _worker._rss()
+        data = np.ones(64 * 1024**2 // 8)
+        after = _worker._rss()
+        assert data.sum() > 0
+        assert after - before >= 60 * 1024**2
+
+    def test_no_proc(_, monkeypatch):
+        def missing(*args, **kwargs):
+            raise FileNotFoundError
+
+        monkeypatch.setattr(_worker, "open", missing, raising=False)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            peak = peak * 1024
+        assert _worker._rss() == peak
+
+
+class TestRun:
+    def test(_, commands, tmp_path):
+        jobs = {
+            "preprocess": {"project": tmp_path},
+            "assess": {"project": tmp_path, "I15_mm_hr": 20},
+            "export": {"project": tmp_path},
+        }
+        output = _worker.run(tmp_path, jobs)
+        assert commands == list(jobs.items())
+
+        assert output["project"] == str(tmp_path)
+        assert output["status"] == "succeeded"
+        assert output["wall_seconds"] >= 0
+        assert list(output["steps"].keys()) == ["preprocess", "assess", "export"]
+        assert output["failed_command"] is None
+        assert output["error"] is None
+
+    def test_failed(_, commands, tmp_path):
+        jobs = {
+            "preprocess": {"project": tmp_path},
+            "assess": {"project": tmp_path, "fail": "assess"},
+            "export": {"project": tmp_path},
+        }
+        output = _worker.run(tmp_path, jobs)
+        assert [command for command, _ in commands] == ["preprocess", "assess"]
+
+        assert output["status"] == "failed"
+        assert list(output["steps"].keys()) == ["preprocess", "assess"]
+        assert output["failed_command"] == "assess"
+        assert output["error"] == "ValueError: Failed assess"
+
+
+class TestRecord:
+    def test(_):
+        assert _worker.record(Path("fire")) == {
+            "project": "fire",
+            "status": "succeeded",
+            "wall_seconds": None,
+            "steps": {},
+            "failed_command": None,
+            "error": None,
+        }
+
+
+class TestFail:
+    def test(_):
+        record = _worker.record(Path("fire"))
+        _worker.fail(record, "export", TypeError("Invalid"))
+        assert record["status"] == "failed"
+        assert record["failed_command"] == "export"
+        assert record["error"] == "TypeError: Invalid"
@@ -1,3 +1,5 @@
+import json
+
 import fiona
 import pytest
 from fiona.crs import CRS
@@ -206,12 +208,14 @@ class TestExport:
         assert parameters.exists()
 
         logcheck.start("wildcat.export")
-        _export.export(locals)
+        output = _export.export(locals)
 
+        assert output == project / "exports"
         check_segments(project)
         check_basins(project)
         check_outlets(project)
         check_log(project, logcheck)
+        check_profile(project)
 
     def test_cli(
         _, project, segments, basins, outlets, config, parameters, CleanCLI, logcheck
@@ -856,6 +860,26 @@ def check_outlets(project):
     ]
 
 
+def check_profile(project):
+    with open(project / "exports" / "profile.json") as file:
+        profile = json.load(file)
+    assert profile["command"] == "export"
+    assert [step["step"] for step in profile["steps"]] == [
+        "_load.parameters",
+        "_properties.parse",
+        "_names.parse",
+        "_load.results",
+        "_load.features",
+        "_reproject.results",
+        "_reproject.features",
+        "_save.results",
+        "_save.config",
+    ]
+    for step in profile["steps"]:
+        assert step["raster_shape"] is None
+        assert step["segments"] is None
+
+
 def check_log(project, logcheck):
     assessment = project / "assessment"
     exports = project / "exports"
@@ -0,0 +1,141 @@
+import json
+import struct
+
+import pytest
+from fiona.crs import CRS as fCRS
+from pyproj import CRS
+
+from wildcat._commands.export import _arrow
+
+
+@pytest.fixture
+def pyarrow():
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def records():
+    return [
+        {
+            "geometry": {"type": "Point", "coordinates": (float(k), float(k))},
+            "properties": {"id": k, "hazard": k / 2, "name": f"outlet-{k}"},
+        }
+        for k in range(5)
+    ]
+
+
+@pytest.fixture
+def pschema():
+    return {"id": "int32", "hazard": "float", "name": "str:80"}
+
+
+class TestWrite:
+    def test(_, pyarrow, tmp_path, records, pschema):
+        import pyarrow.parquet
+
+        path = tmp_path / "outlets.parquet"
+        _arrow.write(path, iter(records), "Point", pschema, fCRS.from_epsg(4326), 2)
+
+        file = pyarrow.parquet.ParquetFile(path)
+        assert file.metadata.num_row_groups == 3
+        table = file.read()
+        assert table.column_names == ["id", "hazard", "name", "geometry"]
+        assert table.column("id").to_pylist() == [0, 1, 2, 3, 4]
+        assert table.column("hazard").to_pylist() == [0, 0.5, 1, 1.5, 2]
+        assert table.column("name").to_pylist()[0] == "outlet-0"
+        geometry = table.column("geometry").to_pylist()[1]
+        assert struct.unpack("<BIdd", geometry) == (1, 1, 1.0, 1.0)
+
+        metadata = json.loads(file.schema_arrow.metadata[b"geo"])
+        assert metadata["primary_column"] == "geometry"
+        assert metadata["columns"]["geometry"]["geometry_types"] == ["Point"]
+
+    def test_empty(_, pyarrow, tmp_path, pschema):
+        import pyarrow.parquet
+
+        path = tmp_path / "outlets.parquet"
+        _arrow.write(path, iter([]), "Point", pschema, CRS(4326), 2)
+        table = pyarrow.parquet.read_table(path)
+        assert table.num_rows == 0
+        assert table.column_names == ["id", "hazard", "name", "geometry"]
+
+
+class TestSchema:
+    def test(_, pyarrow, pschema):
+        output = _arrow._schema(pschema, "Point", CRS(4326))
+        assert output.names == ["id", "hazard", "name", "geometry"]
+        assert output.types == [
+            pyarrow.int32(),
+            pyarrow.float64(),
+            pyarrow.string(),
+            pyarrow.binary(),
+        ]
+        metadata = json.loads(output.metadata[b"geo"])
+        assert metadata == _arrow._metadata("Point", CRS(4326))
+
+
+class TestType:
+    @pytest.mark.parametrize(
+        "kind, expected",
+        (
+            ("int", "int64"),
+            ("int32", "int32"),
+            ("float", "double"),
+            ("float:24.15", "double"),
+            ("str:80", "string"),
+            ("bool", "bool"),
+            ("unknown", "string"),
+        ),
+    )
+    def test(_, pyarrow, kind, expected):
+        assert str(_arrow._type(kind)) == expected
+
+
+class TestMetadata:
+    def test(_):
+        output = _arrow._metadata("LineString", fCRS.from_epsg(26911))
+        assert output["version"] == _arrow.GEOPARQUET_VERSION
+        assert output["primary_column"] == "geometry"
+        column = output["columns"]["geometry"]
+        assert column["encoding"] == "WKB"
+        assert column["geometry_types"] == ["LineString"]
+        assert CRS.from_json_dict(column["crs"]) == CRS(26911)
+
+
+class TestBatch:
+    def test(_, pyarrow, records, pschema):
+        schema = _arrow._schema(pschema, "Point", CRS(4326))
+        output = _arrow._batch(records[:2], schema)
+        assert output.num_rows == 2
+        assert output.schema == schema
+        assert output.column(2).to_pylist() == ["outlet-0", "outlet-1"]
+
+
+class TestWkb:
+    def test_point(_):
+        geometry = {"type": "Point", "coordinates": (1.0, 2.0)}
+        output = _arrow._wkb(geometry)
+        assert output == struct.pack("<BIdd", 1, 1, 1, 2)
+
+    def test_linestring(_):
+        geometry = {"type": "LineString", "coordinates": [(1, 2), (3, 4)]}
+        output = _arrow._wkb(geometry)
+        assert output == struct.pack("<BII4d", 1, 2, 2, 1, 2, 3, 4)
+
+    def test_polygon(_):
+        ring = [(0, 0), (1, 0), (0, 1), (0, 0)]
+        geometry = {"type": "Polygon", "coordinates": [ring, ring]}
+        output = _arrow._wkb(geometry)
+        vertices = [0, 0, 1, 0, 0, 1, 0, 0]
+        expected = struct.pack("<BII", 1, 3, 2)
+        expected += 2 * struct.pack("<I8d", 4, *vertices)
+        assert output == expected
+
+
+class TestVertices:
+    def test(_):
+        output = _arrow._vertices([(1, 2), (3, 4, 5)])
+        assert output == struct.pack("<4d", 1, 2, 3, 4)
+
+    def test_empty(_):
+        assert _arrow._vertices([]) == b""
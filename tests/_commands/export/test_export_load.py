@@ -77,12 +77,17 @@ class TestParameters:
         logcheck.check([("INFO", "Loading assessment parameters")])
 
 
-class TestGeojson:
+class TestStream:
     def test(_, fsegments, segments):
-        with fiona.open(fsegments) as file:
-            output = list(file)
-        output = _load._geojson(output)
-        assert output == segments
+        output = _load._stream(fsegments)
+        assert not isinstance(output, list)
+        assert list(output) == segments
+
+    def test_lazy(_, fsegments):
+        output = _load._stream(fsegments)
+        fsegments.unlink()
+        with pytest.raises(fiona.errors.DriverError):
+            next(output)
 
 
 class TestSegments:
@@ -90,7 +95,7 @@ class TestSegments:
         fsegments.unlink()
         with pytest.raises(FileNotFoundError) as error:
             _load._segments(assessment, logcheck.log)
-        errcheck(error, "Could not locate the segments.geojson file for the assessment")
+        errcheck(error, "Could not locate the saved segments file for the assessment")
 
     def test_folder(_, assessment, fsegments, errcheck, logcheck):
         fsegments.unlink()
@@ -119,13 +124,30 @@ class TestSegments:
                 "ConfAngle": "float",
             },
         }
-        assert output == segments
+        assert list(output) == segments
         logcheck.check(
             [
                 ("DEBUG", "    Loading segments"),
             ]
         )
 
+    @pytest.mark.parametrize("driver, ext", (("FlatGeobuf", ".fgb"), ("GPKG", ".gpkg")))
+    def test_binary(_, assessment, fsegments, segments, driver, ext, logcheck):
+        with fiona.open(fsegments) as source:
+            meta = source.meta | {"driver": driver}
+            records = list(source)
+        fsegments.unlink()
+        with fiona.open(assessment / f"segments{ext}", "w", **meta) as file:
+            file.writerecords(records)
+
+        crs, schema, output = _load._segments(assessment, logcheck.log)
+        assert crs == 4326
+        assert schema["geometry"] == "LineString"
+        output = list(output)
+        for feature, expected in zip(output, segments, strict=True):
+            assert feature["properties"] == expected["properties"]
+            assert feature["geometry"] == expected["geometry"]
+
 
 class TestFeatures:
     def test_not_exist(_, assessment, logcheck):
@@ -151,7 +173,7 @@ class TestFeatures:
 
     def test_valid(_, assessment, fbasins, basins, logcheck):
         output = _load._features(assessment, fbasins.stem, logcheck.log)
-        assert output == basins
+        assert list(output) == basins
         logcheck.check([("DEBUG", "    Loading basins")])
 
 
@@ -175,9 +197,9 @@ class TestResults:
                 "ConfAngle": "float",
             },
         }
-        assert out_segments == segments
-        assert out_basins == basins
-        assert out_outlets == outlets
+        assert list(out_segments) == segments
+        assert list(out_basins) == basins
+        assert list(out_outlets) == outlets
 
         logcheck.check(
             [
@@ -1,5 +1,7 @@
+import pytest
 from fiona.crs import CRS as fCRS
-from pyproj import CRS
+from fiona.transform import transform_geom
+from pyproj import CRS, Transformer
 
 from wildcat._commands.export import _reproject
 
@@ -8,11 +10,12 @@ class TestFeatures:
     def test_segments(_, outlets, logcheck):
         iCRS = CRS(26911)
         fCRS = CRS(4326)
-        _reproject._features(outlets, "outlets", iCRS, fCRS, logcheck.log)
+        outlets = _reproject._features(outlets, "outlets", iCRS, fCRS, logcheck.log)
+        outlets = list(outlets)
 
         # Round to 8 digits for machine precision
         for outlet in outlets:
-            geometry = outlet["geometry"].__geo_interface__
+            geometry = outlet["geometry"]
             coords = tuple(round(coord, ndigits=8) for coord in geometry["coordinates"])
             geometry["coordinates"] = coords
             outlet["geometry"] = geometry
@@ -59,11 +62,68 @@ class TestFeatures:
         outlets = None
         iCRS = CRS(26911)
         fCRS = CRS(4326)
-        _reproject._features(outlets, "outlets", iCRS, fCRS, logcheck.log)
-        assert outlets is None
+        output = _reproject._features(outlets, "outlets", iCRS, fCRS, logcheck.log)
+        assert output is None
         logcheck.check([])
 
 
+class TestTransformer:
+    def test(_):
+        output = _reproject._transformer(CRS(26911), CRS(4326))
+        assert isinstance(output, Transformer)
+        assert _reproject._transformer(CRS(26911), CRS(4326)) is output
+
+
+class TestReproject:
+    def test_chunks(_, segments, monkeypatch):
+        monkeypatch.setattr(_reproject, "CHUNK_SIZE", 3)
+        transformer = _reproject._transformer(CRS(26911), CRS(4326))
+        expected = [
+            transform_geom(26911, 4326, segment["geometry"]) for segment in segments
+        ]
+
+        features = iter(segments)
+        output = _reproject._reproject(features, transformer)
+        assert next(output)["geometry"]["type"] == "LineString"
+        assert len(list(features)) == 1
+        output = list(output)
+        assert len(output) == 2
+        for feature, geometry in zip(segments[1:3], expected[1:3]):
+            for vertex, point in zip(
+                feature["geometry"]["coordinates"], geometry["coordinates"]
+            ):
+                assert vertex == pytest.approx(point[:2])
+
+
+class TestChunk:
+    def test_z(_):
+        features = [
+            {"geometry": {"type": "Point", "coordinates": (500000.0, 0.0, 5.0)}},
+            {"geometry": {"type": "Point", "coordinates": ()}},
+        ]
+        transformer = _reproject._transformer(CRS(26911), CRS(4326))
+        _reproject._chunk(features, transformer)
+        x, y, z = features[0]["geometry"]["coordinates"]
+        assert (round(x, 8), round(y, 8), z) == (-117.0, 0.0, 5.0)
+        assert features[1]["geometry"] == {"type": "Point", "coordinates": ()}
+
+
+class TestVertices:
+    def test(_):
+        vertices = []
+        coordinates = [[(1, 2), (3, 4)], [(5, 6, 7)], []]
+        _reproject._vertices(coordinates, vertices)
+        assert vertices == [(1, 2), (3, 4), (5, 6, 7)]
+
+
+class TestRebuild:
+    def test(_):
+        coordinates = [[(1, 2), (3, 4)], [(5, 6, 7)], []]
+        transformed = iter([(10, 20), (30, 40), (50, 60)])
+        output = _reproject._rebuild(coordinates, transformed)
+        assert output == [[(10, 20), (30, 40)], [(50, 60, 7)], []]
+
+
 class TestResults:
     def test_no_crs(_, config, logcheck):
         results = 1, 2, 3, 4, 5
@@ -91,6 +151,7 @@ class TestResults:
         )
         assert fcrs == CRS(4326)
         assert out_schema == schema
+        segments, basins, outlets = list(segments), list(basins), list(outlets)
         assert segments != basins
         assert segments != outlets
         assert basins != outlets
@@ -127,6 +188,7 @@ class TestResults:
         )
         assert fcrs == CRS(4326)
         assert out_schema == schema
+        segments, outlets = list(segments), list(outlets)
         assert segments != basins
         assert segments != outlets
         assert basins is None
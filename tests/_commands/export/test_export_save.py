@@ -160,13 +160,15 @@ class TestPropertySchema:
 
 class TestFeatures:
     def test_none(_, exports, config, logcheck):
-        _save._features(None, exports, config, crs(), logcheck.log)
+        _save._features(None, "segments", exports, config, crs(), logcheck.log)
         logcheck.check([])
 
     def test_segments(_, segments, expected_segments, exports, config, logcheck):
         names = {"Segment_ID": "id", "Area_km2": "area"}
         pschema = {"id": "int", "area": "float"}
-        _save._features(segments, exports, config, crs(), logcheck.log, names, pschema)
+        _save._features(
+            segments, "segments", exports, config, crs(), logcheck.log, names, pschema
+        )
 
         path = exports / "segments.json"
         assert path.exists()
@@ -182,7 +184,9 @@ class TestFeatures:
     def test_basins(_, basins, expected_basins, exports, config, logcheck):
         names = {"Segment_ID": "id", "Area_km2": "area"}
         pschema = {"id": "int", "area": "float"}
-        _save._features(basins, exports, config, crs(), logcheck.log, names, pschema)
+        _save._features(
+            basins, "basins", exports, config, crs(), logcheck.log, names, pschema
+        )
 
         path = exports / "basins.json"
         assert path.exists()
@@ -196,7 +200,7 @@ class TestFeatures:
         assert output[2] == expected_basins
 
     def test_outlets(_, outlets, expected_outlets, exports, config, logcheck):
-        _save._features(outlets, exports, config, crs(), logcheck.log)
+        _save._features(outlets, "outlets", exports, config, crs(), logcheck.log)
 
         path = exports / "outlets.json"
         assert path.exists()
@@ -209,11 +213,59 @@ class TestFeatures:
     def test_filename(_, segments, exports, config, logcheck):
         config["prefix"] = "fire-id-"
         config["suffix"] = "-date"
-        _save._features(segments, exports, config, crs(), logcheck.log)
+        _save._features(segments, "segments", exports, config, crs(), logcheck.log)
 
         path = exports / "fire-id-segments-date.json"
         assert path.exists()
 
+    def test_chunks(
+        _, segments, expected_segments, exports, config, logcheck, monkeypatch
+    ):
+        monkeypatch.setattr(_save, "CHUNK_SIZE", 3)
+        names = {"Segment_ID": "id", "Area_km2": "area"}
+        pschema = {"id": "int", "area": "float"}
+        features = iter(segments)
+        _save._features(
+            features, "segments", exports, config, crs(), logcheck.log, names, pschema
+        )
+
+        output = load(exports / "segments.json")
+        assert output[2] == expected_segments
+        assert next(features, None) is None
+
+    def test_empty(_, exports, config, logcheck):
+        _save._features(iter([]), "outlets", exports, config, crs(), logcheck.log)
+        output = load(exports / "outlets.json")
+        assert output[2] == []
+
+    def test_geoparquet(_, segments, exports, config, logcheck):
+        parquet = pytest.importorskip("pyarrow.parquet")
+        config["format"] = "GeoParquet"
+        names = {"Segment_ID": "id", "Area_km2": "area"}
+        pschema = {"id": "int", "area": "float"}
+        _save._features(
+            segments, "segments", exports, config, crs(), logcheck.log, names, pschema
+        )
+
+        path = exports / "segments.parquet"
+        assert path.exists()
+        table = parquet.read_table(path)
+        assert table.column_names == ["id", "area", "geometry"]
+        assert table.column("id").to_pylist() == [1, 2, 3, 4]
+
+
+class TestRecord:
+    def test(_, segments):
+        names = {"Segment_ID": "id"}
+        output = _save._record(segments[0], "LineString", names)
+        assert output == {
+            "geometry": {
+                "type": "LineString",
+                "coordinates": segments[0]["geometry"]["coordinates"],
+            },
+            "properties": {"id": 1},
+        }
+
 
 class TestResults:
     def test(
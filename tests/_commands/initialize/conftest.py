@@ -192,6 +192,18 @@ def full_config():
         "developed = [7296, 7297, 7298, 7299, 7300]\n"
         "excluded_evt = []\n"
         "\n"
+        "# Performance\n"
+        "tiled = False\n"
+        "tile_size = 2048\n"
+        "max_workers = 1\n"
+        "cache_datasets = False\n"
+        'raster_compression = "none"\n'
+        "raster_predictor = False\n"
+        'raster_layout = "striped"\n'
+        'raster_bigtiff = "if_needed"\n'
+        "raster_stack = False\n"
+        'raster_precision = "double"\n'
+        "\n"
         "\n"
         "#####\n"
         "# Assessment\n"
@@ -243,6 +255,14 @@ def full_config():
         "# Basins\n"
         "locate_basins = True\n"
         "parallelize_basins = False\n"
+        "basin_workers = None\n"
+        "\n"
+        "# Performance\n"
+        "cache_watershed = False\n"
+        "models_only = False\n"
+        'assessment_format = "geojson"\n'
+        "memory_map = False\n"
+        'watershed_precision = "double"\n'
         "\n"
         "\n"
         "#####\n"
@@ -43,6 +43,17 @@ def defaults():
         "water": [7292],
         "developed": [7296, 7297, 7298, 7299, 7300],
         "excluded_evt": [],
+        # Performance
+        "tiled": False,
+        "tile_size": 2048,
+        "max_workers": 1,
+        "cache_datasets": False,
+        "raster_compression": "none",
+        "raster_predictor": False,
+        "raster_layout": "striped",
+        "raster_bigtiff": "if_needed",
+        "raster_stack": False,
+        "raster_precision": "double",
         # Unit conversions
         "dem_per_m": 1,
         # Network delineation
@@ -68,6 +79,13 @@ def defaults():
         # Basins
         "locate_basins": True,
         "parallelize_basins": False,
+        "basin_workers": None,
+        # Performance
+        "cache_watershed": False,
+        "models_only": False,
+        "assessment_format": "geojson",
+        "memory_map": False,
+        "watershed_precision": "double",
         # Output files
         "format": "Shapefile",
         "export_crs": "WGS 84",
@@ -241,6 +259,18 @@ class TestPreprocess:
             "developed = [7296, 7297, 7298, 7299, 7300]\n"
             "excluded_evt = []\n"
             "\n"
+            "# Performance\n"
+            "tiled = False\n"
+            "tile_size = 2048\n"
+            "max_workers = 1\n"
+            "cache_datasets = False\n"
+            'raster_compression = "none"\n'
+            "raster_predictor = False\n"
+            'raster_layout = "striped"\n'
+            'raster_bigtiff = "if_needed"\n'
+            "raster_stack = False\n"
+            'raster_precision = "double"\n'
+            "\n"
         )
 
 
@@ -335,6 +365,14 @@ class TestAssess:
             "# Basins\n"
             "locate_basins = True\n"
             "parallelize_basins = False\n"
+            "basin_workers = None\n"
+            "\n"
+            "# Performance\n"
+            "cache_watershed = False\n"
+            "models_only = False\n"
+            'assessment_format = "geojson"\n'
+            "memory_map = False\n"
+            'watershed_precision = "double"\n'
             "\n"
         )
 
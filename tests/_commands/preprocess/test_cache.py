@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from pfdf.raster import Raster
+
+from wildcat._commands.preprocess import _cache
+
+
+def _write(path, text="test"):
+    with open(path, "w") as file:
+        file.write(text)
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = {}
+    for name in ["perimeter", "dem", "kf"]:
+        path = tmp_path / f"{name}.tif"
+        _write(path)
+        paths[name] = path
+    return paths
+
+
+@pytest.fixture
+def config():
+    return {"buffer_km": 3, "kf_field": None}
+
+
+@pytest.fixture
+def rasters():
+    dem = Raster.from_array(np.arange(9).reshape(3, 3), nodata=-1, crs=26911)
+    perimeter = Raster.from_array(np.ones((3, 3), bool), isbool=True, crs=26911)
+    return {"perimeter": perimeter, "dem": dem}
+
+
+class TestKeys:
+    def test(_, config, paths):
+        keys = _cache.keys(config, paths)
+        assert list(keys.keys()) == ["perimeter", "dem", "kf"]
+        assert len(set(keys.values())) == 3
+
+    def test_field(_, config, paths):
+        initial = _cache.keys(config, paths)
+        config["kf_field"] = "KFFACT"
+        keys = _cache.keys(config, paths)
+        assert keys["kf"] != initial["kf"]
+        assert keys["dem"] == initial["dem"]
+
+    def test_grid(_, config, paths):
+        initial = _cache.keys(config, paths)
+        config["buffer_km"] = 2
+        keys = _cache.keys(config, paths)
+        for name in keys:
+            assert keys[name] != initial[name]
+
+    def test_modified(_, config, paths):
+        initial = _cache.keys(config, paths)
+        _write(paths["kf"], "modified file")
+        keys = _cache.keys(config, paths)
+        assert keys["kf"] != initial["kf"]
+        assert keys["perimeter"] == initial["perimeter"]
+
+
+class TestSaveLoad:
+    def test(_, tmp_path, rasters, logcheck):
+        keys = {"perimeter": "a", "dem": "b", "kf": "c"}
+        _cache.save(tmp_path, rasters, keys, logcheck.log)
+        assert (tmp_path / ".cache" / "perimeter-a.mask.tif").exists()
+        assert (tmp_path / ".cache" / "dem-b.tif").exists()
+
+        output = _cache.load(tmp_path, keys, logcheck.log)
+        assert list(output.keys()) == ["perimeter", "dem"]
+        assert output["perimeter"].dtype == bool
+        assert output["dem"] == rasters["dem"]
+        logcheck.check(
+            [
+                ("INFO", "Caching warped datasets"),
+                ("DEBUG", "    Caching perimeter"),
+                ("DEBUG", "    Caching dem"),
+                ("INFO", "Loading cached datasets"),
+                ("DEBUG", "    Loading cached perimeter"),
+                ("DEBUG", "    Loading cached dem"),
+            ]
+        )
+
+    def test_stale(_, tmp_path, rasters, logcheck):
+        _cache.save(tmp_path, rasters, {"perimeter": "a", "dem": "b"}, logcheck.log)
+        _cache.save(tmp_path, {"dem": rasters["dem"]}, {"dem": "c"}, logcheck.log)
+        assert not (tmp_path / ".cache" / "dem-b.tif").exists()
+        assert (tmp_path / ".cache" / "dem-c.tif").exists()
+        assert (tmp_path / ".cache" / "perimeter-a.mask.tif").exists()
+
+    def test_empty(_, tmp_path, logcheck):
+        assert _cache.load(tmp_path, {"dem": "b"}, logcheck.log) == {}
+        _cache.save(tmp_path, {}, {}, logcheck.log)
+        assert not (tmp_path / ".cache").exists()
+        logcheck.check([])
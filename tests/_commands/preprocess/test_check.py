@@ -181,6 +181,43 @@ class TestDnbrScaling:
         errcheck(error, "The dNBR may not be scaled properly")
 
 
+class TestDnbrRange:
+    @pytest.mark.parametrize("min, max", ((-11, 0), (0, 11), (-500, 800)))
+    def test_valid(_, dconfig, min, max, logcheck):
+        _check.dnbr_range(dconfig, min, max, logcheck.log)
+        logcheck.check([])
+
+    def test_error(_, dconfig, errcheck, logcheck):
+        with pytest.raises(ValueError) as error:
+            _check.dnbr_range(dconfig, -0.5, 0.8, logcheck.log)
+        errcheck(error, "The dNBR may not be scaled properly")
+
+
+class TestChecksMissingKF:
+    def test_check(_, kconfig):
+        assert _check.checks_missing_kf(kconfig) == True
+
+    def test_none(_, kconfig):
+        kconfig["missing_kf_check"] = "none"
+        assert _check.checks_missing_kf(kconfig) == False
+
+    @pytest.mark.parametrize("fill", (True, 2.2, "a/file/path"))
+    def test_filling(_, fill, kconfig):
+        kconfig["kf_fill"] = fill
+        assert _check.checks_missing_kf(kconfig) == False
+
+
+class TestMissingKFRatio:
+    def test_under_threshold(_, kconfig, logcheck):
+        _check.missing_kf_ratio(kconfig, 0.01, logcheck.log)
+        logcheck.check([("DEBUG", "    Proportion of missing data: 0.01")])
+
+    def test_error(_, kconfig, errcheck, logcheck):
+        with pytest.raises(ValueError) as error:
+            _check.missing_kf_ratio(kconfig, 0.5, logcheck.log)
+        errcheck(error, "The KF-factor raster has missing data")
+
+
 class TestMissingKF:
     def test_valid(_, kconfig, logcheck):
         kf = np.ones((20, 5))
@@ -0,0 +1,232 @@
+import numpy as np
+import pytest
+import rasterio
+from pfdf.raster import Raster
+
+from wildcat._commands.preprocess import _geotiff
+
+
+@pytest.fixture
+def config():
+    return {
+        "raster_compression": "none",
+        "raster_predictor": False,
+        "raster_layout": "striped",
+        "raster_bigtiff": "if_needed",
+        "raster_precision": "double",
+    }
+
+
+@pytest.fixture
+def raster():
+    values = np.arange(600 * 500, dtype=float).reshape(600, 500)
+    return Raster.from_array(values, nodata=-1, crs=26911, transform=(10, -10, 0, 0))
+
+
+@pytest.fixture
+def mask():
+    values = np.zeros((20, 5), bool)
+    values[5:10, :] = True
+    return Raster.from_array(values, isbool=True, crs=26911, transform=(10, -10, 0, 0))
+
+
+class TestWrite:
+    def test_default(_, tmp_path, config, raster):
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, raster, config)
+        with rasterio.open(path) as file:
+            assert file.compression is None
+            assert not file.profile["tiled"]
+            assert file.nodata == -1
+        assert Raster(path) == raster
+
+    def test_compressed(_, tmp_path, config, raster):
+        config["raster_compression"] = "deflate"
+        config["raster_predictor"] = True
+        config["raster_layout"] = "tiled"
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, raster, config)
+        with rasterio.open(path) as file:
+            assert file.compression.name == "deflate"
+            assert file.profile["tiled"]
+            assert file.block_shapes[0] == (256, 256)
+        assert Raster(path) == raster
+
+    def test_cog(_, tmp_path, config, raster):
+        config["raster_compression"] = "deflate"
+        config["raster_layout"] = "cog"
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, raster, config)
+        with rasterio.open(path) as file:
+            assert file.compression.name == "deflate"
+            assert file.block_shapes[0] == (256, 256)
+            assert file.overviews(1)
+        assert not (tmp_path / "test.cog.tif").exists()
+        assert Raster(path) == raster
+
+    def test_mask(_, tmp_path, config, mask):
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, mask, config)
+        with rasterio.open(path) as file:
+            assert file.dtypes[0] == "int8"
+        output = Raster(path, isbool=True)
+        assert np.array_equal(output.values, mask.values)
+
+    def test_compact_mask(_, tmp_path, config, mask):
+        config["raster_precision"] = "compact"
+        path = tmp_path / "test.tif"
+        _geotiff.write(path, mask, config)
+        with rasterio.open(path) as file:
+            assert file.dtypes[0] == "uint8"
+            assert file.tags(1, "IMAGE_STRUCTURE")["NBITS"] == "1"
+        output = Raster(path, isbool=True)
+        assert np.array_equal(output.values, mask.values)
+
+
+class TestStack:
+    def test(_, tmp_path, config, raster):
+        dem = raster
+        small = Raster.from_array(
+            np.arange(600 * 500, dtype="int16").reshape(600, 500),
+            nodata=-1,
+            crs=26911,
+            transform=(10, -10, 0, 0),
+        )
+        perimeter = Raster.from_array(
+            np.ones((600, 500), bool),
+            isbool=True,
+            crs=26911,
+            transform=(10, -10, 0, 0),
+        )
+        path = tmp_path / "stack.tif"
+        rasters = {"perimeter": perimeter, "dem": dem, "severity": small}
+        promoted = _geotiff.stack(path, rasters, config)
+        assert promoted == ["perimeter", "severity"]
+
+        with rasterio.open(path) as file:
+            assert file.count == 3
+            assert file.interleaving.name == "band"
+            assert file.descriptions == ("perimeter", "dem", "severity")
+            assert file.dtypes[0] == "float64"
+            assert file.tags(1)["dtype"] == "int8"
+            assert file.tags(2) == {"dtype": "float64", "nodata": "-1.0"}
+            assert file.tags(3)["dtype"] == "int16"
+            assert np.array_equal(file.read(2), dem.values)
+
+
+class TestCombine:
+    def test(_, tmp_path, config, raster):
+        files = {"dem": tmp_path / "dem.tif", "mask": tmp_path / "mask.tif"}
+        _geotiff.write(files["dem"], raster, config)
+        values = np.zeros(raster.shape, bool)
+        values[100:200, :] = True
+        mask = Raster.from_array(
+            values, isbool=True, crs=26911, transform=(10, -10, 0, 0)
+        )
+        _geotiff.write(files["mask"], mask, config)
+
+        path = tmp_path / "stack.tif"
+        promoted = _geotiff.combine(path, files, config)
+        assert promoted == ["mask"]
+        assert not files["dem"].exists()
+        assert not files["mask"].exists()
+
+        with rasterio.open(path) as file:
+            assert file.descriptions == ("dem", "mask")
+            assert file.dtypes[0] == "float64"
+            assert not file.profile["tiled"]
+            assert np.array_equal(file.read(1), raster.values)
+            assert np.array_equal(file.read(2), values)
+            assert file.tags(2)["dtype"] == "int8"
+
+    def test_tiled(_, tmp_path, config, raster):
+        files = {"dem": tmp_path / "dem.tif", "dnbr": tmp_path / "dnbr.tif"}
+        for file in files.values():
+            _geotiff.write(file, raster, config)
+
+        config["raster_layout"] = "tiled"
+        path = tmp_path / "stack.tif"
+        promoted = _geotiff.combine(path, files, config)
+        assert promoted == []
+        with rasterio.open(path) as file:
+            assert file.profile["tiled"]
+            assert file.block_shapes[0] == (256, 256)
+            assert np.array_equal(file.read(2), raster.values)
+
+
+class TestOptions:
+    def test_default(_, config):
+        assert _geotiff.options(config, "float64") == {"bigtiff": "IF_NEEDED"}
+
+    def test_tiled(_, config):
+        output = _geotiff.options(config, "float64", tiled=True)
+        assert output == {
+            "bigtiff": "IF_NEEDED",
+            "tiled": True,
+            "blockxsize": 256,
+            "blockysize": 256,
+        }
+
+    @pytest.mark.parametrize(
+        "dtype, predictor", (("float32", 3), ("float64", 3), ("int8", 2))
+    )
+    def test_predictor(_, config, dtype, predictor):
+        config["raster_compression"] = "zstd"
+        config["raster_predictor"] = True
+        output = _geotiff.options(config, dtype)
+        assert output == {
+            "bigtiff": "IF_NEEDED",
+            "compress": "ZSTD",
+            "predictor": predictor,
+        }
+
+    def test_lerc(_, config):
+        config["raster_compression"] = "lerc"
+        config["raster_predictor"] = True
+        output = _geotiff.options(config, "float64")
+        assert output == {"bigtiff": "IF_NEEDED", "compress": "LERC"}
+
+    def test_cog(_, config):
+        config["raster_compression"] = "zstd"
+        config["raster_layout"] = "cog"
+        output = _geotiff.options(config, "float64")
+        assert output == {
+            "tiled": True,
+            "blockxsize": 256,
+            "blockysize": 256,
+            "bigtiff": "IF_SAFER",
+        }
+
+
+class TestStorage:
+    def test_numeric(_, config, raster):
+        assert _geotiff.storage(raster, config) == ("float64", -1)
+
+    def test_bool(_, config, mask):
+        dtype, nodata = _geotiff.storage(mask, config)
+        assert dtype == "int8"
+        assert nodata == 0
+        assert isinstance(nodata, int)
+
+    def test_compact_bool(_, config, mask):
+        config["raster_precision"] = "compact"
+        dtype, _ = _geotiff.storage(mask, config)
+        assert dtype == "uint8"
+
+
+class TestNbits:
+    def test_double(_, config, mask):
+        assert _geotiff.nbits(mask, config) is None
+
+    def test_compact_mask(_, config, mask):
+        config["raster_precision"] = "compact"
+        assert _geotiff.nbits(mask, config) == 1
+
+    def test_compact_numeric(_, config, raster):
+        config["raster_precision"] = "compact"
+        assert _geotiff.nbits(raster, config) is None
+
+    def test_cog(_, config, mask):
+        config["raster_precision"] = "compact"
+        config["raster_layout"] = "cog"
+        assert _geotiff.nbits(mask, config) is None
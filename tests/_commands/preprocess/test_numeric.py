@@ -3,6 +3,7 @@ import pytest
 from pfdf.raster import Raster
 
 from wildcat._commands.preprocess import _numeric
+from wildcat._utils import _constants
 
 
 @pytest.fixture
@@ -41,6 +42,12 @@ class TestConstrainDnbr:
         assert np.min(data) == -2000
         assert np.max(data) == 2000
 
+    def test_constant(_, dconfig, drasters, logcheck):
+        drasters["dnbr"] = _constants.raster(5000, drasters["dnbr"], "dnbr")
+        _numeric.constrain_dnbr(dconfig, drasters, logcheck.log)
+        assert _constants.value(drasters["dnbr"]) == 2000
+        assert drasters["dnbr"].shape == (20, 5)
+
 
 @pytest.fixture
 def kconfig():
@@ -82,6 +89,11 @@ class TestConstrainKf:
         data = kf.values[kf.data_mask]
         assert np.min(data) == 5
 
+    def test_positive_constant(_, kconfig, krasters, logcheck):
+        krasters["kf"] = _constants.raster(5, krasters["kf"], "kf")
+        _numeric.constrain_kf(kconfig, krasters, logcheck.log)
+        assert _constants.value(krasters["kf"]) == 5
+
 
 class TestFillMissingKf:
     def test_disabled(_, kconfig, krasters, logcheck):
@@ -95,6 +107,12 @@ class TestFillMissingKf:
         _numeric.fill_missing_kf(kconfig, krasters, logcheck.log)
         logcheck.check([])
 
+    def test_constant(_, kconfig, krasters, logcheck):
+        krasters["kf"] = _constants.raster(5, krasters["kf"], "kf")
+        _numeric.fill_missing_kf(kconfig, krasters, logcheck.log)
+        assert _constants.value(krasters["kf"]) == 5
+        logcheck.check([])
+
     def test_median(_, kconfig, krasters, logcheck):
         _numeric.fill_missing_kf(kconfig, krasters, logcheck.log)
         assert krasters["kf"].values[0, 4] == 2.5
@@ -344,3 +362,29 @@ class TestBuildEVTMasks:
                 ("DEBUG", '    Merging developed mask with "isdeveloped" file'),
             ]
         )
+
+
+class TestCompactRasters:
+    def test_disabled(_, logcheck):
+        rasters = {"dem": Raster.from_array(np.ones((2, 2)))}
+        _numeric.compact_rasters({"raster_precision": "double"}, rasters, logcheck.log)
+        assert rasters["dem"].dtype == "float64"
+        logcheck.check([])
+
+    def test_compact(_, logcheck):
+        rasters = {
+            "dem": Raster.from_array(np.ones((2, 2))),
+            "severity": Raster.from_array(np.full((2, 2), 4)),
+            "iswater": Raster.from_array(np.ones((2, 2), bool), isbool=True),
+        }
+        _numeric.compact_rasters({"raster_precision": "compact"}, rasters, logcheck.log)
+        assert rasters["dem"].dtype == "float32"
+        assert rasters["severity"].dtype == "uint8"
+        assert rasters["iswater"].dtype == bool
+        logcheck.check(
+            [
+                ("INFO", "Converting rasters to compact data types"),
+                ("DEBUG", "    Converting dem to float32"),
+                ("DEBUG", "    Converting severity to uint8"),
+            ]
+        )
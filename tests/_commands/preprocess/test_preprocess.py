@@ -1,3 +1,4 @@
+import json
 import os
 
 import fiona
@@ -176,13 +177,15 @@ class TestPreprocess:
         assert not preprocessed.exists()
 
         logcheck.start("wildcat.preprocess")
-        _preprocess.preprocess(locals)
+        output = _preprocess.preprocess(locals)
 
+        assert output == preprocessed
         assert preprocessed.exists()
         contents = os.listdir(preprocessed)
         assert sorted(contents) == sorted(
             [
                 "configuration.txt",
+                "profile.json",
                 "perimeter.tif",
                 "dem.tif",
                 "dnbr.tif",
@@ -225,11 +228,12 @@ class TestPreprocess:
         assert sorted(contents) == sorted(
             [
                 "configuration.txt",
+                "profile.json",
                 "perimeter.tif",
                 "dem.tif",
                 "dnbr.tif",
                 "severity.tif",
-                "kf.tif",
+                "constants.json",
                 "evt.tif",
                 "retainments.tif",
                 "excluded.tif",
@@ -279,6 +283,7 @@ class TestPreprocess:
         assert sorted(contents) == sorted(
             [
                 "configuration.txt",
+                "profile.json",
                 "perimeter.tif",
                 "dem.tif",
                 "dnbr.tif",
@@ -305,6 +310,115 @@ class TestPreprocess:
         check_config(preprocessed, paths)
         check_log(logcheck, paths)
 
+    def test_workers(_, project, locals, logcheck):
+        locals["max_workers"] = 4
+
+        paths = make_datasets(project)
+        preprocessed = project / "preprocessed"
+        paths["preprocessed"] = preprocessed
+        assert not preprocessed.exists()
+
+        logcheck.start("wildcat.preprocess")
+        _preprocess.preprocess(locals)
+
+        check_perimeter(preprocessed)
+        check_dem(preprocessed)
+        check_dnbr(preprocessed)
+        check_severity(preprocessed)
+        check_kf(preprocessed)
+        check_evt(preprocessed)
+        check_retainments(preprocessed)
+        check_excluded(preprocessed)
+        check_iswater(preprocessed)
+        check_isdeveloped(preprocessed)
+        check_config(preprocessed, paths, max_workers=4)
+        check_log(logcheck, paths)
+
+    def test_cache(_, project, locals, logcheck):
+        locals["cache_datasets"] = True
+
+        paths = make_datasets(project)
+        preprocessed = project / "preprocessed"
+        paths["preprocessed"] = preprocessed
+        _preprocess.preprocess(locals)
+
+        cache = preprocessed / ".cache"
+        assert len(os.listdir(cache)) == 7
+
+        # Rerun with a new numeric setting. All datasets should be reused
+        locals["dnbr_limits"] = [-2000, 2000]
+        logcheck.start("wildcat.preprocess")
+        _preprocess.preprocess(locals)
+
+        check_perimeter(preprocessed)
+        check_dem(preprocessed)
+        check_dnbr(preprocessed)
+        check_severity(preprocessed)
+        check_kf(preprocessed)
+        check_evt(preprocessed)
+        check_retainments(preprocessed)
+        check_excluded(preprocessed)
+        check_iswater(preprocessed)
+        check_isdeveloped(preprocessed)
+        check_config(preprocessed, paths, cache_datasets=True)
+
+        messages = [record[2] for record in logcheck.caplog.record_tuples]
+        assert "Loading cached datasets" in messages
+        assert "Building buffered burn perimeter" not in messages
+        assert "Loading file-based datasets" not in messages
+        assert "Caching warped datasets" not in messages
+
+    def test_tiled(_, project, locals, logcheck):
+        locals["tiled"] = True
+        locals["tile_size"] = 4
+
+        paths = make_datasets(project)
+        preprocessed = project / "preprocessed"
+        paths["preprocessed"] = preprocessed
+        assert not preprocessed.exists()
+
+        logcheck.start("wildcat.preprocess")
+        _preprocess.preprocess(locals)
+
+        assert preprocessed.exists()
+        contents = os.listdir(preprocessed)
+        assert sorted(contents) == sorted(
+            [
+                "configuration.txt",
+                "profile.json",
+                "perimeter.tif",
+                "dem.tif",
+                "dnbr.tif",
+                "severity.tif",
+                "kf.tif",
+                "evt.tif",
+                "retainments.tif",
+                "excluded.tif",
+                "iswater.tif",
+                "isdeveloped.tif",
+            ]
+        )
+
+        check_perimeter(preprocessed)
+        check_dem(preprocessed)
+        check_dnbr(preprocessed)
+        check_severity(preprocessed)
+        check_kf(preprocessed)
+        check_evt(preprocessed)
+        check_retainments(preprocessed)
+        check_excluded(preprocessed)
+        check_iswater(preprocessed)
+        check_isdeveloped(preprocessed)
+        check_config(preprocessed, paths, tiled=True, tile_size=4)
+
+        messages = [record[2] for record in logcheck.caplog.record_tuples]
+        assert "Locating DEM grid" in messages
+        assert "    Grid shape: 9 x 8 pixels" in messages
+        assert "    Number of tiles: 6" in messages
+        assert "Checking dNBR scaling" in messages
+        assert "    Median KF-factor fill value: 1.1" in messages
+        assert "Preprocessing and saving tiles" in messages
+
 
 def _check_raster(preprocessed, name):
     raster = Raster(preprocessed / f"{name}.tif")
@@ -362,9 +476,9 @@ def check_kf(preprocessed):
 
 
 def check_kf_constant(preprocessed):
-    kf = _check_raster(preprocessed, "kf")
-    expected = np.full((9, 8), 5)
-    assert np.array_equal(kf.values, expected)
+    assert not (preprocessed / "kf.tif").exists()
+    with open(preprocessed / "constants.json") as file:
+        assert json.load(file) == {"kf": 5}
 
 
 def check_evt(preprocessed):
@@ -412,7 +526,16 @@ def check_isdeveloped(preprocessed):
     assert np.array_equal(mask.values, expected)
 
 
-def check_config(preprocessed, paths):
+def check_config(
+    preprocessed,
+    paths,
+    tiled=False,
+    tile_size=2048,
+    max_workers=1,
+    cache_datasets=False,
+    raster_compression="none",
+    raster_layout="striped",
+):
     path = preprocessed / "configuration.txt"
     with open(path) as file:
         text = file.read()
@@ -470,11 +593,32 @@ def check_config(preprocessed, paths):
         "# EVT masks\n"
         "water = [7292]\n"
         "developed = [7296, 7297, 7298, 7299, 7300]\n"
-        "excluded_evt = [5, 7]\n\n"
+        "excluded_evt = [5, 7]\n"
+        "\n"
+        "# Performance\n"
+        f"tiled = {tiled}\n"
+        f"tile_size = {tile_size}\n"
+        f"max_workers = {max_workers}\n"
+        f"cache_datasets = {cache_datasets}\n"
+        f'raster_compression = "{raster_compression}"\n'
+        "raster_predictor = False\n"
+        f'raster_layout = "{raster_layout}"\n'
+        'raster_bigtiff = "if_needed"\n'
+        "raster_stack = False\n"
+        'raster_precision = "double"\n\n'
     )
 
 
-def check_config_constant(preprocessed, paths):
+def check_config_constant(
+    preprocessed,
+    paths,
+    tiled=False,
+    tile_size=2048,
+    max_workers=1,
+    cache_datasets=False,
+    raster_compression="none",
+    raster_layout="striped",
+):
     path = preprocessed / "configuration.txt"
     with open(path) as file:
         text = file.read()
@@ -531,7 +675,19 @@ def check_config_constant(preprocessed, paths):
         "# EVT masks\n"
         "water = [7292]\n"
         "developed = [7296, 7297, 7298, 7299, 7300]\n"
-        "excluded_evt = [5, 7]\n\n"
+        "excluded_evt = [5, 7]\n"
+        "\n"
+        "# Performance\n"
+        f"tiled = {tiled}\n"
+        f"tile_size = {tile_size}\n"
+        f"max_workers = {max_workers}\n"
+        f"cache_datasets = {cache_datasets}\n"
+        f'raster_compression = "{raster_compression}"\n'
+        "raster_predictor = False\n"
+        f'raster_layout = "{raster_layout}"\n'
+        'raster_bigtiff = "if_needed"\n'
+        "raster_stack = False\n"
+        'raster_precision = "double"\n\n'
     )
 
 
@@ -570,20 +726,14 @@ def check_log(logcheck, paths):
             ("DEBUG", "    Loading evt"),
             ("DEBUG", "    Loading retainments"),
             ("DEBUG", "    Loading excluded"),
-            ("INFO", "Reprojecting rasters to match the DEM"),
-            ("DEBUG", "    Reprojecting perimeter"),
-            ("DEBUG", "    Reprojecting dnbr"),
-            ("DEBUG", "    Reprojecting kf"),
-            ("DEBUG", "    Reprojecting evt"),
-            ("DEBUG", "    Reprojecting retainments"),
-            ("DEBUG", "    Reprojecting excluded"),
-            ("INFO", "Clipping rasters to the buffered perimeter"),
-            ("DEBUG", "    Clipping dem"),
-            ("DEBUG", "    Clipping dnbr"),
-            ("DEBUG", "    Clipping kf"),
-            ("DEBUG", "    Clipping evt"),
-            ("DEBUG", "    Clipping retainments"),
-            ("DEBUG", "    Clipping excluded"),
+            ("INFO", "Warping rasters to the DEM grid in the buffered perimeter"),
+            ("DEBUG", "    Warping perimeter"),
+            ("DEBUG", "    Warping dem"),
+            ("DEBUG", "    Warping dnbr"),
+            ("DEBUG", "    Warping kf"),
+            ("DEBUG", "    Warping evt"),
+            ("DEBUG", "    Warping retainments"),
+            ("DEBUG", "    Warping excluded"),
             ("INFO", "Checking dNBR scaling"),
             ("INFO", "Constraining dNBR data range"),
             ("INFO", "Estimating severity from dNBR"),
@@ -645,18 +795,13 @@ def check_log_constant(logcheck, paths):
             ("DEBUG", "    Loading evt"),
             ("DEBUG", "    Loading retainments"),
             ("DEBUG", "    Loading excluded"),
-            ("INFO", "Reprojecting rasters to match the DEM"),
-            ("DEBUG", "    Reprojecting perimeter"),
-            ("DEBUG", "    Reprojecting dnbr"),
-            ("DEBUG", "    Reprojecting evt"),
-            ("DEBUG", "    Reprojecting retainments"),
-            ("DEBUG", "    Reprojecting excluded"),
-            ("INFO", "Clipping rasters to the buffered perimeter"),
-            ("DEBUG", "    Clipping dem"),
-            ("DEBUG", "    Clipping dnbr"),
-            ("DEBUG", "    Clipping evt"),
-            ("DEBUG", "    Clipping retainments"),
-            ("DEBUG", "    Clipping excluded"),
+            ("INFO", "Warping rasters to the DEM grid in the buffered perimeter"),
+            ("DEBUG", "    Warping perimeter"),
+            ("DEBUG", "    Warping dem"),
+            ("DEBUG", "    Warping dnbr"),
+            ("DEBUG", "    Warping evt"),
+            ("DEBUG", "    Warping retainments"),
+            ("DEBUG", "    Warping excluded"),
             ("INFO", "Building constant-valued rasters"),
             ("DEBUG", "    Building kf"),
             ("INFO", "Checking dNBR scaling"),
@@ -9,6 +9,8 @@ from pfdf.errors import NoOverlapError, NoOverlappingFeaturesError
 from pfdf.projection import CRS, BoundingBox
 from pfdf.raster import Raster
 from rasterio.errors import NotGeoreferencedWarning
+from rasterio.transform import Affine
+from rasterio.windows import Window
 
 from wildcat._commands.preprocess import _load
 from wildcat.errors import GeoreferencingError
@@ -236,6 +238,37 @@ class TestDEM:
         )
 
 
+class TestDEMGrid:
+    def test_valid(_, pdem, perimeter, logcheck):
+        paths = {"dem": pdem}
+        grid = _load.dem_grid(paths, perimeter, logcheck.log)
+        assert grid["window"] == Window(2, 2, 3, 5)
+        assert grid["height"] == 5
+        assert grid["width"] == 3
+        assert grid["nodata"] == -999
+        assert grid["dtype"] == "float64"
+        assert CRS(grid["crs"]) == CRS(26911)
+        assert grid["transform"] == Affine(10, 0, 20, 0, -10, 80)
+        logcheck.check(
+            [
+                ("INFO", "Locating DEM grid"),
+                ("DEBUG", "    Grid shape: 5 x 3 pixels"),
+            ]
+        )
+
+    def test_no_transform(_, tmp_path, dem_no_georef, perimeter, errcheck, logcheck):
+        dem = dem_no_georef
+        dem.crs = 26911
+        path = Path(tmp_path) / "dem.tif"
+        with warnings.catch_warnings(action="ignore", category=NotGeoreferencedWarning):
+            dem.save(path)
+
+        paths = {"dem": path}
+        with pytest.raises(GeoreferencingError) as error:
+            _load.dem_grid(paths, perimeter, logcheck.log)
+        errcheck(error, "The input DEM does not have an affine transform.")
+
+
 class TestConstants:
     def test_none(_, config, logcheck):
         for name in ["kf", "dnbr", "severity"]:
@@ -7,6 +7,7 @@ from pfdf.raster import Raster
 import wildcat._utils._paths.preprocess as _paths
 from wildcat import version
 from wildcat._commands.preprocess import _save
+from wildcat._utils import _constants, _stack
 
 
 @pytest.fixture
@@ -56,19 +57,30 @@ def config():
         "water": 7292,
         "developed": [7296, 7297, 7298, 7299],
         "excluded_evt": [],
+        # Performance
+        "tiled": False,
+        "tile_size": 2048,
+        "max_workers": 1,
+        "cache_datasets": False,
+        "raster_compression": "none",
+        "raster_predictor": False,
+        "raster_layout": "striped",
+        "raster_bigtiff": "if_needed",
+        "raster_stack": False,
+        "raster_precision": "double",
     }
     return datasets | config
 
 
 class TestRasters:
-    def test(_, outputs, raster, logcheck):
+    def test(_, outputs, raster, config, logcheck):
         perimeter = outputs / "perimeter.tif"
         dem = outputs / "dem.tif"
         rasters = {"perimeter": raster, "dem": raster}
 
         assert not perimeter.exists()
         assert not dem.exists()
-        _save.rasters(outputs, rasters, logcheck.log)
+        _save.rasters(outputs, rasters, config, logcheck.log)
         assert perimeter.exists()
         assert dem.exists()
 
@@ -80,7 +92,7 @@ class TestRasters:
             ]
         )
 
-    def test_overwrite(_, outputs, raster, logcheck):
+    def test_overwrite(_, outputs, raster, config, logcheck):
         with open(outputs / "perimeter.tif", "w") as file:
             file.write("a text file")
         with open(outputs / "dem.tif", "w") as file:
@@ -90,7 +102,7 @@ class TestRasters:
         dem = outputs / "dem.tif"
         rasters = {"perimeter": raster, "dem": raster}
 
-        _save.rasters(outputs, rasters, logcheck.log)
+        _save.rasters(outputs, rasters, config, logcheck.log)
         assert perimeter.exists()
         assert dem.exists()
         Raster(perimeter)
@@ -104,6 +116,55 @@ class TestRasters:
             ]
         )
 
+    def test_stack(_, outputs, raster, config, logcheck):
+        with open(outputs / "dem.tif", "w") as file:
+            file.write("an outdated file")
+
+        config["raster_stack"] = True
+        rasters = {"perimeter": raster, "dem": raster}
+        _save.rasters(outputs, rasters, config, logcheck.log)
+        assert (outputs / "stack.tif").exists()
+        assert not (outputs / "perimeter.tif").exists()
+        assert not (outputs / "dem.tif").exists()
+        assert _stack.bands(outputs / "stack.tif") == ["perimeter", "dem"]
+
+    def test_remove_stack(_, outputs, raster, config, logcheck):
+        with open(outputs / "stack.tif", "w") as file:
+            file.write("an outdated file")
+
+        rasters = {"perimeter": raster, "dem": raster}
+        _save.rasters(outputs, rasters, config, logcheck.log)
+        assert not (outputs / "stack.tif").exists()
+        assert (outputs / "perimeter.tif").exists()
+
+    def test_constants(_, outputs, raster, config, logcheck):
+        with open(outputs / "kf.tif", "w") as file:
+            file.write("an outdated file")
+
+        kf = _constants.raster(5, raster, "kf")
+        rasters = {"perimeter": raster, "dem": raster, "kf": kf}
+        _save.rasters(outputs, rasters, config, logcheck.log)
+        assert (outputs / "dem.tif").exists()
+        assert not (outputs / "kf.tif").exists()
+        assert _constants.load(outputs) == {"kf": 5}
+        assert "kf" in rasters
+
+        logcheck.check(
+            [
+                ("INFO", "Saving preprocessed rasters"),
+                ("DEBUG", "    Saving perimeter"),
+                ("DEBUG", "    Saving dem"),
+                ("DEBUG", "    Saving kf"),
+            ]
+        )
+
+    def test_remove_constants(_, outputs, raster, config, logcheck):
+        _constants.save(outputs, {"kf": 5})
+        rasters = {"perimeter": raster, "dem": raster, "kf": raster}
+        _save.rasters(outputs, rasters, config, logcheck.log)
+        assert not (outputs / "constants.json").exists()
+        assert (outputs / "kf.tif").exists()
+
 
 class TestConfig:
     def test(_, outputs, config, paths, outtext, logcheck):
@@ -160,7 +221,19 @@ class TestConfig:
             "# EVT masks\n"
             "water = 7292\n"
             "developed = [7296, 7297, 7298, 7299]\n"
-            "excluded_evt = []\n\n"
+            "excluded_evt = []\n"
+            "\n"
+            "# Performance\n"
+            "tiled = False\n"
+            "tile_size = 2048\n"
+            "max_workers = 1\n"
+            "cache_datasets = False\n"
+            'raster_compression = "none"\n'
+            "raster_predictor = False\n"
+            'raster_layout = "striped"\n'
+            'raster_bigtiff = "if_needed"\n'
+            "raster_stack = False\n"
+            'raster_precision = "double"\n\n'
         )
 
     def test_kf_fill_file(_, outputs, config, paths, outtext, logcheck):
@@ -225,5 +298,17 @@ class TestConfig:
             "# EVT masks\n"
             "water = 7292\n"
             "developed = [7296, 7297, 7298, 7299]\n"
-            "excluded_evt = []\n\n"
+            "excluded_evt = []\n"
+            "\n"
+            "# Performance\n"
+            "tiled = False\n"
+            "tile_size = 2048\n"
+            "max_workers = 1\n"
+            "cache_datasets = False\n"
+            'raster_compression = "none"\n'
+            "raster_predictor = False\n"
+            'raster_layout = "striped"\n'
+            'raster_bigtiff = "if_needed"\n'
+            "raster_stack = False\n"
+            'raster_precision = "double"\n\n'
         )
@@ -1,58 +1,134 @@
 import numpy as np
+import pytest
+from pfdf.projection import BoundingBox
 from pfdf.raster import Raster
+from rasterio.transform import Affine
+from rasterio.windows import Window
 
 from wildcat._commands.preprocess import _spatial
 
 
-class TestReproject:
-    def test(_, logcheck):
-        dem = Raster(np.arange(100).reshape(10, 10))
-        perimeter = Raster(np.arange(400).reshape(20, 20))
+@pytest.fixture
+def grid():
+    return {
+        "crs": 26911,
+        "transform": Affine(10, 0, 134891, 0, -10, 3880360),
+        "height": 20,
+        "width": 20,
+    }
+
+
+class TestGrid:
+    def test(_):
+        dem = Raster.from_array(
+            np.arange(100).reshape(10, 10), crs=26911, transform=(10, -10, 0, 100)
+        )
+        perimeter = Raster.from_array(
+            np.ones((5, 3), bool), crs=26911, bounds=(20, 30, 50, 80)
+        )
+        output = _spatial.grid(dem, perimeter)
+        assert output["crs"] == 26911
+        assert output["transform"] == Affine(10, 0, 20, 0, -10, 80)
+        assert output["height"] == 5
+        assert output["width"] == 3
+
+
+class TestLocate:
+    def test_aligned(_):
+        bounds = BoundingBox(20, 30, 50, 80, crs=26911)
+        transform = Affine(10, 0, 0, 0, -10, 100)
+        window, output = _spatial.locate(bounds, 26911, transform)
+        assert window == Window(2, 2, 3, 5)
+        assert output == Affine(10, 0, 20, 0, -10, 80)
+
+    def test_partial_pixels(_):
+        bounds = BoundingBox(25, 31, 49, 75, crs=26911)
+        transform = Affine(10, 0, 0, 0, -10, 100)
+        window, output = _spatial.locate(bounds, 26911, transform)
+        assert window == Window(2, 2, 3, 5)
+        assert output == Affine(10, 0, 20, 0, -10, 80)
+
+
+class TestWarp:
+    @pytest.mark.parametrize("max_workers", (1, 2))
+    def test(_, grid, max_workers, logcheck):
+        dem = Raster(np.arange(900).reshape(30, 30))
+        perimeter = Raster(np.ones((20, 20), bool), isbool=True)
         dnbr = Raster(np.arange(1000).reshape(20, 50))
 
         dem.crs = 26911
         perimeter.crs = 26910
         dnbr.crs = 4326
 
-        dem.transform = (10, -10, 134891, 3880360)
+        dem.transform = (10, -10, 134791, 3880460)
         perimeter.transform = (6, -12, 682516, 3874870)
         dnbr.transform = (9e-5, -9e-5, -121, 35)
 
-        rasters = {"dem": dem, "perimeter": perimeter, "dnbr": dnbr}
-        _spatial.reproject(rasters, logcheck.log)
+        rasters = {"perimeter": perimeter, "dem": dem, "dnbr": dnbr}
+        _spatial.warp(rasters, grid, logcheck.log, max_workers)
 
+        bounds = BoundingBox(134891, 3880160, 135091, 3880360, crs=26911)
         for raster in rasters.values():
             assert raster.crs == 26911
-            assert raster.resolution() == (10, 10)
+            assert raster.bounds == bounds
+            assert raster.shape == (20, 20)
+        assert rasters["perimeter"].dtype == bool
+        expected = np.arange(900).reshape(30, 30)[10:, 10:]
+        assert np.array_equal(rasters["dem"].values, expected)
 
         logcheck.check(
             [
-                ("INFO", "Reprojecting rasters to match the DEM"),
-                ("DEBUG", "    Reprojecting perimeter"),
-                ("DEBUG", "    Reprojecting dnbr"),
+                ("INFO", "Warping rasters to the DEM grid in the buffered perimeter"),
+                ("DEBUG", "    Warping perimeter"),
+                ("DEBUG", "    Warping dem"),
+                ("DEBUG", "    Warping dnbr"),
             ]
         )
 
+    def test_matches_reproject_and_clip(_, grid):
+        dnbr = Raster(np.arange(1000, dtype=float).reshape(20, 50), nodata=-1)
+        dnbr.crs = 26910
+        dnbr.transform = (6, -12, 682516, 3874870)
 
-class TestClip:
-    def test(_, logcheck):
-        dem = Raster(np.arange(100).reshape(10, 10))
-        perimeter = Raster(np.arange(400).reshape(20, 20))
-        dnbr = Raster(np.arange(1000).reshape(20, 50))
+        expected = dnbr.copy()
+        template = Raster.from_array(
+            np.zeros((20, 20)), crs=grid["crs"], transform=grid["transform"]
+        )
+        expected.reproject(template=template, resampling="nearest")
+        expected.clip(bounds=template)
 
-        dem.crs = 26911
-        perimeter.crs = 26911
-        dnbr.crs = 26911
+        output = _spatial._warp(dnbr, grid)
+        assert output.bounds == expected.bounds
+        assert np.array_equal(output.values, expected.values)
 
-        perimeter.transform = (10, -10, 134891, 3880360)
-        dnbr.transform = (10, -10, 134991, 3880760)
-        dem.transform = (10, -10, 134591, 3881360)
-        bounds = perimeter.bounds
-        shape = perimeter.shape
 
-        rasters = {"dem": dem, "perimeter": perimeter, "dnbr": dnbr}
-        _spatial.clip(rasters, logcheck.log)
+class TestAligned:
+    def test_aligned(_, grid):
+        raster = Raster.from_array(
+            np.zeros((5, 5)), crs=26911, transform=(10, -10, 134791, 3880460)
+        )
+        assert _spatial._aligned(raster, grid) == True
 
-        for raster in rasters.values():
-            assert raster.bounds == bounds
-            assert raster.shape == shape
+    def test_offset(_, grid):
+        raster = Raster.from_array(
+            np.zeros((5, 5)), crs=26911, transform=(10, -10, 134795, 3880460)
+        )
+        assert _spatial._aligned(raster, grid) == False
+
+    def test_resolution(_, grid):
+        raster = Raster.from_array(
+            np.zeros((5, 5)), crs=26911, transform=(5, -5, 134791, 3880460)
+        )
+        assert _spatial._aligned(raster, grid) == False
+
+    def test_crs(_, grid):
+        raster = Raster.from_array(
+            np.zeros((5, 5)), crs=26910, transform=(10, -10, 134791, 3880460)
+        )
+        assert _spatial._aligned(raster, grid) == False
+
+
+class TestBounds:
+    def test(_, grid):
+        bounds = _spatial._bounds(grid)
+        assert bounds == BoundingBox(134891, 3880160, 135091, 3880360, crs=26911)
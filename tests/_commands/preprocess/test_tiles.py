@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pfdf.errors import NoOverlapError, NoOverlappingFeaturesError
+from pfdf.raster import Raster
+from rasterio.transform import Affine
+from rasterio.windows import Window
+
+from wildcat._commands.preprocess import _tiles
+
+#####
+# Testing fixtures
+#####
+
+
+@pytest.fixture
+def pdem(tmp_path):
+    "Path to a 10 x 10 DEM file"
+    values = np.arange(100, dtype=float).reshape(10, 10)
+    dem = Raster.from_array(values, nodata=-999, crs=26911, bounds=(0, 0, 100, 100))
+    path = Path(tmp_path) / "dem.tif"
+    dem.save(path)
+    return path
+
+
+@pytest.fixture
+def grid():
+    "A 5 x 3 grid located in the center of the DEM"
+    return {
+        "window": Window(2, 2, 3, 5),
+        "crs": 26911,
+        "transform": Affine(10, 0, 20, 0, -10, 80),
+        "height": 5,
+        "width": 3,
+        "nodata": -999,
+        "dtype": "float64",
+    }
+
+
+#####
+# Grid
+#####
+
+
+class TestTiles:
+    def test_single(_, grid):
+        assert _tiles.tiles(grid, 10) == [Window(0, 0, 3, 5)]
+
+    def test_partial(_, grid):
+        assert _tiles.tiles(grid, 2) == [
+            Window(0, 0, 2, 2),
+            Window(2, 0, 1, 2),
+            Window(0, 2, 2, 2),
+            Window(2, 2, 1, 2),
+            Window(0, 4, 2, 1),
+            Window(2, 4, 1, 1),
+        ]
+
+
+class TestTransform:
+    def test(_, grid):
+        output = _tiles._transform(grid, Window(1, 2, 1, 1))
+        assert output == Affine(10, 0, 30, 0, -10, 60)
+
+
+class TestBounds:
+    def test(_, grid):
+        bounds = _tiles._bounds(grid, Window(1, 2, 1, 1))
+        assert bounds.tolist(crs=False) == [10, 30, 60, 80]
+
+
+#####
+# Checks
+#####
+
+
+def median(tmp_path, values):
+    "Writes values to a binary file and returns their median"
+    path = Path(tmp_path) / "kf.bin"
+    np.asarray(values, float).tofile(path)
+    return _tiles._median(path, len(values))
+
+
+class TestMedian:
+    @pytest.mark.parametrize("size", (999, 1000))
+    def test_refined(_, tmp_path, monkeypatch, size):
+        monkeypatch.setattr(_tiles, "_CHUNK", 10)
+        monkeypatch.setattr(_tiles, "_BINS", 4)
+        values = np.random.default_rng(0).random(size)
+        assert median(tmp_path, values) == np.median(values)
+
+    def test_repeated(_, tmp_path, monkeypatch):
+        monkeypatch.setattr(_tiles, "_CHUNK", 10)
+        values = np.repeat([0.1, 0.28, 0.3], [100, 300, 100])
+        assert median(tmp_path, values) == 0.28
+
+    def test_in_memory(_, tmp_path):
+        assert median(tmp_path, [4, 1, 3, 2]) == 2.5
+
+    def test_empty(_, tmp_path):
+        assert np.isnan(_tiles._median(Path(tmp_path) / "kf.bin", 0))
+
+
+#####
+# Tiles
+#####
+
+
+class TestDEM:
+    def test_interior(_, pdem, grid):
+        dem = _tiles._dem({"dem": pdem}, grid, Window(1, 1, 2, 2))
+        assert dem.name == "dem"
+        assert dem.nodata == -999
+        assert dem.bounds.tolist(crs=False) == [30, 50, 50, 70]
+        assert np.array_equal(dem.values, [[33, 34], [43, 44]])
+
+    def test_edge(_, pdem, grid):
+        grid["window"] = Window(8, 8, 3, 5)
+        dem = _tiles._dem({"dem": pdem}, grid, Window(0, 0, 3, 3))
+        expected = np.full((3, 3), -999.0)
+        expected[:2, :2] = [[88, 89], [98, 99]]
+        assert np.array_equal(dem.values, expected)
+
+
+#####
+# Output Files
+#####
+
+
+class TestRequireOverlap:
+    def test_valid(_):
+        paths = {"dem": Path("dem.tif"), "kf": Path("kf.shp")}
+        outputs = {"dem": None, "kf": None}
+        _tiles._require_overlap(paths, outputs)
+
+    def test_raster(_, errcheck):
+        paths = {"dem": Path("dem.tif"), "dnbr": Path("dnbr.tif")}
+        with pytest.raises(NoOverlapError) as error:
+            _tiles._require_overlap(paths, {"dem": None})
+        errcheck(error, "The dnbr dataset does not overlap the buffered fire perimeter")
+
+    def test_features(_, errcheck):
+        paths = {"dem": Path("dem.tif"), "kf": Path("kf.shp")}
+        with pytest.raises(NoOverlappingFeaturesError) as error:
+            _tiles._require_overlap(paths, {"dem": None})
+        errcheck(error, "The kf dataset does not overlap the buffered fire perimeter")
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from wildcat._commands.serve import _serve
+from wildcat._commands.serve._server import Server
+from wildcat._utils import _jit
+
+
+@pytest.fixture
+def imports(monkeypatch):
+    modules = []
+    monkeypatch.setattr(_serve, "import_module", modules.append)
+    return modules
+
+
+@pytest.fixture
+def token(monkeypatch):
+    monkeypatch.delenv(_serve.TOKEN_VARIABLE, raising=False)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    folder = tmp_path / "jit-cache"
+    monkeypatch.setenv(_jit.CACHE_VARIABLE, str(folder))
+    return folder
+
+
+class TestServe:
+    def test(_, imports, cache, token, monkeypatch, logcheck):
+        def interrupt(self):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(Server, "serve_forever", interrupt)
+        logcheck.start("wildcat.serve")
+        _serve.serve(port=0)
+
+        records = logcheck.caplog.record_tuples
+        assert records[0] == ("wildcat.serve", 20, "Starting wildcat server")
+        assert records[3][2].startswith("Job requests must include the header ")
+        assert records[4][2].startswith("Serving wildcat jobs at http://127.0.0.1:")
+        assert records[5] == ("wildcat.serve", 20, "Stopping wildcat server")
+
+    def test_invalid(_, errcheck):
+        with pytest.raises(TypeError) as error:
+            _serve.serve(host=5)
+        errcheck(error, 'The "host" setting must be a string')
+
+    def test_not_loopback(_, imports, errcheck):
+        with pytest.raises(ValueError) as error:
+            _serve.serve(host="0.0.0.0")
+        errcheck(error, 'The "host" setting must be a loopback address')
+        assert imports == []
+
+
+class TestCreate:
+    def test(_, imports, cache, monkeypatch, logcheck):
+        monkeypatch.setenv(_serve.TOKEN_VARIABLE, "test-token")
+        logcheck.start("wildcat.serve")
+        server = _serve.create("127.0.0.1", 0, logcheck.log)
+        try:
+            assert isinstance(server, Server)
+            assert server.server_address[0] == "127.0.0.1"
+            assert server.log is logcheck.log
+            assert server.token == "test-token"
+        finally:
+            server.server_close()
+
+        assert os.environ[_jit.CACHE_VARIABLE] == str(cache)
+        logcheck.check(
+            [
+                ("DEBUG", f"    JIT cache folder: {cache}"),
+                ("DEBUG", "    Importing command modules"),
+                ("DEBUG", "    Using the session token in WILDCAT_SERVE_TOKEN"),
+            ]
+        )
+
+    def test_ipv6(_, imports, cache, token, logcheck):
+        logcheck.start("wildcat.serve")
+        server = _serve.create("::1", 0, logcheck.log)
+        try:
+            assert server.server_address[0] == "::1"
+        finally:
+            server.server_close()
+
+
+class TestToken:
+    def test_environment(_, monkeypatch, logcheck):
+        monkeypatch.setenv(_serve.TOKEN_VARIABLE, "test-token")
+        logcheck.start("wildcat.serve")
+        assert _serve._token(logcheck.log) == "test-token"
+        logcheck.check(
+            [("DEBUG", "    Using the session token in WILDCAT_SERVE_TOKEN")]
+        )
+
+    def test_random(_, token, logcheck):
+        logcheck.start("wildcat.serve")
+        output = _serve._token(logcheck.log)
+        assert len(output) >= 32
+        assert output != _serve._token(logcheck.log)
+        message = logcheck.caplog.record_tuples[0]
+        assert message == (
+            "wildcat.serve",
+            20,
+            f"Job requests must include the header X-Wildcat-Token: {output}",
+        )
+
+
+class TestImports:
+    def test(_, imports, logcheck):
+        _serve._imports(logcheck.log)
+        assert imports == [
+            "wildcat._commands.preprocess",
+            "wildcat._commands.assess",
+            "wildcat._commands.export",
+        ]
+        logcheck.check([("DEBUG", "    Importing command modules")])
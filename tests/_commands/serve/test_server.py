@@ -0,0 +1,230 @@
+import json
+import logging
+from pathlib import Path
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+import wildcat
+from wildcat._commands.serve import _server
+
+
+def _export(project=None, prefix=""):
+    log = logging.getLogger("wildcat.export")
+    log.info("Exporting results")
+    log.debug("    Saving files")
+    return Path(project) / "exports"
+
+
+def _failed_export(project=None, prefix=""):
+    logging.getLogger("wildcat.export").info("Exporting results")
+    raise ValueError("Could not export")
+
+
+@pytest.fixture
+def log(logcheck):
+    logcheck.start("wildcat.serve")
+    return logcheck.log
+
+
+TOKEN = "test-token"
+HEADERS = {"X-Wildcat-Token": TOKEN, "Content-Type": "application/json"}
+
+
+@pytest.fixture
+def server(log):
+    server = _server.Server(("127.0.0.1", 0), log, TOKEN)
+    thread = Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _url(server, path):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{path}"
+
+
+def _post(server, path, body):
+    request = Request(_url(server, path), data=body, headers=HEADERS, method="POST")
+    with urlopen(request) as response:
+        assert response.status == 200
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        return [json.loads(line) for line in response.read().splitlines()]
+
+
+def _error(server, path, body=None, headers=HEADERS):
+    method = "GET" if body is None else "POST"
+    request = Request(_url(server, path), data=body, headers=headers, method=method)
+    with pytest.raises(HTTPError) as error:
+        urlopen(request)
+    return error.value.code, json.loads(error.value.read())
+
+
+class TestStatus:
+    def test(_, server):
+        with urlopen(_url(server, "/status")) as response:
+            assert response.status == 200
+            output = json.loads(response.read())
+        assert output == {
+            "wildcat": wildcat.version(),
+            "commands": ["preprocess", "assess", "export"],
+            "busy": False,
+        }
+
+    def test_busy(_, server):
+        with server.lock:
+            with urlopen(_url(server, "/status")) as response:
+                output = json.loads(response.read())
+        assert output["busy"] == True
+
+    def test_unknown(_, server):
+        code, output = _error(server, "/other")
+        assert code == 404
+        assert output == {"error": "Unknown path: /other"}
+
+
+class TestJob:
+    def test(_, server, monkeypatch, tmp_path):
+        monkeypatch.setattr(wildcat, "export", _export)
+        body = json.dumps({"project": str(tmp_path)}).encode()
+        output = _post(server, "/export", body)
+        assert output == [
+            {"type": "log", "level": "INFO", "message": "Exporting results"},
+            {"type": "log", "level": "DEBUG", "message": "    Saving files"},
+            {"type": "result", "path": str(tmp_path / "exports")},
+        ]
+
+    def test_logs(_, server, monkeypatch, tmp_path, logcheck):
+        monkeypatch.setattr(wildcat, "export", _export)
+        body = json.dumps({"project": str(tmp_path)}).encode()
+        _post(server, "/export", body)
+        records = [
+            record
+            for record in logcheck.caplog.record_tuples
+            if record[0] == "wildcat.serve" and not record[2].startswith("    ")
+        ]
+        assert records[0] == ("wildcat.serve", 20, "Running export job")
+        assert records[1][2].startswith("Finished export job in ")
+        assert len(records) == 2
+
+    def test_failed(_, server, monkeypatch, logcheck):
+        monkeypatch.setattr(wildcat, "export", _failed_export)
+        output = _post(server, "/export", b"{}")
+        assert output == [
+            {"type": "log", "level": "INFO", "message": "Exporting results"},
+            {"type": "error", "error": "ValueError", "message": "Could not export"},
+        ]
+        assert (
+            "wildcat.serve",
+            20,
+            "Failed export job: Could not export",
+        ) in logcheck.caplog.record_tuples
+
+    def test_restores_logger(_, server, monkeypatch, tmp_path):
+        monkeypatch.setattr(wildcat, "export", _export)
+        logger = logging.getLogger("wildcat.export")
+        level, handlers = logger.level, list(logger.handlers)
+        body = json.dumps({"project": str(tmp_path)}).encode()
+        _post(server, "/export", body)
+        assert logger.level == level
+        assert logger.handlers == handlers
+
+    def test_unknown_command(_, server):
+        code, output = _error(server, "/initialize", b"{}")
+        assert code == 404
+        assert output == {"error": "Unknown command: initialize"}
+
+    def test_invalid_json(_, server):
+        code, output = _error(server, "/export", b"{invalid")
+        assert code == 400
+        assert "Expecting property name" in output["error"]
+
+    def test_not_object(_, server):
+        code, output = _error(server, "/export", b"[1, 2]")
+        assert code == 400
+        assert output == {"error": "The job must be a JSON object"}
+
+    def test_invalid_kwargs(_, server, monkeypatch):
+        monkeypatch.setattr(wildcat, "export", _export)
+        code, output = _error(server, "/export", b'{"invalid": 5}')
+        assert code == 400
+        assert "invalid" in output["error"]
+
+    def test_charset(_, server, monkeypatch, tmp_path):
+        monkeypatch.setattr(wildcat, "export", _export)
+        headers = HEADERS | {"Content-Type": "application/json; charset=utf-8"}
+        body = json.dumps({"project": str(tmp_path)}).encode()
+        request = Request(_url(server, "/export"), body, headers, method="POST")
+        with urlopen(request) as response:
+            lines = response.read().splitlines()
+        assert json.loads(lines[-1]) == {
+            "type": "result",
+            "path": str(tmp_path / "exports"),
+        }
+
+
+class TestRejected:
+    def check(_, server, headers, code, message, monkeypatch):
+        called = []
+        monkeypatch.setattr(wildcat, "export", lambda **kwargs: called.append(kwargs))
+        output = _error(server, "/export", b"{}", headers)
+        assert output == (code, {"error": message})
+        assert called == []
+
+    def test_missing_token(self, server, monkeypatch):
+        headers = {"Content-Type": "application/json"}
+        message = "Missing or invalid X-Wildcat-Token header"
+        self.check(server, headers, 401, message, monkeypatch)
+
+    def test_invalid_token(self, server, monkeypatch):
+        headers = HEADERS | {"X-Wildcat-Token": "invalid"}
+        message = "Missing or invalid X-Wildcat-Token header"
+        self.check(server, headers, 401, message, monkeypatch)
+
+    def test_missing_content_type(self, server, monkeypatch):
+        headers = {"X-Wildcat-Token": TOKEN}
+        message = "Job requests must have a Content-Type of application/json"
+        self.check(server, headers, 415, message, monkeypatch)
+
+    def test_invalid_content_type(self, server, monkeypatch):
+        headers = HEADERS | {"Content-Type": "text/plain"}
+        message = "Job requests must have a Content-Type of application/json"
+        self.check(server, headers, 415, message, monkeypatch)
+
+    def test_form(self, server, monkeypatch):
+        headers = HEADERS | {"Content-Type": "application/x-www-form-urlencoded"}
+        message = "Job requests must have a Content-Type of application/json"
+        self.check(server, headers, 415, message, monkeypatch)
+
+
+class _Disconnected:
+    def write(self, data):
+        raise BrokenPipeError
+
+    def flush(self):
+        return
+
+
+class TestStream:
+    def test_write(_, tmp_path):
+        path = tmp_path / "stream.txt"
+        with open(path, "wb") as file:
+            stream = _server._Stream(file)
+            stream.write({"type": "result", "path": "test"})
+            stream.write({"type": "log", "level": "INFO", "message": "\nWARNING\n"})
+        lines = path.read_bytes().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"type": "result", "path": "test"},
+            {"type": "log", "level": "INFO", "message": "\nWARNING\n"},
+        ]
+
+    def test_disconnected(_):
+        stream = _server._Stream(_Disconnected())
+        stream.write({"type": "result", "path": "test"})
+        assert stream.connected == False
+        stream.write({"type": "result", "path": "test"})
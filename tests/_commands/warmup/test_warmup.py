@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pytest
+
+from wildcat._commands.warmup import _warmup
+from wildcat._utils import _jit
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    monkeypatch.delenv(_jit.CACHE_VARIABLE, raising=False)
+    return tmp_path / "jit-cache"
+
+
+class TestWarmup:
+    def test(_, folder, logcheck):
+        logcheck.start("wildcat.warmup")
+        _warmup.warmup(folder)
+        assert os.environ[_jit.CACHE_VARIABLE] == str(folder.resolve())
+
+        records = logcheck.caplog.record_tuples
+        assert records[:4] == [
+            ("wildcat.warmup", 20, "Warming up JIT kernels"),
+            ("wildcat.warmup", 10, f"    JIT cache folder: {folder.resolve()}"),
+            ("wildcat.warmup", 10, "    Compiling watershed kernels"),
+            ("wildcat.warmup", 10, "    Compiling stream segment kernels"),
+        ]
+        assert records[4][2].startswith("Compiled JIT kernels in ")
+        assert len(records) == 5
+
+    def test_invalid(_, errcheck):
+        with pytest.raises(TypeError) as error:
+            _warmup.warmup(5)
+        errcheck(error, 'Could not convert the "folder" setting to a file path')
+
+
+class TestDem:
+    def test(_):
+        dem = _warmup._dem()
+        assert dem.shape == (_warmup.SIZE, _warmup.SIZE)
+        assert dem.crs.to_epsg() == 26911
+
+        # Drains to the south, with a valley in the center
+        values = dem.values
+        assert np.all(np.diff(values, axis=0) < 0)
+        center = _warmup.SIZE // 2
+        assert np.all(values[:, center] == values.min(axis=1))
+
+
+class TestWatershed:
+    def test(_, logcheck):
+        dem = _warmup._dem()
+        flow, relief = _warmup._watershed(dem, logcheck.log)
+        assert flow.shape == dem.shape
+        assert relief.shape == dem.shape
+        logcheck.check([("DEBUG", "    Compiling watershed kernels")])
+
+
+class TestNetwork:
+    def test(_, logcheck):
+        dem = _warmup._dem()
+        flow, relief = _warmup._watershed(dem, logcheck.log)
+        _warmup._network(dem, flow, relief, logcheck.log)
+        logcheck.check(
+            [
+                ("DEBUG", "    Compiling watershed kernels"),
+                ("DEBUG", "    Compiling stream segment kernels"),
+            ]
+        )
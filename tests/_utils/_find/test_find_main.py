@@ -1,7 +1,10 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
+import rasterio
 
+from wildcat._utils import _paths
 from wildcat._utils._find import _main
 
 
@@ -326,6 +329,44 @@ class TestPreprocessed:
             ]
         )
 
+    def test_stack(_, config, folder, raster, logcheck):
+        names = ["perimeter", "dnbr", "severity", "kf", "iswater"]
+        stack = folder / "stack.tif"
+        with rasterio.open(
+            stack, "w", driver="GTiff", width=2, height=2, count=5, dtype="int8"
+        ) as file:
+            for band, name in enumerate(names, start=1):
+                file.write(np.zeros((2, 2), "int8"), band)
+                file.set_band_description(band, name)
+
+        # Default paths use the stack, but other paths are unchanged
+        for name in _paths.assess.all():
+            config[name] = Path(name.removesuffix("_p"))
+        config["dnbr_p"] = raster
+        config["dem_p"] = raster
+        paths = _main.preprocessed(config, folder, logcheck.log)
+        assert paths == {
+            "perimeter_p": stack,
+            "dem_p": raster,
+            "dnbr_p": raster,
+            "severity_p": stack,
+            "kf_p": stack,
+            "iswater_p": stack,
+        }
+
+    def test_constants(_, config, folder, raster, logcheck):
+        constants = folder / "constants.json"
+        constants.write_text('{"kf": 5, "dnbr": 2.5}')
+
+        # Default paths use the constants file, but other paths are unchanged
+        for name in _paths.assess.all():
+            config[name] = raster
+        config["kf_p"] = Path("kf")
+        paths = _main.preprocessed(config, folder, logcheck.log)
+        assert paths["kf_p"] == constants
+        assert paths["dnbr_p"] == raster
+        assert paths["dem_p"] == raster
+
     @pytest.mark.parametrize(
         "missing", ("perimeter_p", "dem_p", "dnbr_p", "severity_p", "kf_p")
     )
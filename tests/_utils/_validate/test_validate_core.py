@@ -156,6 +156,19 @@ class TestStrlist:
         assert config["properties"] == expected
 
 
+class TestString:
+    def test_str(_):
+        config = {"test": "Here is some text"}
+        _core.string(config, "test")
+        assert config["test"] == "Here is some text"
+
+    @pytest.mark.parametrize("value", (None, 5))
+    def test_invalid(_, value, errcheck):
+        with pytest.raises(TypeError) as error:
+            _core.string({"test": value}, "test")
+        errcheck(error, 'The "test" setting must be a string')
+
+
 class TestOptionalString:
     def test_none(_):
         config = {"test": None}
@@ -173,6 +186,31 @@ class TestOptionalString:
         errcheck(error, 'The "test" setting must be a string, or None')
 
 
+class TestLoopback:
+    @pytest.mark.parametrize(
+        "host", ("localhost", "LocalHost", "127.0.0.1", "127.0.1.1", "::1")
+    )
+    def test_valid(_, host):
+        config = {"test": host}
+        _core.loopback(config, "test")
+        assert config["test"] == host
+
+    def test_not_string(_, errcheck):
+        with pytest.raises(TypeError) as error:
+            _core.loopback({"test": 5}, "test")
+        errcheck(error, 'The "test" setting must be a string')
+
+    @pytest.mark.parametrize("host", ("0.0.0.0", "192.168.1.5", "::", "example.com"))
+    def test_not_loopback(_, host, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.loopback({"test": host}, "test")
+        errcheck(
+            error,
+            'The "test" setting must be a loopback address (such as 127.0.0.1, ::1, '
+            f'or localhost), but it is "{host}"',
+        )
+
+
 class TestOption:
     def test_invalid(_, errcheck):
         with pytest.raises(TypeError) as error:
@@ -228,6 +266,99 @@ class TestCheck:
         assert config["test"] == option.lower()
 
 
+class TestAssessmentFormat:
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.assessment_format({"test": "GeoParquet"}, "test")
+        errcheck(
+            error,
+            'The "test" setting should be one of the following strings: '
+            "geojson, flatgeobuf, gpkg",
+        )
+
+    @pytest.mark.parametrize(
+        "option, expected",
+        (("GeoJSON", "geojson"), ("flatgeobuf", "flatgeobuf"), ("GPKG", "gpkg")),
+    )
+    def test_valid(_, option, expected):
+        config = {"test": option}
+        _core.assessment_format(config, "test")
+        assert config["test"] == expected
+
+
+class TestRasterCompression:
+    def test_none(_):
+        config = {"test": None}
+        _core.raster_compression(config, "test")
+        assert config["test"] == "none"
+
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.raster_compression({"test": "lzw"}, "test")
+        errcheck(
+            error,
+            'The "test" setting should be one of the following strings: '
+            "none, deflate, zstd, lerc",
+        )
+
+    @pytest.mark.parametrize("option", ("None", "DEFLATE", "zstd", "Lerc"))
+    def test_valid(_, option):
+        config = {"test": option}
+        _core.raster_compression(config, "test")
+        assert config["test"] == option.lower()
+
+
+class TestRasterLayout:
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.raster_layout({"test": "strips"}, "test")
+        errcheck(
+            error,
+            'The "test" setting should be one of the following strings: '
+            "striped, tiled, cog",
+        )
+
+    @pytest.mark.parametrize("option", ("striped", "Tiled", "COG"))
+    def test_valid(_, option):
+        config = {"test": option}
+        _core.raster_layout(config, "test")
+        assert config["test"] == option.lower()
+
+
+class TestRasterBigtiff:
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.raster_bigtiff({"test": "sometimes"}, "test")
+        errcheck(
+            error,
+            'The "test" setting should be one of the following strings: '
+            "if_needed, if_safer, yes, no",
+        )
+
+    @pytest.mark.parametrize("option", ("IF_NEEDED", "if_safer", "Yes", "no"))
+    def test_valid(_, option):
+        config = {"test": option}
+        _core.raster_bigtiff(config, "test")
+        assert config["test"] == option.lower()
+
+
+class TestPrecision:
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.precision({"test": "single"}, "test")
+        errcheck(
+            error,
+            'The "test" setting should be one of the following strings: '
+            "double, compact",
+        )
+
+    @pytest.mark.parametrize("option", ("double", "Compact"))
+    def test_valid(_, option):
+        config = {"test": option}
+        _core.precision(config, "test")
+        assert config["test"] == option.lower()
+
+
 class TestConfigStyle:
     def test_none(_):
         config = {"test": None}
@@ -314,6 +445,23 @@ class TestPositive:
         assert config["test"] == 2
 
 
+class TestOptionalPositive:
+    def test_none(_):
+        config = {"test": None}
+        _core.optional_positive(config, "test")
+        assert config["test"] is None
+
+    def test_valid(_):
+        config = {"test": 2.5}
+        _core.optional_positive(config, "test")
+        assert config["test"] == 2.5
+
+    def test_negative(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.optional_positive({"test": -2}, "test")
+        errcheck(error, 'The "test" setting must be positive')
+
+
 class TestPositiveInteger:
     def test_invalid(_, errcheck):
         with pytest.raises(TypeError) as error:
@@ -336,6 +484,42 @@ class TestPositiveInteger:
         errcheck(error, 'The "test" setting must be an integer')
 
 
+class TestCount:
+    def test_invalid_float(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.count({"test": 2.2}, "test")
+        errcheck(error, 'The "test" setting must be an integer')
+
+    def test_zero(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.count({"test": 0}, "test")
+        errcheck(error, 'The "test" setting must be greater than 0')
+
+    def test_valid(_):
+        config = {"test": 2.0}
+        _core.count(config, "test")
+        assert config["test"] == 2
+        assert isinstance(config["test"], int)
+
+
+class TestOptionalCount:
+    def test_none(_):
+        config = {"test": None}
+        _core.optional_count(config, "test")
+        assert config["test"] is None
+
+    def test_invalid(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.optional_count({"test": 0}, "test")
+        errcheck(error, 'The "test" setting must be greater than 0')
+
+    def test_valid(_):
+        config = {"test": 2.0}
+        _core.optional_count(config, "test")
+        assert config["test"] == 2
+        assert isinstance(config["test"], int)
+
+
 class TestBounded:
     def test_invalid(_, errcheck):
         with pytest.raises(TypeError) as error:
@@ -392,6 +576,31 @@ class TestAngle:
         assert config["test"] == value
 
 
+class TestPort:
+    def test_invalid(_, errcheck):
+        with pytest.raises(TypeError) as error:
+            _core.port({"test": "invalid"}, "test")
+        errcheck(error, 'The "test" setting must be an int or a float')
+
+    @pytest.mark.parametrize("value", (-1, 65536))
+    def test_out_of_bounds(_, value, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.port({"test": value}, "test")
+        errcheck(error, 'The "test" setting must be between 0 and 65535')
+
+    def test_invalid_float(_, errcheck):
+        with pytest.raises(ValueError) as error:
+            _core.port({"test": 8910.5}, "test")
+        errcheck(error, 'The "test" setting must be an integer')
+
+    @pytest.mark.parametrize("value", (0, 8910.0, 65535))
+    def test_valid(_, value):
+        config = {"test": value}
+        _core.port(config, "test")
+        assert config["test"] == value
+        assert isinstance(config["test"], int)
+
+
 class TestVector:
     def test_valid_scalar(_):
         config = {"test": 5}
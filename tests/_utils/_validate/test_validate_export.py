@@ -50,6 +50,19 @@ class TestFileFormat:
             _export.file_format(config, "format")
         errcheck(error, 'The "format" setting must be a recognized vector file format')
 
+    def test_arrow(_, monkeypatch):
+        monkeypatch.setattr(_export, "find_spec", lambda name: object())
+        config = {"format": "geoparquet"}
+        _export.file_format(config, "format")
+        assert config["format"] == "GeoParquet"
+
+    def test_missing_pyarrow(_, monkeypatch, errcheck):
+        monkeypatch.setattr(_export, "find_spec", lambda name: None)
+        config = {"format": "GeoParquet"}
+        with pytest.raises(ImportError) as error:
+            _export.file_format(config, "format")
+        errcheck(error, 'Exporting to GeoParquet requires the optional "pyarrow"')
+
 
 class TestStrList:
     def test_none(_):
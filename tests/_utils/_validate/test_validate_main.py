@@ -3,7 +3,15 @@ from pathlib import Path
 import pytest
 from pyproj import CRS
 
-from wildcat import assess, export, initialize, preprocess
+from wildcat import (
+    assess,
+    batch,
+    export,
+    initialize,
+    preprocess,
+    serve,
+    warmup,
+)
 from wildcat._utils import _args
 from wildcat._utils._validate import _core, _main
 
@@ -53,6 +61,16 @@ def pconfig():
         "water": 7292,
         "developed": [7296, 7297, 7298, 7299],
         "excluded_evt": [],
+        "tiled": False,
+        "tile_size": 512.0,
+        "max_workers": 4,
+        "cache_datasets": True,
+        "raster_compression": "DEFLATE",
+        "raster_predictor": True,
+        "raster_layout": "COG",
+        "raster_bigtiff": "if_safer",
+        "raster_stack": False,
+        "raster_precision": "double",
     }
     for name in [
         "project",
@@ -104,6 +122,13 @@ def aconfig():
         # Basins
         "locate_basins": True,
         "parallelize_basins": False,
+        "basin_workers": 4.0,
+        # Performance
+        "cache_watershed": False,
+        "models_only": False,
+        "assessment_format": "geojson",
+        "memory_map": False,
+        "watershed_precision": "double",
     }
     for name in ["project", "config", "preprocessed", "assessment"]:
         config[name] = name
@@ -242,6 +267,17 @@ class TestPreprocess:
             "water": [7292],
             "developed": [7296, 7297, 7298, 7299],
             "excluded_evt": [],
+            # Performance
+            "tiled": False,
+            "tile_size": 512,
+            "max_workers": 4,
+            "cache_datasets": True,
+            "raster_compression": "deflate",
+            "raster_predictor": True,
+            "raster_layout": "cog",
+            "raster_bigtiff": "if_safer",
+            "raster_stack": False,
+            "raster_precision": "double",
         }
         for name in [
             "project",
@@ -312,6 +348,10 @@ class TestPreprocess:
             "estimate_severity",
             "contain_severity",
             "constrain_kf",
+            "tiled",
+            "cache_datasets",
+            "raster_predictor",
+            "raster_stack",
         ]:
             with alter(pconfig, boolean, 5):
                 with pytest.raises(TypeError) as error:
@@ -356,6 +396,23 @@ class TestPreprocess:
                     f'The "{vector}" setting must be one of the following types: list, tuple, int, float',
                 )
 
+        for count in ["tile_size", "max_workers"]:
+            with alter(pconfig, count, 0):
+                with pytest.raises(ValueError) as error:
+                    _main.preprocess(pconfig)
+                errcheck(error, f'The "{count}" setting must be greater than 0')
+
+        for option in [
+            "raster_compression",
+            "raster_layout",
+            "raster_bigtiff",
+            "raster_precision",
+        ]:
+            with alter(pconfig, option, "invalid"):
+                with pytest.raises(ValueError) as error:
+                    _main.preprocess(pconfig)
+                errcheck(error, f'The "{option}" setting should be one of')
+
     def test_all_validated(_, pconfig, errcheck):
         check_all_validated(pconfig, _main.preprocess, preprocess, errcheck)
 
@@ -389,6 +446,13 @@ class TestAssess:
             # Basins
             "locate_basins": True,
             "parallelize_basins": False,
+            "basin_workers": 4,
+            # Performance
+            "cache_watershed": False,
+            "models_only": False,
+            "assessment_format": "geojson",
+            "memory_map": False,
+            "watershed_precision": "double",
         }
         for name in ["project", "config", "preprocessed", "assessment"]:
             expected[name] = Path(name)
@@ -466,12 +530,34 @@ class TestAssess:
                 _main.assess(aconfig)
             errcheck(error, 'The "confinement_neighborhood" setting must be an integer')
 
-        for boolean in ["flow_continuous", "locate_basins", "parallelize_basins"]:
+        for boolean in [
+            "flow_continuous",
+            "locate_basins",
+            "parallelize_basins",
+            "cache_watershed",
+            "models_only",
+            "memory_map",
+        ]:
             with alter(aconfig, boolean, 5):
                 with pytest.raises(TypeError) as error:
                     _main.assess(aconfig)
                 errcheck(error, f'The "{boolean}" setting must be a bool')
 
+        with alter(aconfig, "basin_workers", 0):
+            with pytest.raises(ValueError) as error:
+                _main.assess(aconfig)
+            errcheck(error, 'The "basin_workers" setting must be greater than 0')
+
+        with alter(aconfig, "assessment_format", "shapefile"):
+            with pytest.raises(ValueError) as error:
+                _main.assess(aconfig)
+            errcheck(error, 'The "assessment_format" setting should be one of')
+
+        with alter(aconfig, "watershed_precision", "single"):
+            with pytest.raises(ValueError) as error:
+                _main.assess(aconfig)
+            errcheck(error, 'The "watershed_precision" setting should be one of')
+
         with alter(aconfig, "remove_ids", [1, 2, 3, 4.4]):
             with pytest.raises(ValueError) as error:
                 _main.assess(aconfig)
@@ -575,3 +661,82 @@ class TestExport:
 
     def test_all_validated(_, econfig, errcheck):
         check_all_validated(econfig, _main.export, export, errcheck)
+
+
+class TestWarmup:
+    def test_valid(_):
+        config = {"folder": "test"}
+        _main.warmup(config)
+        assert config == {"folder": Path("test")}
+
+    def test_none(_):
+        config = {"folder": None}
+        _main.warmup(config)
+        assert config == {"folder": None}
+
+    def test_invalid(_, errcheck):
+        config = {"folder": 5}
+        with pytest.raises(TypeError) as error:
+            _main.warmup(config)
+        errcheck(error, 'Could not convert the "folder" setting to a file path')
+
+    def test_all_validated(_, errcheck):
+        config = {"folder": Path("test")}
+        check_all_validated(config, _main.warmup, warmup, errcheck)
+
+
+class TestServe:
+    def test_valid(_):
+        config = {"host": "localhost", "port": 8000.0}
+        _main.serve(config)
+        assert config == {"host": "localhost", "port": 8000}
+        assert isinstance(config["port"], int)
+
+    def test_invalid_host(_, errcheck):
+        config = {"host": 5, "port": 8000}
+        with pytest.raises(TypeError) as error:
+            _main.serve(config)
+        errcheck(error, 'The "host" setting must be a string')
+
+    def test_not_loopback(_, errcheck):
+        config = {"host": "0.0.0.0", "port": 8000}
+        with pytest.raises(ValueError) as error:
+            _main.serve(config)
+        errcheck(error, 'The "host" setting must be a loopback address')
+
+    def test_invalid_port(_, errcheck):
+        config = {"host": "localhost", "port": 70000}
+        with pytest.raises(ValueError) as error:
+            _main.serve(config)
+        errcheck(error, 'The "port" setting must be between 0 and 65535')
+
+    def test_all_validated(_, errcheck):
+        config = {"host": "localhost", "port": 8000}
+        check_all_validated(config, _main.serve, serve, errcheck)
+
+
+class TestBatch:
+    def test_valid(_):
+        config = {"manifest": "manifest.toml", "workers": 2.0, "max_memory_gb": None}
+        _main.batch(config)
+        assert config == {
+            "manifest": Path("manifest.toml"),
+            "workers": 2,
+            "max_memory_gb": None,
+        }
+
+    def test_invalid_workers(_, errcheck):
+        config = {"manifest": "manifest.toml", "workers": 0, "max_memory_gb": None}
+        with pytest.raises(ValueError) as error:
+            _main.batch(config)
+        errcheck(error, 'The "workers" setting must be greater than 0')
+
+    def test_invalid_memory(_, errcheck):
+        config = {"manifest": "manifest.toml", "workers": 1, "max_memory_gb": -1}
+        with pytest.raises(ValueError) as error:
+            _main.batch(config)
+        errcheck(error, 'The "max_memory_gb" setting must be positive')
+
+    def test_all_validated(_, errcheck):
+        config = {"manifest": Path("manifest.toml"), "workers": 1, "max_memory_gb": 4}
+        check_all_validated(config, _main.batch, batch, errcheck)
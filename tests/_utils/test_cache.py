@@ -0,0 +1,46 @@
+import os
+
+from wildcat._utils import _cache
+
+
+def _write(path, text):
+    with open(path, "w") as file:
+        file.write(text)
+
+
+class TestFingerprint:
+    def test_file(_, tmp_path):
+        path = tmp_path / "dem.tif"
+        _write(path, "test")
+        output = _cache.fingerprint(path)
+        stat = path.stat()
+        assert output == [[str(path.resolve()), 4, stat.st_mtime_ns]]
+
+    def test_sidecars(_, tmp_path):
+        for extension in [".shp", ".dbf", ".prj"]:
+            _write(tmp_path / f"kf{extension}", "test")
+        _write(tmp_path / "other.shp", "test")
+        output = _cache.fingerprint(tmp_path / "kf.shp")
+        names = [os.path.basename(file) for file, _, _ in output]
+        assert names == ["kf.dbf", "kf.prj", "kf.shp"]
+
+    def test_modified(_, tmp_path):
+        path = tmp_path / "dem.tif"
+        _write(path, "test")
+        initial = _cache.fingerprint(path)
+        _write(path, "a longer test")
+        assert _cache.fingerprint(path) != initial
+
+    def test_missing(_, tmp_path):
+        assert _cache.fingerprint(tmp_path / "missing.tif") == []
+
+
+class TestKey:
+    def test_deterministic(_):
+        assert _cache.key("dem", [1, 2], None) == _cache.key("dem", [1, 2], None)
+
+    def test_distinct(_):
+        assert _cache.key("dem", [1, 2]) != _cache.key("dem", [1, 3])
+
+    def test_length(_):
+        assert len(_cache.key("dem")) == 32
@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+import pytest
+from pfdf.raster import Raster
+
+from wildcat._utils import _constants
+
+
+@pytest.fixture
+def template():
+    values = np.zeros((10, 8))
+    return Raster.from_array(values, crs=26911, transform=(10, -10, 0, 0))
+
+
+class TestRaster:
+    def test_int(_, template):
+        output = _constants.raster(5, template, "kf")
+        assert isinstance(output, Raster)
+        assert output.name == "kf"
+        assert output.shape == (10, 8)
+        assert output.crs == template.crs
+        assert output.transform == template.transform
+        assert np.array_equal(output.values, np.full((10, 8), 5))
+        assert output.values.strides == (0, 0)
+        assert output.nodata != 5
+
+    def test_float(_, template):
+        output = _constants.raster(2.5, template, "dnbr")
+        assert output.dtype == float
+        assert np.array_equal(output.values, np.full((10, 8), 2.5))
+        assert np.isnan(output.nodata)
+
+    def test_nodata_conflict(_, template):
+        value = np.iinfo(int).min
+        output = _constants.raster(value, template, "kf")
+        assert output.nodata == 0
+
+
+class TestValue:
+    def test_constant(_, template):
+        raster = _constants.raster(5, template, "kf")
+        output = _constants.value(raster)
+        assert output == 5
+        assert isinstance(output, int)
+
+    def test_not_constant(_, template):
+        assert _constants.value(template) is None
+
+
+class TestPath:
+    def test(_, tmp_path):
+        assert _constants.path(tmp_path) == tmp_path / "constants.json"
+
+
+class TestSave:
+    def test(_, tmp_path):
+        _constants.save(tmp_path, {"kf": 5, "dnbr": 2.5})
+        with open(tmp_path / "constants.json") as file:
+            assert json.load(file) == {"kf": 5, "dnbr": 2.5}
+
+    def test_empty(_, tmp_path):
+        path = tmp_path / "constants.json"
+        path.write_text("{}")
+        _constants.save(tmp_path, {})
+        assert not path.exists()
+
+
+class TestLoad:
+    def test(_, tmp_path):
+        _constants.save(tmp_path, {"kf": 5})
+        assert _constants.load(tmp_path) == {"kf": 5}
+
+    def test_missing(_, tmp_path):
+        assert _constants.load(tmp_path) == {}
@@ -1,6 +1,43 @@
+import json
+
+import pytest
+
 from wildcat._utils import _extensions
 
 
+@pytest.fixture(autouse=True)
+def clear_registry():
+    _extensions.registry.cache_clear()
+    yield
+    _extensions.registry.cache_clear()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "drivers.json"
+    monkeypatch.setenv(_extensions.CACHE_VARIABLE, str(path))
+    return path
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    monkeypatch.delenv(_extensions.CACHE_VARIABLE, raising=False)
+
+
+@pytest.fixture
+def fake():
+    return {
+        "versions": _extensions._versions(),
+        "raster": ["fake"],
+        "vector": ["fake-vector"],
+        "formats": {"Fake": "fake, fk"},
+    }
+
+
+def _no_build(versions):
+    raise AssertionError("The registry should not be rebuilt")
+
+
 def test_add_periods():
     a = ["a", "list", "of", "exts"]
     output = _extensions._add_periods(a)
@@ -20,3 +57,110 @@ def test_vector():
     assert ".shp" in exts
     assert ".geojson" in exts
     assert ".tif" not in exts
+
+
+def test_formats():
+    formats = _extensions.formats()
+    assert "GeoJSON" in formats
+    assert "ESRI Shapefile" in formats
+    assert "GeoParquet" in formats
+
+
+def test_from_format():
+    assert _extensions.from_format("GeoJSON") == ".json"
+    assert _extensions.from_format("ESRI Shapefile") == ".shp"
+    assert _extensions.from_format("GeoParquet") == ".parquet"
+
+
+def test_is_arrow():
+    assert _extensions.is_arrow("GeoParquet")
+    assert not _extensions.is_arrow("GeoJSON")
+
+
+class TestRegistry:
+    def test_no_cache(_, no_cache):
+        output = _extensions.registry()
+        assert list(output.keys()) == ["versions", "raster", "vector", "formats"]
+        assert output["versions"] == _extensions._versions()
+
+    def test_lazy(_, no_cache):
+        assert _extensions.registry() is _extensions.registry()
+
+    def test_save(_, cache):
+        assert not cache.exists()
+        output = _extensions.registry()
+        assert cache.exists()
+        assert json.loads(cache.read_text()) == output
+        assert list(cache.parent.iterdir()) == [cache]
+
+    def test_load(_, cache, fake, monkeypatch):
+        cache.parent.mkdir()
+        cache.write_text(json.dumps(fake))
+        monkeypatch.setattr(_extensions, "_build", _no_build)
+        assert _extensions.registry() == fake
+        assert _extensions.raster() == [".fake"]
+        assert _extensions.vector() == [".fake-vector"]
+        assert _extensions.formats() == ["Fake", "GeoParquet"]
+        assert _extensions.from_format("Fake") == "fake"
+
+    def test_outdated(_, cache, fake):
+        fake["versions"]["wildcat"] = "0.0.0"
+        cache.parent.mkdir()
+        cache.write_text(json.dumps(fake))
+        output = _extensions.registry()
+        assert output != fake
+        assert json.loads(cache.read_text()) == output
+
+
+class TestLoad:
+    def test_missing(_, tmp_path):
+        assert _extensions._load(tmp_path / "missing.json", {}) is None
+
+    def test_invalid_json(_, tmp_path):
+        path = tmp_path / "drivers.json"
+        path.write_text("invalid")
+        assert _extensions._load(path, {}) is None
+
+    def test_not_dict(_, tmp_path):
+        path = tmp_path / "drivers.json"
+        path.write_text("[1, 2, 3]")
+        assert _extensions._load(path, {}) is None
+
+    def test_versions(_, tmp_path, fake):
+        path = tmp_path / "drivers.json"
+        path.write_text(json.dumps(fake))
+        assert _extensions._load(path, fake["versions"]) == fake
+        assert _extensions._load(path, {}) is None
+
+
+class TestSave:
+    def test(_, tmp_path, fake):
+        path = tmp_path / "drivers.json"
+        _extensions._save(path, fake)
+        assert json.loads(path.read_text()) == fake
+
+    def test_failed(_, tmp_path, fake):
+        path = tmp_path / "drivers.json"
+        path.mkdir()
+        _extensions._save(path, fake)
+        assert path.is_dir()
+
+
+class TestVersions:
+    def test(_):
+        output = _extensions._versions()
+        assert list(output.keys()) == ["wildcat", "pfdf", "rasterio", "fiona"]
+        assert output["wildcat"] == _extensions.version("wildcat")
+
+    def test_missing(_, monkeypatch):
+        def missing(package):
+            raise _extensions.PackageNotFoundError(package)
+
+        monkeypatch.setattr(_extensions, "version", missing)
+        output = _extensions._versions()
+        assert output == {
+            "wildcat": None,
+            "pfdf": None,
+            "rasterio": None,
+            "fiona": None,
+        }
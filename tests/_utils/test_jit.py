@@ -0,0 +1,86 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from wildcat._utils import _jit
+
+
+@pytest.fixture(autouse=True)
+def environ(monkeypatch):
+    monkeypatch.delenv(_jit.CACHE_VARIABLE, raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.delenv("LOCALAPPDATA", raising=False)
+
+
+class _Config:
+    def __init__(self):
+        self.reloaded = False
+
+    def reload_config(self):
+        self.reloaded = True
+
+
+class TestConfigure:
+    def test_folder(_, tmp_path):
+        folder = tmp_path / "cache"
+        output = _jit.configure(folder)
+        assert output == folder.resolve()
+        assert os.environ[_jit.CACHE_VARIABLE] == str(folder.resolve())
+
+    def test_relative(_, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        output = _jit.configure("cache")
+        assert output == (tmp_path / "cache").resolve()
+
+    def test_environ(_, tmp_path, monkeypatch):
+        folder = tmp_path / "environ"
+        monkeypatch.setenv(_jit.CACHE_VARIABLE, str(folder))
+        output = _jit.configure()
+        assert output == folder.resolve()
+        assert os.environ[_jit.CACHE_VARIABLE] == str(folder.resolve())
+
+    def test_override_environ(_, tmp_path, monkeypatch):
+        monkeypatch.setenv(_jit.CACHE_VARIABLE, str(tmp_path / "environ"))
+        output = _jit.configure(tmp_path / "cache")
+        assert output == (tmp_path / "cache").resolve()
+        assert os.environ[_jit.CACHE_VARIABLE] == str(output)
+
+    def test_default(_, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        output = _jit.configure()
+        assert output == (tmp_path / "wildcat" / "numba").resolve()
+
+    def test_reload(_, tmp_path, monkeypatch):
+        config = _Config()
+        monkeypatch.setitem(sys.modules, "numba.core.config", config)
+        _jit.configure(tmp_path)
+        assert config.reloaded
+
+    def test_no_reload(_, tmp_path, monkeypatch):
+        monkeypatch.delitem(sys.modules, "numba.core.config", raising=False)
+        _jit.configure(tmp_path)
+        assert "numba.core.config" not in sys.modules
+
+
+class TestDefault:
+    def test_linux(_, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "linux")
+        assert _jit.default() == Path.home() / ".cache" / "wildcat" / "numba"
+
+    def test_xdg(_, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert _jit.default() == tmp_path / "wildcat" / "numba"
+
+    def test_windows(_, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "win32")
+        expected = Path.home() / "AppData" / "Local" / "wildcat" / "numba"
+        assert _jit.default() == expected
+
+    def test_localappdata(_, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+        assert _jit.default() == tmp_path / "wildcat" / "numba"
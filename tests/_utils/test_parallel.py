@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+from wildcat._utils import _parallel
+
+
+def _add(a, b):
+    return a + b
+
+
+class TestRun:
+    def test_serial(_):
+        threads = []
+
+        def record(value):
+            threads.append(threading.get_ident())
+            return value
+
+        output = _parallel.run(record, [(1,), (2,), (3,)], 1)
+        assert output == [1, 2, 3]
+        assert threads == [threading.get_ident()] * 3
+
+    def test_parallel(_):
+        args = [(k, k) for k in range(10)]
+        output = _parallel.run(_add, args, 4)
+        assert output == [2 * k for k in range(10)]
+
+    def test_empty(_):
+        assert _parallel.run(_add, [], 4) == []
+
+    def test_error(_):
+        def fail(value):
+            if value == 2:
+                raise ValueError("failed")
+            return value
+
+        with pytest.raises(ValueError, match="failed"):
+            _parallel.run(fail, [(1,), (2,), (3,)], 3)
@@ -0,0 +1,139 @@
+import numpy as np
+from pfdf.raster import Raster
+
+from wildcat._utils import _constants, _precision
+
+
+def raster(values, nodata=None):
+    values = np.array(values)
+    transform = (10, -10, 0, 0)
+    output = Raster.from_array(values, nodata=nodata, crs=26911, transform=transform)
+    output.name = "test"
+    return output
+
+
+class TestCompact:
+    def test_all(_):
+        rasters = {
+            "dem": raster([[1.5, 2.5]], nodata=-999),
+            "dnbr": raster([[100.4, -200.6]]),
+            "perimeter": Raster.from_array(np.ones((1, 2), bool), isbool=True),
+        }
+        output = _precision.compact(rasters)
+        assert output == ["dem", "dnbr"]
+        assert rasters["dem"].dtype == "float32"
+        assert rasters["dnbr"].dtype == "int16"
+        assert rasters["perimeter"].dtype == bool
+
+    def test_names(_):
+        rasters = {
+            "dem": raster([[1.5, 2.5]]),
+            "dnbr": raster([[100.4, -200.6]]),
+        }
+        output = _precision.compact(rasters, ["dnbr", "slopes"])
+        assert output == ["dnbr"]
+        assert rasters["dem"].dtype == "float64"
+
+    def test_already_compact(_):
+        rasters = {"dem": raster(np.ones((2, 2), "float32"))}
+        original = rasters["dem"]
+        assert _precision.compact(rasters) == []
+        assert rasters["dem"] is original
+
+
+class TestConvert:
+    def test_float(_):
+        input = raster([[1.5, -999], [2.25, 3]], nodata=-999)
+        output = _precision.convert(input, "float32")
+        assert output.dtype == "float32"
+        assert output.nodata == -999
+        assert output.name == "test"
+        assert output.crs == input.crs
+        assert output.transform == input.transform
+        assert np.array_equal(output.values, [[1.5, -999], [2.25, 3]])
+
+    def test_float_nodata_nan(_):
+        input = raster([[1.5, np.nan]], nodata=np.nan)
+        output = _precision.convert(input, "float32")
+        assert np.isnan(output.nodata)
+        assert np.array_equal(output.values, [[1.5, np.nan]], equal_nan=True)
+
+    def test_float_unrepresentable_nodata(_):
+        nodata = np.finfo("float64").min
+        input = raster([[1.5, nodata]], nodata=nodata)
+        output = _precision.convert(input, "float32")
+        assert np.isnan(output.nodata)
+        assert np.array_equal(output.values, [[1.5, np.nan]], equal_nan=True)
+
+    def test_float_nodata_collision(_):
+        # -999.00001 and -998.99999 both round to -999 as float32
+        input = raster([[-999.00001, -999, -998.99999, 5]], nodata=-999)
+        output = _precision.convert(input, "float32")
+        assert output.nodata == -999
+        assert np.array_equal(output.nodata_mask, [[False, True, False, False]])
+        values = output.values[0]
+        assert values[0] == np.nextafter(np.float32(-999), np.float32(-np.inf))
+        assert values[2] == np.nextafter(np.float32(-999), np.float32(np.inf))
+        assert np.allclose(values, input.values[0], rtol=1e-7)
+
+    def test_signed(_):
+        input = raster([[1.4, 2.6, -9999, 50000]], nodata=-9999)
+        output = _precision.convert(input, "int16")
+        assert output.dtype == "int16"
+        assert output.nodata == -32768
+        assert np.array_equal(output.values, [[1, 3, -32768, 32767]])
+
+    def test_unsigned(_):
+        input = raster([[1, 4, -1, 300]], nodata=-1)
+        output = _precision.convert(input, "uint8")
+        assert output.dtype == "uint8"
+        assert output.nodata == 255
+        assert np.array_equal(output.values, [[1, 4, 255, 254]])
+
+    def test_clip_signed(_):
+        input = raster([[-40000.0, -32768.4, 32767.6, 40000.0]])
+        output = _precision.convert(input, "int16")
+        assert np.array_equal(output.values, [[-32767, -32767, 32767, 32767]])
+        assert not output.nodata_mask.any()
+
+    def test_clip_unsigned(_):
+        input = raster([[-5.0, -0.4, 254.6, 1000.0]])
+        output = _precision.convert(input, "uint8")
+        assert np.array_equal(output.values, [[0, 0, 254, 254]])
+        assert not output.nodata_mask.any()
+
+    def test_signed_nodata_collision(_):
+        # Data values equal to the reserved NoData value are clipped to valid data
+        input = raster([[-32768, 7, -1]], nodata=-1)
+        output = _precision.convert(input, "int16")
+        assert output.nodata == -32768
+        assert np.array_equal(output.values, [[-32767, 7, -32768]])
+        assert np.array_equal(output.nodata_mask, [[False, False, True]])
+
+    def test_unsigned_nodata_collision(_):
+        input = raster([[255, 7, 0]], nodata=0)
+        output = _precision.convert(input, "uint8")
+        assert output.nodata == 255
+        assert np.array_equal(output.values, [[254, 7, 255]])
+        assert np.array_equal(output.nodata_mask, [[False, False, True]])
+
+    def test_nan_to_integer(_):
+        input = raster([[1.0, np.nan]])
+        output = _precision.convert(input, "int16")
+        assert output.nodata == -32768
+        assert np.array_equal(output.values, [[1, -32768]])
+
+    def test_no_nodata_integer(_):
+        input = raster([[7292, 7296]])
+        output = _precision.convert(input, "uint16")
+        assert output.nodata == 65535
+        assert np.array_equal(output.values, [[7292, 7296]])
+
+    def test_mask(_):
+        input = Raster.from_array(np.ones((2, 2), bool), isbool=True)
+        assert _precision.convert(input, "uint8") is input
+
+    def test_constant(_):
+        template = raster(np.zeros((3, 3)))
+        input = _constants.raster(2.5, template, "kf")
+        assert _precision.convert(input, "float32") is input
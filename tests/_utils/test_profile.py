@@ -0,0 +1,252 @@
+import json
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pfdf.raster import Raster
+
+from wildcat import version
+from wildcat._utils import _profile
+
+
+def _add(a, b):
+    return a + b
+
+
+def _raster(shape):
+    return Raster.from_array(np.zeros(shape))
+
+
+class _Segments:
+    size = 5
+
+
+@pytest.fixture
+def segments(monkeypatch):
+    module = SimpleNamespace(Segments=_Segments)
+    monkeypatch.setitem(sys.modules, "pfdf.segments", module)
+    return _Segments()
+
+
+def _slow(values, seconds):
+    for value in values:
+        time.sleep(seconds)
+        yield value
+
+
+class TestProfile:
+    def test_init(_):
+        profile = _profile.Profile("assess")
+        assert profile.command == "assess"
+        assert profile.trace_memory is False
+        assert profile.steps == []
+
+    @pytest.mark.parametrize(
+        "value, expected", (("1", True), ("true", True), ("0", False), ("", False))
+    )
+    def test_init_variable(_, monkeypatch, value, expected):
+        monkeypatch.setenv("WILDCAT_TRACE_MEMORY", value)
+        assert _profile.Profile("assess").trace_memory is expected
+        assert _profile.Profile("assess", trace_memory=True).trace_memory is True
+
+    def test_step(_):
+        profile = _profile.Profile("assess")
+        raster = _raster((3, 4))
+        output = profile.step(_add, 1, 2)
+        assert output == 3
+        profile.step(_raster, (3, 4))
+        profile.step(lambda raster: None, raster)
+
+        assert len(profile.steps) == 3
+        step = profile.steps[0]
+        assert list(step.keys()) == [
+            "step",
+            "wall_seconds",
+            "cpu_seconds",
+            "peak_rss_mb",
+            "tracemalloc_peak_mb",
+            "raster_shape",
+            "segments",
+            "streamed",
+        ]
+        assert step["step"] == "test_profile._add"
+        assert step["wall_seconds"] >= 0
+        assert step["cpu_seconds"] >= 0
+        assert step["peak_rss_mb"] > 0
+        assert step["tracemalloc_peak_mb"] is None
+        assert step["raster_shape"] is None
+        assert step["segments"] is None
+        assert step["streamed"] is False
+        assert profile.steps[1]["raster_shape"] is None
+        assert profile.steps[2]["raster_shape"] == [3, 4]
+
+    def test_tracemalloc_peak(_):
+        profile = _profile.Profile("assess", trace_memory=True)
+        profile.step(np.ones, 1000000)
+        assert profile.steps[0]["tracemalloc_peak_mb"] >= 7.5
+
+    def test_not_tracing(_):
+        def check():
+            assert not tracemalloc.is_tracing()
+
+        profile = _profile.Profile("assess")
+        profile.step(check)
+        assert profile.steps[0]["tracemalloc_peak_mb"] is None
+
+    def test_stops_tracing(_):
+        assert not tracemalloc.is_tracing()
+        profile = _profile.Profile("assess", trace_memory=True)
+        profile.step(_add, 1, 2)
+        assert not tracemalloc.is_tracing()
+
+    def test_already_tracing(_):
+        tracemalloc.start()
+        try:
+            profile = _profile.Profile("assess", trace_memory=True)
+            profile.step(_add, 1, 2)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_error(_):
+        def fail():
+            raise ValueError("failed")
+
+        profile = _profile.Profile("assess", trace_memory=True)
+        with pytest.raises(ValueError, match="failed"):
+            profile.step(fail)
+        assert not tracemalloc.is_tracing()
+        assert profile.steps == []
+
+    def test_stream(_):
+        profile = _profile.Profile("export")
+        loaded = profile.stream("_load.features", _slow([1, 2, 3], 0.02))
+        converted = profile.stream("_convert.features", _slow(loaded, 0.01))
+        output = profile.step(list, converted)
+        assert output == [1, 2, 3]
+
+        assert [step["step"] for step in profile.steps] == [
+            "_load.features",
+            "_convert.features",
+            "builtins.list",
+        ]
+        load, convert, consume = profile.steps
+        assert load["streamed"] is True
+        assert load["peak_rss_mb"] > 0
+        assert load["tracemalloc_peak_mb"] is None
+        assert consume["streamed"] is False
+
+        # Each step excludes the time spent in the streams it consumes
+        assert load["wall_seconds"] >= 0.06
+        assert 0.03 <= convert["wall_seconds"] < 0.06
+        assert consume["wall_seconds"] < 0.03
+
+    def test_stream_shared(_):
+        profile = _profile.Profile("export")
+        first = profile.stream("_load.features", _slow([1, 2], 0.01))
+        second = profile.stream("_load.features", _slow([3], 0.01))
+        assert list(first) + list(second) == [1, 2, 3]
+        assert len(profile.steps) == 1
+        assert profile.steps[0]["wall_seconds"] >= 0.03
+
+    def test_stream_none(_):
+        profile = _profile.Profile("export")
+        assert profile.stream("_load.features", None) is None
+        assert profile.steps == []
+
+    def test_save(_, tmp_path):
+        profile = _profile.Profile("export")
+        profile.step(_add, 1, 2)
+        path = profile.save(tmp_path)
+        assert path == tmp_path / "profile.json"
+
+        with open(path) as file:
+            output = json.load(file)
+        assert list(output.keys()) == [
+            "command",
+            "wildcat",
+            "wall_seconds",
+            "cpu_seconds",
+            "peak_rss_mb",
+            "steps",
+        ]
+        assert output["command"] == "export"
+        assert output["wildcat"] == version()
+        assert output["wall_seconds"] >= 0
+        assert output["cpu_seconds"] >= 0
+        assert output["peak_rss_mb"] > 0
+        assert output["steps"] == profile.steps
+
+
+class TestPeakRss:
+    def test_linux(_, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "linux")
+        output = _profile.peak_rss()
+        assert isinstance(output, float)
+        assert output > 0
+
+    def test_darwin(_, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "linux")
+        linux = _profile.peak_rss()
+        monkeypatch.setattr(sys, "platform", "darwin")
+        output = _profile.peak_rss()
+        assert output == pytest.approx(linux / 1024)
+
+    def test_windows(_, monkeypatch):
+        monkeypatch.setitem(sys.modules, "resource", None)
+        assert _profile.peak_rss() is None
+
+
+class TestName:
+    def test(_):
+        assert _profile._name(_add) == "test_profile._add"
+        assert _profile._name(_profile.peak_rss) == "_profile.peak_rss"
+
+
+class TestShape:
+    def test_none(_):
+        assert _profile._shape((1, "a", {"a": 1})) is None
+
+    def test_raster(_):
+        args = (1, _raster((3, 4)), _raster((5, 6)))
+        assert _profile._shape(args) == [3, 4]
+
+    def test_dem(_):
+        rasters = {"perimeter": _raster((3, 4)), "dem": _raster((5, 6))}
+        assert _profile._shape((rasters,)) == [5, 6]
+
+    def test_dict(_):
+        rasters = {"constant": 5, "dnbr": _raster((3, 4)), "kf": _raster((5, 6))}
+        assert _profile._shape((rasters,)) == [3, 4]
+
+    def test_not_imported(_, monkeypatch):
+        args = (_raster((3, 4)),)
+        monkeypatch.delitem(sys.modules, "pfdf.raster")
+        assert _profile._shape(args) is None
+
+
+class TestSegments:
+    def test_none(_, segments):
+        assert _profile._segments((1, 2), None) is None
+
+    def test_output(_, segments):
+        assert _profile._segments((1, 2), segments) == 5
+
+    def test_arg(_, segments):
+        assert _profile._segments((1, segments), None) == 5
+
+    def test_not_imported(_, segments, monkeypatch):
+        monkeypatch.delitem(sys.modules, "pfdf.segments")
+        assert _profile._segments((1, segments), None) is None
+
+
+class TestPfdf:
+    def test_imported(_):
+        assert _profile._pfdf("raster", "Raster") is Raster
+
+    def test_not_imported(_, monkeypatch):
+        monkeypatch.delitem(sys.modules, "pfdf.raster")
+        assert _profile._pfdf("raster", "Raster") is None
@@ -0,0 +1,43 @@
+from wildcat._utils import _saved
+
+
+class TestPath:
+    def test(_, tmp_path):
+        assert _saved.path(tmp_path, "segments", "geojson") == (
+            tmp_path / "segments.geojson"
+        )
+        assert _saved.path(tmp_path, "basins", "flatgeobuf") == tmp_path / "basins.fgb"
+        assert _saved.path(tmp_path, "outlets", "gpkg") == tmp_path / "outlets.gpkg"
+
+
+class TestLocate:
+    def test_missing(_, tmp_path):
+        assert _saved.locate(tmp_path, "segments") is None
+
+    def test(_, tmp_path):
+        path = tmp_path / "segments.fgb"
+        path.touch()
+        assert _saved.locate(tmp_path, "segments") == path
+        assert _saved.locate(tmp_path, "basins") is None
+
+    def test_legacy(_, tmp_path):
+        path = tmp_path / "segments.geojson"
+        path.touch()
+        assert _saved.locate(tmp_path, "segments") == path
+
+
+class TestRemove:
+    def test(_, tmp_path):
+        for ext in [".geojson", ".fgb", ".gpkg"]:
+            (tmp_path / f"segments{ext}").touch()
+        (tmp_path / "basins.geojson").touch()
+        _saved.remove(tmp_path, "segments", keep="gpkg")
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "basins.geojson",
+            "segments.gpkg",
+        ]
+
+    def test_all(_, tmp_path):
+        (tmp_path / "outlets.fgb").touch()
+        _saved.remove(tmp_path, "outlets")
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,66 @@
+import numpy as np
+import rasterio
+
+from wildcat._utils import _stack
+
+
+def write(path, names):
+    with rasterio.open(
+        path, "w", driver="GTiff", width=2, height=2, count=len(names), dtype="int8"
+    ) as file:
+        for band, name in enumerate(names, start=1):
+            file.write(np.zeros((2, 2), "int8"), band)
+            file.set_band_description(band, name)
+
+
+class TestPath:
+    def test(_, tmp_path):
+        assert _stack.path(tmp_path) == tmp_path / "stack.tif"
+
+
+class TestLocate:
+    def test_missing(_, tmp_path):
+        assert _stack.locate(tmp_path) is None
+
+    def test(_, tmp_path):
+        path = tmp_path / "stack.tif"
+        write(path, ["perimeter"])
+        assert _stack.locate(tmp_path) == path
+
+
+class TestBands:
+    def test(_, tmp_path):
+        path = tmp_path / "stack.tif"
+        write(path, ["perimeter", "dem", "kf"])
+        assert _stack.bands(path) == ["perimeter", "dem", "kf"]
+
+
+class TestRemove:
+    def test(_, tmp_path):
+        path = tmp_path / "stack.tif"
+        write(path, ["perimeter"])
+        _stack.remove(tmp_path)
+        assert not path.exists()
+
+    def test_missing(_, tmp_path):
+        _stack.remove(tmp_path)
+
+
+class TestLogPromoted:
+    def test(_, logcheck):
+        logcheck.start("wildcat.preprocess")
+        _stack.log_promoted(["perimeter", "dem"], logcheck.log)
+        logcheck.check(
+            [
+                (
+                    "DEBUG",
+                    "    Promoted to the stack data type (cannot be memory-mapped): "
+                    "perimeter, dem",
+                )
+            ]
+        )
+
+    def test_none(_, logcheck):
+        logcheck.start("wildcat.preprocess")
+        _stack.log_promoted([], logcheck.log)
+        logcheck.check([])
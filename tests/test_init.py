@@ -1,3 +1,9 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 import wildcat
@@ -56,3 +62,105 @@ def test_export(project, errcheck, logcheck):
         20,
         "----- Exporting Results -----",
     )
+
+
+def test_warmup(errcheck, logcheck):
+    logcheck.start("wildcat.warmup")
+    with pytest.raises(TypeError) as error:
+        wildcat.warmup(folder=5)
+    errcheck(error, 'Could not convert the "folder" setting to a file path')
+    assert logcheck.caplog.record_tuples[0] == (
+        "wildcat.warmup",
+        20,
+        "Warming up JIT kernels",
+    )
+
+
+def test_serve(errcheck, logcheck):
+    logcheck.start("wildcat.serve")
+    with pytest.raises(ValueError) as error:
+        wildcat.serve(port=-1)
+    errcheck(error, 'The "port" setting must be between 0 and 65535')
+    assert logcheck.caplog.record_tuples[0] == (
+        "wildcat.serve",
+        20,
+        "Starting wildcat server",
+    )
+
+
+def test_batch(errcheck, logcheck):
+    logcheck.start("wildcat.batch")
+    with pytest.raises(ValueError) as error:
+        wildcat.batch("manifest.toml", workers=0)
+    errcheck(error, 'The "workers" setting must be greater than 0')
+    assert logcheck.caplog.record_tuples[0] == (
+        "wildcat.batch",
+        20,
+        "----- Batch -----",
+    )
+
+
+#####
+# Startup
+#####
+
+# Maximum time to show the CLI help and initialize a project in a fresh process
+STARTUP_BUDGET = 1.0
+
+# Heavy packages that should not be imported by the CLI help, initialize, or
+# config validation
+HEAVY = ["pfdf", "rasterio", "fiona", "osgeo", "pandas", "pyproj", "numpy", "numba"]
+
+STARTUP = """
+import json, sys
+from contextlib import redirect_stdout
+from io import StringIO
+from time import perf_counter
+
+start = perf_counter()
+from wildcat._cli import main
+
+try:
+    with redirect_stdout(StringIO()):
+        main(["-h"])
+except SystemExit:
+    pass
+main(["initialize", sys.argv[1], "--quiet"])
+import wildcat._utils._setup
+
+seconds = perf_counter() - start
+heavy = [name for name in json.loads(sys.argv[2]) if name in sys.modules]
+print(json.dumps({"seconds": seconds, "heavy": heavy}))
+"""
+
+
+def test_startup(tmp_path):
+    env = os.environ.copy()
+    root = str(Path(wildcat.__file__).parents[1])
+    env["PYTHONPATH"] = os.pathsep.join([root, env.get("PYTHONPATH", "")])
+    args = [sys.executable, "-c", STARTUP, str(tmp_path / "project"), json.dumps(HEAVY)]
+    output = subprocess.run(args, capture_output=True, text=True, env=env, check=True)
+
+    output = json.loads(output.stdout)
+    assert output["heavy"] == []
+    assert output["seconds"] < STARTUP_BUDGET
+
+
+# Packages that should not be imported by the export command
+FLOW_ROUTING = ["pfdf", "pysheds", "numba"]
+
+EXPORT = """
+import json, sys
+import wildcat._commands.export
+
+print(json.dumps([name for name in json.loads(sys.argv[1]) if name in sys.modules]))
+"""
+
+
+def test_export_imports():
+    env = os.environ.copy()
+    root = str(Path(wildcat.__file__).parents[1])
+    env["PYTHONPATH"] = os.pathsep.join([root, env.get("PYTHONPATH", "")])
+    args = [sys.executable, "-c", EXPORT, json.dumps(FLOW_ROUTING)]
+    output = subprocess.run(args, capture_output=True, text=True, env=env, check=True)
+    assert json.loads(output.stdout) == []
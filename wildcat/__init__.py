@@ -9,6 +9,9 @@ package include:
 * preprocess -- Cleans and preprocesses input datasets
 * assess     -- Implements a hazard assessment
 * export     -- Exports results to common GIS formats (such as Shapefile and GeoJSON)
+* warmup     -- Compiles JIT kernels so that later assessments start quickly
+* serve      -- Runs preprocess, assess, and export jobs in a long-running process
+* batch      -- Runs many projects concurrently from a batch manifest
 
 The simplest way to use wildcat is from the command line:
 
@@ -27,6 +30,9 @@ Functions:
     preprocess  - Preprocesses input datasets
     assess      - Runs a hazard assessment using preprocessed data
     export      - Exports hazard assessment results to GIS file formats
+    warmup      - Compiles JIT kernels and saves them to the on-disk JIT cache
+    serve       - Runs a server that runs wildcat jobs in a warm process
+    batch       - Runs the projects in a batch manifest in a process pool
     version     - Returns the wildcat version string
 
 Misc:
@@ -56,6 +62,7 @@ from __future__ import annotations
 import typing
 
 if typing.TYPE_CHECKING:
+    from pathlib import Path
     from typing import Optional
 
     from wildcat.typing import CRS, Check, ConfigType, Pathlike, scalar, strs, vector
@@ -164,7 +171,18 @@ def preprocess(
     water: vector = None,
     developed: vector = None,
     excluded_evt: vector = None,
-) -> None:
+    # Performance
+    tiled: bool = None,
+    tile_size: int = None,
+    max_workers: int = None,
+    cache_datasets: bool = None,
+    raster_compression: str = None,
+    raster_predictor: bool = None,
+    raster_layout: str = None,
+    raster_bigtiff: str = None,
+    raster_stack: bool = None,
+    raster_precision: str = None,
+) -> Path:
     """
     Cleans datasets prior to hazard assessment
     ----------
@@ -313,6 +331,60 @@ def preprocess(
     water codes and an iswater input dataset, then the two masks will be merged.
     If you provide both excluded_evt codes and an excluded dataset, then the two
     masks will be merged.
+
+    preprocess(..., tiled)
+    preprocess(..., tile_size)
+    Options for preprocessing very large fires. When tiled=True, splits the DEM
+    grid into square tiles with tile_size pixels per side, and streams each tile
+    through the preprocessor. Datasets are only loaded within the current tile, and
+    preprocessed tiles are written directly to tiled GeoTIFF files, so peak memory
+    use scales with the tile size, rather than the size of the fire. Filling missing
+    KF-factors with the median value requires holding the valid KF-factor values
+    in memory.
+
+    preprocess(..., max_workers)
+    Specifies the maximum number of worker threads used to load, reproject, and
+    clip the input datasets. Each dataset is processed independently, so using
+    multiple workers can speed up preprocessing when there are many input datasets.
+    The default of 1 processes the datasets serially.
+
+    preprocess(..., cache_datasets)
+    When cache_datasets=True, saves each loaded and warped dataset to the ".cache"
+    subfolder of the "preprocessed" folder. Later runs reuse the cached datasets
+    whenever the input files (as determined by file sizes and modification times)
+    and the settings that affect the warped datasets are unchanged, so only
+    datasets whose inputs have changed are reloaded. Numeric preprocessing steps
+    always rerun. Ignored when tiled=True.
+
+    preprocess(..., raster_compression)
+    preprocess(..., raster_predictor)
+    preprocess(..., raster_layout)
+    preprocess(..., raster_bigtiff)
+    Options for the GeoTIFF files holding the preprocessed rasters. Use
+    raster_compression to compress the files. Options are "none" (default),
+    "deflate", "zstd", or "lerc" (lossless). When raster_predictor=True, uses a
+    predictor to improve DEFLATE and ZSTD compression. The predictor is selected
+    for the data type of each raster. The raster_layout option sets the internal
+    layout of the files. Options are "striped" (default), "tiled" (256 x 256 pixel
+    tiles), or "cog" (Cloud-Optimized GeoTIFFs with internal overviews). Tiled
+    preprocessing always writes tiled files. Use raster_bigtiff to set when the
+    files use the BigTIFF format. Options are "if_needed" (default), "if_safer",
+    "yes", or "no". The files are written using up to max_workers threads.
+
+    preprocess(..., raster_stack)
+    If raster_stack=True, saves the preprocessed rasters as the bands of a single
+    multi-band GeoTIFF named "stack.tif", instead of as separate files. The
+    description of each band is the name of its dataset. The assessment opens the
+    stack once and reads the bands as they are needed.
+
+    preprocess(..., raster_precision)
+    When raster_precision="compact", converts the preprocessed rasters to compact
+    data types before saving them. The DEM and KF-factors are saved as 32-bit
+    floats, the dNBR as 16-bit integers, burn severity as 8-bit unsigned integers,
+    and EVT codes as 16-bit unsigned integers. Integer values are rounded and
+    clipped to the range of their data type. Single-band mask files are saved as 1-bit
+    GeoTIFFs, except in COG layouts. The default ("double") saves the rasters
+    using the data types produced by the preprocessor.
     ----------
     Inputs:
         project: The path to the project folder
@@ -359,15 +431,33 @@ def preprocess(
         water: EVT codes that should be classified as water
         developed: EVT codes that should be classified as human development
         excluded_evt: EVT codes that should be excluded from network delineation
+        tiled: Whether to preprocess the DEM grid in tiles to limit memory use
+        tile_size: The number of pixels along each side of a preprocessing tile
+        max_workers: The maximum number of threads used to load and warp datasets
+        cache_datasets: Whether to reuse cached warped datasets from earlier runs
+        raster_compression: The compression of the saved GeoTIFFs. Options are
+            "none", "deflate", "zstd", "lerc"
+        raster_predictor: Whether to use a predictor for compressed GeoTIFFs
+        raster_layout: The layout of the saved GeoTIFFs. Options are "striped",
+            "tiled", "cog"
+        raster_bigtiff: When to save GeoTIFFs as BigTIFF. Options are "if_needed",
+            "if_safer", "yes", "no"
+        raster_stack: Whether to save the rasters as the bands of a single file
+        raster_precision: The precision of the saved rasters. Options are "double",
+            "compact"
+
+    Outputs:
+        Path: The path to the "preprocessed" folder
 
     Saves:
         Saves the collection of preprocessed rasters to the "preprocessed" folder.
-        Also saves the final settings in configuration.txt.
+        Also saves the final settings in configuration.txt, and a performance
+        profile of the preprocessing steps in profile.json.
     """
 
     from wildcat._commands.preprocess import preprocess
 
-    preprocess(locals())
+    return preprocess(locals())
 
 
 def assess(
@@ -414,7 +504,14 @@ def assess(
     # Basins
     locate_basins: bool = None,
     parallelize_basins: bool = None,
-) -> None:
+    basin_workers: Optional[int] = None,
+    # Performance
+    cache_watershed: bool = None,
+    models_only: bool = None,
+    assessment_format: str = None,
+    memory_map: bool = None,
+    watershed_precision: str = None,
+) -> Path:
     """
     Implements a hazard assessment using preprocessed datasets
     ----------
@@ -541,6 +638,55 @@ def assess(
     as the parallelization overhead can worsen for small watershed. As a rule of
     thumb, parallelization will often improve runtime if the assessment requires
     >10 minutes to locate basins.
+
+    assess(..., basin_workers)
+    Sets the number of worker processes used to locate basins in parallel. Only
+    used when parallelize_basins=True. If None (the default), uses one fewer than
+    the number of available CPUs. Parallel runs also log the worker count and the
+    time spent locating the basins.
+
+    assess(..., cache_watershed)
+    When cache_watershed=True, saves the flow direction, slope, vertical relief,
+    and flow accumulation rasters to the ".cache" subfolder of the "assessment"
+    folder. Later runs reuse these rasters whenever the preprocessed DEM, burn
+    severity, and retainment files (as determined by file sizes and modification
+    times) and dem_per_m are unchanged. This allows reruns that only change
+    filtering or modeling settings to skip the most expensive hydrologic steps.
+
+    assess(..., models_only)
+    When models_only=True, skips the watershed analysis, delineation, and filtering
+    steps, and only reruns the hazard models. The model inputs (Terrain_M1, Fire_M1,
+    Soil_M1, Bmh_km2, and Relief_m) are loaded from the segments and basins saved
+    by an earlier assessment, and the model results in these files are replaced
+    using the current hazard modeling parameters. The modeling parameters in the
+    recorded "configuration.txt" are also updated. This is useful for updating
+    rainfall scenarios without rerunning the full assessment.
+
+    assess(..., assessment_format)
+    Specifies the file format of the saved segments, basins, and outlets. Options
+    are "geojson" (the default), "flatgeobuf", and "gpkg" (GeoPackage). The
+    FlatGeobuf and GeoPackage formats are compact binary formats with a spatial
+    index, and are much faster to save and to read back during export than
+    GeoJSON. Saved results in other formats are removed. Rerunning the models
+    with models_only=True updates the saved results in their existing format.
+
+    assess(..., memory_map)
+    When memory_map=True, the preprocessed rasters are memory-mapped, rather than
+    read into memory. Only the pixels used by the assessment are paged in, and
+    assessments running at the same time on the same preprocessed folder share
+    the operating system's page cache. Only uncompressed, striped GeoTIFFs (the
+    default preprocessor output) can be memory-mapped. Other rasters, and stack
+    bands whose data type was promoted to the shared band type, are read into
+    memory as usual.
+
+    assess(..., watershed_precision)
+    When watershed_precision="compact", converts the preprocessed rasters to
+    compact data types after they are loaded, and computes the slopes and vertical
+    relief as 32-bit floats. Flow accumulations are always computed as 64-bit floats,
+    so that catchments larger than 2^24 pixels are counted exactly. This reduces the
+    memory used by the watershed analysis. Model results may differ slightly from the default
+    ("double") results, and rounding the dNBR to integers causes larger
+    differences when the dNBR is not integer-valued.
     ----------
     Inputs:
         project: The path to the project folder
@@ -587,14 +733,30 @@ def assess(
             On the interval from 0 to 1.
         locate_basin: Whether to locate terminal outlet basins
         parallelize_basins: Whether to use multiple CPUs to locate basins
+        basin_workers: The number of processes used to locate basins in parallel
+        cache_watershed: Whether to reuse cached watershed rasters from earlier runs
+        models_only: Whether to only rerun the hazard models on saved results
+        assessment_format: The file format of the saved segments, basins, and outlets
+        memory_map: Whether to memory-map preprocessed rasters
+        watershed_precision: The precision of the watershed analysis. Options are
+            "double", "compact"
+
+    Outputs:
+        Path: The path to the "assessment" folder
 
     Saves:
-        Saves "segments.geojson", "outlets.geojson", and optionally "basins.geojson"
-        in the "assessment" folder. Also saves the final settings in "configuration.txt"
+        Saves "segments", "outlets", and optionally "basins" feature files in the
+        "assessment" folder, using the extension of the assessment format. Also
+        saves the final settings in "configuration.txt"
+        and a performance profile of the assessment steps in "profile.json"
     """
+    from wildcat._utils import _jit
+
+    # Configure the JIT cache before the command imports pysheds
+    _jit.configure()
     from wildcat._commands.assess import assess
 
-    assess(locals())
+    return assess(locals())
 
 
 def export(
@@ -617,7 +779,7 @@ def export(
     order_properties: bool = None,
     clean_names: bool = None,
     rename: dict[str, str] = None,
-) -> None:
+) -> Path:
     """
     Export assessment results to desired format(s)
     ----------
@@ -782,10 +944,135 @@ def export(
             in the names.
         rename: A dict specifying renaming rules for exported properties
 
+    Outputs:
+        Path: The path to the "exports" folder
+
     Saves:
         Vector feature files for the segments, basins, and outlets. Also saves
-        configuration.txt with the config settings for the export.
+        configuration.txt with the config settings for the export, and
+        profile.json with a performance profile of the export steps.
     """
     from wildcat._commands.export import export
 
-    export(locals())
+    return export(locals())
+
+
+def warmup(folder: Optional[Pathlike] = None) -> None:
+    """
+    Compiles JIT kernels and saves them to the on-disk JIT cache
+    ----------
+    warmup()
+    Runs the pfdf routines that rely on numba kernels (via pysheds) on a tiny
+    synthetic DEM. This compiles the kernels and saves them to the on-disk JIT
+    cache, so that later assessments can reuse the compiled kernels, rather than
+    recompiling them in every new process. This is useful for building container
+    images with a warm JIT cache. By default, uses the folder indicated by the
+    NUMBA_CACHE_DIR environment variable. If this variable is not set, uses a
+    "wildcat/numba" folder in the user's cache directory.
+
+    warmup(folder)
+    Saves the compiled kernels to the indicated folder.
+    ----------
+    Inputs:
+        folder: The path to the JIT cache folder
+
+    Saves:
+        Compiled numba kernels in the JIT cache folder
+    """
+    from wildcat._commands.warmup import warmup
+
+    warmup(folder)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8910) -> None:
+    """
+    Runs a server that runs preprocess, assess, and export jobs in a warm process
+    ----------
+    serve()
+    Runs a long-running server that accepts preprocess, assess, and export jobs
+    over HTTP at http://127.0.0.1:8910. The server imports the wildcat commands
+    (and their dependencies) once on startup, and JIT kernels remain compiled
+    after the first job, so later jobs start quickly. Jobs run one at a time.
+
+    To run a job, POST a JSON object with the keyword arguments for the command
+    to /preprocess, /assess, or /export. The response streams the job's log
+    records as newline-delimited JSON, and ends with the path to the job's output
+    folder, or the error if the job failed. Send a GET request to /status to
+    check the server's status. The server runs until interrupted (for example,
+    with Ctrl+C).
+
+    Job requests must have a Content-Type of application/json, and must include
+    the session token in the X-Wildcat-Token header. If the WILDCAT_SERVE_TOKEN
+    environment variable is set, then its value is used as the token. Otherwise,
+    the server generates a random token on startup and logs it to the console.
+
+    serve(host, port)
+    Listens at the indicated host and port. Use port 0 to select an open port.
+    The host must be a loopback address (such as 127.0.0.1, ::1, or localhost),
+    so only clients on the local machine can connect.
+    ----------
+    Inputs:
+        host: The host address for the server
+        port: The port number for the server
+    """
+    from wildcat._commands.serve import serve
+
+    serve(host, port)
+
+
+def batch(
+    manifest: Pathlike, workers: int = 1, max_memory_gb: Optional[float] = None
+) -> Path:
+    """
+    Runs preprocess, assess, and export for many projects in a process pool
+    ----------
+    batch(manifest)
+    Runs the preprocess, assess, and export commands for each project listed in
+    a batch manifest. The manifest is a TOML file with a [[projects]] table for
+    each project. Each project table should include a "project" field with the
+    path to the project folder. Relative project paths are parsed relative to
+    the folder holding the manifest. A project table may also include settings
+    that override the project's config file, and the optional [settings] table
+    holds overrides that apply to every project. For example:
+
+        [settings]
+        I15_mm_hr = [16, 20, 24]
+
+        [[projects]]
+        project = "fires/fire-a"
+
+        [[projects]]
+        project = "fires/fire-b"
+        export_crs = 4326
+
+    A failed command stops the remaining commands for its project, but does not
+    stop the other projects. Saves a JSON summary with the timings and failures
+    of each project next to the manifest, and returns the path to the summary.
+
+    batch(..., workers)
+    Runs projects concurrently using the indicated number of worker processes.
+    Each worker imports wildcat's dependencies once, and reuses the warm imports
+    for every project it runs. By default, runs projects one at a time in a
+    single worker process.
+
+    batch(..., max_memory_gb)
+    Limits the resident memory (RSS) of each worker process. Each worker polls
+    its RSS, and kills itself if the RSS exceeds the limit, so the project that
+    it was running fails. This option is not supported on Windows.
+    ----------
+    Inputs:
+        manifest: The path to the batch manifest
+        workers: The number of worker processes used to run projects
+        max_memory_gb: The maximum resident memory (in gigabytes) for each worker process
+
+    Outputs:
+        Path: The path to the batch summary file
+
+    Saves:
+        Saves the usual outputs in each project folder. Also saves a
+        "<manifest>-summary.json" file next to the manifest with the timings and
+        failures of each project.
+    """
+    from wildcat._commands.batch import batch
+
+    return batch(manifest, workers, max_memory_gb)
@@ -8,6 +8,7 @@ Submodules / Subpackages:
     _parsers    - Subpackage to build argument parsers for CLI commands
     _kwargs     - Module to convert CLI args to command functions kwargs
     _main       - Module implementing the "main" function
+    _profiling  - Module to profile a command with cProfile
 """
 
 from wildcat._cli._main import main
@@ -10,6 +10,9 @@ Functions:
     preprocess      - Converts CLI inputs to kwargs for the preprocess command
     assess          - Converts CLI inputs to kwargs for the assess command
     export          - Converts CLI inputs to kwargs for the export command
+    warmup          - Converts CLI inputs to kwargs for the warmup command
+    serve           - Converts CLI inputs to kwargs for the serve command
+    batch           - Converts CLI inputs to kwargs for the batch command
 
 Utilities:
     _parse_paths    - Parses filepath options, converting None to boolean False
@@ -88,6 +91,12 @@ def preprocess(args: Namespace) -> kwargs:
     if args.no_find_excluded:
         kwargs["excluded_evt"] = []
 
+    # Only override the configured performance options when the switches are used
+    kwargs["tiled"] = True if args.tiled else None
+    kwargs["cache_datasets"] = True if args.cache_datasets else None
+    kwargs["raster_predictor"] = True if args.raster_predictor else None
+    kwargs["raster_stack"] = True if args.raster_stack else None
+
     # Copy all remaining fields directly
     _copy_remaining(args, kwargs)
     return kwargs
@@ -106,6 +115,11 @@ def assess(args: Namespace) -> kwargs:
     kwargs["locate_basins"] = not args.no_basins
     kwargs["parallelize_basins"] = bool(args.parallel)
 
+    # Only override the configured performance options when the switches are used
+    kwargs["cache_watershed"] = True if args.cache_watershed else None
+    kwargs["models_only"] = True if args.models_only else None
+    kwargs["memory_map"] = True if args.memory_map else None
+
     # Force filtering in perimeter by setting exterior ratio to 0
     if args.filter_in_perimeter:
         kwargs["max_exterior_ratio"] = 0
@@ -149,6 +163,30 @@ def export(args: Namespace) -> kwargs:
     return kwargs
 
 
+def warmup(args: Namespace) -> kwargs:
+    "Converts CLI args to kwargs for the warmup function"
+
+    kwargs = {}
+    _copy_remaining(args, kwargs)
+    return kwargs
+
+
+def serve(args: Namespace) -> kwargs:
+    "Converts CLI args to kwargs for the serve function"
+
+    kwargs = {}
+    _copy_remaining(args, kwargs)
+    return kwargs
+
+
+def batch(args: Namespace) -> kwargs:
+    "Converts CLI args to kwargs for the batch function"
+
+    kwargs = {}
+    _copy_remaining(args, kwargs)
+    return kwargs
+
+
 #####
 # Utilities
 #####
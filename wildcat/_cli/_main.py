@@ -18,7 +18,7 @@ import sys
 import typing
 
 import wildcat
-from wildcat._cli import _kwargs, _parsers
+from wildcat._cli import _kwargs, _parsers, _profiling
 
 if typing.TYPE_CHECKING:
     from argparse import Namespace
@@ -36,7 +36,9 @@ def main(args: list[str] = None) -> None:
 
     Note that this function will configure the wildcat logging format. It will
     also set the system traceback limit to 0 when an uncaught exception occurs,
-    unless the "-t" or "--traceback" flags are included in the args.
+    unless the "-t" or "--traceback" flags are included in the args. If the
+    "--profile" option is included, runs the command in cProfile and saves the
+    profile in the format indicated by "--profile-format".
     ----------
     Inputs:
         args: A list of strings that would follow the "wildcat" string when
@@ -52,10 +54,15 @@ def main(args: list[str] = None) -> None:
     # Configure the logging format
     _configure_log(args)
 
-    # Run the command, suppressing tracebacks unless explicitly enabled
+    # Run the command, suppressing tracebacks unless explicitly enabled.
+    # Optionally profile the command
     command = getattr(wildcat, args.command)
     try:
-        command(**kwargs)
+        if args.profile is None:
+            command(**kwargs)
+        else:
+            log = logging.getLogger(f"wildcat.{args.command}")
+            _profiling.run(command, kwargs, args.profile, args.profile_format, log)
     except Exception:
         if not args.show_traceback:
             sys.tracebacklimit = 0
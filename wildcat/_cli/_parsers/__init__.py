@@ -14,6 +14,9 @@ Subcommand modules:
     _preprocess     - Builds the parser for the "preprocess" subcommand
     _assess         - Builds the parser for the "assess" subcommand
     _export         - Builds the parser for the "export" subcommand
+    _warmup         - Builds the parser for the "warmup" subcommand
+    _serve          - Builds the parser for the "serve" subcommand
+    _batch          - Builds the parser for the "batch" subcommand
 
 Utility modules:
     _descriptions   - Lengthy help text descriptions of subcommands and input files
@@ -23,7 +26,15 @@ Utility modules:
 from argparse import ArgumentParser
 
 import wildcat
-from wildcat._cli._parsers import _assess, _export, _initialize, _preprocess
+from wildcat._cli._parsers import (
+    _assess,
+    _batch,
+    _export,
+    _initialize,
+    _preprocess,
+    _serve,
+    _warmup,
+)
 
 
 def main() -> ArgumentParser:
@@ -40,7 +51,8 @@ def main() -> ArgumentParser:
 
     # Add the subcommand parsers
     subparsers = parser.add_subparsers(dest="command", title="Commands")
-    for command in [_initialize, _preprocess, _assess, _export]:
+    commands = [_initialize, _preprocess, _assess, _export, _warmup, _serve, _batch]
+    for command in commands:
         add_parser = getattr(command, "parser")
         add_parser(subparsers)
     return parser
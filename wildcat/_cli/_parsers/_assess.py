@@ -16,6 +16,7 @@ Option groups:
     _remove_ids     - Adds option to remove specific IDs
     _modeling       - Adds hazard modeling parameters
     _basins         - Options for locating basins
+    _performance    - Options for caching and rerunning models
 """
 
 from __future__ import annotations
@@ -45,6 +46,7 @@ def parser(subparsers) -> None:
     _remove_ids(parser)
     _modeling(parser)
     _basins(parser)
+    _performance(parser)
 
 
 #####
@@ -240,6 +242,31 @@ def _basins(parser: ArgumentParser) -> None:
     "Adds basins group with parallelization options"
 
     parser = parser.add_argument_group("Basins")
-    parser = parser.add_mutually_exclusive_group()
-    switch(parser, "parallel", "Use multiple CPUs to locate outlet basins")
-    switch(parser, "no-basins", "Do not locate outlet basins")
+    exclusive = parser.add_mutually_exclusive_group()
+    switch(exclusive, "parallel", "Use multiple CPUs to locate outlet basins")
+    switch(exclusive, "no-basins", "Do not locate outlet basins")
+    parser.add_argument(
+        "--basin-workers",
+        type=int,
+        metavar="N",
+        help="The number of processes used to locate basins in parallel",
+    )
+
+
+def _performance(parser: ArgumentParser) -> None:
+    "Adds the performance group with caching and rerun options"
+
+    parser = parser.add_argument_group("Performance")
+    switch(parser, "cache-watershed", "Reuse cached watershed rasters from past runs")
+    switch(parser, "models-only", "Only rerun the hazard models on saved results")
+    parser.add_argument(
+        "--assessment-format",
+        metavar="FORMAT",
+        help="The file format of the saved results (geojson, flatgeobuf, or gpkg)",
+    )
+    switch(parser, "memory-map", "Memory-map the preprocessed rasters")
+    parser.add_argument(
+        "--watershed-precision",
+        metavar="MODE",
+        help="The precision of the watershed analysis (double or compact)",
+    )
@@ -0,0 +1,37 @@
+"""
+Builds the CLI parser for the "batch" command
+----------
+Main Function:
+    parser  - Adds the "batch" parser to the subparsers
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from wildcat._cli._parsers._utils import create_subcommand, logging
+
+
+def parser(subparsers) -> None:
+    "Builds the parser for the batch command"
+
+    parser = create_subcommand(
+        subparsers, "batch", alternate_config=False, project=False
+    )
+    parser.add_argument("manifest", type=Path, help="The path to the batch manifest")
+    pool = parser.add_argument_group("Worker Pool")
+    pool.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="The number of worker processes used to run projects (default: 1)",
+    )
+    pool.add_argument(
+        "--max-memory-gb",
+        type=float,
+        metavar="GB",
+        help="The maximum resident memory (in gigabytes) for each worker process",
+    )
+    logging(parser)
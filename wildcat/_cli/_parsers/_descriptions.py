@@ -9,6 +9,9 @@ Subcommand strings:
     preprocess      - Description of the "preprocess" subcommand
     assess          - Description of the "assess" subcommand
     export          - Description of the "export" subcommand
+    warmup          - Description of the "warmup" subcommand
+    serve           - Description of the "serve" subcommand
+    batch           - Description of the "batch" subcommand
 """
 
 #####
@@ -143,3 +146,54 @@ export = (
     "property names. In addition to this default renaming, users can specify custom\n"
     "names for exported properties using renaming options.\n",
 )
+
+warmup = (
+    "Compile JIT kernels so that later assessments start quickly",
+    # ----------
+    "Compiles the numba JIT kernels used by wildcat (via pfdf and pysheds), and\n"
+    "saves them to the on-disk JIT cache. Later assessments will load the compiled\n"
+    "kernels from the cache, rather than recompiling them in every new process.\n"
+    "This is useful for building container images with a warm JIT cache.\n"
+    " \n"
+    "By default, uses the folder indicated by the NUMBA_CACHE_DIR environment\n"
+    'variable. If this variable is not set, uses a "wildcat/numba" folder in the\n'
+    "user's cache directory. Note that assessments will only use the cache if they\n"
+    "use the same cache folder.",
+)
+
+serve = (
+    "Run preprocess, assess, and export jobs in a long-running process",
+    # ----------
+    "Runs a long-running server that accepts preprocess, assess, and export jobs\n"
+    "over localhost HTTP. The server imports wildcat's dependencies once on\n"
+    "startup, and JIT kernels remain compiled after the first job, so later jobs\n"
+    "start quickly. Jobs run one at a time.\n"
+    " \n"
+    "To run a job, POST a JSON object with the keyword arguments for the command's\n"
+    "Python function to /preprocess, /assess, or /export. The response streams the\n"
+    "job's log records as newline-delimited JSON, and ends with the path to the\n"
+    "job's output folder, or the error if the job failed. Send a GET request to\n"
+    "/status to check the server's status. Press Ctrl+C to stop the server.\n"
+    " \n"
+    "Job requests must have a Content-Type of application/json, and must include\n"
+    "the session token in the X-Wildcat-Token header. The token is read from the\n"
+    "WILDCAT_SERVE_TOKEN environment variable if set. Otherwise, the server\n"
+    "generates a random token and prints it on startup.",
+)
+
+batch = (
+    "Run preprocess, assess, and export for many projects from a manifest",
+    # ----------
+    "Runs the preprocess, assess, and export commands for each project listed in\n"
+    'a TOML batch manifest. Each [[projects]] table should include a "project"\n'
+    "field with the path to the project folder, and may include settings that\n"
+    "override the project's config file. The optional [settings] table holds\n"
+    "overrides for every project. Relative project paths are parsed relative to\n"
+    "the folder holding the manifest.\n"
+    " \n"
+    "Projects run concurrently in a pool of worker processes, and each worker\n"
+    "reuses its warm imports for every project it runs. A failed command stops\n"
+    "the remaining commands for its project, but not the other projects. Saves\n"
+    "a JSON summary with the timings and failures of each project next to the\n"
+    "manifest.",
+)
@@ -18,6 +18,7 @@ Preprocessing Options:
     _severity   - Adds the severity group with data field and dNBR estimation options
     _kf         - Adds the KF-factor group with data field and positive constraint options
     _evt_mask   - Adds the EVT group with water, development, and excluded options
+    _performance    - Adds the performance group with tiling, worker, and caching options
 """
 
 from __future__ import annotations
@@ -50,6 +51,7 @@ def parser(subparsers) -> None:
     _severity(parser)
     _kf(parser)
     _evt_masks(parser)
+    _performance(parser)
 
 
 #####
@@ -289,3 +291,45 @@ def _evt_masks(parser: ArgumentParser) -> None:
         )
         name = name.split("-")[0]
         switch(mask, f"no-find-{name}", f"Do not search the EVT for {name} pixels")
+
+
+def _performance(parser: ArgumentParser) -> None:
+    "Adds the performance group with tiling, worker, and caching options"
+
+    parser = parser.add_argument_group("Performance")
+    switch(parser, "tiled", "Preprocess the DEM grid in tiles to limit memory use")
+    parser.add_argument(
+        "--tile-size",
+        type=int,
+        metavar="PIXELS",
+        help="The number of pixels along each side of a preprocessing tile",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        metavar="N",
+        help="The maximum number of threads used to load and warp datasets",
+    )
+    switch(parser, "cache-datasets", "Reuse cached warped datasets from earlier runs")
+    parser.add_argument(
+        "--raster-compression",
+        metavar="NAME",
+        help="The GeoTIFF compression (none, deflate, zstd, or lerc)",
+    )
+    switch(parser, "raster-predictor", "Use a predictor for compressed GeoTIFFs")
+    parser.add_argument(
+        "--raster-layout",
+        metavar="LAYOUT",
+        help="The GeoTIFF layout (striped, tiled, or cog)",
+    )
+    parser.add_argument(
+        "--raster-bigtiff",
+        metavar="MODE",
+        help="When to write BigTIFF files (if_needed, if_safer, yes, or no)",
+    )
+    switch(parser, "raster-stack", "Save the rasters as the bands of a single file")
+    parser.add_argument(
+        "--raster-precision",
+        metavar="MODE",
+        help="The precision of the saved rasters (double or compact)",
+    )
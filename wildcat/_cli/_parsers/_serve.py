@@ -0,0 +1,32 @@
+"""
+Builds the CLI parser for the "serve" command
+----------
+Main Function:
+    parser  - Adds the "serve" parser to the subparsers
+"""
+
+from __future__ import annotations
+
+from wildcat._cli._parsers._utils import create_subcommand, logging
+
+
+def parser(subparsers) -> None:
+    "Builds the parser for the serve command"
+
+    parser = create_subcommand(
+        subparsers, "serve", alternate_config=False, project=False
+    )
+    server = parser.add_argument_group("Server")
+    server.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="The loopback host address for the server (default: 127.0.0.1)",
+    )
+    server.add_argument(
+        "--port",
+        type=int,
+        default=8910,
+        help="The port number for the server (default: 8910)",
+    )
+    logging(parser)
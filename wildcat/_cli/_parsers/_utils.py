@@ -17,6 +17,7 @@ import typing
 from argparse import RawDescriptionHelpFormatter
 from pathlib import Path
 
+from wildcat._cli import _profiling
 from wildcat._cli._parsers import _descriptions
 
 if typing.TYPE_CHECKING:
@@ -28,9 +29,10 @@ def create_subcommand(
     command: str,
     project_help: str = "The folder containing the configuration file for the command",
     alternate_config: bool = True,
+    project: bool = True,
 ) -> ArgumentParser:
     """Creates a subcommand parser with the project folder as a positional argument.
-    Also adds an error traceback option"""
+    Also adds an error traceback option and profiling options"""
 
     # Add the subcommand help text
     description = getattr(_descriptions, command)
@@ -42,12 +44,13 @@ def create_subcommand(
     )
 
     # Add the project folder as the first positional argument
-    parser.add_argument(
-        "project",
-        nargs="?",
-        type=Path,
-        help=project_help,
-    )
+    if project:
+        parser.add_argument(
+            "project",
+            nargs="?",
+            type=Path,
+            help=project_help,
+        )
 
     # Add a traceback option
     parser.add_argument(
@@ -57,6 +60,20 @@ def create_subcommand(
         help="Show the full traceback when an error occurs",
     )
 
+    # Add profiling options
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        help="Profiles the command and saves the profile to the indicated file",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=_profiling.FORMATS,
+        default="pstats",
+        help="The format of the saved profile (default: pstats)",
+    )
+
     # Add alternate config option
     if alternate_config:
         parser.add_argument(
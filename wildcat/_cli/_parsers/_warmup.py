@@ -0,0 +1,27 @@
+"""
+Builds the CLI parser for the "warmup" command
+----------
+Main Function:
+    parser  - Adds the "warmup" parser to the subparsers
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from wildcat._cli._parsers._utils import create_subcommand, logging
+
+
+def parser(subparsers) -> None:
+    "Builds the parser for the warmup command"
+
+    parser = create_subcommand(
+        subparsers, "warmup", alternate_config=False, project=False
+    )
+    parser.add_argument(
+        "folder",
+        nargs="?",
+        type=Path,
+        help="The JIT cache folder. Defaults to NUMBA_CACHE_DIR, or the user cache",
+    )
+    logging(parser)
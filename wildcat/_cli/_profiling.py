@@ -0,0 +1,271 @@
+"""
+Functions that profile a wildcat command run from the CLI
+----------
+When the "--profile" option is provided, the CLI runs the command within
+cProfile, and saves the profile to the indicated file. Supported formats are:
+
+    pstats      - The standard binary format, which can be opened in snakeviz
+    collapsed   - Folded stacks, which can be used to build a flamegraph
+    speedscope  - A JSON file that can be opened in speedscope
+
+cProfile only records caller-callee pairs, so the stacks for the collapsed and
+speedscope formats are reconstructed from the call graph. Time spent in a function
+is divided among its callers in proportion to the time of each call pair. The
+graph is walked iteratively, and functions already on a stack are not revisited,
+so recursion cannot grow a stack. Stacks are limited to a maximum depth and count,
+and negligible stacks are skipped. Recursion can attribute the same time to several
+levels of a stack, so the stacks ending in each function are scaled to never
+exceed its self time. As such, the stacks never sum to more than the measured time.
+
+After saving the profile, the CLI logs the self time of each module. Modules in
+wildcat, pfdf, and pysheds are listed individually. Other packages are grouped
+by name, so that (for example) GDAL IO via rasterio and fiona, numba kernels,
+and pure Python code can be distinguished.
+----------
+Main Function:
+    run             - Runs a command in cProfile and saves the profile
+
+Formats:
+    FORMATS         - The supported profile formats
+    _collapsed      - Saves folded stacks
+    _speedscope     - Saves a speedscope JSON file
+
+Call Stacks:
+    stacks          - Reconstructs call stacks and their self times
+
+Module Summary:
+    modules         - Returns the total self time of each module
+    module          - Returns the module or package that contains a function
+    _label          - Returns a display label for a function
+"""
+
+from __future__ import annotations
+
+import cProfile
+import heapq
+import json
+import pstats
+import typing
+from itertools import count
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from typing import Any, Callable
+
+    Function = tuple[str, int, str]
+    Stack = tuple[Function, ...]
+
+# The supported profile formats
+FORMATS = ["pstats", "collapsed", "speedscope"]
+
+# Packages whose modules are summarized individually
+DETAILED = ["wildcat", "pfdf", "pysheds"]
+
+# Packages that are summarized as a group, when called via a built-in function
+GROUPED = ["rasterio", "fiona", "numba", "numpy", "scipy", "shapely", "pyproj"]
+
+# Folders that hold installed packages
+SITE_PACKAGES = ["site-packages", "dist-packages"]
+
+# Callees with less time than this (in seconds) are not added to a stack
+MIN_SECONDS = 1e-6
+
+# The maximum depth of a reconstructed stack, and the maximum number of stacks
+MAX_DEPTH = 128
+MAX_STACKS = 100000
+
+# The number of modules to include in the logged summary
+SUMMARY_SIZE = 15
+
+
+#####
+# Main Function
+#####
+
+
+def run(
+    command: Callable, kwargs: dict[str, Any], path: Path, format: str, log: Logger
+) -> None:
+    """Runs a command in cProfile, and saves the profile to the indicated path
+    using the indicated format. Then logs the self time of each module. The
+    profile is saved even if the command fails"""
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(command, **kwargs)
+    finally:
+        stats = pstats.Stats(profiler)
+        if format == "pstats":
+            stats.dump_stats(path)
+        elif format == "collapsed":
+            _collapsed(stats, path)
+        else:
+            _speedscope(stats, path)
+        log.info(f"Saved {format} profile to {path}")
+
+        # Summarize the self time of each module
+        log.info("Self time by module:")
+        summary = modules(stats)
+        for name, seconds in list(summary.items())[:SUMMARY_SIZE]:
+            log.info(f"    {seconds:10.3f} s  {name}")
+
+
+#####
+# Formats
+#####
+
+
+def _collapsed(stats: pstats.Stats, path: Path) -> None:
+    "Saves folded call stacks with self times in integer microseconds"
+
+    lines = []
+    for stack, seconds in stacks(stats).items():
+        microseconds = round(seconds * 1e6)
+        if microseconds > 0:
+            frames = ";".join(_label(function) for function in stack)
+            lines.append(f"{frames} {microseconds}\n")
+    path.write_text("".join(lines))
+
+
+def _speedscope(stats: pstats.Stats, path: Path) -> None:
+    "Saves call stacks as a sampled profile in the speedscope file format"
+
+    # Collect the frames and stacks
+    frames, indices = [], {}
+    samples, weights = [], []
+    for stack, seconds in stacks(stats).items():
+        for function in stack:
+            if function not in indices:
+                indices[function] = len(frames)
+                file, line, _ = function
+                frames.append({"name": _label(function), "file": file, "line": line})
+        samples.append([indices[function] for function in stack])
+        weights.append(seconds)
+
+    # Build the speedscope file
+    profile = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": "wildcat",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+        "exporter": "wildcat",
+    }
+    path.write_text(json.dumps(profile))
+
+
+#####
+# Call Stacks
+#####
+
+
+def stacks(stats: pstats.Stats) -> dict[Stack, float]:
+    """Reconstructs call stacks from the call graph of a profile. Returns a dict
+    mapping each stack to its self time in seconds"""
+
+    # Get the callees of each function
+    callees = {function: [] for function in stats.stats}
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller in callers:
+            callees[caller].append(function)
+
+    # Start from each root function. Roots have calls that are not made by any
+    # profiled caller, which includes functions in a recursive cycle that was
+    # entered from outside the profile. Each pending stack records its total time,
+    # and the portion of its final function's time in the stack. Stacks with the
+    # most time are walked first, so the stack limit only drops the smallest stacks
+    order = count()
+    pending = []
+    for function, (_, ncalls, _, cumtime, callers) in stats.stats.items():
+        if sum(calls[0] for calls in callers.values()) < ncalls:
+            pending.append((-cumtime, next(order), (function,), 1.0))
+    heapq.heapify(pending)
+
+    # Record the self time of each stack, and then extend the stack with each
+    # callee that does not recurse back into the stack
+    output = {}
+    while pending:
+        _, _, stack, fraction = heapq.heappop(pending)
+        function = stack[-1]
+        output[stack] = output.get(stack, 0) + stats.stats[function][2] * fraction
+        if len(stack) == MAX_DEPTH:
+            continue
+        for callee in callees[function]:
+            seconds = stats.stats[callee][4][function][3] * fraction
+            full = len(output) + len(pending) >= MAX_STACKS
+            if callee in stack or seconds < MIN_SECONDS or full:
+                continue
+            portion = min(seconds / stats.stats[callee][3], 1)
+            item = (-seconds, next(order), stack + (callee,), portion)
+            heapq.heappush(pending, item)
+
+    # Scale the stacks ending in each function to not exceed its self time
+    totals = {}
+    for stack, seconds in output.items():
+        totals[stack[-1]] = totals.get(stack[-1], 0) + seconds
+    for stack, seconds in output.items():
+        tottime = stats.stats[stack[-1]][2]
+        if totals[stack[-1]] > tottime:
+            output[stack] = seconds * tottime / totals[stack[-1]]
+    return output
+
+
+#####
+# Module Summary
+#####
+
+
+def modules(stats: pstats.Stats) -> dict[str, float]:
+    """Returns the total self time of each module, sorted from longest to
+    shortest time"""
+
+    output = {}
+    for function, (_, _, tottime, _, _) in stats.stats.items():
+        name = module(function)
+        output[name] = output.get(name, 0) + tottime
+    return dict(sorted(output.items(), key=lambda item: item[1], reverse=True))
+
+
+def module(function: Function) -> str:
+    """Returns the module containing a function for wildcat, pfdf, and pysheds.
+    Otherwise, returns the name of the package containing the function"""
+
+    # Built-in functions are grouped by the package of their class, if known
+    file, _, name = function
+    if file == "~":
+        for package in DETAILED + GROUPED:
+            if f"'{package}." in name or f" {package}." in name:
+                return package
+        return "<built-in>"
+
+    # Use the package name for installed packages, except for detailed packages
+    parts = Path(file).with_suffix("").parts
+    for folder in SITE_PACKAGES:
+        if folder in parts:
+            parts = parts[len(parts) - parts[::-1].index(folder) :]
+            if parts[0] not in DETAILED:
+                return parts[0]
+
+    # Get the module for detailed packages. Everything else is pure Python
+    for index in reversed(range(len(parts))):
+        if parts[index] in DETAILED:
+            return ".".join(part for part in parts[index:] if part != "__init__")
+    return "<python>"
+
+
+def _label(function: Function) -> str:
+    "Returns a display label for a function"
+
+    file, line, name = function
+    if file == "~":
+        return name
+    return f"{name} ({Path(file).name}:{line})"
@@ -6,4 +6,7 @@ Subpackages:
     preprocess  - Implements the "preprocess" command
     assess      - Implements the "assess" command
     export      - Implements the "export" command
+    warmup      - Implements the "warmup" command
+    serve       - Implements the "serve" command
+    batch       - Implements the "batch" command
 """
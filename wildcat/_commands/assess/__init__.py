@@ -6,9 +6,12 @@ Main Function:
 
 Internal Modules:
     _assess     - Implements the "assess" function
+    _cache      - Functions that cache watershed rasters between runs
     _load       - Functions that load preprocessed datasets
     _model      - Functions that implement hazard models
     _network    - Functions to design and manage the stream segment network
+    _statistics - Functions that compute segment statistics in one batched pass
+    _rerun      - Functions that rerun hazard models on saved results
     _save       - Functions to save results to file
     _watershed  - Functions to analyze watersheds
 """
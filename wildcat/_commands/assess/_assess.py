@@ -2,22 +2,33 @@
 Function implementing the "assess" command
 ----------
 Functions:
-    assess  - Implements the "assess" command
+    assess          - Implements the "assess" command
+    _models_only    - Reruns the hazard models on saved assessment results
 """
 
 from __future__ import annotations
 
 import typing
 
-from wildcat._commands.assess import _load, _model, _network, _save, _watershed
-from wildcat._utils import _find, _setup
+from wildcat._commands.assess import (
+    _load,
+    _model,
+    _network,
+    _rerun,
+    _save,
+    _watershed,
+)
+from wildcat._utils import _find, _profile, _setup
 
 if typing.TYPE_CHECKING:
+    from logging import Logger
+    from pathlib import Path
+
     from wildcat.typing import Config
 
 
-def assess(locals: Config) -> None:
-    "Runs an assessment"
+def assess(locals: Config) -> Path:
+    "Runs an assessment. Returns the path to the assessment folder"
 
     # Start log. Parse config settings. Locate IO folders
     config, log = _setup.command("assess", "Assessment", locals)
@@ -25,25 +36,44 @@ def assess(locals: Config) -> None:
         config, "preprocessed", "assessment", log
     )
 
+    # Optionally just rerun the hazard models on saved results
+    profile = _profile.Profile("assess")
+    if config["models_only"]:
+        _models_only(config, assessment, profile, log)
+        profile.save(assessment)
+        return assessment
+
     # Locate and load preprocessed datasets
     paths = _find.preprocessed(config, preprocessed, log)
-    rasters = _load.datasets(paths, log)
+    rasters = profile.step(_load.datasets, config, paths, log)
 
-    # Analyze watershed
-    _watershed.severity_masks(rasters, log)
-    _watershed.characterize(config, rasters, log)
-    _watershed.accumulation(rasters, log)
+    # Analyze watershed. Optionally reuse cached watershed rasters
+    profile.step(_watershed.severity_masks, rasters, log)
+    profile.step(_watershed.analyze, config, paths, assessment, rasters, log)
 
     # Delineate and filter the network. Remove listed IDs and locate basins
-    segments = _network.delineate(config, rasters, log)
-    properties = _network.filter(config, segments, rasters, log)
-    _network.remove_ids(config, segments, properties, log)
-    _network.locate_basins(config, segments, log)
+    segments = profile.step(_network.delineate, config, rasters, log)
+    properties = profile.step(_network.filter, config, segments, rasters, log)
+    profile.step(_network.remove_ids, config, segments, properties, log)
+    profile.step(_network.locate_basins, config, segments, log)
 
     # Run the hazard assessment models
-    _model.i15_hazard(config, segments, rasters, properties, log)
-    _model.thresholds(config, segments, rasters, properties, log)
+    profile.step(_model.i15_hazard, config, segments, rasters, properties, log)
+    profile.step(_model.thresholds, config, segments, rasters, properties, log)
+
+    # Save results and the performance profile
+    profile.step(_save.results, assessment, config, segments, properties, log)
+    profile.step(_save.config, assessment, config, paths, log)
+    profile.save(assessment)
+    return assessment
+
+
+def _models_only(
+    config: Config, assessment: Path, profile: _profile.Profile, log: Logger
+) -> None:
+    "Reruns the hazard models on the saved segments and basins"
 
-    # Save results
-    _save.results(assessment, config, segments, properties, log)
-    _save.config(assessment, config, paths, log)
+    results = profile.step(_rerun.load, assessment, log)
+    properties = profile.step(_rerun.models, config, results, log)
+    profile.step(_rerun.save, assessment, results, properties, log)
+    profile.step(_rerun.config, assessment, config, log)
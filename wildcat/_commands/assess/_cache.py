@@ -0,0 +1,108 @@
+"""
+Functions that cache watershed rasters between assessment runs
+----------
+Conditioning the DEM, computing flow directions, slopes, and vertical relief, and
+computing flow accumulations are usually the most expensive steps of an
+assessment. However, these rasters only depend on the preprocessed DEM, burn
+severity, and retainment datasets, along with the dem_per_m and
+watershed_precision settings. When
+watershed caching is enabled, the assessment saves these rasters to the ".cache"
+subfolder of the "assessment" folder. The saved files are named using a key
+built from the fingerprints of the relevant preprocessed files and settings.
+Later runs with the same key reuse the cached rasters, so reruns that only change
+filtering or modeling settings skip the hydrologic analysis.
+----------
+Functions:
+    names   - Returns the names of the cached watershed rasters
+    key     - Returns the cache key for the watershed rasters
+    load    - Loads cached watershed rasters
+    save    - Saves watershed rasters to the cache
+
+Utilities:
+    _folder - Returns the path to the cache folder
+    _path   - Returns the path to a cached raster file
+"""
+
+from __future__ import annotations
+
+import typing
+
+from pfdf.raster import Raster
+
+from wildcat._utils import _cache
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from pathlib import Path
+
+    from wildcat.typing import Config, PathDict, RasterDict
+
+
+def names(rasters: RasterDict) -> list[str]:
+    "Returns the names of the cached watershed rasters"
+
+    names = ["flow", "slopes", "relief", "area", "burned-area"]
+    if "retainments" in rasters:
+        names.append("nretainments")
+    return names
+
+
+def key(config: Config, paths: PathDict) -> str:
+    "Returns the cache key for the watershed rasters"
+
+    fingerprints = {}
+    for name in ["dem_p", "severity_p", "retainments_p"]:
+        path = paths.get(name, None)
+        if path is not None:
+            path = _cache.fingerprint(path)
+        fingerprints[name] = path
+    settings = [config["dem_per_m"], config["watershed_precision"]]
+    return _cache.key("watershed", fingerprints, *settings)
+
+
+def load(assessment: Path, key: str, rasters: RasterDict, log: Logger) -> bool:
+    """Loads cached watershed rasters into the raster dict. Returns True if the
+    rasters were loaded, or False if the cache does not contain every raster"""
+
+    # Require every watershed raster
+    paths = {name: _path(assessment, name, key) for name in names(rasters)}
+    if not all(path.exists() for path in paths.values()):
+        return False
+
+    # Load the cached rasters
+    log.info("Loading cached watershed rasters")
+    for name, path in paths.items():
+        log.debug(f"    Loading cached {name}")
+        rasters[name] = Raster.from_file(path, name=name)
+    return True
+
+
+def save(assessment: Path, key: str, rasters: RasterDict, log: Logger) -> None:
+    "Saves watershed rasters to the cache, and removes stale cache files"
+
+    # Create the cache folder
+    log.info("Caching watershed rasters")
+    folder = _folder(assessment)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    # Remove stale versions of each raster and cache the new version
+    for name in names(rasters):
+        log.debug(f"    Caching {name}")
+        for stale in folder.glob(f"{name}-*.tif"):
+            stale.unlink()
+        rasters[name].save(_path(assessment, name, key), overwrite=True)
+
+
+#####
+# Utilities
+#####
+
+
+def _folder(assessment: Path) -> Path:
+    "Returns the path to the cache folder"
+    return assessment / ".cache"
+
+
+def _path(assessment: Path, name: str, key: str) -> Path:
+    "Returns the path to a cached watershed raster"
+    return _folder(assessment) / f"{name}-{key}.tif"
@@ -1,40 +1,199 @@
 """
 Function to load preprocessed rasters
 ----------
+When the "memory_map" setting is enabled, the values of preprocessed rasters are
+memory-mapped views of their files, rather than arrays read into memory. Only
+the pixels used by the assessment are paged in, and concurrent assessments on
+the same preprocessed folder share the operating system's page cache. A band can
+only be memory-mapped when its pixels are stored as contiguous, uncompressed
+strips, which is the default layout of preprocessed rasters. Other bands, such
+as compressed or internally tiled bands, are read into memory as usual. Stack
+bands are stored using a data type shared by every band, so datasets whose data
+type was promoted in the stack must be converted back to their original type.
+These bands are also read into memory, and are logged at the DEBUG level.
+
+Datasets recorded in the constants file are rebuilt as constant-valued rasters
+on the grid of the preprocessed DEM. When the "watershed_precision" setting is
+"compact", the loaded rasters are converted to compact data types.
+----------
 Functions:
     datasets    - Loads preprocessed raster datasets
+    _file       - Loads a preprocessed raster from a single-band file
+    _band       - Loads a preprocessed raster from a band of a stack file
+    _memmap     - Returns a memory-mapped view of a band, if possible
 """
 
 from __future__ import annotations
 
 import typing
 
+import numpy as np
+import rasterio
 from pfdf.raster import Raster
+from rasterio.enums import Interleaving
 
 import wildcat._utils._paths.assess as _paths
+from wildcat._utils import _constants, _precision, _stack
 
 if typing.TYPE_CHECKING:
     from logging import Logger
+    from pathlib import Path
+    from typing import Optional
+
+    from rasterio.io import DatasetReader
 
-    from wildcat.typing import PathDict, RasterDict
+    from wildcat.typing import Config, PathDict, RasterDict
 
 
-def datasets(paths: PathDict, log: Logger) -> RasterDict:
-    "Loads preprocessed raster datasets"
+def datasets(config: Config, paths: PathDict, log: Logger) -> RasterDict:
+    """Loads preprocessed raster datasets. Each stack file is opened once, and
+    its datasets are read from their bands. Optionally memory-maps the values.
+    Recorded constants are built on the grid of the DEM. Optionally converts the
+    rasters to compact data types"""
 
     # Start log and initialize raster dict
     log.info("Loading preprocessed rasters")
+    memory_map = config["memory_map"]
     rasters = {}
+    stacks = {}
+    constants = {}
 
     # Iterate through datasets. Skip missing files
-    for name_p, path in paths.items():
-        if path is None:
-            continue
-        name = name_p.removesuffix("_p")
-
-        # Load each preprocessed raster. Load masks as booleans
-        log.debug(f"    Loading {name}")
-        rasters[name] = Raster.from_file(
-            path, name=name, isbool=name_p in _paths.masks()
-        )
+    try:
+        for name_p, path in paths.items():
+            if path is None:
+                continue
+            name = name_p.removesuffix("_p")
+            isbool = name_p in _paths.masks()
+
+            # Load each preprocessed raster from its file or stack band. Load
+            # masks as booleans
+            if path.name == _constants.FILENAME:
+                constants[name] = path
+                continue
+            log.debug(f"    Loading {name}")
+            if path.name == _stack.FILENAME:
+                if path not in stacks:
+                    stacks[path] = rasterio.open(path)
+                rasters[name] = _band(stacks[path], name, isbool, memory_map, log)
+            elif memory_map:
+                rasters[name] = _file(path, name, isbool, log)
+            else:
+                rasters[name] = Raster.from_file(path, name=name, isbool=isbool)
+
+    # Close any open stack files
+    finally:
+        for file in stacks.values():
+            file.close()
+
+    # Build recorded constants on the DEM grid
+    for name, path in constants.items():
+        log.debug(f"    Building constant {name}")
+        value = _constants.load(path.parent)[name]
+        rasters[name] = _constants.raster(value, rasters["dem"], name)
+
+    # Optionally use compact data types
+    if config["watershed_precision"] == "compact":
+        for name in _precision.compact(rasters):
+            log.debug(f"    Converting {name} to {_precision.DTYPES[name]}")
     return rasters
+
+
+def _file(path: Path, name: str, isbool: bool, log: Logger) -> Raster:
+    "Loads a preprocessed raster from a single-band file using a memory map"
+
+    with rasterio.open(path) as file:
+        values = _memmap(file, 1)
+        if values is None:
+            log.debug(f"    Reading {name} into memory (not uncompressed strips)")
+            values = file.read(1)
+        return Raster.from_array(
+            values,
+            name=name,
+            nodata=file.nodata,
+            crs=file.crs,
+            transform=file.transform,
+            isbool=isbool,
+            copy=False,
+        )
+
+
+def _band(
+    file: DatasetReader, name: str, isbool: bool, memory_map: bool, log: Logger
+) -> Raster:
+    """Loads a preprocessed raster from a band of a stack file. Only memory-maps
+    bands that are stored using the dataset's original data type"""
+
+    # Locate the band and get the original data type
+    band = file.descriptions.index(name) + 1
+    tags = file.tags(band)
+    dtype = np.dtype(tags["dtype"])
+
+    # Read the values, memory-mapping them if possible
+    values = None
+    if memory_map and file.dtypes[band - 1] != dtype.name:
+        log.debug(f"    Reading {name} into memory (promoted stack data type)")
+    elif memory_map:
+        values = _memmap(file, band)
+        if values is None:
+            log.debug(f"    Reading {name} into memory (not uncompressed strips)")
+    if values is None:
+        values = file.read(band)
+
+    # Restore the original data type and NoData value
+    values = values.astype(dtype, copy=False)
+    nodata = tags.get("nodata", None)
+    if nodata is not None:
+        nodata = dtype.type(nodata)
+
+    # Build the raster
+    return Raster.from_array(
+        values,
+        name=name,
+        nodata=nodata,
+        crs=file.crs,
+        transform=file.transform,
+        isbool=isbool,
+        copy=False,
+    )
+
+
+def _memmap(file: DatasetReader, band: int) -> Optional[np.memmap]:
+    """Returns a read-only memory-mapped view of a GeoTIFF band. Returns None if
+    the band is not stored as contiguous, uncompressed strips"""
+
+    # Require an uncompressed, striped GeoTIFF whose bands are stored separately
+    if file.driver != "GTiff" or file.compression is not None:
+        return None
+    rows, width = file.block_shapes[band - 1]
+    if width != file.width or (
+        file.count > 1 and file.interleaving != Interleaving.band
+    ):
+        return None
+
+    # Get the location of the first strip. Offsets are 0 for sparse files
+    offset = file.get_tag_item("BLOCK_OFFSET_0_0", "TIFF", bidx=band)
+    size = file.get_tag_item("BLOCK_SIZE_0_0", "TIFF", bidx=band)
+    if not offset or not size:
+        return None
+    offset = int(offset)
+
+    # Require full-size strips that are stored contiguously
+    dtype = np.dtype(file.dtypes[band - 1])
+    if int(size) != rows * width * dtype.itemsize:
+        return None
+    last = (file.height - 1) // rows
+    final = file.get_tag_item(f"BLOCK_OFFSET_0_{last}", "TIFF", bidx=band)
+    if final is None or int(final) != offset + last * int(size):
+        return None
+
+    # Use the byte order of the file
+    with open(file.name, "rb") as tiff:
+        order = "<" if tiff.read(2) == b"II" else ">"
+    return np.memmap(
+        file.name,
+        dtype=dtype.newbyteorder(order),
+        mode="r",
+        offset=offset,
+        shape=(file.height, file.width),
+    )
@@ -7,6 +7,7 @@ Main Functions:
 
 Utilities:
     _m1_variables   - Computes the terrain, fire, and soil variables for the M1 model
+    _g14_variables  - Computes the burned area and relief variables for the G14 model
     _likelihood      - Estimates debris-flow likelihood
     _volume          - Estimates debris-flow volumes
     _hazard          - Classifies relative hazard
@@ -122,6 +123,31 @@ def _m1_variables(
     properties["Soil_M1"] = S
 
 
+def _g14_variables(
+    config: Config,
+    segments: Segments,
+    rasters: RasterDict,
+    properties: PropertyDict,
+    log: Logger,
+) -> None:
+    "Computes the burned area and relief variables for the G14 model"
+
+    # Just exit if the variables were already computed
+    if "Bmh_km2" in properties:
+        return
+
+    # Compute the variables
+    log.debug("    Computing catchment area burned at moderate-or-high severity")
+    Bmh_km2 = segments.burned_area(rasters["moderate-high"], units="kilometers")
+    log.debug("    Computing vertical relief")
+    relief = segments.relief(rasters["relief"])
+    relief = relief / config["dem_per_m"]
+
+    # Record as properties
+    properties["Bmh_km2"] = Bmh_km2
+    properties["Relief_m"] = relief
+
+
 def _likelihood(
     I15: list[float],
     segments: Segments,
@@ -161,26 +187,19 @@ def _volume(
 ) -> None:
     "Estimates potential sediment volume using the G14 emergency assessment model"
 
-    # Start log and extract config fields
+    # Start log and extract config fields. Get model variables
     log.info("Estimating potential sediment volume")
     I15 = config["I15_mm_hr"]
     CI = config["volume_CI"]
-    dem_per_m = config["dem_per_m"]
-
-    # Compute variables
-    log.debug("    Computing catchment area burned at moderate-or-high severity")
-    Bmh_km2 = segments.burned_area(rasters["moderate-high"], units="kilometers")
-    log.debug("    Computing vertical relief")
-    relief = segments.relief(rasters["relief"])
-    relief = relief / dem_per_m
+    _g14_variables(config, segments, rasters, properties, log)
 
     # Run the model
     log.debug("    Running model")
-    V, Vmin, Vmax = g14.emergency(I15, Bmh_km2, relief, CI=CI, keepdims=True)
+    V, Vmin, Vmax = g14.emergency(
+        I15, properties["Bmh_km2"], properties["Relief_m"], CI=CI, keepdims=True
+    )
 
-    # Collect model variables and outputs
-    properties["Bmh_km2"] = Bmh_km2
-    properties["Relief_m"] = relief
+    # Collect model outputs
     properties["V"] = V
     properties["Vmin"] = Vmin
     properties["Vmax"] = Vmax
@@ -9,17 +9,19 @@ Functions:
 
 Utilities:
     _mask           - Returns a value for mask that can be used in logical expressions
-    _developed_area - Computes the developed area in km2
-    _included       - Indicates whether segments intersect an included area
 """
 
 from __future__ import annotations
 
+import os
 import typing
+from time import perf_counter
 
 import numpy as np
 from pfdf.segments import Segments
 
+from wildcat._commands.assess import _statistics
+
 if typing.TYPE_CHECKING:
     from logging import Logger
 
@@ -78,7 +80,7 @@ def filter(
 ) -> PropertyDict:
     "Filters the network to model-worthy segments"
 
-    # Start log. Extract config settings and perimeter mask
+    # Start log and extract config settings
     log.info("Filtering network")
     dem_per_m = config["dem_per_m"]
     max_area = config["max_area_km2"]
@@ -89,21 +91,22 @@ def filter(
     max_confinement = config["max_confinement"]
     neighborhood = config["confinement_neighborhood"]
     flow_continuous = config["flow_continuous"]
-    perimeter = rasters["perimeter"].values
 
-    # Compute physical variables characterizing the segments
+    # Compute physical variables characterizing the segments. The pixel and
+    # catchment statistics (including any model inputs) are computed in one pass
     log.debug("    Characterizing segments")
-    area = segments.area(units="kilometers")
-    exterior_ratio = segments.catchment_ratio(~perimeter)
-    burn_ratio = segments.burn_ratio(rasters["burned"])
-    slopes = segments.slope(rasters["slopes"])
+    statistics = _statistics.compute(config, segments, rasters)
+    area = statistics.pop("Area_km2")
+    exterior_ratio = statistics.pop("ExtRatio")
+    burn_ratio = statistics.pop("BurnRatio")
+    slopes = statistics.pop("Slope")
     confinement = segments.confinement(rasters["dem"], neighborhood, dem_per_m)
-    developed_area = _developed_area(segments, rasters)
+    developed_area = statistics.pop("DevAreaKm2")
 
     # Determine which segments meet filtering criteria
-    included = _included(segments, rasters)
+    included = statistics.pop("IsIncluded")
     floodlike = area > max_area
-    intersects_perimeter = segments.in_perimeter(perimeter)
+    intersects_perimeter = statistics.pop("IsXPerim")
     exterior = exterior_ratio >= max_exterior_ratio
     burned = burn_ratio >= min_burn_ratio
     steep = slopes >= min_slope
@@ -147,6 +150,8 @@ def filter(
         "IsConfined": confined,
         "IsUndev": undeveloped,
         "IsFlowSave": flow_saved,
+        # Model inputs
+        **statistics,
     }
 
     # Filter network and return filtered variables
@@ -155,24 +160,6 @@ def filter(
     return {name: values[keep] for name, values in variables.items()}
 
 
-def _developed_area(segments: Segments, rasters: RasterDict) -> np.ndarray:
-    "Returns the developed area (in km2) of the segments"
-
-    if "isdeveloped" in rasters:
-        return segments.developed_area(rasters["isdeveloped"], units="kilometers")
-    else:
-        return np.zeros(segments.size)
-
-
-def _included(segments: Segments, rasters: RasterDict) -> np.ndarray:
-    "Indicates whether segments intersect an included area"
-
-    if "included" in rasters:
-        return segments.in_mask(rasters["included"])
-    else:
-        return np.zeros(segments.size, dtype=bool)
-
-
 def remove_ids(
     config: Config, segments: Segments, variables: PropertyDict, log: Logger
 ) -> None:
@@ -204,6 +191,22 @@ def remove_ids(
 def locate_basins(config: Config, segments: Segments, log: Logger) -> None:
     "Optionally locates the basins"
 
-    if config["locate_basins"]:
-        log.info("Locating outlet basins")
-        segments.locate_basins(parallel=config["parallelize_basins"])
+    # Just exit if not locating basins
+    if not config["locate_basins"]:
+        return
+    log.info("Locating outlet basins")
+
+    # Locate basins serially
+    if not config["parallelize_basins"]:
+        segments.locate_basins()
+        return
+
+    # Otherwise, use the configured number of workers (or all but one CPU), and
+    # log the time spent locating basins
+    nprocess = config["basin_workers"]
+    if nprocess is None:
+        nprocess = max(os.cpu_count() - 1, 1)
+    log.debug(f"    Using {nprocess} worker processes")
+    start = perf_counter()
+    segments.locate_basins(parallel=True, nprocess=nprocess)
+    log.debug(f"    Located basins in {perf_counter() - start:.2f} seconds")
@@ -0,0 +1,224 @@
+"""
+Functions that rerun the hazard models on saved assessment results
+----------
+The stream segment network and the hazard model inputs only depend on the
+preprocessed datasets, delineation settings, and filtering settings. By contrast,
+the hazard modeling parameters (I15_mm_hr, volume_CI, durations, and
+probabilities) are often updated as rainfall forecasts change. When the
+"models_only" setting is enabled, the assessment skips the watershed analysis,
+delineation, and filtering steps. Instead, it loads the model inputs (Terrain_M1,
+Fire_M1, Soil_M1, Bmh_km2, and Relief_m) from the saved segments and basins,
+reruns the hazard models, and overwrites the saved model results. The saved
+files are rewritten in their existing format. The hazard modeling parameters in
+the recorded configuration.txt are also updated, so that exports use the new
+parameters to name the model results.
+----------
+Main Functions:
+    load        - Loads the saved segments and basins
+    models      - Reruns the hazard models on the saved model inputs
+    save        - Overwrites the saved model results
+    config      - Updates the recorded modeling parameters in configuration.txt
+
+Utilities:
+    _features   - Loads a saved feature file
+    _require    - Requires the model inputs needed to run the models
+    _inputs     - Returns the model input properties for a set of records
+    _isresult   - True if a property is a model result
+    _overwrite  - Overwrites a saved feature file with new model results
+"""
+
+from __future__ import annotations
+
+import typing
+
+import fiona
+import numpy as np
+
+from wildcat._commands.assess import _model, _save
+from wildcat._utils import _parameters, _properties, _saved
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from pathlib import Path
+    from typing import Any
+
+    from wildcat.typing._assess import Config, PropertyDict
+
+    Features = tuple[dict[str, Any], list[dict]]
+    SavedResults = dict[str, Features]
+
+
+#####
+# Main Functions
+#####
+
+
+def load(assessment: Path, log: Logger) -> SavedResults:
+    "Loads the saved segments and basins"
+
+    # Segments are required, but basins are optional
+    log.info("Loading saved assessment results")
+    results = {"segments": _features(assessment, "segments", log)}
+    if _saved.locate(assessment, "basins") is not None:
+        results["basins"] = _features(assessment, "basins", log)
+    return results
+
+
+def models(config: Config, results: SavedResults, log: Logger) -> list[PropertyDict]:
+    """Reruns the hazard models on the saved model inputs. Returns the finalized
+    model results for each saved feature file"""
+
+    # Combine the model inputs from each file, so the models only run once
+    _require(config, results)
+    inputs = [_inputs(records) for _, records in results.values()]
+    properties = {
+        field: np.concatenate([values[field] for values in inputs])
+        for field in inputs[0]
+    }
+
+    # Run the models. The segments and rasters are not needed because the model
+    # inputs were already computed
+    _model.i15_hazard(config, None, None, properties, log)
+    _model.thresholds(config, None, None, properties, log)
+    _save._finalize(config, properties)
+
+    # Split the results back into the individual feature files
+    ends = np.cumsum([len(records) for _, records in results.values()])
+    starts = np.concatenate([[0], ends[:-1]])
+    return [
+        {field: values[start:end] for field, values in properties.items()}
+        for start, end in zip(starts, ends)
+    ]
+
+
+def save(
+    assessment: Path,
+    results: SavedResults,
+    properties: list[PropertyDict],
+    log: Logger,
+) -> None:
+    "Overwrites the saved model results"
+
+    log.info("Saving results")
+    for (name, features), values in zip(results.items(), properties):
+        log.debug(f"    Saving {name}")
+        _overwrite(_saved.locate(assessment, name), features, values)
+
+
+def config(assessment: Path, config: Config, log: Logger) -> None:
+    "Updates the recorded modeling parameters in configuration.txt"
+
+    # Require the recorded configuration
+    log.debug("    Updating configuration.txt")
+    path = assessment / "configuration.txt"
+    if not path.exists():
+        raise FileNotFoundError(
+            "Could not locate the configuration.txt record for the assessment. "
+            f"It may have been deleted.\nMissing Path: {path}"
+        )
+
+    # Replace the modeling parameters, leaving all other settings unchanged
+    fields = _parameters.names() + ["models_only"]
+    with open(path) as file:
+        lines = file.readlines()
+    with open(path, "w") as file:
+        for line in lines:
+            field = line.split("=")[0].strip()
+            if field in fields:
+                line = f"{field} = {config[field]}\n"
+            file.write(line)
+
+
+#####
+# Utilities
+#####
+
+
+def _features(assessment: Path, name: str, log: Logger) -> Features:
+    "Loads a saved feature file as a fiona metadata dict and GeoJSON-like records"
+
+    # Require an existing file
+    log.debug(f"    Loading {name}")
+    path = _saved.locate(assessment, name)
+    if path is None:
+        raise FileNotFoundError(
+            f"Could not locate the saved {name} file for the assessment. "
+            "You must run a full assessment before rerunning the hazard models.\n"
+            f"Assessment Folder: {assessment}"
+        )
+
+    # Load the features
+    try:
+        with fiona.open(path) as file:
+            meta = file.meta
+            records = [record.__geo_interface__ for record in file]
+    except Exception as error:
+        raise RuntimeError(
+            f"Could not load the saved {path.name} file for the assessment. "
+            "The assessment results may have been altered."
+        ) from error
+    return meta, records
+
+
+def _require(config: Config, results: SavedResults) -> None:
+    "Requires the saved model inputs needed to run the hazard models"
+
+    # Determine the required inputs
+    inputs = []
+    if len(config["I15_mm_hr"]) > 0:
+        inputs = _properties.model_inputs()
+    elif len(config["durations"]) > 0 and len(config["probabilities"]) > 0:
+        inputs = ["Terrain_M1", "Fire_M1", "Soil_M1"]
+
+    # Require each input in each saved file
+    for name, (meta, _) in results.items():
+        for field in inputs:
+            if field not in meta["schema"]["properties"]:
+                raise ValueError(
+                    "Cannot rerun the hazard models because the saved "
+                    f'{name} file does not include the "{field}" model '
+                    "input. Run a full assessment with the desired modeling "
+                    "parameters instead."
+                )
+
+
+def _inputs(records: list[dict]) -> PropertyDict:
+    "Returns the saved model inputs for a set of records. Uses NaN for missing values"
+
+    inputs = {}
+    for field in _properties.model_inputs():
+        values = [record["properties"].get(field, None) for record in records]
+        inputs[field] = np.array(values, dtype=float)
+    return inputs
+
+
+def _isresult(field: str) -> bool:
+    "True if a property is a model result"
+    return field.split("_")[0] in _properties.results()
+
+
+def _overwrite(path: Path, features: Features, properties: PropertyDict) -> None:
+    "Overwrites a saved feature file, replacing any previous model results"
+
+    # Remove the old results from the schema, then add the new fields
+    meta, records = features
+    schema = meta["schema"]["properties"]
+    schema = {field: kind for field, kind in schema.items() if not _isresult(field)}
+    for field, values in properties.items():
+        if _isresult(field):
+            schema[field] = "int" if values.dtype.kind in "iu" else "float"
+    meta = meta | {"schema": meta["schema"] | {"properties": schema}}
+
+    # Rewrite each record with the updated properties
+    with fiona.open(path, "w", **meta) as file:
+        for k, record in enumerate(records):
+            values = {
+                field: value
+                for field, value in record["properties"].items()
+                if not _isresult(field)
+            }
+            for field in schema:
+                if _isresult(field):
+                    values[field] = properties[field][k].item()
+            record = record | {"properties": values}
+            file.write(fiona.Feature.from_dict(record))
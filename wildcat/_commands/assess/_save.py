@@ -1,6 +1,10 @@
 """
 Functions that save assessment results to file
 ----------
+The segments, basins, and outlets are saved in the file format given by the
+"assessment_format" setting. Saved results left in other formats by earlier
+runs are removed, so that later commands always read the current results.
+----------
 Functions:
     _finalize   - Finalizes a property dict for geojson export
     results     - Saves the segments, basins, and outlets
@@ -12,7 +16,7 @@ from __future__ import annotations
 import typing
 
 import wildcat._utils._paths.assess as _paths
-from wildcat._utils import _parameters
+from wildcat._utils import _parameters, _saved
 from wildcat._utils._config import record
 
 if typing.TYPE_CHECKING:
@@ -75,18 +79,21 @@ def results(
     log.debug("    Finalizing properties")
     _finalize(config, properties)
 
+    # Remove saved results in other formats
+    format = config["assessment_format"]
+    for name in ["segments", "basins", "outlets"]:
+        _saved.remove(assessment, name, keep=format)
+
     # Save segments
     log.debug("    Saving segments")
-    segments.save(
-        assessment / "segments.geojson", "segments", properties, overwrite=True
-    )
+    path = _saved.path(assessment, "segments", format)
+    segments.save(path, "segments", properties, overwrite=True)
 
     # Optionally save basins
     if config["locate_basins"]:
         log.debug("    Saving basins")
-        segments.save(
-            assessment / "basins.geojson", "basins", properties, overwrite=True
-        )
+        path = _saved.path(assessment, "basins", format)
+        segments.save(path, "basins", properties, overwrite=True)
 
     # Remove nested basins
     log.debug("    Removing nested drainages")
@@ -96,7 +103,8 @@ def results(
 
     # Export outlets
     log.debug("    Saving outlets")
-    segments.save(assessment / "outlets.geojson", "outlets", overwrite=True)
+    path = _saved.path(assessment, "outlets", format)
+    segments.save(path, "outlets", overwrite=True)
 
 
 def config(assessment: Path, config: Config, paths: PathDict, log: Logger) -> None:
@@ -139,4 +147,21 @@ def config(assessment: Path, config: Config, paths: PathDict, log: Logger) -> No
             ["I15_mm_hr", "volume_CI", "durations", "probabilities"],
             config,
         )
-        record.section(file, "Basins", ["locate_basins", "parallelize_basins"], config)
+        record.section(
+            file,
+            "Basins",
+            ["locate_basins", "parallelize_basins", "basin_workers"],
+            config,
+        )
+        record.section(
+            file,
+            "Performance",
+            [
+                "cache_watershed",
+                "models_only",
+                "assessment_format",
+                "memory_map",
+                "watershed_precision",
+            ],
+            config,
+        )
@@ -0,0 +1,196 @@
+"""
+Functions that compute segment statistics in a single batched pass
+----------
+Filtering the network and running the hazard models both require statistics for
+each stream segment. Some of these summarize the pixels in each segment (the
+mean slope, and whether the segment intersects the fire perimeter or an included
+area), while others summarize the catchment that drains to each segment's outlet
+(catchment area, exterior and burn ratios, developed area, and the M1 and G14
+model inputs). Rather than computing each statistic separately, the functions in
+this module locate the segment pixels and outlets once, and summarize the segment
+pixels using a single set of bincounts. Catchment and burned areas are sampled
+from the flow accumulations computed by the watershed analysis, and the remaining
+catchment statistics are computed from a single traversal of the flow network.
+Confinement angles are not included, as they depend on the DEM neighborhood of
+each segment, and are still computed by the stream segment network.
+----------
+Main Function:
+    compute         - Computes the statistics used to filter and model segments
+
+Segment Geometry:
+    _pixels         - Returns the flattened pixel indices and labels of the segments
+    _outlets        - Returns the flattened index of each segment's outlet pixel
+
+Statistics:
+    _models         - Returns the names of the model inputs that will be needed
+    _weights        - Returns the weights of the remaining catchment statistics
+    _segment_stats  - Computes statistics that summarize the pixels in each segment
+"""
+
+from __future__ import annotations
+
+import typing
+from math import nan
+
+import numpy as np
+
+from wildcat._commands.assess import _watershed
+
+if typing.TYPE_CHECKING:
+    from numpy import ndarray
+    from pfdf.segments import Segments
+
+    from wildcat.typing._assess import Config, PropertyDict, RasterDict
+
+# The minimum slope gradient (tan 23 degrees) of the M1 terrain variable
+_M1_SLOPE = np.tan(np.radians(23))
+
+
+#####
+# Main Function
+#####
+
+
+def compute(config: Config, segments: Segments, rasters: RasterDict) -> PropertyDict:
+    """Computes the statistics used to filter the segments, along with any
+    model inputs needed by the hazard models. Returns a dict of property arrays"""
+
+    # Locate the segment pixels and outlets
+    flow = rasters["flow"]
+    pixels, labels = _pixels(segments, flow.shape)
+    downstream = _watershed.downstream(flow.values)
+    outlets = _outlets(pixels, labels, downstream, segments.size)
+
+    # Sample the existing catchment areas. Accumulate every other catchment
+    # weight at once and sample at the outlets
+    models = _models(config)
+    weights = _weights(rasters, models)
+    accumulations = _watershed.accumulate(flow.values, list(weights.values()))
+    catchments = {
+        name: rasters[name].values.ravel()[outlets].astype(float)
+        for name in ["area", "burned-area"]
+    }
+    for name, values in zip(weights.keys(), accumulations):
+        catchments[name] = values.ravel()[outlets]
+
+    # Filtering statistics
+    area = catchments["area"]
+    pixel_area = flow.pixel_area(units="kilometers")
+    npixels = area / pixel_area
+    developed = catchments.get("developed", np.zeros(segments.size))
+    statistics = {
+        "Area_km2": area,
+        "ExtRatio": catchments["exterior"] / npixels,
+        "BurnRatio": catchments["burned-area"] / area,
+        "DevAreaKm2": developed * pixel_area,
+    }
+    statistics |= _segment_stats(segments, rasters, pixels, labels)
+
+    # M1 model inputs. Missing dNBR and KF-factor values are omitted from the means
+    if "Terrain_M1" in models:
+        statistics["Terrain_M1"] = catchments["terrain"] / npixels
+        statistics["Fire_M1"] = catchments["dnbr"] / catchments["dnbr-count"] / 1000
+        statistics["Soil_M1"] = catchments["kf"] / catchments["kf-count"]
+
+    # G14 model inputs
+    if "Bmh_km2" in models:
+        statistics["Bmh_km2"] = catchments["modhigh"] * pixel_area
+        relief = rasters["relief"].values.ravel()[outlets].astype(float)
+        statistics["Relief_m"] = relief / config["dem_per_m"]
+    return statistics
+
+
+#####
+# Segment Geometry
+#####
+
+
+def _pixels(segments: Segments, shape: tuple[int, int]) -> tuple[ndarray, ndarray]:
+    """Returns the flattened indices of the pixels in the segments, along with the
+    index of the segment that contains each pixel"""
+
+    pixels = [np.ravel_multi_index(indices, shape) for indices in segments.indices]
+    labels = np.repeat(np.arange(segments.size), [len(k) for k in pixels])
+    pixels = np.concatenate([np.empty(0, int)] + pixels)
+    return pixels, labels
+
+
+def _outlets(
+    pixels: ndarray, labels: ndarray, downstream: ndarray, nsegments: int
+) -> ndarray:
+    """Returns the flattened index of the outlet pixel of each segment. The outlet
+    is the segment pixel that does not flow into another pixel of the segment"""
+
+    segment = np.full(downstream.size, -1)
+    segment[pixels] = labels
+    target = downstream[pixels]
+    isoutlet = (target < 0) | (segment[target] != labels)
+
+    outlets = np.zeros(nsegments, int)
+    outlets[labels[isoutlet]] = pixels[isoutlet]
+    return outlets
+
+
+#####
+# Statistics
+#####
+
+
+def _models(config: Config) -> list[str]:
+    "Returns the names of the model inputs needed by the hazard models"
+
+    if len(config["I15_mm_hr"]) > 0:
+        return ["Terrain_M1", "Fire_M1", "Soil_M1", "Bmh_km2", "Relief_m"]
+    elif len(config["durations"]) > 0 and len(config["probabilities"]) > 0:
+        return ["Terrain_M1", "Fire_M1", "Soil_M1"]
+    else:
+        return []
+
+
+def _weights(rasters: RasterDict, models: list[str]) -> dict[str, ndarray]:
+    """Returns the weights of the catchment statistics. Excludes the catchment
+    and burned areas, which are accumulated by the watershed analysis"""
+
+    # Filtering statistics
+    weights = {"exterior": ~rasters["perimeter"].values}
+    if "isdeveloped" in rasters:
+        weights["developed"] = rasters["isdeveloped"].values
+
+    # M1 variables. Means use the number of valid pixels in each catchment
+    if "Terrain_M1" in models:
+        slopes = rasters["slopes"]
+        steep = (slopes.values >= _M1_SLOPE) & ~slopes.nodata_mask
+        weights["terrain"] = rasters["moderate-high"].values & steep
+        for name in ["dnbr", "kf"]:
+            raster = rasters[name]
+            valid = ~raster.nodata_mask & ~np.isnan(raster.values)
+            weights[name] = np.where(valid, raster.values, 0)
+            weights[f"{name}-count"] = valid
+
+    # G14 variables
+    if "Bmh_km2" in models:
+        weights["modhigh"] = rasters["moderate-high"].values
+    return weights
+
+
+def _segment_stats(
+    segments: Segments, rasters: RasterDict, pixels: ndarray, labels: ndarray
+) -> PropertyDict:
+    """Computes the mean slope of each segment, and whether each segment intersects
+    the fire perimeter or an included area"""
+
+    # Mean slopes. A NoData slope in a segment results in a NaN mean
+    slopes = rasters["slopes"]
+    values = np.where(slopes.nodata_mask, nan, slopes.values).ravel()[pixels]
+    npixels = np.bincount(labels, minlength=segments.size)
+    slopes = np.bincount(labels, weights=values, minlength=segments.size) / npixels
+
+    # Whether segments intersect the perimeter and included areas
+    statistics = {"Slope": slopes}
+    for field, name in [("IsXPerim", "perimeter"), ("IsIncluded", "included")]:
+        if name in rasters:
+            mask = rasters[name].values.ravel()[pixels]
+            statistics[field] = np.bincount(labels[mask], minlength=segments.size) > 0
+        else:
+            statistics[field] = np.zeros(segments.size, dtype=bool)
+    return statistics
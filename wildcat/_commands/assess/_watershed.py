@@ -4,20 +4,45 @@ Functions that analyze the watershed
 Functions:]
     severity_masks  - Builds the burn mask and moderate-high severity mask
     _mask           - Builds a burn severity mask
+    analyze         - Computes (or loads cached) watershed rasters
     characterize    - Computes flow directions, slopes, and vertical relief
     accumulation    - Computes flow accumulations
+
+Flow Networks:
+    downstream      - Returns the index of the pixel downstream of each pixel
+    accumulate      - Accumulates multiple weights in one traversal of a flow network
+    _next           - Returns the pixel downstream of a pixel (JIT kernel)
+    _accumulate     - Accumulates a stack of weights in place (JIT kernel)
 """
 
 from __future__ import annotations
 
 import typing
+from math import nan
 
+import numpy as np
+from numba import njit
 from pfdf import severity, watershed
+from pfdf.raster import Raster
+
+from wildcat._commands.assess import _cache
+from wildcat._utils import _precision
 
 if typing.TYPE_CHECKING:
     from logging import Logger
+    from pathlib import Path
+
+    from numpy import ndarray
 
-    from wildcat.typing import Config, RasterDict
+    from wildcat.typing import Config, PathDict, RasterDict
+
+# Row and column offsets of each TauDEM-style D8 flow direction. Directions are
+# numbered counter-clockwise from 1 (east) to 8 (southeast). Index 0 is a sink
+_ROWS = np.array([0, 0, -1, -1, -1, 0, 1, 1, 1])
+_COLS = np.array([0, 1, 1, 0, -1, -1, -1, 0, 1])
+
+# Inflow count that marks a pixel processed by the accumulation kernel
+_PROCESSED = 255
 
 
 def severity_masks(rasters: RasterDict, log: Logger) -> None:
@@ -36,8 +61,33 @@ def _mask(rasters: RasterDict, description: str, log: Logger) -> None:
     return severity.mask(rasters["severity"], description)
 
 
+def analyze(
+    config: Config,
+    paths: PathDict,
+    assessment: Path,
+    rasters: RasterDict,
+    log: Logger,
+) -> None:
+    """Computes flow directions, slopes, vertical relief, and flow accumulations.
+    Optionally reuses cached rasters from an earlier run"""
+
+    # Just compute the rasters if not caching
+    if not config["cache_watershed"]:
+        characterize(config, rasters, log)
+        accumulation(config, rasters, log)
+        return
+
+    # Otherwise, attempt to load cached rasters before computing and caching
+    key = _cache.key(config, paths)
+    if not _cache.load(assessment, key, rasters, log):
+        characterize(config, rasters, log)
+        accumulation(config, rasters, log)
+        _cache.save(assessment, key, rasters, log)
+
+
 def characterize(config: Config, rasters: RasterDict, log: Logger) -> None:
-    "Computes flow directions, slopes, and vertical relief"
+    """Computes flow directions, slopes, and vertical relief. Optionally stores
+    the slopes and relief using compact data types"""
 
     # Condition the DEM
     log.info("Characterizing watershed")
@@ -60,29 +110,116 @@ def characterize(config: Config, rasters: RasterDict, log: Logger) -> None:
     rasters["flow"] = flow
     rasters["slopes"] = slopes
     rasters["relief"] = relief
+    if config["watershed_precision"] == "compact":
+        _precision.compact(rasters, ["slopes", "relief"])
 
 
-def accumulation(rasters: RasterDict, log: Logger) -> None:
-    "Computes flow accumulations"
+def accumulation(config: Config, rasters: RasterDict, log: Logger) -> None:
+    """Computes flow accumulations in a single traversal of the flow directions.
+    Always accumulates using 64-bit floats, since 32-bit floats cannot count more
+    than 2^24 upstream pixels exactly"""
 
     # Setup
     log.info("Computing flow accumulations")
     pixel_area = rasters["dem"].pixel_area(units="kilometers")
     flow = rasters["flow"]
 
-    # Total area
+    # Collect the weights and multiplier for each accumulation
     log.debug("    Total catchment area")
-    rasters["area"] = watershed.accumulation(flow, times=pixel_area, check_flow=False)
-
-    # Burned area
+    weights = {"area": (np.ones(flow.shape), pixel_area)}
     log.debug("    Burned catchment area")
-    rasters["burned-area"] = watershed.accumulation(
-        flow, mask=rasters["burned"], times=pixel_area, check_flow=False
-    )
+    weights["burned-area"] = (rasters["burned"].values, pixel_area)
 
     # Areas below retainment features
     if "retainments" in rasters:
         log.debug("    Areas below retainment features")
-        rasters["nretainments"] = watershed.accumulation(
-            flow, mask=rasters["retainments"], check_flow=False
+        weights["nretainments"] = (rasters["retainments"].values, 1)
+
+    # Accumulate all the weights at once and build the rasters
+    arrays = [values for values, _ in weights.values()]
+    accumulations = accumulate(flow.values, arrays)
+    for (name, (_, times)), values in zip(weights.items(), accumulations):
+        rasters[name] = Raster.from_array(
+            values * times, nodata=nan, crs=flow.crs, transform=flow.transform
         )
+
+
+#####
+# Flow Networks
+#####
+
+
+def downstream(flow: ndarray) -> ndarray:
+    """Returns the flattened index of the pixel downstream of each pixel in a D8
+    flow direction array. Pixels without a valid flow direction, or that flow past
+    the edge of the array, are sinks and have a downstream index of -1"""
+
+    nrows, ncols = flow.shape
+    directions = flow.ravel().astype(int)
+    valid = (directions >= 1) & (directions <= 8)
+    directions = np.where(valid, directions, 0)
+    rows, cols = np.divmod(np.arange(flow.size), ncols)
+    rows = rows + _ROWS[directions]
+    cols = cols + _COLS[directions]
+    flows = valid & (rows >= 0) & (rows < nrows) & (cols >= 0) & (cols < ncols)
+    output = np.full(flow.size, -1)
+    output[flows] = rows[flows] * ncols + cols[flows]
+    return output
+
+
+def accumulate(flow: ndarray, weights: list[ndarray]) -> list[ndarray]:
+    """Accumulates multiple weights down a D8 flow network. Every weight is
+    accumulated as 64-bit floats using a single traversal of the network"""
+
+    values = np.stack([np.asarray(w, float).reshape(flow.shape) for w in weights])
+    _accumulate(flow, values)
+    return list(values)
+
+
+@njit(cache=True)
+def _next(flow: ndarray, row: int, col: int) -> tuple[int, int]:
+    """Returns the row and column of the pixel downstream of a pixel, or (-1, -1)
+    if the pixel is a sink"""
+
+    direction = flow[row, col]
+    if direction < 1 or direction > 8:
+        return -1, -1
+    row = row + _ROWS[direction]
+    col = col + _COLS[direction]
+    nrows, ncols = flow.shape
+    if row < 0 or row >= nrows or col < 0 or col >= ncols:
+        return -1, -1
+    return row, col
+
+
+@njit(cache=True)
+def _accumulate(flow: ndarray, values: ndarray) -> None:
+    """Accumulates a (weights x rows x columns) array down a D8 flow network in
+    place. Uses the traversal order of pysheds: starting from each headwater pixel,
+    passes values downstream until reaching a pixel with unprocessed upstream
+    pixels. Processed pixels are marked with an inflow count larger than 8, so are
+    never revisited"""
+
+    # Count the number of pixels draining directly into each pixel
+    nrows, ncols = flow.shape
+    ninflow = np.zeros(flow.shape, np.uint8)
+    for row in range(nrows):
+        for col in range(ncols):
+            next_row, next_col = _next(flow, row, col)
+            if next_row >= 0:
+                ninflow[next_row, next_col] += 1
+
+    # Walk downstream from each headwater pixel
+    nweights = values.shape[0]
+    for row in range(nrows):
+        for col in range(ncols):
+            current_row, current_col = row, col
+            while ninflow[current_row, current_col] == 0:
+                ninflow[current_row, current_col] = _PROCESSED
+                next_row, next_col = _next(flow, current_row, current_col)
+                if next_row < 0:
+                    break
+                for k in range(nweights):
+                    values[k, next_row, next_col] += values[k, current_row, current_col]
+                ninflow[next_row, next_col] -= 1
+                current_row, current_col = next_row, next_col
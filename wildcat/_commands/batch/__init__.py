@@ -0,0 +1,13 @@
+"""
+Subpackage to run many wildcat projects from a batch manifest
+----------
+Main Function:
+    batch       - Runs the projects in a batch manifest in a process pool
+
+Internal Modules:
+    _batch      - Implements the "batch" function
+    _manifest   - Loads a batch manifest
+    _worker     - Functions that run in the worker processes
+"""
+
+from wildcat._commands.batch._batch import batch
@@ -0,0 +1,225 @@
+"""
+Implements the "batch" command
+----------
+The batch command runs the preprocess, assess, and export commands for each
+project listed in a batch manifest. Projects run concurrently in a pool of worker
+processes. Each worker imports the command modules once, and then reuses the warm
+imports (and compiled JIT kernels) for every project it runs. Each command uses
+the usual config parsing and IO folder logic, so a project in a batch produces
+the same outputs as running the commands individually.
+
+A failed command stops the remaining commands for its project, but does not stop
+the other projects. A worker process that dies (for example, by exceeding the
+memory limit) breaks its process pool. When this occurs, the pool is restarted,
+and the projects that were running are rerun one at a time in their own pool, so
+that only the project that killed its worker is marked as failed. The timings and
+failures of every project are saved to a JSON summary file next to the manifest.
+----------
+Command Function:
+    batch       - Implements the wildcat batch routine
+
+Substeps:
+    _run        - Runs the jobs in process pools
+    _pool       - Runs queued jobs in a new process pool until the pool breaks
+    _result     - Returns the summary record of a finished job
+    _log        - Logs the result of a project
+    _save       - Saves the batch summary
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import typing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from logging import getLogger
+from time import perf_counter
+
+import wildcat
+from wildcat._commands.batch import _manifest, _worker
+from wildcat._utils import _validate
+
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Future
+    from logging import Logger
+    from pathlib import Path
+    from typing import Optional
+
+    from wildcat._commands.batch._manifest import Job
+    from wildcat._commands.batch._worker import Record
+    from wildcat.typing import Pathlike
+
+
+def batch(
+    manifest: Pathlike, workers: int = 1, max_memory_gb: Optional[float] = None
+) -> Path:
+    "Runs the projects in a batch manifest. Returns the path to the summary file"
+
+    # Start log. Validate settings
+    log = getLogger("wildcat.batch")
+    log.info("----- Batch -----")
+    settings = {
+        "manifest": manifest,
+        "workers": workers,
+        "max_memory_gb": max_memory_gb,
+    }
+    _validate.batch(settings)
+    manifest = settings["manifest"].resolve()
+
+    # The memory watchdog requires /proc or the POSIX resource module
+    if settings["max_memory_gb"] is not None and sys.platform == "win32":
+        raise ValueError("The max_memory_gb setting is not supported on Windows")
+
+    # Load the jobs
+    log.info("Loading batch manifest")
+    jobs = _manifest.load(manifest)
+    log.debug(f"    Projects: {len(jobs)}")
+
+    # Run the jobs and save the summary
+    start = perf_counter()
+    records = _run(jobs, settings["workers"], settings["max_memory_gb"], log)
+    seconds = perf_counter() - start
+    path = _save(manifest, settings, seconds, records, log)
+
+    # Report failed projects
+    failed = sum(record["status"] == "failed" for record in records)
+    if failed > 0:
+        log.warning(
+            f"\nWARNING: {failed} of {len(records)} projects failed. "
+            f"See {path} for details.\n"
+        )
+    return path
+
+
+def _run(
+    jobs: list[Job], workers: int, max_memory_gb: Optional[float], log: Logger
+) -> list[Record]:
+    """Runs the jobs in a pool of worker processes. Restarts the pool if a worker
+    process dies. Returns the summary records in the same order as the jobs"""
+
+    # Run the jobs, restarting the pool whenever a worker process dies
+    workers = min(workers, len(jobs))
+    log.info(f"Running {len(jobs)} projects using {workers} worker processes")
+    records = [None] * len(jobs)
+    queue = deque(range(len(jobs)))
+    while queue:
+        interrupted = _pool(jobs, queue, workers, max_memory_gb, records, log)
+        if len(interrupted) == 0:
+            continue
+
+        # Rerun each interrupted project alone, so that a crash can only fail the
+        # project that caused it
+        log.info(
+            f"A worker process died. Rerunning {len(interrupted)} interrupted "
+            "projects one at a time"
+        )
+        for index in interrupted:
+            isolated = deque([index])
+            if _pool(jobs, isolated, 1, max_memory_gb, records, log):
+                record = _worker.record(jobs[index][0])
+                error = BrokenProcessPool("The worker process running the project died")
+                _worker.fail(record, None, error)
+                _log(record, log)
+                records[index] = record
+    return records
+
+
+def _pool(
+    jobs: list[Job],
+    queue: deque[int],
+    workers: int,
+    max_memory_gb: Optional[float],
+    records: list[Record],
+    log: Logger,
+) -> list[int]:
+    """Runs queued jobs in a new pool of worker processes, and records the result
+    of each finished job. Submits at most one job per worker, so that a dead
+    worker only interrupts the jobs that were running. Returns the indices of the
+    interrupted jobs, which is empty if every queued job finished. Jobs that were
+    not started remain in the queue"""
+
+    pool = ProcessPoolExecutor(
+        workers, initializer=_worker.initialize, initargs=(max_memory_gb,)
+    )
+    running: dict[Future, int] = {}
+    interrupted = []
+    with pool:
+        while (queue or running) and not interrupted:
+            while queue and len(running) < workers:
+                index = queue.popleft()
+                running[pool.submit(_worker.run, *jobs[index])] = index
+
+            # Record finished jobs. A dead worker breaks the pool, which stops
+            # any new jobs from being submitted
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = running.pop(future)
+                record = _result(jobs[index], future, log)
+                if record is None:
+                    interrupted.append(index)
+                else:
+                    records[index] = record
+
+        # Collect the jobs that were running when the pool broke
+        for future in wait(running).done:
+            index = running[future]
+            record = _result(jobs[index], future, log)
+            if record is None:
+                interrupted.append(index)
+            else:
+                records[index] = record
+    return sorted(interrupted)
+
+
+def _result(job: Job, future: Future, log: Logger) -> Optional[Record]:
+    """Returns the summary record of a finished job, or None if the job was
+    interrupted by a dead worker process"""
+
+    # Build a failed record if the job could not return one
+    try:
+        record = future.result()
+    except BrokenProcessPool:
+        return None
+    except Exception as error:
+        record = _worker.record(job[0])
+        _worker.fail(record, None, error)
+    _log(record, log)
+    return record
+
+
+def _log(record: Record, log: Logger) -> None:
+    "Logs the result of a project"
+
+    project = record["project"]
+    if record["status"] == "succeeded":
+        seconds = record["wall_seconds"]
+        log.info(f"Finished {project} in {seconds:.2f} seconds")
+    else:
+        log.warning(f"\nWARNING: Failed {project}\n{record['error']}\n")
+
+
+def _save(
+    manifest: Path,
+    settings: dict,
+    seconds: float,
+    records: list[Record],
+    log: Logger,
+) -> Path:
+    "Saves the batch summary as JSON next to the manifest. Returns the file path"
+
+    summary = {
+        "manifest": str(manifest),
+        "wildcat": wildcat.version(),
+        "workers": settings["workers"],
+        "max_memory_gb": settings["max_memory_gb"],
+        "wall_seconds": seconds,
+        "succeeded": sum(record["status"] == "succeeded" for record in records),
+        "failed": sum(record["status"] == "failed" for record in records),
+        "projects": records,
+    }
+    path = manifest.with_name(f"{manifest.stem}-summary.json")
+    path.write_text(json.dumps(summary, indent=4))
+    log.info(f"Saved batch summary to {path}")
+    return path
@@ -0,0 +1,130 @@
+"""
+Function that loads a batch manifest
+----------
+A batch manifest is a TOML file that lists the project folders in a batch. Each
+project is a [[projects]] table with a "project" field, which is the path to the
+project folder. Relative project paths are parsed relative to the folder holding
+the manifest. A project table may also include settings that override the
+project's config file. These settings are passed as keyword arguments to each
+command that supports them. The optional [settings] table holds overrides that
+apply to every project. For example:
+
+    [settings]
+    I15_mm_hr = [16, 20, 24]
+
+    [[projects]]
+    project = "fires/fire-a"
+
+    [[projects]]
+    project = "fires/fire-b"
+    export_crs = 4326
+----------
+Functions:
+    load        - Loads a manifest and returns the job for each project
+    _table      - Checks that a table only contains supported settings
+    _commands   - Returns the settings for each command in a job
+
+Internal:
+    COMMANDS    - The commands run for each project, in order
+"""
+
+from __future__ import annotations
+
+import tomllib
+import typing
+from pathlib import Path
+
+import wildcat
+from wildcat._utils import _args
+from wildcat.errors import ManifestError
+
+if typing.TYPE_CHECKING:
+    from typing import Any
+
+    Settings = dict[str, Any]
+    Job = tuple[Path, dict[str, Settings]]
+
+# The commands run for each project, in order
+COMMANDS = ["preprocess", "assess", "export"]
+
+
+def load(path: Path) -> list[Job]:
+    """Loads a batch manifest. Returns a list with the project folder and the
+    settings for each command of each job"""
+
+    # Read the file
+    try:
+        with open(path, "rb") as file:
+            manifest = tomllib.load(file)
+    except OSError as error:
+        raise ManifestError(f"Could not read the batch manifest: {path}") from error
+    except tomllib.TOMLDecodeError as error:
+        raise ManifestError(
+            f"Could not parse the batch manifest: {path}\n{error}"
+        ) from error
+
+    # Only settings and projects are supported
+    for field in manifest:
+        if field not in ["settings", "projects"]:
+            raise ManifestError(
+                f'Unrecognized field in the batch manifest: "{field}". '
+                'Supported fields are "settings" and "projects"'
+            )
+
+    # Check the shared settings
+    settings = manifest.get("settings", {})
+    _table(settings, "settings")
+    if "project" in settings:
+        raise ManifestError(
+            'The [settings] table of the batch manifest cannot include "project"'
+        )
+
+    # Must have at least one project
+    projects = manifest.get("projects")
+    if not isinstance(projects, list) or len(projects) == 0:
+        raise ManifestError(
+            "The batch manifest must include at least one [[projects]] table"
+        )
+
+    # Check each project and parse the project folder
+    jobs = []
+    for index, project in enumerate(projects):
+        name = f"projects[{index}]"
+        _table(project, name)
+        folder = project.get("project")
+        if not isinstance(folder, str):
+            raise ManifestError(
+                f'The {name} table of the batch manifest must include a "project" '
+                "field with the path to the project folder"
+            )
+        folder = (path.parent / folder).resolve()
+
+        # Build the settings for each command. Project settings take precedence
+        project = settings | project | {"project": folder}
+        jobs.append((folder, _commands(project)))
+    return jobs
+
+
+def _table(table: Any, name: str) -> None:
+    "Checks that a manifest table only contains settings supported by a command"
+
+    if not isinstance(table, dict):
+        raise ManifestError(f"The {name} field of the batch manifest must be a table")
+    for field in table:
+        if not any(field in _args.collect(getattr(wildcat, c)) for c in COMMANDS):
+            raise ManifestError(
+                f"The {name} table of the batch manifest has an unrecognized "
+                f'setting: "{field}"'
+            )
+
+
+def _commands(settings: Settings) -> dict[str, Settings]:
+    "Returns the settings supported by each command, in the order they run"
+
+    commands = {}
+    for command in COMMANDS:
+        parameters = _args.collect(getattr(wildcat, command))
+        commands[command] = {
+            field: value for field, value in settings.items() if field in parameters
+        }
+    return commands
@@ -0,0 +1,147 @@
+"""
+Functions that run in the batch worker processes
+----------
+Each worker process is initialized once, and then runs jobs until the batch is
+finished. Initialization configures the JIT cache and imports the command modules,
+so that these costs are shared by all the jobs in a worker. Initialization can
+also start a watchdog thread that limits the resident memory (RSS) of the worker.
+The watchdog polls the worker's RSS, and kills the worker if it exceeds the
+limit. This cancels the running job, and the batch then marks the project as
+failed. Unlike an address space limit, the RSS limit does not count memory that
+is reserved but never used, such as large memory-mapped files.
+----------
+Worker Functions:
+    initialize  - Starts the memory watchdog, and warms up imports in a worker process
+    run         - Runs the commands for a project, and returns its summary record
+
+Memory:
+    POLL_SECONDS    - How often the watchdog checks the worker's RSS
+    _watch      - Kills the worker if its RSS exceeds a limit
+    _rss        - Returns the RSS of the worker in bytes
+
+Records:
+    record      - Returns a new summary record for a project
+    fail        - Marks a summary record as failed
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import typing
+from importlib import import_module
+from threading import Thread
+from time import perf_counter, sleep
+
+import wildcat
+from wildcat._commands.batch._manifest import COMMANDS
+from wildcat._utils import _jit
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Optional
+
+    Record = dict[str, Any]
+
+# How often (in seconds) the watchdog checks the worker's resident memory
+POLL_SECONDS = 0.1
+
+
+#####
+# Worker Functions
+#####
+
+
+def initialize(max_memory_gb: Optional[float]) -> None:
+    """Optionally starts a watchdog that limits the resident memory of the worker
+    process. Then configures the JIT cache and imports the command modules"""
+
+    # Limit the resident memory (RSS) of the process
+    if max_memory_gb is not None:
+        limit = int(max_memory_gb * 1024**3)
+        Thread(target=_watch, args=(limit,), daemon=True).start()
+
+    # Warm up the imports used by every job
+    _jit.configure()
+    for command in COMMANDS:
+        import_module(f"wildcat._commands.{command}")
+
+
+def run(project: Path, commands: dict[str, dict[str, Any]]) -> Record:
+    """Runs the commands for a project in order, stopping at the first failed
+    command. Returns the summary record for the project"""
+
+    output = record(project)
+    start = perf_counter()
+    for command, kwargs in commands.items():
+        step = perf_counter()
+        try:
+            getattr(wildcat, command)(**kwargs)
+        except Exception as error:
+            fail(output, command, error)
+            break
+        finally:
+            output["steps"][command] = perf_counter() - step
+    output["wall_seconds"] = perf_counter() - start
+    return output
+
+
+#####
+# Memory
+#####
+
+
+def _watch(limit: int) -> None:
+    """Polls the resident memory of the worker, and kills the worker if its RSS
+    exceeds the limit (in bytes)"""
+
+    while True:
+        rss = _rss()
+        if rss > limit:
+            print(
+                f"Killing the batch worker because its memory ({rss / 1024**3:.2f} GB) "
+                f"exceeded the max_memory_gb limit ({limit / 1024**3:.2f} GB)",
+                file=sys.stderr,
+                flush=True,
+            )
+            os._exit(1)
+        sleep(POLL_SECONDS)
+
+
+def _rss() -> int:
+    """Returns the resident memory of the worker in bytes. Uses the peak RSS on
+    systems without /proc (such as macOS)"""
+
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+#####
+# Records
+#####
+
+
+def record(project: Path) -> Record:
+    "Returns a new summary record for a project"
+    return {
+        "project": str(project),
+        "status": "succeeded",
+        "wall_seconds": None,
+        "steps": {},
+        "failed_command": None,
+        "error": None,
+    }
+
+
+def fail(record: Record, command: Optional[str], error: Exception) -> None:
+    "Marks a summary record as failed by a command"
+    record["status"] = "failed"
+    record["failed_command"] = command
+    record["error"] = f"{type(error).__name__}: {error}"
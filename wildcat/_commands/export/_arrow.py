@@ -0,0 +1,161 @@
+"""
+Functions that export features to GeoParquet using Apache Arrow
+----------
+GeoParquet files are written directly from Arrow columns, rather than through a
+GDAL driver. Each chunk of export records is converted to an Arrow record batch,
+with one column per exported property (in the export order), and a final
+"geometry" column holding the WKB encoding of each feature. The batches are
+streamed to file, so only one chunk of features is held in memory at a time.
+The file includes the "geo" metadata required by the GeoParquet specification,
+which records the geometry type and the CRS (as PROJJSON).
+
+Requires the optional pyarrow package, which is imported when a file is written.
+----------
+Functions:
+    write               - Writes a stream of export records to a GeoParquet file
+    _schema             - Returns the Arrow schema for an exported file
+    _type               - Returns the Arrow data type for a fiona property type
+    _metadata           - Returns the GeoParquet metadata for an exported file
+    _batch              - Converts a chunk of export records to an Arrow record batch
+
+WKB:
+    _wkb                - Returns the WKB encoding of a Point, LineString, or Polygon
+    _vertices           - Returns the WKB encoding of a sequence of vertices
+
+Internal:
+    GEOPARQUET_VERSION  - The implemented version of the GeoParquet specification
+    ARROW_TYPES         - The Arrow data type for each fiona property type
+    WKB_TYPES           - The WKB code for each geometry type
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import typing
+from itertools import islice
+
+import numpy as np
+from pyproj import CRS
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Iterator
+
+    import pyarrow
+
+    from wildcat.typing._export import PropSchema
+
+# The implemented version of the GeoParquet specification
+GEOPARQUET_VERSION = "1.1.0"
+
+# The Arrow data type for each fiona property type
+ARROW_TYPES = {
+    "int": "int64",
+    "int32": "int32",
+    "int64": "int64",
+    "float": "float64",
+    "str": "string",
+    "bool": "bool_",
+}
+
+# The WKB code for each geometry type
+WKB_TYPES = {"Point": 1, "LineString": 2, "Polygon": 3}
+
+
+def write(
+    path: Path,
+    records: Iterator[dict],
+    geometry_type: str,
+    pschema: PropSchema,
+    crs: Any,
+    chunk_size: int,
+) -> None:
+    "Writes a stream of export records to a GeoParquet file in fixed-size chunks"
+
+    import pyarrow.parquet
+
+    schema = _schema(pschema, geometry_type, crs)
+    with pyarrow.parquet.ParquetWriter(path, schema) as file:
+        while chunk := list(islice(records, chunk_size)):
+            file.write_batch(_batch(chunk, schema))
+
+
+def _schema(pschema: PropSchema, geometry_type: str, crs: Any) -> pyarrow.Schema:
+    "Returns the Arrow schema for the exported properties and geometries"
+
+    import pyarrow
+
+    fields = [pyarrow.field(name, _type(kind)) for name, kind in pschema.items()]
+    fields.append(pyarrow.field("geometry", pyarrow.binary()))
+    metadata = {"geo": json.dumps(_metadata(geometry_type, crs))}
+    return pyarrow.schema(fields, metadata=metadata)
+
+
+def _type(kind: str) -> pyarrow.DataType:
+    "Returns the Arrow data type for a fiona property type. Ignores field widths"
+
+    import pyarrow
+
+    kind = kind.split(":")[0]
+    name = ARROW_TYPES.get(kind, "string")
+    return getattr(pyarrow, name)()
+
+
+def _metadata(geometry_type: str, crs: Any) -> dict:
+    "Returns the GeoParquet file metadata for the geometry column"
+    return {
+        "version": GEOPARQUET_VERSION,
+        "primary_column": "geometry",
+        "columns": {
+            "geometry": {
+                "encoding": "WKB",
+                "geometry_types": [geometry_type],
+                "crs": CRS.from_user_input(crs).to_json_dict(),
+            }
+        },
+    }
+
+
+def _batch(chunk: list[dict], schema: pyarrow.Schema) -> pyarrow.RecordBatch:
+    "Converts a chunk of export records to an Arrow record batch"
+
+    import pyarrow
+
+    # Build a column for each property, and then the geometry column
+    columns = []
+    for field in list(schema)[:-1]:
+        values = [record["properties"][field.name] for record in chunk]
+        columns.append(pyarrow.array(values, type=field.type))
+    geometries = [_wkb(record["geometry"]) for record in chunk]
+    columns.append(pyarrow.array(geometries, type=pyarrow.binary()))
+    return pyarrow.RecordBatch.from_arrays(columns, schema=schema)
+
+
+#####
+# WKB
+#####
+
+
+def _wkb(geometry: dict) -> bytes:
+    "Returns the little-endian WKB encoding of a Point, LineString, or Polygon"
+
+    type = geometry["type"]
+    coordinates = geometry["coordinates"]
+    wkb = struct.pack("<BI", 1, WKB_TYPES[type])
+    if type == "Point":
+        return wkb + _vertices([coordinates])
+    elif type == "LineString":
+        return wkb + struct.pack("<I", len(coordinates)) + _vertices(coordinates)
+
+    # Polygons have a count of rings, and then each ring
+    wkb += struct.pack("<I", len(coordinates))
+    for ring in coordinates:
+        wkb += struct.pack("<I", len(ring)) + _vertices(ring)
+    return wkb
+
+
+def _vertices(vertices: list) -> bytes:
+    "Returns the WKB encoding of a sequence of XY vertices. Ignores Z values"
+    xy = [vertex[:2] for vertex in vertices]
+    return np.array(xy, dtype="<f8").tobytes()
@@ -3,6 +3,7 @@ Function implementing the "export" command
 ----------
 Functions:
     export  - Implements the "export" command
+    _stream - Profiles the streamed features of assessment results
 """
 
 from __future__ import annotations
@@ -10,30 +11,50 @@ from __future__ import annotations
 import typing
 
 from wildcat._commands.export import _load, _names, _properties, _reproject, _save
-from wildcat._utils import _find, _setup
+from wildcat._utils import _find, _profile, _setup
 
 if typing.TYPE_CHECKING:
+    from pathlib import Path
+
     from wildcat.typing import Config
+    from wildcat.typing._export import Results
 
 
-def export(locals: Config) -> None:
-    "Exports assessment results"
+def export(locals: Config) -> Path:
+    "Exports assessment results. Returns the path to the exports folder"
 
     # Start log. Parse config settings. Locate IO folders and load hazard parameters
     config, log = _setup.command("export", "Exporting Results", locals)
     assessment, exports = _find.io_folders(config, "assessment", "exports", log)
-    parameters = _load.parameters(assessment, log)
+    profile = _profile.Profile("export")
+    parameters = profile.step(_load.parameters, assessment, log)
 
     # Secondary validation accounting for dynamic property names
     _properties.validate(config, parameters)
     _names.validate(config, parameters)
 
     # Parse properties and get final names in exported file
-    properties = _properties.parse(config, parameters, log)
-    names = _names.parse(config, parameters, properties, log)
-
-    # Load the assessment results, then export to desired format
-    results = _load.results(assessment, log)
-    results = _reproject.results(results, config, log)
-    _save.results(exports, config, results, names, log)
-    _save.config(exports, config, log)
+    properties = profile.step(_properties.parse, config, parameters, log)
+    names = profile.step(_names.parse, config, parameters, properties, log)
+
+    # Load the assessment results, then export to desired format. The features are
+    # streamed into the saved files, so loading and reprojecting them are profiled
+    # as separate streamed steps
+    results = profile.step(_load.results, assessment, log)
+    results = _stream(profile, "_load.features", results)
+    results = profile.step(_reproject.results, results, config, log)
+    results = _stream(profile, "_reproject.features", results)
+    profile.step(_save.results, exports, config, results, names, log)
+    profile.step(_save.config, exports, config, log)
+    profile.save(exports)
+    return exports
+
+
+def _stream(profile: _profile.Profile, name: str, results: Results) -> Results:
+    "Profiles the streamed segments, basins, and outlets of assessment results"
+
+    crs, schema, segments, basins, outlets = results
+    segments = profile.stream(name, segments)
+    basins = profile.stream(name, basins)
+    outlets = profile.stream(name, outlets)
+    return crs, schema, segments, basins, outlets
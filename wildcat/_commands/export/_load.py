@@ -2,16 +2,23 @@
 Functions that load saved assessment files:
 ----------
 These functions load values that were saved in the assessment folder. The user
-should not have altered the files in this folder.
+should not have altered the files in this folder. The saved features may use any
+supported assessment format (GeoJSON, FlatGeobuf, or GeoPackage), and are
+located by their file extension.
+
+The segments, basins, and outlets are not read into memory. Instead, they are
+returned as streams (generators) that read one feature at a time while the
+features are exported. This keeps memory use constant, regardless of the size of
+the stream network.
 ----------
 Main Functions:
     parameters  - Loads the hazard modeling parameters from the configuration.txt file
-    results     - Load the CRS, schema, segments, basins, and outlets from the assessment
+    results     - Loads the CRS and schema, and streams of the saved features
 
 Utilities:
-    _geojson    - Converts fiona records to GeoJSON-like dicts
-    _segments   - Loads the saved segments, as well as the CRS and schema
-    _features   - Optionally loads basins or outlets
+    _stream     - Yields the features in a saved file as GeoJSON-like dicts
+    _segments   - Loads the CRS and schema of the saved segments, and a segment stream
+    _features   - Optionally returns a stream of the basins or outlets
 """
 
 from __future__ import annotations
@@ -20,18 +27,14 @@ import typing
 
 import fiona
 
-from wildcat._utils import _config, _parameters, _validate
+from wildcat._utils import _config, _parameters, _saved, _validate
 from wildcat.errors import ConfigRecordError
 
 if typing.TYPE_CHECKING:
     from logging import Logger
     from pathlib import Path
 
-    import fiona.model
-
-    from wildcat.typing._export import CRS, Config, Records, Results, Schema
-
-    FionaFeatures = list[fiona.model.Feature]
+    from wildcat.typing._export import CRS, Config, Features, Results, Schema
 
 
 def parameters(assessment: Path, log: Logger) -> Config:
@@ -81,6 +84,7 @@ def parameters(assessment: Path, log: Logger) -> Config:
 
 
 def results(assessment: Path, log: Logger) -> Results:
+    "Loads the CRS and schema of the results, and streams of the saved features"
 
     log.info("Loading assessment results")
     crs, schema, segments = _segments(assessment, log)
@@ -89,70 +93,71 @@ def results(assessment: Path, log: Logger) -> Results:
     return crs, schema, segments, basins, outlets
 
 
-def _geojson(records: FionaFeatures) -> list[dict]:
-    "Converts fiona records to geojson-like dicts"
-    return [record.__geo_interface__ for record in records]
+def _stream(path: Path) -> Features:
+    "Yields the features in a saved file as GeoJSON-like dicts, one at a time"
+    with fiona.open(path) as file:
+        for record in file:
+            yield record.__geo_interface__
 
 
-def _segments(assessment: Path, log: Logger) -> tuple[CRS, Schema, Records]:
-    "Loads the segments as list of GeoJSON-like dicts"
+def _segments(assessment: Path, log: Logger) -> tuple[CRS, Schema, Features]:
+    "Loads the CRS and schema of the segments, and returns a stream of the segments"
 
     # Path must be an existing file
     log.debug("    Loading segments")
-    path = assessment / "segments.geojson"
-    if not path.exists():
+    path = _saved.locate(assessment, "segments")
+    if path is None:
         raise FileNotFoundError(
-            f"Could not locate the segments.geojson file for the assessment. "
-            f"It may have been deleted\nMissing Path: {path}"
+            f"Could not locate the saved segments file for the assessment. "
+            f"It may have been deleted\nAssessment Folder: {assessment}"
         )
     elif not path.is_file():
         raise TypeError(
-            "The saved segments.geojson is not a file. The assessment results "
+            f"The saved {path.name} is not a file. The assessment results "
             "may have been altered."
         )
 
-    # Load from file
+    # Load the CRS and schema from file
     try:
         with fiona.open(path) as file:
             crs = file.crs
             schema = file.schema
-            records = list(file)
 
     # Informative error if failed
     except Exception as error:
         raise RuntimeError(
-            "Could not load the saved segments.geojson file for the assessment. "
+            f"Could not load the saved {path.name} file for the assessment. "
             "The assessment results may have been altered."
         ) from error
 
-    # Return with CRS, schema, and geojson-like records
-    return crs, schema, _geojson(records)
+    # Return with CRS, schema, and a stream of geojson-like records
+    return crs, schema, _stream(path)
 
 
-def _features(assessment: Path, name: str, log: Logger) -> Records | None:
-    "Loads the basins or outlets, if available"
+def _features(assessment: Path, name: str, log: Logger) -> Features | None:
+    "Returns a stream of the basins or outlets, if available"
 
     # Just exit if the path doesn't exist
-    path = assessment / f"{name}.geojson"
-    if not path.exists():
+    path = _saved.locate(assessment, name)
+    if path is None:
         return
 
-    # Attempt to load from file
+    # Check the file can be opened
     log.debug(f"    Loading {name}")
     try:
-        with fiona.open(path) as file:
-            records = list(file)
+        with fiona.open(path):
+            pass
 
     # Basins and outlets are not mandatory. If file loading fails, log an error
     # and report the stack trace but let the routine continue
     except Exception:
         log.exception(
             f"\n"
-            f"ERROR: Could not load the saved {name}.geojson file for the assessment.\n"
+            f"ERROR: Could not load the saved {path.name} file for the assessment.\n"
             f"    The assessment results may have been altered. Skipping {name} export.\n"
         )
         log.error("")  # Adds a trailing newline
         return
 
-    # Return as geojson-like dicts
-    return _geojson(records)
+    # Return a stream of geojson-like dicts
+    return _stream(path)
@@ -1,22 +1,43 @@
 """
 Functions that reproject assessment results
 ----------
+Features are reprojected in fixed-size chunks. The vertices of every feature in a
+chunk are gathered into NumPy arrays and transformed with a single pyproj call,
+and then split back into the original geometries. This avoids the overhead of
+transforming each feature individually, while still streaming the features.
+----------
 Functions:
-    results     - Returns assessment results projected into a requested CRS
-    _features   - Reprojects feature collection geometries in-place
+    results         - Returns assessment results projected into a requested CRS
+    _features       - Returns a stream of features with reprojected geometries
+    _transformer    - Returns a cached transformer for a pair of CRSs
+    _reproject      - Yields features with reprojected geometries
+
+Chunks:
+    _chunk          - Reprojects the geometries of a chunk of features
+    _vertices       - Collects the vertices of a set of coordinates
+    _rebuild        - Rebuilds a set of coordinates from transformed vertices
+
+Internal:
+    CHUNK_SIZE      - The number of features reprojected at a time
 """
 
 from __future__ import annotations
 
 import typing
+from functools import cache
+from itertools import islice
 
-from fiona.transform import transform_geom
-from pyproj import CRS
+import numpy as np
+from pyproj import CRS, Transformer
 
 if typing.TYPE_CHECKING:
     from logging import Logger
+    from typing import Any, Iterator
 
-    from wildcat.typing._export import Config, Records, Results
+    from wildcat.typing._export import Config, Features, Results
+
+# The number of features reprojected at a time
+CHUNK_SIZE = 10000
 
 
 def results(results: Results, config: Config, log: Logger) -> Results:
@@ -36,16 +57,18 @@ def results(results: Results, config: Config, log: Logger) -> Results:
     # Reproject each set of features
     log.info(f"Reprojecting from {icrs.name} to {fcrs.name}")
     args = [icrs, fcrs, log]
-    _features(segments, "segments", *args)
-    _features(basins, "basins", *args)
-    _features(outlets, "outlets", *args)
+    segments = _features(segments, "segments", *args)
+    basins = _features(basins, "basins", *args)
+    outlets = _features(outlets, "outlets", *args)
 
     # Return updated results
     return fcrs, schema, segments, basins, outlets
 
 
-def _features(features: Records, name: str, icrs: CRS, fcrs: CRS, log: Logger) -> None:
-    "Reprojects feature collection geometries in-place"
+def _features(
+    features: Features | None, name: str, icrs: CRS, fcrs: CRS, log: Logger
+) -> Features | None:
+    "Returns a stream of features whose geometries are reprojected as they are read"
 
     # Skip empty features
     if features is None:
@@ -53,9 +76,70 @@ def _features(features: Records, name: str, icrs: CRS, fcrs: CRS, log: Logger) -
 
     # Reproject the geometry
     log.debug(f"    Reprojecting {name}")
+    return _reproject(features, _transformer(icrs, fcrs))
+
+
+@cache
+def _transformer(icrs: CRS, fcrs: CRS) -> Transformer:
+    "Returns a transformer between two CRSs. Reuses transformers for repeated pairs"
+    return Transformer.from_crs(icrs, fcrs, always_xy=True)
+
+
+def _reproject(features: Features, transformer: Transformer) -> Features:
+    "Yields features with reprojected geometries, one chunk at a time"
+    features = iter(features)
+    while chunk := list(islice(features, CHUNK_SIZE)):
+        _chunk(chunk, transformer)
+        yield from chunk
+
+
+#####
+# Chunks
+#####
+
+
+def _chunk(features: list[dict], transformer: Transformer) -> None:
+    "Reprojects the geometries of a chunk of features in-place"
+
+    # Gather the vertices of every geometry. Exit if there are none
+    vertices = []
+    for feature in features:
+        _vertices(feature["geometry"]["coordinates"], vertices)
+    if len(vertices) == 0:
+        return
+
+    # Transform all the vertices at once
+    x = np.fromiter((vertex[0] for vertex in vertices), float, len(vertices))
+    y = np.fromiter((vertex[1] for vertex in vertices), float, len(vertices))
+    x, y = transformer.transform(x, y)
+
+    # Split the vertices back into geometries
+    transformed = zip(x.tolist(), y.tolist())
     for feature in features:
-        feature["geometry"] = transform_geom(
-            src_crs=icrs,
-            dst_crs=fcrs,
-            geom=feature["geometry"],
-        )
+        geometry = feature["geometry"]
+        feature["geometry"] = {
+            "type": geometry["type"],
+            "coordinates": _rebuild(geometry["coordinates"], transformed),
+        }
+
+
+def _vertices(coordinates: Any, vertices: list) -> None:
+    "Appends the vertices in a (possibly nested) set of coordinates to a list"
+    if len(coordinates) == 0:
+        return
+    elif isinstance(coordinates[0], (list, tuple)):
+        for coordinate in coordinates:
+            _vertices(coordinate, vertices)
+    else:
+        vertices.append(coordinates)
+
+
+def _rebuild(coordinates: Any, transformed: Iterator[tuple[float, float]]) -> Any:
+    """Rebuilds a set of coordinates, replacing each vertex with the next
+    transformed vertex. Any Z values are preserved"""
+    if len(coordinates) == 0:
+        return coordinates
+    elif isinstance(coordinates[0], (list, tuple)):
+        return [_rebuild(coordinate, transformed) for coordinate in coordinates]
+    x, y = next(transformed)
+    return (x, y, *coordinates[2:])
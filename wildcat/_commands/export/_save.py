@@ -1,6 +1,11 @@
 """
 Functions that save exported files
 ----------
+The features are streamed from the assessment results, so they are converted to
+export records and written to file in fixed-size chunks. This way, only one chunk
+of features is held in memory at a time. Most formats are written with fiona.
+Arrow-based formats (GeoParquet) are written by the _arrow module instead.
+----------
 Main Functions:
     results             - Saves the segments, basins, and outlets
     config              - Saves the configuration.txt file for the export
@@ -8,14 +13,21 @@ Main Functions:
 Utilities:
     _property_schema    - Returns the property schema for the exported results
     _features           - Exports a collection of vector features to the indicated format
+    _record             - Converts a feature to an export record
+
+Internal:
+    CHUNK_SIZE          - The number of features written to file at a time
+    GEOMETRIES          - The geometry type of each feature collection
 """
 
 from __future__ import annotations
 
 import typing
+from itertools import islice
 
 import fiona
 
+from wildcat._commands.export import _arrow
 from wildcat._utils import _extensions
 from wildcat._utils._config import record
 
@@ -27,13 +39,19 @@ if typing.TYPE_CHECKING:
 
     from wildcat.typing._export import (
         Config,
+        Features,
         PropNames,
         PropSchema,
-        Records,
         Results,
         Schema,
     )
 
+# The number of features written to file at a time
+CHUNK_SIZE = 10000
+
+# The geometry type of each feature collection
+GEOMETRIES = {"segments": "LineString", "basins": "Polygon", "outlets": "Point"}
+
 
 def results(
     exports: Path, config: Config, results: Results, names: PropNames, log: Logger
@@ -46,9 +64,9 @@ def results(
 
     # Finalize property schema, then export files
     pschema = _property_schema(names, schema)
-    _features(segments, exports, config, crs, log, names, pschema)
-    _features(basins, exports, config, crs, log, names, pschema)
-    _features(outlets, exports, config, crs, log)
+    _features(segments, "segments", exports, config, crs, log, names, pschema)
+    _features(basins, "basins", exports, config, crs, log, names, pschema)
+    _features(outlets, "outlets", exports, config, crs, log)
 
 
 def _property_schema(names: PropNames, schema: Schema) -> PropSchema:
@@ -57,7 +75,8 @@ def _property_schema(names: PropNames, schema: Schema) -> PropSchema:
 
 
 def _features(
-    features: Records | None,
+    features: Features | None,
+    name: str,
     exports: Path,
     config: Config,
     crs: CRS,
@@ -76,10 +95,8 @@ def _features(
     suffix = config["suffix"]
     format = config["format"]
 
-    # Parse the geometry and file name.
-    geometry_type = features[0]["geometry"]["type"]
-    filenames = {"Point": "outlets", "LineString": "segments", "Polygon": "basins"}
-    name = filenames[geometry_type]
+    # Get the geometry type
+    geometry_type = GEOMETRIES[name]
     log.debug(f"    Exporting {name}")
 
     # Determine the file path
@@ -87,21 +104,28 @@ def _features(
     ext = _extensions.from_format(format)
     path = exports / f"{filename}{ext}"
 
-    # Build the records
-    records = []
-    for feature in features:
-        geometry = {
-            "type": geometry_type,
-            "coordinates": feature["geometry"]["coordinates"],
-        }
-        properties = {name: feature["properties"][raw] for raw, name in names.items()}
-        record = {"geometry": geometry, "properties": properties}
-        records.append(record)
-
-    # Save
+    # Build the records lazily. Write Arrow formats directly from Arrow columns
+    records = (_record(feature, geometry_type, names) for feature in features)
+    if _extensions.is_arrow(format):
+        _arrow.write(path, records, geometry_type, pschema, crs, CHUNK_SIZE)
+        return
+
+    # Otherwise, save with fiona in fixed-size chunks
     schema = {"geometry": geometry_type, "properties": pschema}
     with fiona.open(path, "w", driver=format, crs=crs, schema=schema) as file:
-        file.writerecords(records)
+        while chunk := list(islice(records, CHUNK_SIZE)):
+            file.writerecords(chunk)
+
+
+def _record(feature: dict, geometry_type: str, names: PropNames) -> dict:
+    "Converts a feature to an export record with the renamed properties"
+
+    geometry = {
+        "type": geometry_type,
+        "coordinates": feature["geometry"]["coordinates"],
+    }
+    properties = {name: feature["properties"][raw] for raw, name in names.items()}
+    return {"geometry": geometry, "properties": properties}
 
 
 def config(exports: Path, config: Config, log: Logger) -> None:
@@ -181,6 +181,19 @@ def _preprocess(file: TextIO, defaults: dict, isfull: bool) -> None:
         fields += ["excluded_evt"]
     record.section(file, "EVT Masks", fields, defaults)
 
+    # Performance
+    if isfull:
+        fields = ["tiled", "tile_size", "max_workers", "cache_datasets"]
+        fields += [
+            "raster_compression",
+            "raster_predictor",
+            "raster_layout",
+            "raster_bigtiff",
+            "raster_stack",
+            "raster_precision",
+        ]
+        record.section(file, "Performance", fields, defaults)
+
 
 def _assess(file: TextIO, defaults: dict, isfull: bool) -> None:
     "Adds assessment options to the config file"
@@ -244,9 +257,19 @@ def _assess(file: TextIO, defaults: dict, isfull: bool) -> None:
 
     # Basins
     if isfull:
-        record.section(
-            file, "Basins", ["locate_basins", "parallelize_basins"], defaults
-        )
+        fields = ["locate_basins", "parallelize_basins", "basin_workers"]
+        record.section(file, "Basins", fields, defaults)
+
+    # Performance
+    if isfull:
+        fields = [
+            "cache_watershed",
+            "models_only",
+            "assessment_format",
+            "memory_map",
+            "watershed_precision",
+        ]
+        record.section(file, "Performance", fields, defaults)
 
 
 def _export(file: TextIO, defaults: dict, isfull: bool) -> None:
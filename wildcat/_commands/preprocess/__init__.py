@@ -6,12 +6,14 @@ Main Function:
 
 Internal Modules:
     _check      - Functions that optionally raise warnings or errors when a condition is met
+    _geotiff    - Functions that write preprocessed rasters to GeoTIFF files
     _load       - Functions that load input datasets as rasters
     _locate     - Functions that locate file paths to preprocessing resources
     _numeric    - Functions that preprocess raster data arrays
     _preprocess - Implements the "preprocess" function
     _save       - Functions to save output files
     _spatial    - Functions to implement spatial preprocessing
+    _tiles      - Functions that implement tiled preprocessing
 """
 
 from wildcat._commands.preprocess._preprocess import preprocess
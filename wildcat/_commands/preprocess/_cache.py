@@ -0,0 +1,116 @@
+"""
+Functions that cache warped datasets between preprocessor runs
+----------
+Loading and warping the input datasets is usually the most expensive part of the
+preprocessor, but these steps only depend on the input files and a few config
+settings. When dataset caching is enabled, the preprocessor saves each warped
+dataset to the ".cache" subfolder of the "preprocessed" folder. The saved file
+is named using a key built from the fingerprints of the perimeter, DEM, and
+dataset files, along with the config settings that affect the warped dataset.
+Later runs with the same key reuse the cached dataset, so only datasets whose
+inputs have changed are reloaded. Numeric preprocessing steps (such as dNBR and
+KF-factor constraints) always rerun, so changing their settings does not
+invalidate the cache.
+----------
+Functions:
+    keys    - Returns the cache keys of the file-based datasets
+    load    - Loads cached datasets
+    save    - Saves newly warped datasets to the cache
+
+Utilities:
+    _folder - Returns the path to the cache folder
+    _path   - Returns the path to a cached dataset file
+"""
+
+from __future__ import annotations
+
+import typing
+
+from pfdf.raster import Raster
+
+from wildcat._utils import _cache
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from pathlib import Path
+
+    from wildcat.typing import Config, PathDict, RasterDict
+
+
+def keys(config: Config, paths: PathDict) -> dict[str, str]:
+    "Returns the cache keys of the file-based datasets"
+
+    # The grid depends on the perimeter, DEM, and buffer
+    grid = [
+        _cache.fingerprint(paths["perimeter"]),
+        _cache.fingerprint(paths["dem"]),
+        config["buffer_km"],
+    ]
+
+    # Each dataset also depends on its own file and attribute field
+    keys = {}
+    for name, path in paths.items():
+        field = f"{name}_field"
+        field = config.get(field, None)
+        keys[name] = _cache.key(name, grid, _cache.fingerprint(path), field)
+    return keys
+
+
+def load(preprocessed: Path, keys: dict[str, str], log: Logger) -> RasterDict:
+    "Loads any cached datasets"
+
+    # Locate the cached datasets. Just exit if there are none
+    rasters = {}
+    cached = {}
+    for name, key in keys.items():
+        for isbool in [False, True]:
+            path = _path(preprocessed, name, key, isbool)
+            if path.exists():
+                cached[name] = (path, isbool)
+    if len(cached) == 0:
+        return rasters
+
+    # Load the cached datasets
+    log.info("Loading cached datasets")
+    for name, (path, isbool) in cached.items():
+        log.debug(f"    Loading cached {name}")
+        rasters[name] = Raster.from_file(path, name=name, isbool=isbool)
+    return rasters
+
+
+def save(
+    preprocessed: Path, rasters: RasterDict, keys: dict[str, str], log: Logger
+) -> None:
+    "Saves newly warped datasets to the cache, and removes stale cache files"
+
+    # Just exit if there are no new datasets
+    if len(rasters) == 0:
+        return
+    log.info("Caching warped datasets")
+    folder = _folder(preprocessed)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    # Remove stale versions of each dataset and cache the new version
+    for name, raster in rasters.items():
+        log.debug(f"    Caching {name}")
+        for stale in folder.glob(f"{name}-*.tif"):
+            stale.unlink()
+        isbool = raster.dtype == bool
+        raster.save(_path(preprocessed, name, keys[name], isbool), overwrite=True)
+
+
+#####
+# Utilities
+#####
+
+
+def _folder(preprocessed: Path) -> Path:
+    "Returns the path to the cache folder"
+    return preprocessed / ".cache"
+
+
+def _path(preprocessed: Path, name: str, key: str, isbool: bool) -> Path:
+    "Returns the path to a cached dataset. Masks use a distinct suffix"
+
+    suffix = ".mask" if isbool else ""
+    return _folder(preprocessed) / f"{name}-{key}{suffix}.tif"
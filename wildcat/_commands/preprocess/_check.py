@@ -6,6 +6,11 @@ Checks:
     dnbr_scaling    - Checks that the dNBR has values outside the interval [-10, 10]
     missing_kf      - Checks if the KF-factor raster has missing values
 
+Summary Checks:
+    dnbr_range          - Checks dNBR scaling using the minimum and maximum dNBR values
+    checks_missing_kf   - True if the preprocessor should check for missing KF-factors
+    missing_kf_ratio    - Checks the proportion of missing KF-factor data
+
 Utilities:
     _isunexpected   - True if a resolution is outside the expected range
     _check          - Logs a warning or raises and error if a condition is not met
@@ -17,6 +22,8 @@ import typing
 
 import numpy as np
 
+from wildcat._utils import _constants
+
 if typing.TYPE_CHECKING:
     from logging import Logger
 
@@ -85,12 +92,19 @@ def dnbr_scaling(config: Config, rasters: RasterDict, log: Logger) -> None:
     if check == "none" or "dnbr" not in rasters:
         return
 
-    # Get the min and max values
+    # Get the min and max values. Constants do not require a full array
     log.info("Checking dNBR scaling")
     dnbr = rasters["dnbr"]
+    value = _constants.value(dnbr)
+    if value is not None:
+        dnbr_range(config, value, value, log)
+        return
     values = dnbr.values[dnbr.data_mask]
-    min = np.nanmin(values)
-    max = np.nanmax(values)
+    dnbr_range(config, np.nanmin(values), np.nanmax(values), log)
+
+
+def dnbr_range(config: Config, min: float, max: float, log: Logger) -> None:
+    "Checks dNBR scaling using the minimum and maximum dNBR data values"
 
     # Check scaling. Inform user if check failed
     failed = min >= -10 and max <= 10
@@ -108,26 +122,40 @@ def dnbr_scaling(config: Config, rasters: RasterDict, log: Logger) -> None:
         "    OR\n"
         '    dnbr_check = "none"'
     )
-    _check(check, failed, message, log)
+    _check(config["dnbr_scaling_check"], failed, message, log)
+
+
+def checks_missing_kf(config: Config) -> bool:
+    "True if the preprocessor should check for missing KF-factor data"
+
+    # Don't check if disabled, or if a fill option is selected
+    kf_fill = config["kf_fill"]
+    filling = not isinstance(kf_fill, bool) or kf_fill == True
+    return config["missing_kf_check"] != "none" and not filling
 
 
 def missing_kf(config: Config, rasters: RasterDict, log: Logger) -> None:
     "Checks if the KF-factor dataset has missing values"
 
     # Exit if not checking, or if a fill option is selected
-    check = config["missing_kf_check"]
-    kf_fill = config["kf_fill"]
-    filling = not isinstance(kf_fill, bool) or kf_fill == True
-    if check == "none" or "kf" not in rasters or filling:
+    if not checks_missing_kf(config) or "kf" not in rasters:
         return
 
-    # Compute the proportion of missing data
+    # Compute the proportion of missing data. Constants have no missing data
     log.info("Checking for missing KF-factor data")
     kf = rasters["kf"]
-    proportion = np.sum(kf.nodata_mask) / kf.size
-    log.debug(f"    Proportion of missing data: {proportion}")
+    if _constants.value(kf) is not None:
+        proportion = 0.0
+    else:
+        proportion = np.sum(kf.nodata_mask) / kf.size
+    missing_kf_ratio(config, proportion, log)
+
+
+def missing_kf_ratio(config: Config, proportion: float, log: Logger) -> None:
+    "Checks the proportion of missing KF-factor data against the maximum allowed ratio"
 
     # Inform the user if the check failed
+    log.debug(f"    Proportion of missing data: {proportion}")
     failed = proportion > config["max_missing_kf_ratio"]
     message = (
         "WARNING: The KF-factor raster has missing data. This may indicate that\n"
@@ -143,4 +171,4 @@ def missing_kf(config: Config, rasters: RasterDict, log: Logger) -> None:
         '    Alternatively, see the "kf_fill" config value for options to fill missing\n'
         "    KF-factor data pixels."
     )
-    _check(check, failed, message, log)
+    _check(config["missing_kf_check"], failed, message, log)
@@ -0,0 +1,270 @@
+"""
+Functions that write preprocessed rasters to GeoTIFF files
+----------
+Preprocessed rasters are written with GDAL creation options built from the
+"raster_compression", "raster_predictor", "raster_layout", and "raster_bigtiff"
+settings. Compressed, internally tiled files are much smaller than the default
+uncompressed strips, and are faster to read from network storage. When the
+layout is "cog", each file is first written as a tiled GeoTIFF, and is then
+rewritten as a Cloud-Optimized GeoTIFF with internal overviews. Overviews are
+built using nearest-neighbor resampling, so that masks and classifications only
+contain valid values.
+
+When the "raster_stack" setting is enabled, the rasters are instead written as
+the bands of a single multi-band GeoTIFF. The bands use the smallest data type
+that can represent every raster, and the original data type and NoData value of
+each raster are recorded in the tags of its band. Rasters whose data type is
+promoted to the shared type must be converted back when they are loaded, so
+cannot be memory-mapped by the assessment. Stack files use the configured layout,
+so the bands of striped, uncompressed stacks with a single data type can be
+memory-mapped.
+
+When the "raster_precision" setting is "compact", single-band mask files are saved
+as 1-bit GeoTIFFs, so that each byte packs the values of 8 pixels. COG layouts and
+stack files are not bit-packed.
+----------
+Functions:
+    write       - Writes a preprocessed raster to a GeoTIFF file
+    stack       - Writes preprocessed rasters to the bands of a stack file
+    combine     - Combines single-band GeoTIFF files into a stack file
+    create      - Creates a GeoTIFF file for writing
+    cog         - Rewrites a GeoTIFF file as a Cloud-Optimized GeoTIFF
+    options     - Returns the GDAL creation options for a GeoTIFF
+    storage     - Returns the data type and NoData value used to save a raster
+    nbits       - Returns the number of bits used to save each pixel of a raster
+    _describe   - Records the dataset name, data type, and NoData value of a stack band
+    _predictor  - Returns the GDAL predictor for a data type
+
+Internal:
+    BLOCKSIZE   - The internal tile size of tiled GeoTIFFs
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+import rasterio
+import rasterio.shutil
+from rasterio.windows import Window
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Optional
+
+    from pfdf.raster import Raster
+    from rasterio.io import DatasetWriter
+
+    from wildcat.typing import Config, RasterDict
+
+# The internal tile size of tiled GeoTIFFs
+BLOCKSIZE = 256
+
+
+def write(path: Path, raster: Raster, config: Config) -> None:
+    "Writes a preprocessed raster to a GeoTIFF file using the configured options"
+
+    # GeoTIFFs do not support booleans, so save masks as integers
+    dtype, nodata = storage(raster, config)
+    values = raster.values.astype(dtype, copy=False)
+    transform = None if raster.transform is None else raster.transform.affine
+
+    # Write the file, and optionally convert to a COG
+    height, width = raster.shape
+    args = (width, height, dtype, nodata, raster.crs, transform)
+    with create(path, config, *args, nbits=nbits(raster, config)) as file:
+        file.write(values, 1)
+    if config["raster_layout"] == "cog":
+        cog(path, config)
+
+
+def stack(path: Path, rasters: RasterDict, config: Config) -> list[str]:
+    """Writes preprocessed rasters to the bands of a stack file. Returns the names
+    of the rasters whose data type was promoted to the shared band type"""
+
+    # Get the shared data type. All rasters share the grid of the first raster
+    storages = {name: storage(raster, config) for name, raster in rasters.items()}
+    dtype = np.result_type(*[dtype for dtype, _ in storages.values()]).name
+    first = next(iter(rasters.values()))
+    transform = None if first.transform is None else first.transform.affine
+
+    # Write each raster to a band
+    height, width = first.shape
+    args = (width, height, dtype, None, first.crs, transform)
+    with create(path, config, *args, count=len(rasters)) as file:
+        for band, (name, raster) in enumerate(rasters.items(), start=1):
+            file.write(raster.values.astype(dtype, copy=False), band)
+            _describe(file, band, name, *storages[name])
+    if config["raster_layout"] == "cog":
+        cog(path, config)
+    return [name for name, (original, _) in storages.items() if original != dtype]
+
+
+def combine(path: Path, files: dict[str, Path], config: Config) -> list[str]:
+    """Combines single-band GeoTIFF files into a stack file. Copies the files in
+    blocks of rows, so the complete rasters are never held in memory. Deletes the
+    single-band files once the stack is written. Returns the names of the rasters
+    whose data type was promoted to the shared band type"""
+
+    # Open the files and get the shared data type
+    inputs = {name: rasterio.open(file) for name, file in files.items()}
+    try:
+        dtypes = {name: input.dtypes[0] for name, input in inputs.items()}
+        dtype = np.result_type(*dtypes.values()).name
+        first = next(iter(inputs.values()))
+        args = (first.width, first.height, dtype, None, first.crs, first.transform)
+
+        # Copy each file to a band in blocks of rows
+        with create(path, config, *args, count=len(inputs)) as file:
+            for band, (name, input) in enumerate(inputs.items(), start=1):
+                for row in range(0, input.height, BLOCKSIZE):
+                    nrows = min(BLOCKSIZE, input.height - row)
+                    window = Window(0, row, input.width, nrows)
+                    values = input.read(1, window=window).astype(dtype, copy=False)
+                    file.write(values, band, window=window)
+                _describe(file, band, name, input.dtypes[0], input.nodata)
+    finally:
+        for input in inputs.values():
+            input.close()
+
+    # Remove the single-band files and optionally convert to a COG
+    for file in files.values():
+        file.unlink()
+    if config["raster_layout"] == "cog":
+        cog(path, config)
+    return [name for name, original in dtypes.items() if original != dtype]
+
+
+def create(
+    path: Path,
+    config: Config,
+    width: int,
+    height: int,
+    dtype: str,
+    nodata: Any,
+    crs: Any,
+    transform: Any,
+    tiled: bool = False,
+    count: int = 1,
+    nbits: Optional[int] = None,
+) -> DatasetWriter:
+    """Creates a GeoTIFF file for writing using the configured creation options.
+    Set tiled=True to always write an internally tiled file. Use count to set
+    the number of bands, and nbits to pack pixels into fewer bits"""
+
+    # Store the bands of multi-band files separately, so that the pixels of each
+    # band are contiguous and can be memory-mapped
+    creation = options(config, dtype, tiled)
+    if count > 1:
+        creation["interleave"] = "band"
+
+    # Predictors do not support bit-packed pixels
+    if nbits is not None:
+        creation["nbits"] = nbits
+        creation.pop("predictor", None)
+
+    # Create the file
+    return rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        width=width,
+        height=height,
+        count=count,
+        dtype=dtype,
+        nodata=nodata,
+        crs=crs,
+        transform=transform,
+        **creation,
+    )
+
+
+def cog(path: Path, config: Config) -> None:
+    "Rewrites a tiled GeoTIFF file as a Cloud-Optimized GeoTIFF with overviews"
+
+    # Get the COG options. The COG driver selects the predictor for the data type
+    options = {
+        "blocksize": BLOCKSIZE,
+        "bigtiff": config["raster_bigtiff"].upper(),
+        "overviews": "AUTO",
+        "resampling": "NEAREST",
+    }
+    compression = config["raster_compression"]
+    if compression != "none":
+        options["compress"] = compression.upper()
+        if config["raster_predictor"] and compression != "lerc":
+            options["predictor"] = "YES"
+
+    # Write to a temporary file, and then replace the original
+    temp = path.with_name(f"{path.stem}.cog{path.suffix}")
+    rasterio.shutil.copy(path, temp, driver="COG", **options)
+    temp.replace(path)
+
+
+def options(config: Config, dtype: str, tiled: bool = False) -> dict[str, Any]:
+    """Returns the GDAL creation options for a GeoTIFF. Files that will be
+    rewritten as COGs are tiled and uncompressed, since the COG is compressed
+    when it is written. Set tiled=True to always use an internally tiled layout"""
+
+    # Files that become COGs are intermediate, tiled files
+    layout = config["raster_layout"]
+    if layout == "cog":
+        return {
+            "tiled": True,
+            "blockxsize": BLOCKSIZE,
+            "blockysize": BLOCKSIZE,
+            "bigtiff": "IF_SAFER",
+        }
+
+    # Otherwise, build options from the settings
+    options = {"bigtiff": config["raster_bigtiff"].upper()}
+    if tiled or layout == "tiled":
+        options.update(tiled=True, blockxsize=BLOCKSIZE, blockysize=BLOCKSIZE)
+    compression = config["raster_compression"]
+    if compression != "none":
+        options["compress"] = compression.upper()
+        if config["raster_predictor"] and compression != "lerc":
+            options["predictor"] = _predictor(dtype)
+    return options
+
+
+def storage(raster: Raster, config: Config) -> tuple[str, Any]:
+    """Returns the data type and NoData value used to save a raster. Compact masks
+    are unsigned, so they can be bit-packed"""
+
+    dtype = raster.dtype
+    nodata = raster.nodata
+    if dtype == bool:
+        dtype = "uint8" if config["raster_precision"] == "compact" else "int8"
+        nodata = None if nodata is None else int(nodata)
+    return np.dtype(dtype).name, nodata
+
+
+def nbits(raster: Raster, config: Config) -> Optional[int]:
+    """Returns the number of bits used to save each pixel of a raster, or None
+    to use the full data type. Compact masks use 1 bit, except in COG layouts"""
+
+    compact = config["raster_precision"] == "compact"
+    compact = compact and config["raster_layout"] != "cog"
+    if compact and raster.dtype == bool:
+        return 1
+    return None
+
+
+def _describe(
+    file: DatasetWriter, band: int, name: str, dtype: str, nodata: Any
+) -> None:
+    "Records the dataset name, data type, and NoData value of a stack band"
+
+    file.set_band_description(band, name)
+    tags = {"dtype": dtype}
+    if nodata is not None:
+        tags["nodata"] = str(nodata)
+    file.update_tags(band, **tags)
+
+
+def _predictor(dtype: str) -> int:
+    "Returns the floating-point predictor for floats, and horizontal otherwise"
+    if np.issubdtype(dtype, np.floating):
+        return 3
+    return 2
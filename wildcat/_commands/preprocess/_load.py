@@ -4,13 +4,18 @@ Functions that load datasets as rasters for the preprocessor
 Special Datasets:
     buffered_perimeter  - Loads and buffers the fire perimeter
     dem                 - Loads the DEM in the perimeter, requiring georeferencing
+    dem_grid            - Locates the DEM grid in the perimeter without loading DEM data
     constants           - Builds constant-valued datasets
 
 General Loading:
     datasets            - Loads the remaining datasets as rasters
+    dataset             - Loads a file-based dataset as a raster
     _load_features      - Loads vector feature datasets
     _rasterize          - Converts a vector feature dataset to a raster
     _load_raster        - Loads a raster from file
+
+Utilities:
+    _georeferencing_error   - Returns an error for a DEM without an affine transform
 """
 
 from __future__ import annotations
@@ -18,14 +23,14 @@ from __future__ import annotations
 import typing
 import warnings
 
-import numpy as np
+import rasterio
 from pfdf.errors import NoOverlapError, NoOverlappingFeaturesError
 from pfdf.raster import Raster
-from pfdf.utils.nodata import default as default_nodata
 from rasterio.errors import NotGeoreferencedWarning
 
 import wildcat._utils._paths.preprocess as _paths
-from wildcat._utils import _extensions
+from wildcat._commands.preprocess import _spatial
+from wildcat._utils import _constants, _extensions, _parallel
 from wildcat.errors import GeoreferencingError
 
 if typing.TYPE_CHECKING:
@@ -33,7 +38,9 @@ if typing.TYPE_CHECKING:
     from pathlib import Path
     from typing import Callable
 
-    from wildcat.typing import Config, PathDict, RasterDict
+    from pfdf.projection import BoundingBox
+
+    from wildcat.typing import Config, Grid, PathDict, RasterDict
 
 
 #####
@@ -74,15 +81,47 @@ def dem(paths: PathDict, perimeter: Raster, log: Logger) -> Raster:
 
         # Informative error if missing a transform
         except NotGeoreferencedWarning:
-            raise GeoreferencingError(
-                "The input DEM does not have an affine transform. Please provide "
-                "a properly georeferenced DEM instead."
-            )
+            raise _georeferencing_error()
     return dem
 
 
+def dem_grid(paths: PathDict, perimeter: Raster, log: Logger) -> Grid:
+    """Locates the DEM grid in the bounds of the buffered perimeter without
+    loading any DEM data values"""
+
+    # Read the DEM metadata, requiring georeferencing
+    log.info("Locating DEM grid")
+    with warnings.catch_warnings(action="error", category=NotGeoreferencedWarning):
+        try:
+            with rasterio.open(paths["dem"]) as file:
+                crs = file.crs
+                transform = file.transform
+                nodata = file.nodata
+                dtype = file.dtypes[0]
+
+        # Informative error if missing a transform
+        except NotGeoreferencedWarning:
+            raise _georeferencing_error()
+
+    # Locate the perimeter bounds in the DEM grid
+    window, transform = _spatial.locate(perimeter.bounds, crs, transform)
+    height, width = window.height, window.width
+    log.debug(f"    Grid shape: {height} x {width} pixels")
+
+    # Return the grid metadata
+    return {
+        "window": window,
+        "crs": crs,
+        "transform": transform,
+        "height": height,
+        "width": width,
+        "nodata": nodata,
+        "dtype": dtype,
+    }
+
+
 def constants(config: Config, rasters: RasterDict, log: Logger) -> None:
-    "Builds rasters that are constant values"
+    "Builds rasters that are constant values, broadcast over the DEM grid"
 
     # Iterate through datasets that are constants
     log_step = True
@@ -97,12 +136,8 @@ def constants(config: Config, rasters: RasterDict, log: Logger) -> None:
             log_step = False
         log.debug(f"    Building {name}")
 
-        # Build the raster. Ensure the NoData value is not the same as the data value
-        values = np.full(rasters["dem"].shape, value)
-        nodata = default_nodata(values.dtype)
-        if nodata == value:
-            nodata = 0
-        rasters[name] = Raster.from_array(values, nodata=nodata, spatial=rasters["dem"])
+        # Build the raster
+        rasters[name] = _constants.raster(value, rasters["dem"], name)
 
 
 #####
@@ -122,30 +157,36 @@ def datasets(
         return rasters
     log.info("Loading file-based datasets")
 
-    # Iterate through remaining file-based datasets.
-    for name, path in paths.items():
-        if name in ["perimeter", "dem"]:
-            continue
+    # Log the remaining file-based datasets, then load them concurrently
+    names = [name for name in paths if name not in ["perimeter", "dem"]]
+    args = []
+    for name in names:
         log.debug(f"    Loading {name}")
+        args.append((config, name, paths[name], perimeter, dem))
+    loaded = _parallel.run(dataset, args, config["max_workers"])
+    rasters.update(zip(names, loaded))
+    return rasters
 
-        # Load vector features or raster datasets, as appropriate
-        if name in _paths.features() and path.suffix in _extensions.vector():
-            raster = _load_features(name, path, perimeter, dem, config)
-        else:
-            raster = _load_raster(name, path, perimeter)
 
-        # Name and record each raster
-        rasters[name] = raster
-    return rasters
+def dataset(
+    config: Config, name: str, path: Path, bounds: Raster | BoundingBox, dem: Raster
+) -> Raster:
+    "Loads a file-based dataset within the indicated bounds"
+
+    # Load vector features or raster datasets, as appropriate
+    if name in _paths.features() and path.suffix in _extensions.vector():
+        return _load_features(name, path, bounds, dem, config)
+    else:
+        return _load_raster(name, path, bounds)
 
 
 def _load_features(
-    name: str, path: Path, perimeter: Raster, dem: Raster, config: Config
+    name: str, path: Path, bounds: Raster | BoundingBox, dem: Raster, config: Config
 ) -> Raster:
     "Loads vector feature datasets"
 
     # Collect resolution and bounds
-    kwargs = {"path": path, "resolution": dem, "bounds": perimeter}
+    kwargs = {"path": path, "resolution": dem, "bounds": bounds}
 
     # Retainment features are points
     if name == "retainments":
@@ -184,12 +225,25 @@ def _rasterize(name: str, factory: Callable, kwargs: dict) -> Raster:
         ) from None
 
 
-def _load_raster(name: str, path: Path, perimeter: Raster) -> Raster:
+def _load_raster(name: str, path: Path, bounds: Raster | BoundingBox) -> Raster:
     "Loads a raster, providing informative errors as needed"
 
     try:
-        return Raster.from_file(path, name=name, bounds=perimeter)
+        return Raster.from_file(path, name=name, bounds=bounds)
     except NoOverlapError as error:
         raise NoOverlapError(
             f"The {name} dataset does not overlap the buffered fire perimeter"
         ) from None
+
+
+#####
+# Utilities
+#####
+
+
+def _georeferencing_error() -> GeoreferencingError:
+    "Returns an informative error for a DEM without an affine transform"
+    return GeoreferencingError(
+        "The input DEM does not have an affine transform. Please provide "
+        "a properly georeferenced DEM instead."
+    )
@@ -8,6 +8,7 @@ Functions:
     estimate_severity   - Estimates burn severity from the dNBR
     contain_severity    - Restricts burn severity data to the perimeter mask
     build_evt_masks     - Builds raster masks of water, developed, and excluded EVT pixels
+    compact_rasters     - Converts rasters to compact data types
 """
 
 from __future__ import annotations
@@ -18,6 +19,8 @@ import numpy as np
 from pfdf import severity
 from pfdf.raster import Raster
 
+from wildcat._utils import _constants, _precision
+
 if typing.TYPE_CHECKING:
     from logging import Logger
 
@@ -31,10 +34,19 @@ def constrain_dnbr(config: Config, rasters: RasterDict, log: Logger) -> None:
     if not config["constrain_dnbr"] or "dnbr" not in rasters:
         return
 
-    # Constrain the dNBR
+    # Constrain the dNBR. Constrain constant values directly, so the raster
+    # remains a broadcast of a single value
     log.info("Constraining dNBR data range")
     min, max = config["dnbr_limits"]
-    rasters["dnbr"].set_range(min=min, max=max)
+    value = _constants.value(rasters["dnbr"])
+    if value is not None:
+        if value < min:
+            value = min
+        elif value > max:
+            value = max
+        rasters["dnbr"] = _constants.raster(value, rasters["dnbr"], "dnbr")
+    else:
+        rasters["dnbr"].set_range(min=min, max=max)
 
 
 def constrain_kf(config: Config, rasters: RasterDict, log: Logger) -> None:
@@ -44,9 +56,11 @@ def constrain_kf(config: Config, rasters: RasterDict, log: Logger) -> None:
     if not config["constrain_kf"] or "kf" not in rasters:
         return
 
-    # Constrain KF to positive values
+    # Constrain KF to positive values. Positive constants are unchanged
     log.info("Constraining KF-factors to positive values")
-    rasters["kf"].set_range(min=0, fill=True, exclude_bounds=True)
+    value = _constants.value(rasters["kf"])
+    if value is None or value <= 0:
+        rasters["kf"].set_range(min=0, fill=True, exclude_bounds=True)
 
 
 def fill_missing_kf(config: Config, rasters: RasterDict, log: Logger) -> None:
@@ -57,8 +71,10 @@ def fill_missing_kf(config: Config, rasters: RasterDict, log: Logger) -> None:
     if disabled or "kf" not in rasters:
         return
 
-    # Also exit if there isn't any missing data
+    # Also exit if there isn't any missing data. Constants have no missing data
     kf = rasters["kf"]
+    if _constants.value(kf) is not None:
+        return
     missing = kf.nodata_mask
     if not np.any(missing):
         return
@@ -163,3 +179,16 @@ def build_evt_masks(config: Config, rasters: RasterDict, log: Logger) -> None:
             mask = mask.values | rasters[raster].values
             mask = Raster.from_array(mask, nodata=False, spatial=rasters["evt"])
         rasters[raster] = mask
+
+
+def compact_rasters(config: Config, rasters: RasterDict, log: Logger) -> None:
+    "Optionally converts rasters to compact data types"
+
+    # Just exit if not using compact precision
+    if config["raster_precision"] != "compact":
+        return
+
+    # Convert the rasters
+    log.info("Converting rasters to compact data types")
+    for name in _precision.compact(rasters):
+        log.debug(f"    Converting {name} to {_precision.DTYPES[name]}")
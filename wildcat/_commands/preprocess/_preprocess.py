@@ -3,62 +3,124 @@ Function implementing the "preprocess" command
 ----------
 Functions:
     preprocess  - Implements the preprocessor
+    _datasets   - Loads and warps the file-based datasets, reusing cached datasets
 """
 
 from __future__ import annotations
 
 import typing
 
-from wildcat._commands.preprocess import _check, _load, _save
+from wildcat._commands.preprocess import (
+    _cache,
+    _check,
+    _load,
+    _save,
+    _spatial,
+    _tiles,
+)
 from wildcat._commands.preprocess._numeric import (
     build_evt_masks,
+    compact_rasters,
     constrain_dnbr,
     constrain_kf,
     contain_severity,
     estimate_severity,
     fill_missing_kf,
 )
-from wildcat._commands.preprocess._spatial import clip, reproject
-from wildcat._utils import _find, _setup
+from wildcat._utils import _find, _profile, _setup
 
 if typing.TYPE_CHECKING:
-    from wildcat.typing import Config
+    from logging import Logger
+    from pathlib import Path
+
+    from wildcat.typing import Config, PathDict, RasterDict
 
 
-def preprocess(locals: Config) -> None:
-    "Runs the preprocessor"
+def preprocess(locals: Config) -> Path:
+    "Runs the preprocessor. Returns the path to the preprocessed folder"
 
     # Start log. Parse config settings. Locate IO folders and file paths
     config, log = _setup.command("preprocess", "Preprocessing", locals)
     inputs, preprocessed = _find.io_folders(config, "inputs", "preprocessed", log)
     paths = _find.inputs(config, inputs, log)
+    profile = _profile.Profile("preprocess")
 
-    # Build buffered burn perimeter. Load DEM and check resolution. Load
-    # remaining datasets as rasters
-    perimeter = _load.buffered_perimeter(config, paths, log)
-    dem = _load.dem(paths, perimeter, log)
-    _check.resolution(config, dem, log)
-    rasters = _load.datasets(config, paths, perimeter, dem, log)
+    # Optionally stream tiles of the DEM grid through the preprocessor
+    if config["tiled"]:
+        perimeter = profile.step(_load.buffered_perimeter, config, paths, log)
+        profile.step(_tiles.preprocess, config, paths, perimeter, preprocessed, log)
+        profile.step(_save.config, preprocessed, config, paths, log)
+        profile.save(preprocessed)
+        return preprocessed
 
-    # Reproject to match the DEM. Clip to the bounds of the perimeter
-    reproject(rasters, log)
-    clip(rasters, log)
+    # Load the file-based datasets and warp them onto the DEM grid
+    rasters = _datasets(config, paths, preprocessed, profile, log)
 
     # Build rasters that are constant values
-    _load.constants(config, rasters, log)
+    profile.step(_load.constants, config, rasters, log)
 
     # Preprocess dNBR and burn severity
-    _check.dnbr_scaling(config, rasters, log)
-    constrain_dnbr(config, rasters, log)
-    estimate_severity(config, rasters, log)
-    contain_severity(config, rasters, log)
-
-    # Preprocess KF-factors, and build EVT masks
-    constrain_kf(config, rasters, log)
-    _check.missing_kf(config, rasters, log)
-    fill_missing_kf(config, rasters, log)
-    build_evt_masks(config, rasters, log)
-
-    # Save the preprocessed rasters and configuration
-    _save.rasters(preprocessed, rasters, log)
-    _save.config(preprocessed, config, paths, log)
+    profile.step(_check.dnbr_scaling, config, rasters, log)
+    profile.step(constrain_dnbr, config, rasters, log)
+    profile.step(estimate_severity, config, rasters, log)
+    profile.step(contain_severity, config, rasters, log)
+
+    # Preprocess KF-factors, build EVT masks, and optionally use compact data types
+    profile.step(constrain_kf, config, rasters, log)
+    profile.step(_check.missing_kf, config, rasters, log)
+    profile.step(fill_missing_kf, config, rasters, log)
+    profile.step(build_evt_masks, config, rasters, log)
+    profile.step(compact_rasters, config, rasters, log)
+
+    # Save the preprocessed rasters, configuration, and performance profile
+    profile.step(_save.rasters, preprocessed, rasters, config, log)
+    profile.step(_save.config, preprocessed, config, paths, log)
+    profile.save(preprocessed)
+    return preprocessed
+
+
+def _datasets(
+    config: Config,
+    paths: PathDict,
+    preprocessed: Path,
+    profile: _profile.Profile,
+    log: Logger,
+) -> RasterDict:
+    """Loads the file-based datasets and warps them onto the DEM grid in the
+    buffered perimeter. Reuses cached datasets when dataset caching is enabled"""
+
+    # Optionally load cached datasets
+    keys, cached = {}, {}
+    if config["cache_datasets"]:
+        keys = _cache.keys(config, paths)
+        cached = profile.step(_cache.load, preprocessed, keys, log)
+
+    # The perimeter and DEM define the grid, so reload both if either is stale
+    if "perimeter" in cached and "dem" in cached:
+        perimeter, dem = cached["perimeter"], cached["dem"]
+    else:
+        cached.pop("perimeter", None)
+        cached.pop("dem", None)
+        perimeter = profile.step(_load.buffered_perimeter, config, paths, log)
+        dem = profile.step(_load.dem, paths, perimeter, log)
+    _check.resolution(config, dem, log)
+
+    # Load remaining datasets as rasters
+    remaining = {
+        name: path
+        for name, path in paths.items()
+        if name in ["perimeter", "dem"] or name not in cached
+    }
+    rasters = profile.step(_load.datasets, config, remaining, perimeter, dem, log)
+    rasters = {name: raster for name, raster in rasters.items() if name not in cached}
+
+    # Warp onto the DEM grid within the bounds of the perimeter. Optionally cache
+    if len(rasters) > 0:
+        grid = _spatial.grid(dem, perimeter)
+        profile.step(_spatial.warp, rasters, grid, log, config["max_workers"])
+    if config["cache_datasets"]:
+        profile.step(_cache.save, preprocessed, rasters, keys, log)
+
+    # Return all datasets in their original order
+    rasters = rasters | cached
+    return {name: rasters[name] for name in paths}
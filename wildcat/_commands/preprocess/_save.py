@@ -2,8 +2,9 @@
 Functions that save results from the preprocessor
 ----------
 Functions:
-    rasters - Saves preprocessed rasters as GeoTiff files
-    config  - Saves the configuration settings used to run the preprocessor
+    rasters             - Saves preprocessed rasters as GeoTiff files
+    _record_constants   - Records datasets that are constant values
+    config              - Saves the configuration settings used to run the preprocessor
 """
 
 from __future__ import annotations
@@ -11,6 +12,8 @@ from __future__ import annotations
 import typing
 
 import wildcat._utils._paths.preprocess as _paths
+from wildcat._commands.preprocess import _geotiff
+from wildcat._utils import _constants, _parallel, _stack
 from wildcat._utils._config import record
 
 if typing.TYPE_CHECKING:
@@ -20,14 +23,55 @@ if typing.TYPE_CHECKING:
     from wildcat.typing import Config, PathDict, RasterDict
 
 
-def rasters(preprocessed: Path, rasters: RasterDict, log: Logger) -> None:
-    "Saves all preprocessed rasters as GeoTIFF files in the 'preprocessed' folder"
+def rasters(
+    preprocessed: Path, rasters: RasterDict, config: Config, log: Logger
+) -> None:
+    """Saves all preprocessed rasters as GeoTIFF files in the 'preprocessed' folder.
+    Uses up to max_workers threads to write the files. If raster_stack is enabled,
+    saves the rasters as the bands of a single stack file instead. Datasets that
+    are still constant values are recorded in the constants file"""
 
     log.info("Saving preprocessed rasters")
-    for name, raster in rasters.items():
+    for name in rasters:
         log.debug(f"    Saving {name}")
-        file = preprocessed / f"{name}.tif"
-        raster.save(file, overwrite=True)
+
+    # Record constant values instead of saving full rasters
+    rasters = _record_constants(preprocessed, rasters)
+
+    # Optionally write a stack file, and remove any outdated single-band files
+    if config["raster_stack"]:
+        promoted = _geotiff.stack(_stack.path(preprocessed), rasters, config)
+        _stack.log_promoted(promoted, log)
+        for name in rasters:
+            (preprocessed / f"{name}.tif").unlink(missing_ok=True)
+        return
+
+    # Otherwise, write each raster with the configured GeoTIFF options and
+    # remove any outdated stack file
+    _stack.remove(preprocessed)
+    args = [
+        (preprocessed / f"{name}.tif", raster, config)
+        for name, raster in rasters.items()
+    ]
+    _parallel.run(_geotiff.write, args, config["max_workers"])
+
+
+def _record_constants(preprocessed: Path, rasters: RasterDict) -> RasterDict:
+    """Records datasets that are constant values in the constants file, and removes
+    any outdated GeoTIFFs for them. Returns the rasters that are not constant"""
+
+    rasters = rasters.copy()
+    constants = {}
+    for name in _paths.constant():
+        if name not in rasters:
+            continue
+        value = _constants.value(rasters[name])
+        if value is not None:
+            constants[name] = value
+            del rasters[name]
+            (preprocessed / f"{name}.tif").unlink(missing_ok=True)
+    _constants.save(preprocessed, constants)
+    return rasters
 
 
 def config(
@@ -81,4 +125,21 @@ def config(
         )
         record.section(
             file, "EVT masks", ["water", "developed", "excluded_evt"], config
-        ),
+        )
+        record.section(
+            file,
+            "Performance",
+            [
+                "tiled",
+                "tile_size",
+                "max_workers",
+                "cache_datasets",
+                "raster_compression",
+                "raster_predictor",
+                "raster_layout",
+                "raster_bigtiff",
+                "raster_stack",
+                "raster_precision",
+            ],
+            config,
+        )
@@ -1,44 +1,172 @@
 """
 Functions that implement spatial preprocessing routines
 ----------
-Functions:
-    reproject   - Reprojects rasters to the same CRS, alignment, and resolution as the DEM
-    clip        - Clips rasters to the bounds of the buffered perimeter
+The preprocessor warps each raster directly onto the DEM grid within the bounds
+of the buffered perimeter. This reprojects and clips each raster in a single
+pass, so the full reprojected raster is never allocated. Each raster is warped
+independently, so these steps can run over a pool of worker threads.
+----------
+Grids:
+    grid        - Returns the DEM grid within the bounds of the buffered perimeter
+    locate      - Locates bounds in a grid, expanding to whole pixels
+
+Warping:
+    warp        - Warps rasters onto a grid
+    _warp       - Warps a single raster onto a grid
+    _aligned    - True if a raster is already aligned with a grid
+    _bounds     - Returns the bounding box of a grid
 """
 
 from __future__ import annotations
 
 import typing
+from math import ceil, floor
+
+import numpy as np
+from pfdf.projection import BoundingBox
+from pfdf.raster import Raster
+from pfdf.utils.nodata import default as default_nodata
+from rasterio.enums import Resampling
+from rasterio.transform import Affine
+from rasterio.warp import reproject, transform_bounds
+from rasterio.windows import Window
+
+from wildcat._utils import _parallel
 
 if typing.TYPE_CHECKING:
     from logging import Logger
+    from typing import Any
+
+    from wildcat.typing import Grid, RasterDict
+
+# Tolerance for floating-point error when comparing pixel offsets
+_TOLERANCE = 1e-6
+
+
+#####
+# Grids
+#####
+
+
+def grid(dem: Raster, perimeter: Raster) -> Grid:
+    "Returns the DEM grid within the bounds of the buffered perimeter"
+
+    window, transform = locate(perimeter.bounds, dem.crs, dem.transform.affine)
+    return {
+        "crs": dem.crs,
+        "transform": transform,
+        "height": window.height,
+        "width": window.width,
+    }
+
+
+def locate(bounds: BoundingBox, crs: Any, transform: Affine) -> tuple[Window, Affine]:
+    """Locates bounds in a grid with the indicated CRS and transform. Expands the
+    bounds to whole pixels. Returns the window of the bounds in the grid, and the
+    affine transform of the window"""
+
+    # Convert the bounds to the grid CRS, and then to pixel offsets
+    left, bottom, right, top = transform_bounds(
+        bounds.crs, crs, bounds.left, bounds.bottom, bounds.right, bounds.top
+    )
+    dx, dy = transform.a, transform.e
+    cols = sorted([(left - transform.c) / dx, (right - transform.c) / dx])
+    rows = sorted([(top - transform.f) / dy, (bottom - transform.f) / dy])
+
+    # Expand to whole pixels, with a small tolerance for floating-point error
+    col = floor(cols[0] + _TOLERANCE)
+    row = floor(rows[0] + _TOLERANCE)
+    width = ceil(cols[1] - _TOLERANCE) - col
+    height = ceil(rows[1] - _TOLERANCE) - row
+    window = Window(col, row, width, height)
+    transform = Affine(dx, 0, transform.c + col * dx, 0, dy, transform.f + row * dy)
+    return window, transform
+
+
+#####
+# Warping
+#####
+
+
+def warp(rasters: RasterDict, grid: Grid, log: Logger, max_workers: int = 1) -> None:
+    "Reprojects and clips rasters onto a grid in a single pass"
+
+    # Log step and each raster
+    log.info("Warping rasters to the DEM grid in the buffered perimeter")
+    names = list(rasters.keys())
+    for name in names:
+        log.debug(f"    Warping {name}")
+
+    # Warp the rasters and update the dict
+    args = [(rasters[name], grid) for name in names]
+    warped = _parallel.run(_warp, args, max_workers)
+    rasters.update(zip(names, warped))
+
+
+def _warp(raster: Raster, grid: Grid) -> Raster:
+    "Warps a single raster onto a grid. Returns the warped raster"
+
+    # Rasters already aligned with the grid only need to be clipped
+    if _aligned(raster, grid):
+        raster.clip(bounds=_bounds(grid))
+        return raster
+
+    # Get a NoData value. GDAL does not support booleans, so warp masks as integers
+    nodata = raster.nodata
+    if nodata is None:
+        nodata = default_nodata(raster.dtype)
+    source = raster.values
+    fill = nodata
+    if raster.dtype == bool:
+        source = source.astype("uint8")
+        fill = int(nodata)
 
-    from wildcat.typing import RasterDict
+    # Warp directly onto the grid using nearest-neighbor resampling
+    values = np.full((grid["height"], grid["width"]), fill, dtype=source.dtype)
+    reproject(
+        source,
+        values,
+        src_transform=raster.transform.affine,
+        src_crs=raster.crs,
+        src_nodata=fill,
+        dst_transform=grid["transform"],
+        dst_crs=grid["crs"],
+        dst_nodata=fill,
+        resampling=Resampling.nearest,
+    )
+    if raster.dtype == bool:
+        values = values.astype(bool)
 
+    # Build the warped raster
+    warped = Raster.from_array(
+        values, nodata=nodata, crs=grid["crs"], transform=grid["transform"]
+    )
+    warped.name = raster.name
+    return warped
 
-def reproject(rasters: RasterDict, log: Logger) -> None:
-    "Reprojects rasters to the same CRS, resolution, and alignment as the DEM"
 
-    # Log step. Iterate through rasters, but skip the DEM
-    log.info("Reprojecting rasters to match the DEM")
-    for name, raster in rasters.items():
-        if name == "dem":
-            continue
+def _aligned(raster: Raster, grid: Grid) -> bool:
+    "True if a raster has the same CRS, resolution, and alignment as a grid"
 
-        # Reproject to match the DEM
-        log.debug(f"    Reprojecting {name}")
-        raster.reproject(template=rasters["dem"], resampling="nearest")
+    # Require matching CRS and resolution
+    if raster.crs is None or raster.crs != grid["crs"]:
+        return False
+    source = raster.transform.affine
+    target = grid["transform"]
+    if not np.allclose([source.a, source.e], [target.a, target.e]):
+        return False
 
+    # Require pixel edges to align
+    cols = (source.c - target.c) / target.a
+    rows = (source.f - target.f) / target.e
+    offsets = np.array([cols, rows])
+    return bool(np.all(np.abs(offsets - np.round(offsets)) < _TOLERANCE))
 
-def clip(rasters: RasterDict, log: Logger) -> None:
-    "Clips rasters to the bounds of the perimeter"
 
-    # Log step. Iterate through rasters, but skip the perimeter
-    log.info("Clipping rasters to the buffered perimeter")
-    for name, raster in rasters.items():
-        if name == "perimeter":
-            continue
+def _bounds(grid: Grid) -> BoundingBox:
+    "Returns the bounding box of a grid"
 
-        # Clip to the perimeter
-        log.debug(f"    Clipping {name}")
-        raster.clip(bounds=rasters["perimeter"])
+    transform = grid["transform"]
+    right = transform.c + grid["width"] * transform.a
+    bottom = transform.f + grid["height"] * transform.e
+    return BoundingBox(transform.c, bottom, right, transform.f, crs=grid["crs"])
@@ -0,0 +1,560 @@
+"""
+Functions that implement tiled preprocessing
+----------
+Tiled preprocessing splits the DEM grid into square tiles, and then streams each
+tile through the preprocessor. Datasets are only loaded within the bounds of the
+current tile, and preprocessed tiles are written directly to tiled GeoTIFF files.
+As such, peak memory use scales with the tile size, rather than the size of the fire.
+The median KF-factor fill value is computed from valid KF-factors spilled to a
+temporary file, by narrowing a histogram over fixed-size chunks of the file.
+----------
+Main Function:
+    preprocess      - Runs the preprocessor over tiles of the DEM grid
+
+Grid:
+    tiles           - Splits the DEM grid into square tile windows
+    _transform      - Returns the affine transform of a tile
+    _bounds         - Returns the bounds of a tile, buffered by a few pixels
+
+Checks:
+    _check_datasets - Runs dataset checks using statistics collected from all tiles
+    _has            - True if a dataset is either a file or a constant value
+    _median         - Returns the median of the values in a binary file
+    _select         - Returns the value with a given rank in a binary file
+    _within         - Returns the values within a range
+    _chunks         - Iterates over fixed-size chunks of an array
+
+Tiles:
+    _load_tile      - Loads the datasets in a tile and warps them onto the tile grid
+    _overlapping    - Loads a dataset in a tile, returning None if it does not overlap
+    _dem            - Reads the DEM values in a tile
+    _perimeter      - Loads the buffered perimeter in a tile
+    _process        - Runs the numeric preprocessing steps on a tile
+
+Output Files:
+    _write          - Writes preprocessed tiles to the output GeoTIFFs
+    _open           - Opens a tiled GeoTIFF for a preprocessed dataset
+    _cogs           - Rewrites the output GeoTIFFs as Cloud-Optimized GeoTIFFs
+    _combine        - Combines the output GeoTIFFs into a single stack file
+    _record_constants   - Records datasets that are constant values
+    _require_overlap    - Checks that each dataset overlapped at least one tile
+"""
+
+from __future__ import annotations
+
+import logging
+import typing
+from math import nan
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import rasterio
+from pfdf.errors import NoOverlapError, NoOverlappingFeaturesError
+from pfdf.projection import BoundingBox
+from pfdf.raster import Raster
+from pfdf.utils.nodata import default as default_nodata
+from rasterio.errors import WindowError
+from rasterio.transform import Affine
+from rasterio.windows import Window
+
+import wildcat._utils._paths.preprocess as _paths
+from wildcat._commands.preprocess import _check, _geotiff, _load, _spatial
+from wildcat._commands.preprocess._numeric import (
+    build_evt_masks,
+    compact_rasters,
+    constrain_dnbr,
+    constrain_kf,
+    contain_severity,
+    estimate_severity,
+    fill_missing_kf,
+)
+from wildcat._utils import _constants, _extensions, _parallel, _stack
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from typing import Iterator, Optional
+
+    from numpy import ndarray
+    from rasterio.io import DatasetWriter
+
+    from wildcat.typing import Config, Grid, PathDict, RasterDict
+
+# The number of pixels used to buffer tile bounds when loading datasets. This
+# ensures that reprojected datasets fully cover the edges of each tile.
+_HALO = 2
+
+# The maximum number of KF-factor values held in memory when computing the
+# median fill value, and the number of histogram bins used to narrow the search
+_CHUNK = 2**20
+_BINS = 1024
+
+
+def preprocess(
+    config: Config, paths: PathDict, perimeter: Raster, preprocessed: Path, log: Logger
+) -> None:
+    "Runs the preprocessor over square tiles of the DEM grid"
+
+    # Locate the DEM grid and check its resolution. Split into tiles
+    grid = _load.dem_grid(paths, perimeter, log)
+    _check.resolution(config, _dem(paths, grid, Window(0, 0, 1, 1)), log)
+    windows = tiles(grid, config["tile_size"])
+    log.debug(f"    Number of tiles: {len(windows)}")
+
+    # Tile steps repeat for every tile, so only log their warnings
+    quiet = logging.getLogger(f"{log.name}.tiles")
+    quiet.setLevel(logging.WARNING)
+
+    # Save the buffered perimeter to a temporary file, so tiles can load it
+    # without copying the complete array
+    with TemporaryDirectory() as temp:
+        buffered = Path(temp) / "perimeter.tif"
+        perimeter.save(buffered)
+
+        # Run dataset checks using statistics from every tile
+        config = _check_datasets(config, paths, buffered, grid, windows, log, quiet)
+
+        # Preprocess each tile and write it to the output files
+        log.info("Preprocessing and saving tiles")
+        outputs = {}
+        constants = {}
+        try:
+            for k, window in enumerate(windows):
+                log.debug(f"    Tile {k+1} of {len(windows)}")
+                rasters = _load_tile(config, paths, buffered, grid, window, quiet)
+                _process(config, paths, rasters, quiet)
+                _write(preprocessed, grid, config, outputs, constants, rasters, window)
+        finally:
+            for file in outputs.values():
+                file.close()
+    _require_overlap(paths, outputs)
+    _record_constants(preprocessed, constants)
+
+    # Optionally combine the completed files into a stack file. Otherwise,
+    # remove any outdated stack file, and optionally rewrite the files as COGs
+    if config["raster_stack"]:
+        _combine(preprocessed, config, outputs, log)
+        return
+    _stack.remove(preprocessed)
+    if config["raster_layout"] == "cog":
+        _cogs(preprocessed, config, outputs, log)
+
+
+#####
+# Grid
+#####
+
+
+def tiles(grid: Grid, tile_size: int) -> list[Window]:
+    "Splits the DEM grid into square tile windows"
+
+    tile_size = int(tile_size)
+    windows = []
+    for row in range(0, grid["height"], tile_size):
+        for col in range(0, grid["width"], tile_size):
+            width = min(tile_size, grid["width"] - col)
+            height = min(tile_size, grid["height"] - row)
+            windows.append(Window(col, row, width, height))
+    return windows
+
+
+def _transform(grid: Grid, window: Window) -> Affine:
+    "Returns the affine transform of a window of the DEM grid"
+
+    transform = grid["transform"]
+    dx, dy = transform.a, transform.e
+    left = transform.c + window.col_off * dx
+    top = transform.f + window.row_off * dy
+    return Affine(dx, 0, left, 0, dy, top)
+
+
+def _bounds(grid: Grid, window: Window) -> BoundingBox:
+    "Returns the bounds of a tile, buffered by a few pixels to avoid edge effects"
+
+    padded = Window(
+        window.col_off - _HALO,
+        window.row_off - _HALO,
+        window.width + 2 * _HALO,
+        window.height + 2 * _HALO,
+    )
+    transform = _transform(grid, padded)
+    right = transform.c + padded.width * transform.a
+    bottom = transform.f + padded.height * transform.e
+    return BoundingBox(transform.c, bottom, right, transform.f, crs=grid["crs"])
+
+
+#####
+# Checks
+#####
+
+
+def _has(config: Config, paths: PathDict, name: str) -> bool:
+    "True if a dataset is either a file, or a constant value"
+    return name in paths or isinstance(config[name], (int, float))
+
+
+def _check_datasets(
+    config: Config,
+    paths: PathDict,
+    perimeter: Path,
+    grid: Grid,
+    windows: list[Window],
+    log: Logger,
+    quiet: Logger,
+) -> Config:
+    """Runs the dNBR and KF-factor checks using statistics collected from all tiles.
+    Returns the config settings that should be used to preprocess each tile"""
+
+    # Determine which statistics are needed. Just exit if there are none
+    check_dnbr = config["dnbr_scaling_check"] != "none" and _has(config, paths, "dnbr")
+    check_kf = _check.checks_missing_kf(config) and _has(config, paths, "kf")
+    median_kf = config["kf_fill"] is True and _has(config, paths, "kf")
+    if not (check_dnbr or check_kf or median_kf):
+        return config
+
+    # Only load the datasets needed for the statistics
+    log.info("Collecting dataset statistics from tiles")
+    names = []
+    if check_dnbr:
+        names.append("dnbr")
+    if check_kf or median_kf:
+        names.append("kf")
+
+    # Collect statistics from each tile. Valid KF-factors are written to a
+    # temporary file, so the median does not require the full raster in memory
+    min, max = np.inf, -np.inf
+    npixels, nmissing, nvalid = 0, 0, 0
+    with TemporaryDirectory() as folder:
+        kf = Path(folder) / "kf.bin"
+        for window in windows:
+            rasters = _load_tile(config, paths, perimeter, grid, window, quiet, names)
+            _load.constants(config, rasters, quiet)
+            npixels += window.width * window.height
+
+            # dNBR range
+            if check_dnbr and "dnbr" in rasters:
+                dnbr = rasters["dnbr"]
+                values = dnbr.values[dnbr.data_mask]
+                if values.size > 0:
+                    min = np.fmin(min, np.nanmin(values))
+                    max = np.fmax(max, np.nanmax(values))
+
+            # Missing and valid KF-factors. Tiles without KF data are entirely missing
+            if "kf" in names and "kf" not in rasters:
+                nmissing += window.width * window.height
+            elif "kf" in names:
+                constrain_kf(config, rasters, quiet)
+                missing = rasters["kf"].nodata_mask
+                nmissing += np.sum(missing)
+                if median_kf:
+                    values = rasters["kf"].values[~missing].astype(float)
+                    values = values[~np.isnan(values)]
+                    with open(kf, "ab") as file:
+                        values.tofile(file)
+                    nvalid += values.size
+
+        # Tiles should fill missing KF-factors using the median of the complete dataset
+        if median_kf and nmissing > 0:
+            fill = _median(kf, nvalid)
+            log.debug(f"    Median KF-factor fill value: {fill}")
+            config = config | {"kf_fill": fill}
+
+    # Run the checks
+    if check_dnbr:
+        log.info("Checking dNBR scaling")
+        _check.dnbr_range(config, min, max, log)
+    if check_kf:
+        log.info("Checking for missing KF-factor data")
+        _check.missing_kf_ratio(config, nmissing / npixels, log)
+    return config
+
+
+def _median(path: Path, count: int) -> float:
+    """Returns the median of the float64 values in a binary file. Returns NaN if
+    the file is empty. Memory use is limited to a fixed number of values"""
+
+    if count == 0:
+        return nan
+    values = np.memmap(path, dtype=float, mode="r", shape=(count,))
+    lower = _select(values, (count - 1) // 2)
+    if count % 2 == 1:
+        return lower
+    return (lower + _select(values, count // 2)) / 2
+
+
+def _select(values: ndarray, rank: int) -> float:
+    """Returns the value with the indicated (0-indexed) rank in sorted order.
+    Repeatedly narrows a histogram of the values to the bin containing the rank,
+    until the remaining candidates fit in memory"""
+
+    # Start with the full range of values (upper bound inclusive)
+    lower = min(chunk.min() for chunk in _chunks(values))
+    upper = max(chunk.max() for chunk in _chunks(values))
+    closed = True
+    while True:
+        # Count the values below the range, and bin the values within it
+        edges = np.linspace(lower, upper, _BINS + 1)
+        counts = np.zeros(_BINS, int)
+        below, smallest, largest = 0, np.inf, -np.inf
+        for chunk in _chunks(values):
+            below += np.count_nonzero(chunk < lower)
+            inside = _within(chunk, lower, upper, closed)
+            counts += np.histogram(inside, edges)[0]
+            if inside.size > 0:
+                smallest = np.fmin(smallest, inside.min())
+                largest = np.fmax(largest, inside.max())
+
+        # Finish if the candidates are all equal, or small enough to load
+        if smallest == largest:
+            return float(smallest)
+        elif counts.sum() <= _CHUNK:
+            candidates = [
+                _within(chunk, lower, upper, closed) for chunk in _chunks(values)
+            ]
+            candidates = np.concatenate(candidates)
+            return float(np.partition(candidates, rank - below)[rank - below])
+
+        # Otherwise, narrow the range to the bin containing the rank. Only the
+        # final histogram bin includes its upper edge
+        k = int(np.searchsorted(np.cumsum(counts), rank - below, side="right"))
+        closed = closed and k == _BINS - 1
+        lower, upper = edges[k], edges[k + 1]
+
+
+def _within(values: ndarray, lower: float, upper: float, closed: bool) -> ndarray:
+    "Returns the values in a range. Only includes the upper bound if closed"
+    above = values >= lower
+    if closed:
+        return values[above & (values <= upper)]
+    return values[above & (values < upper)]
+
+
+def _chunks(values: ndarray) -> Iterator[ndarray]:
+    "Iterates over fixed-size chunks of an array"
+    for start in range(0, values.size, _CHUNK):
+        yield np.asarray(values[start : start + _CHUNK])
+
+
+#####
+# Tiles
+#####
+
+
+def _load_tile(
+    config: Config,
+    paths: PathDict,
+    perimeter: Path,
+    grid: Grid,
+    window: Window,
+    log: Logger,
+    names: Optional[list[str]] = None,
+) -> RasterDict:
+    "Loads the datasets in a tile and warps them onto the tile grid"
+
+    # Load the DEM and buffered perimeter
+    dem = _dem(paths, grid, window)
+    bounds = _bounds(grid, window)
+    rasters = {"perimeter": _perimeter(perimeter, bounds, dem), "dem": dem}
+
+    # Load any remaining file-based datasets that overlap the tile
+    if names is None:
+        names = list(paths.keys())
+    names = [name for name in names if name in paths]
+    names = [name for name in names if name not in ["perimeter", "dem"]]
+    args = [(config, name, paths[name], bounds, dem) for name in names]
+    loaded = _parallel.run(_overlapping, args, config["max_workers"])
+    for name, raster in zip(names, loaded):
+        if raster is not None:
+            rasters[name] = raster
+
+    # Warp everything onto the tile grid
+    tile = {
+        "crs": grid["crs"],
+        "transform": _transform(grid, window),
+        "height": window.height,
+        "width": window.width,
+    }
+    _spatial.warp(rasters, tile, log, config["max_workers"])
+    return rasters
+
+
+def _overlapping(
+    config: Config, name: str, path: Path, bounds: BoundingBox, dem: Raster
+) -> Raster | None:
+    "Loads a dataset in a tile. Returns None if the dataset does not overlap the tile"
+
+    try:
+        return _load.dataset(config, name, path, bounds, dem)
+    except (NoOverlapError, NoOverlappingFeaturesError):
+        return None
+
+
+def _dem(paths: PathDict, grid: Grid, window: Window) -> Raster:
+    "Reads the DEM values in a tile, filling pixels outside the DEM with NoData"
+
+    # Get the NoData fill value and initialize the tile
+    nodata = grid["nodata"]
+    if nodata is None:
+        nodata = default_nodata(grid["dtype"])
+    values = np.full((window.height, window.width), nodata, dtype=grid["dtype"])
+
+    # Locate the tile in the DEM file
+    offset = grid["window"]
+    tile = Window(
+        offset.col_off + window.col_off,
+        offset.row_off + window.row_off,
+        window.width,
+        window.height,
+    )
+
+    # Read any pixels that exist in the file
+    with rasterio.open(paths["dem"]) as file:
+        try:
+            overlap = tile.intersection(Window(0, 0, file.width, file.height))
+        except WindowError:
+            overlap = None
+        if overlap is not None:
+            row = int(overlap.row_off - tile.row_off)
+            col = int(overlap.col_off - tile.col_off)
+            rows = slice(row, row + int(overlap.height))
+            cols = slice(col, col + int(overlap.width))
+            values[rows, cols] = file.read(1, window=overlap)
+
+    # Build the tile raster
+    transform = _transform(grid, window)
+    dem = Raster.from_array(values, nodata=nodata, crs=grid["crs"], transform=transform)
+    dem.name = "dem"
+    return dem
+
+
+def _perimeter(path: Path, bounds: BoundingBox, dem: Raster) -> Raster:
+    "Loads the buffered perimeter in a tile"
+
+    try:
+        perimeter = Raster.from_file(path, isbool=True, bounds=bounds)
+    except NoOverlapError:
+        values = np.zeros(dem.shape, bool)
+        perimeter = Raster.from_array(values, nodata=False, spatial=dem)
+    perimeter.name = "perimeter"
+    return perimeter
+
+
+def _process(config: Config, paths: PathDict, rasters: RasterDict, log: Logger) -> None:
+    "Runs the numeric preprocessing steps on a tile"
+
+    # Severity datasets that miss the tile should not be estimated from the dNBR,
+    # and KF-factor fill files that miss the tile cannot fill missing values
+    if "severity" in paths:
+        config = config | {"estimate_severity": False}
+    if "kf_fill" in paths and "kf_fill" not in rasters:
+        config = config | {"kf_fill": False}
+
+    # Preprocess the tile
+    _load.constants(config, rasters, log)
+    constrain_dnbr(config, rasters, log)
+    estimate_severity(config, rasters, log)
+    contain_severity(config, rasters, log)
+    constrain_kf(config, rasters, log)
+    fill_missing_kf(config, rasters, log)
+    build_evt_masks(config, rasters, log)
+    compact_rasters(config, rasters, log)
+
+
+#####
+# Output Files
+#####
+
+
+def _write(
+    preprocessed: Path,
+    grid: Grid,
+    config: Config,
+    outputs: dict[str, DatasetWriter],
+    constants: dict[str, int | float],
+    rasters: RasterDict,
+    window: Window,
+) -> None:
+    """Writes preprocessed tiles to the output GeoTIFFs, opening files as needed.
+    Collects datasets that are constant values, instead of writing them"""
+
+    for name, raster in rasters.items():
+        if name in _paths.constant() and name not in outputs:
+            value = _constants.value(raster)
+            if value is not None:
+                constants[name] = value
+                continue
+        if name not in outputs:
+            path = preprocessed / f"{name}.tif"
+            outputs[name] = _open(path, grid, config, raster)
+        file = outputs[name]
+        values = raster.values.astype(file.dtypes[0], copy=False)
+        file.write(values, 1, window=window)
+
+
+def _open(path: Path, grid: Grid, config: Config, raster: Raster) -> DatasetWriter:
+    """Opens a tiled GeoTIFF for a preprocessed dataset. Tiles that are never
+    written are filled with NoData"""
+
+    dtype, nodata = _geotiff.storage(raster, config)
+    return _geotiff.create(
+        path,
+        config,
+        grid["width"],
+        grid["height"],
+        dtype,
+        nodata,
+        grid["crs"],
+        grid["transform"],
+        tiled=True,
+        nbits=_geotiff.nbits(raster, config),
+    )
+
+
+def _cogs(
+    preprocessed: Path,
+    config: Config,
+    outputs: dict[str, DatasetWriter],
+    log: Logger,
+) -> None:
+    "Rewrites the completed output GeoTIFFs as Cloud-Optimized GeoTIFFs"
+
+    log.info("Writing Cloud-Optimized GeoTIFFs")
+    for name in outputs:
+        log.debug(f"    Writing {name}")
+    args = [(preprocessed / f"{name}.tif", config) for name in outputs]
+    _parallel.run(_geotiff.cog, args, config["max_workers"])
+
+
+def _combine(
+    preprocessed: Path,
+    config: Config,
+    outputs: dict[str, DatasetWriter],
+    log: Logger,
+) -> None:
+    "Combines the completed output GeoTIFFs into a single stack file"
+
+    log.info("Writing stack file")
+    files = {name: preprocessed / f"{name}.tif" for name in outputs}
+    promoted = _geotiff.combine(_stack.path(preprocessed), files, config)
+    _stack.log_promoted(promoted, log)
+
+
+def _record_constants(preprocessed: Path, constants: dict[str, int | float]) -> None:
+    "Records datasets that are constant values and removes any outdated GeoTIFFs"
+
+    for name in constants:
+        (preprocessed / f"{name}.tif").unlink(missing_ok=True)
+    _constants.save(preprocessed, constants)
+
+
+def _require_overlap(paths: PathDict, outputs: dict[str, DatasetWriter]) -> None:
+    "Checks that every file-based dataset overlapped at least one tile"
+
+    for name, path in paths.items():
+        if name in outputs:
+            continue
+        message = f"The {name} dataset does not overlap the buffered fire perimeter"
+        if name in _paths.features() and path.suffix in _extensions.vector():
+            raise NoOverlappingFeaturesError(message)
+        else:
+            raise NoOverlapError(message)
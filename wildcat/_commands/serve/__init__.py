@@ -0,0 +1,12 @@
+"""
+Subpackage to run wildcat commands in a long-running server
+----------
+Main Function:
+    serve       - Runs a server that runs preprocess, assess, and export jobs
+
+Internal Modules:
+    _serve      - Implements the "serve" function
+    _server     - The HTTP server and request handler that run jobs
+"""
+
+from wildcat._commands.serve._serve import serve
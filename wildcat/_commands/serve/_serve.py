@@ -0,0 +1,95 @@
+"""
+Implements the "serve" command
+----------
+The serve command runs a long-running process that accepts preprocess, assess,
+and export jobs over localhost HTTP. The server imports the wildcat commands (and
+so pfdf, pysheds, numba, and GDAL) once on startup, and JIT kernels remain
+compiled after the first job. As such, later jobs skip the import and compilation
+costs of launching a new wildcat process. See the _server module for the details
+of the HTTP interface.
+
+The server only listens on loopback addresses, and job requests must include a
+session token. The token is read from the WILDCAT_SERVE_TOKEN environment
+variable if set. Otherwise, the server generates a random token on startup and
+logs it to the console.
+----------
+Command Function:
+    TOKEN_VARIABLE  - The environment variable with the session token
+    serve       - Implements the wildcat server
+
+Substeps:
+    create      - Creates a server with warm imports
+    _imports    - Imports the command modules run by the server
+    _token      - Returns the session token for job requests
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import typing
+from importlib import import_module
+from logging import getLogger
+
+from wildcat._commands.serve._server import COMMANDS, TOKEN_HEADER, Server
+from wildcat._utils import _jit, _validate
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+
+# The environment variable with the session token for job requests
+TOKEN_VARIABLE = "WILDCAT_SERVE_TOKEN"
+
+
+def serve(host: str = "127.0.0.1", port: int = 8910) -> None:
+    "Runs a server that runs wildcat jobs until interrupted"
+
+    # Start log. Validate settings and create the server
+    log = getLogger("wildcat.serve")
+    log.info("Starting wildcat server")
+    settings = {"host": host, "port": port}
+    _validate.serve(settings)
+    server = create(settings["host"], settings["port"], log)
+
+    # Run jobs until interrupted
+    host, port = server.server_address[:2]
+    log.info(f"Serving wildcat jobs at http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log.info("Stopping wildcat server")
+    finally:
+        server.server_close()
+
+
+def create(host: str, port: int, log: Logger) -> Server:
+    """Configures the JIT cache and imports the command modules, then creates a
+    server listening at the indicated host and port"""
+
+    # Configure the JIT cache before the commands import pysheds
+    folder = _jit.configure()
+    log.debug(f"    JIT cache folder: {folder}")
+    _imports(log)
+    token = _token(log)
+    return Server((host, port), log, token)
+
+
+def _imports(log: Logger) -> None:
+    "Imports the command modules, so that jobs do not pay the import cost"
+
+    log.debug("    Importing command modules")
+    for command in COMMANDS:
+        import_module(f"wildcat._commands.{command}")
+
+
+def _token(log: Logger) -> str:
+    """Returns the session token from the environment, or generates a random
+    token and logs it for the user"""
+
+    token = os.environ.get(TOKEN_VARIABLE)
+    if token:
+        log.debug(f"    Using the session token in {TOKEN_VARIABLE}")
+    else:
+        token = secrets.token_urlsafe(32)
+        log.info(f"Job requests must include the header {TOKEN_HEADER}: {token}")
+    return token
@@ -0,0 +1,217 @@
+"""
+The HTTP server and request handler that run wildcat jobs
+----------
+The server accepts the following requests:
+
+    GET  /status        - Returns the wildcat version, the supported commands,
+                          and whether a job is currently running
+    POST /<command>     - Runs a preprocess, assess, or export job
+
+The body of a job request should be a JSON object with the keyword arguments
+for the command's Python function (for example, {"project": "/path/to/project"}).
+Relative paths are parsed relative to the server's working directory, so
+clients should typically use absolute paths.
+
+Job requests must include the server's session token in the X-Wildcat-Token
+header, and must have a Content-Type of application/json. The server returns a
+401 response if the token is missing or incorrect, and a 415 response for other
+content types. These checks prevent web pages open in a local browser from
+submitting jobs to the server.
+
+Jobs run one at a time in the server process. The response to a job is a stream
+of newline-delimited JSON objects. The stream begins with the job's log records
+({"type": "log", "level": ..., "message": ...}) as they occur, and ends with
+either {"type": "result", "path": ...}, where path is the job's output folder,
+or {"type": "error", "error": ..., "message": ...} if the job failed.
+----------
+Server:
+    COMMANDS    - The commands that can be run as jobs
+    TOKEN_HEADER    - The header that holds the session token
+    Server      - Threaded HTTP server that runs one job at a time
+    Handler     - Handles HTTP requests and runs jobs
+
+Logging:
+    _Stream     - Log handler that streams log records to a job response
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import socket
+import typing
+from hmac import compare_digest
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from inspect import signature
+from threading import Lock
+from time import perf_counter
+
+import wildcat
+
+if typing.TYPE_CHECKING:
+    from io import BufferedIOBase
+    from logging import Logger
+    from typing import Any
+
+# The commands that can be run as jobs
+COMMANDS = ["preprocess", "assess", "export"]
+
+# The header that holds the session token for job requests
+TOKEN_HEADER = "X-Wildcat-Token"
+
+
+#####
+# Server
+#####
+
+
+class Server(ThreadingHTTPServer):
+    "Threaded HTTP server that runs one wildcat job at a time"
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], log: Logger, token: str) -> None:
+        if ":" in address[0]:
+            self.address_family = socket.AF_INET6
+        super().__init__(address, Handler)
+        self.log = log
+        self.token = token
+        self.lock = Lock()
+
+
+class Handler(BaseHTTPRequestHandler):
+    "Handles status and job requests"
+
+    server: Server
+
+    def do_GET(self) -> None:
+        "Returns the server status"
+
+        if self.path != "/status":
+            error = {"error": f"Unknown path: {self.path}"}
+            self._respond(HTTPStatus.NOT_FOUND, error)
+            return
+        status = {
+            "wildcat": wildcat.version(),
+            "commands": COMMANDS,
+            "busy": self.server.lock.locked(),
+        }
+        self._respond(HTTPStatus.OK, status)
+
+    def do_POST(self) -> None:
+        "Validates a job request, then runs the job and streams its log"
+
+        # Get the command
+        command = self.path.strip("/")
+        if command not in COMMANDS:
+            error = {"error": f"Unknown command: {command}"}
+            self._respond(HTTPStatus.NOT_FOUND, error)
+            return
+
+        # Require the session token and a JSON body
+        token = self.headers.get(TOKEN_HEADER, "").encode()
+        if not compare_digest(token, self.server.token.encode()):
+            error = {"error": f"Missing or invalid {TOKEN_HEADER} header"}
+            self._respond(HTTPStatus.UNAUTHORIZED, error)
+            return
+        if self.headers.get_content_type() != "application/json":
+            error = {
+                "error": "Job requests must have a Content-Type of application/json"
+            }
+            self._respond(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, error)
+            return
+
+        # Parse the kwargs and check they match the command's signature
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            kwargs = json.loads(self.rfile.read(length) or "{}")
+            if not isinstance(kwargs, dict):
+                raise TypeError("The job must be a JSON object")
+            signature(getattr(wildcat, command)).bind(**kwargs)
+        except (TypeError, ValueError) as error:
+            self._respond(HTTPStatus.BAD_REQUEST, {"error": str(error)})
+            return
+
+        # Stream the job's log records and result
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        with self.server.lock:
+            self._run(command, kwargs)
+
+    def _run(self, command: str, kwargs: dict[str, Any]) -> None:
+        "Runs a job, streaming its log records, and then the result or error"
+
+        # Stream the command's log records to the response
+        log = self.server.log
+        logger = logging.getLogger(f"wildcat.{command}")
+        level = logger.level
+        stream = _Stream(self.wfile)
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(stream)
+
+        # Run the job and report the output folder or error
+        log.info(f"Running {command} job")
+        start = perf_counter()
+        try:
+            output = getattr(wildcat, command)(**kwargs)
+        except Exception as error:
+            log.info(f"Failed {command} job: {error}")
+            name = type(error).__name__
+            stream.write({"type": "error", "error": name, "message": str(error)})
+        else:
+            log.info(f"Finished {command} job in {perf_counter() - start:.2f} seconds")
+            stream.write({"type": "result", "path": str(output)})
+        finally:
+            logger.removeHandler(stream)
+            logger.setLevel(level)
+
+    def _respond(self, status: HTTPStatus, content: dict[str, Any]) -> None:
+        "Sends a JSON response"
+
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        "Logs HTTP requests at the DEBUG level"
+        self.server.log.debug(f"    {self.address_string()} - {format % args}")
+
+
+#####
+# Logging
+#####
+
+
+class _Stream(logging.Handler):
+    """Log handler that writes log records to a job response as JSON lines.
+    Stops writing if the client disconnects, so the job can still finish"""
+
+    def __init__(self, file: BufferedIOBase) -> None:
+        super().__init__(logging.DEBUG)
+        self.file = file
+        self.connected = True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        "Writes a log record to the response"
+        message = {
+            "type": "log",
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        self.write(message)
+
+    def write(self, message: dict[str, Any]) -> None:
+        "Writes a JSON line to the response, unless the client disconnected"
+
+        if not self.connected:
+            return
+        try:
+            self.file.write(json.dumps(message).encode() + b"\n")
+            self.file.flush()
+        except OSError:
+            self.connected = False
@@ -0,0 +1,11 @@
+"""
+Subpackage to compile the JIT kernels used by wildcat
+----------
+Main Function:
+    warmup      - Compiles JIT kernels and saves them to the on-disk JIT cache
+
+Internal Modules:
+    _warmup     - Implements the "warmup" function
+"""
+
+from wildcat._commands.warmup._warmup import warmup
@@ -0,0 +1,108 @@
+"""
+Implements the "warmup" command
+----------
+The warmup command runs the pfdf routines that rely on numba kernels (via
+pysheds), along with wildcat's flow accumulation kernel, on a tiny synthetic DEM.
+This compiles the kernels and saves them to the on-disk JIT cache, so that later assessments can load the compiled kernels
+instead of recompiling them. This is useful for baking a warm cache into a
+container image.
+
+Note that pfdf and the assessment modules are imported within the substeps
+(rather than at the top of this file), so that the JIT cache folder is configured
+before any kernels are defined.
+----------
+Command Function:
+    warmup      - Implements the wildcat warmup routine
+
+Substeps:
+    _dem        - Builds a tiny synthetic DEM
+    _watershed  - Compiles the watershed kernels
+    _network    - Compiles the stream segment network kernels
+"""
+
+from __future__ import annotations
+
+import typing
+from logging import getLogger
+from time import perf_counter
+
+import numpy as np
+
+from wildcat._utils import _jit, _validate
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from typing import Optional
+
+    from pfdf.raster import Raster
+
+    from wildcat.typing import Pathlike
+
+# Size of the synthetic DEM (pixels along each side), and its resolution (meters)
+SIZE = 16
+RESOLUTION = 10
+
+
+def warmup(folder: Optional[Pathlike] = None) -> None:
+    "Compiles the JIT kernels used by wildcat"
+
+    # Start log. Validate and configure the JIT cache folder
+    log = getLogger("wildcat.warmup")
+    log.info("Warming up JIT kernels")
+    settings = {"folder": folder}
+    _validate.warmup(settings)
+    folder = _jit.configure(settings["folder"])
+    log.debug(f"    JIT cache folder: {folder}")
+
+    # Run each kernel on a synthetic DEM
+    start = perf_counter()
+    dem = _dem()
+    flow, relief = _watershed(dem, log)
+    _network(dem, flow, relief, log)
+    log.info(f"Compiled JIT kernels in {perf_counter() - start:.2f} seconds")
+
+
+#####
+# Substeps
+#####
+
+
+def _dem() -> Raster:
+    "Builds a DEM with a V-shaped valley that drains to the south"
+
+    from pfdf.raster import Raster
+
+    rows, cols = np.indices((SIZE, SIZE))
+    values = 10.0 * (SIZE - rows) + 5.0 * np.abs(cols - SIZE // 2)
+    transform = (RESOLUTION, -RESOLUTION, 0, SIZE * RESOLUTION)
+    return Raster.from_array(values, crs=26911, transform=transform)
+
+
+def _watershed(dem: Raster, log: Logger) -> tuple[Raster, Raster]:
+    "Compiles the DEM conditioning, flow, slope, relief, and accumulation kernels"
+
+    from pfdf import watershed
+
+    from wildcat._commands.assess._watershed import accumulate
+
+    log.debug("    Compiling watershed kernels")
+    conditioned = watershed.condition(dem)
+    flow = watershed.flow(conditioned)
+    watershed.slopes(conditioned, flow, 1, check_flow=False)
+    relief = watershed.relief(conditioned, flow, check_flow=False)
+    accumulate(flow.values, [np.ones(flow.shape)])
+    return flow, relief
+
+
+def _network(dem: Raster, flow: Raster, relief: Raster, log: Logger) -> None:
+    "Compiles the stream segment network, confinement, and basin kernels"
+
+    from pfdf.segments import Segments
+
+    log.debug("    Compiling stream segment kernels")
+    mask = np.ones(dem.shape, bool)
+    segments = Segments(flow, mask)
+    segments.confinement(dem, 4, 1)
+    segments.relief(relief)
+    segments.burned_area(mask, units="kilometers")
+    segments.locate_basins()
@@ -11,7 +11,12 @@ Subpackages:
 Modules:
     _extensions - Functions listing supported raster and vector driver extensions
     _parameters - Functions for working with hazard modeling parameters
+    _parallel   - Function to run independent tasks in a thread pool
     _properties - Functions listing property groups
     _setup      - Function that starts a log, then parses and validates config settings
     _args       - Function that returns the names of an input function's args
+    _cache      - Functions that build keys for cached intermediate results
+    _profile    - Class that records a performance profile of the steps of a command
+    _jit        - Functions that configure the on-disk numba JIT cache
+    _stack      - Functions that locate and describe the stack file in a preprocessed folder
 """
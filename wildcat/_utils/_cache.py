@@ -0,0 +1,52 @@
+"""
+Functions that build keys for cached intermediate results
+----------
+Cache keys are built from fingerprints of input files, along with any config
+settings that affect a cached result. File fingerprints use the size and
+modification time of each file (rather than hashing file contents), so keys
+remain cheap to compute for very large datasets. A fingerprint includes any
+sidecar files that share the dataset's file stem (for example, the .dbf and .prj
+files of a Shapefile). Keys also include the wildcat version, so caches are
+invalidated whenever wildcat is updated.
+----------
+Functions:
+    fingerprint - Returns a fingerprint of an input file and its sidecar files
+    key         - Returns a hash key for a collection of values
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import typing
+from glob import escape
+
+import wildcat
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+def fingerprint(path: Path) -> list:
+    "Returns a fingerprint of a file and any sidecar files that share its stem"
+
+    path = path.resolve()
+    files = sorted(path.parent.glob(f"{escape(path.stem)}.*"))
+    if path not in files:
+        files.append(path)
+
+    output = []
+    for file in files:
+        if file.is_file():
+            stat = file.stat()
+            output.append([str(file), stat.st_size, stat.st_mtime_ns])
+    return output
+
+
+def key(*values: Any) -> str:
+    "Returns a hash key for a collection of JSON-serializable values"
+
+    values = [wildcat.version(), *values]
+    text = json.dumps(values, default=str, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
@@ -0,0 +1,106 @@
+"""
+Functions that build constant-valued rasters and record them in a preprocessed folder
+----------
+The dNBR, burn severity, and KF-factor datasets may be constant values. Rather
+than filling a complete array with the value, constant-valued rasters are backed
+by a single scalar that is broadcast over the DEM grid. When a dataset is still
+constant after preprocessing, the preprocessor records its value in the
+"constants.json" file of the "preprocessed" folder, instead of saving a full
+GeoTIFF. The assessment then rebuilds the broadcast raster on the grid of the
+preprocessed DEM.
+----------
+Rasters:
+    raster      - Builds a constant-valued raster on the grid of a template raster
+    value       - Returns the value of a constant-valued raster
+
+Files:
+    path        - Returns the path to the constants file in a preprocessed folder
+    save        - Records constant values in a preprocessed folder
+    load        - Returns the constant values recorded in a preprocessed folder
+
+Internal:
+    FILENAME    - The name of the constants file
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Optional
+
+    from pfdf.raster import Raster
+
+# The name of the constants file
+FILENAME = "constants.json"
+
+
+#####
+# Rasters
+#####
+
+
+def raster(value: int | float, template: Raster, name: str) -> Raster:
+    """Builds a constant-valued raster on the grid of a template raster. The
+    values are a read-only broadcast of the scalar, so no full array is allocated"""
+
+    # Imported here to keep pfdf out of the export command
+    from pfdf.raster import Raster
+    from pfdf.utils.nodata import default as default_nodata
+
+    # Ensure the NoData value is not the same as the data value
+    scalar = np.array(value)
+    nodata = default_nodata(scalar.dtype)
+    if nodata == value:
+        nodata = 0
+
+    # Build the raster from a broadcast view
+    values = np.broadcast_to(scalar, template.shape)
+    raster = Raster.from_array(values, nodata=nodata, spatial=template, copy=False)
+    raster.name = name
+    return raster
+
+
+def value(raster: Raster) -> Optional[int | float]:
+    "Returns the value of a constant-valued raster, or None if it is not constant"
+
+    values = raster.values
+    if values.size == 0 or any(stride != 0 for stride in values.strides):
+        return None
+    return values.flat[0].item()
+
+
+#####
+# Files
+#####
+
+
+def path(preprocessed: Path) -> Path:
+    "Returns the path to the constants file in a preprocessed folder"
+    return preprocessed / FILENAME
+
+
+def save(preprocessed: Path, constants: dict[str, int | float]) -> None:
+    """Records constant values in a preprocessed folder. Deletes any outdated
+    constants file when there are no constant values"""
+
+    file = path(preprocessed)
+    if not constants:
+        file.unlink(missing_ok=True)
+        return
+    with open(file, "w") as output:
+        json.dump(constants, output, indent=4)
+
+
+def load(preprocessed: Path) -> dict[str, int | float]:
+    "Returns the constant values recorded in a preprocessed folder"
+
+    file = path(preprocessed)
+    if not file.is_file():
+        return {}
+    with open(file) as input:
+        return json.load(input)
@@ -46,3 +46,11 @@ probabilities = [0.5, 0.75]
 # Basins
 locate_basins = True
 parallelize_basins = False
+basin_workers = None
+
+# Performance
+cache_watershed = False
+models_only = False
+assessment_format = "geojson"
+memory_map = False
+watershed_precision = "double"
@@ -49,3 +49,15 @@ kf_fill_field = None
 water = [7292]
 developed = [7296, 7297, 7298, 7299, 7300]
 excluded_evt = []
+
+# Performance
+tiled = False
+tile_size = 2048
+max_workers = 1
+cache_datasets = False
+raster_compression = "none"
+raster_predictor = False
+raster_layout = "striped"
+raster_bigtiff = "if_needed"
+raster_stack = False
+raster_precision = "double"
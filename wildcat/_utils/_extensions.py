@@ -1,22 +1,65 @@
 """
-Lists of supported file extensions for rasters and vector features
+Lazy registry of supported file extensions and vector format drivers
+----------
+Building the driver tables requires importing rasterio, fiona, and pfdf (and so
+GDAL and pandas), which is slow. As such, the registry is only built when an
+extension or driver is first requested, and is then reused for the rest of the
+session. This keeps these imports out of the CLI help, the "initialize" command,
+and config validation (except for export file formats, which can use the cache).
+
+The registry can optionally be cached to a small JSON file on disk, by setting
+the WILDCAT_DRIVER_CACHE environment variable to the path of the cache file.
+The cached registry is rebuilt whenever the installed versions of wildcat,
+pfdf, rasterio, or fiona change. Delete the file to force a rebuild.
+
+Export formats that wildcat writes with Apache Arrow (rather than through a GDAL
+driver) are listed separately in ARROW_FORMATS. These formats are always listed
+as supported export formats, but require the optional pyarrow package.
 ----------
 Lists:
     raster          - Supported raster file extensions
     vector          - Supported vector-feature file extensions
+    formats         - Supported vector file format drivers
+    from_format     - Returns the extension for a vector format driver
+    is_arrow        - True if an export format is written with Apache Arrow
+
+Registry:
+    registry        - Returns the driver registry, building it if necessary
+    _build          - Builds the registry from rasterio, fiona, and pfdf
+    _versions       - Returns the versions of the packages used to build the registry
+    _load           - Loads a cached registry
+    _save           - Saves a registry to the cache file
 
 Internal:
-    _RASTER         - List of raster extensions
-    _VECTOR         - List of vector extensions
+    CACHE_VARIABLE  - The environment variable with the path to the cache file
+    ARROW_FORMATS   - Export formats written with Apache Arrow, and their extensions
     _add_periods    - Adds periods to the extensions in a list
 """
 
-import fiona
-import rasterio
-from pfdf.utils import driver
+from __future__ import annotations
+
+import json
+import os
+import typing
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Optional
+
+    Registry = dict[str, Any]
+
+# The environment variable with the path to the on-disk registry cache
+CACHE_VARIABLE = "WILDCAT_DRIVER_CACHE"
 
-_RASTER: list[str] = list(rasterio.drivers.raster_driver_extensions().keys())
-_VECTOR: list[str] = list(fiona.drvsupport.vector_driver_extensions().keys())
+# Export formats written with Apache Arrow, and their file extensions
+ARROW_FORMATS = {"GeoParquet": ".parquet"}
+
+
+#####
+# Lists
+#####
 
 
 def _add_periods(exts: list[str]) -> list[str]:
@@ -26,15 +69,106 @@ def _add_periods(exts: list[str]) -> list[str]:
 
 def raster() -> list[str]:
     "Returns a list of supported raster file extensions"
-    return _add_periods(_RASTER)
+    return _add_periods(registry()["raster"])
 
 
 def vector() -> list[str]:
     "Returns a list of supported vector feature file extensions"
-    return _add_periods(_VECTOR)
+    return _add_periods(registry()["vector"])
+
+
+def formats() -> list[str]:
+    "Returns a list of supported vector file format drivers"
+    return list(registry()["formats"].keys()) + list(ARROW_FORMATS.keys())
 
 
 def from_format(format: str) -> str:
     "Returns the extension for a vector format driver"
+    if is_arrow(format):
+        return ARROW_FORMATS[format]
+    return registry()["formats"][format].split(", ")[0]
+
+
+def is_arrow(format: str) -> bool:
+    "True if an export format is written with Apache Arrow, rather than GDAL"
+    return format in ARROW_FORMATS
+
+
+#####
+# Registry
+#####
+
+
+@cache
+def registry() -> Registry:
+    """Returns the driver registry. Loads the registry from the cache file when
+    the file is enabled and up to date. Otherwise, builds the registry and
+    updates the cache file, if enabled"""
+
+    # Use the cached registry if available
+    path = os.environ.get(CACHE_VARIABLE)
+    versions = _versions()
+    if path:
+        output = _load(Path(path), versions)
+        if output is not None:
+            return output
+
+    # Otherwise, build the registry and optionally cache
+    output = _build(versions)
+    if path:
+        _save(Path(path), output)
+    return output
+
+
+def _build(versions: dict[str, Optional[str]]) -> Registry:
+    "Builds the driver registry from rasterio, fiona, and pfdf"
+
+    import fiona
+    import rasterio
+    from pfdf.utils import driver
+
+    vectors = driver.vectors()
+    return {
+        "versions": versions,
+        "raster": list(rasterio.drivers.raster_driver_extensions().keys()),
+        "vector": list(fiona.drvsupport.vector_driver_extensions().keys()),
+        "formats": dict(zip(vectors.index, vectors.Extensions)),
+    }
+
+
+def _versions() -> dict[str, Optional[str]]:
+    "Returns the installed versions of the packages used to build the registry"
+
+    versions = {}
+    for package in ["wildcat", "pfdf", "rasterio", "fiona"]:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def _load(path: Path, versions: dict[str, Optional[str]]) -> Optional[Registry]:
+    """Loads a cached registry. Returns None if the cache file is missing,
+    invalid, or was built with different package versions"""
+
+    try:
+        registry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(registry, dict) or registry.get("versions") != versions:
+        return None
+    return registry
+
+
+def _save(path: Path, registry: Registry) -> None:
+    """Saves a registry to the cache file. Does nothing if the file cannot be
+    written, as the cache is only an optimization"""
 
-    return driver.vectors().loc[format].Extensions.split(", ")[0]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(registry))
+        os.replace(temporary, path)
+    except OSError:
+        return
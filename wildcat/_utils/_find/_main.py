@@ -6,6 +6,8 @@ Functions:
     inputs          - Locates input datasets for the preprocessor
     preprocessed    - Locates preprocessed rasters for the assessment
     _collect_paths  - Initializes path dict with datasets that are Paths
+    _stacked        - Locates datasets with default paths in a stack file
+    _constant       - Locates datasets with default paths that are recorded constants
     _resolved_paths - Resolves config paths and logs the locations
 """
 
@@ -14,11 +16,13 @@ from __future__ import annotations
 import typing
 from pathlib import Path
 
-from wildcat._utils import _paths
+from wildcat._utils import _constants, _paths, _stack
+from wildcat._utils._defaults import defaults
 from wildcat._utils._find import _file, _folders
 
 if typing.TYPE_CHECKING:
     from logging import Logger
+    from typing import Optional
 
     from wildcat.typing import Config, IOFolders, PathDict
 
@@ -51,9 +55,12 @@ def inputs(config: Config, folder: Path, log: Logger) -> PathDict:
 
 
 def preprocessed(config: Config, folder: Path, log: Logger) -> PathDict:
-    "Locate the paths to preprocessed rasters for the assessment"
+    """Locate the paths to preprocessed rasters for the assessment. If the folder
+    contains a stack file, datasets with default paths are located in the stack.
+    Datasets with default paths that are recorded constants use the constants file"""
 
     paths = _collect_paths(config, _paths.assess.all())
+    located = _stacked(paths, folder) | _constant(paths, folder)
     return _resolved_paths(
         "preprocessed rasters",
         paths,
@@ -61,6 +68,7 @@ def preprocessed(config: Config, folder: Path, log: Logger) -> PathDict:
         required=_paths.assess.required(),
         features=[],
         log=log,
+        located=located,
     )
 
 
@@ -74,6 +82,36 @@ def _collect_paths(config: Config, datasets: list[str]) -> PathDict:
     return paths
 
 
+def _stacked(paths: PathDict, folder: Path) -> PathDict:
+    "Returns the stack file path for datasets with default paths that are stack bands"
+
+    # Just exit if there is no stack file
+    stack = _stack.locate(folder)
+    if stack is None:
+        return {}
+
+    # Use the stack for default datasets with a band
+    bands = _stack.bands(stack)
+    stacked = {}
+    for name, input in paths.items():
+        isdefault = str(input) == getattr(defaults, name)
+        if isdefault and name.removesuffix("_p") in bands:
+            stacked[name] = stack
+    return stacked
+
+
+def _constant(paths: PathDict, folder: Path) -> PathDict:
+    "Returns the constants file path for datasets with default paths that are constants"
+
+    constants = _constants.load(folder)
+    located = {}
+    for name, input in paths.items():
+        isdefault = str(input) == getattr(defaults, name)
+        if isdefault and name.removesuffix("_p") in constants:
+            located[name] = _constants.path(folder)
+    return located
+
+
 def _resolved_paths(
     title: str,
     paths: PathDict,
@@ -81,8 +119,13 @@ def _resolved_paths(
     required: list[str],
     features: list[str],
     log: Logger,
+    located: Optional[PathDict] = None,
 ) -> PathDict:
-    "Resolves config paths and logs the locations"
+    """Resolves config paths and logs the locations. Datasets in the optional
+    located dict use the indicated stack or constants file path"""
+
+    if located is None:
+        located = {}
 
     # Start logger and get message padding
     log.info(f"Locating {title}")
@@ -90,9 +133,12 @@ def _resolved_paths(
 
     # Resolve the path to each dataset
     for name, input in paths.items():
-        paths[name] = _file.file(
-            folder, input, name, name in required, name in features
-        )
+        if name in located:
+            paths[name] = located[name]
+        else:
+            paths[name] = _file.file(
+                folder, input, name, name in required, name in features
+            )
 
         # Log each path
         heading = f"{name}: ".ljust(padding, " ")
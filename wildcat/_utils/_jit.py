@@ -0,0 +1,64 @@
+"""
+Functions that configure the on-disk numba JIT cache
+----------
+Wildcat uses pysheds (via pfdf) for flow routing, and pysheds compiles its
+kernels using numba. Wildcat's own flow accumulation kernel is also compiled
+using numba. Compiled kernels are saved to an on-disk cache, so that
+later processes can reuse the kernels instead of recompiling them. Wildcat sets
+the cache folder using the NUMBA_CACHE_DIR environment variable. If the
+variable is already set, wildcat uses the indicated folder. Otherwise, wildcat
+uses a "wildcat/numba" folder in the user's cache directory.
+
+Numba locates the cache when a kernel is first defined, so the cache folder
+must be configured before any command that uses pfdf or the assessment modules.
+----------
+Functions:
+    configure       - Sets the JIT cache folder
+    default         - Returns the default JIT cache folder
+
+Internal:
+    CACHE_VARIABLE  - The environment variable with the JIT cache folder
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import typing
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from typing import Optional
+
+    from wildcat.typing import Pathlike
+
+# The environment variable used by numba to locate the JIT cache
+CACHE_VARIABLE = "NUMBA_CACHE_DIR"
+
+
+def configure(folder: Optional[Pathlike] = None) -> Path:
+    """Sets the JIT cache folder. Uses the input folder if provided. Otherwise,
+    uses the current NUMBA_CACHE_DIR, or the default folder if the variable is
+    not set. Returns the absolute path to the folder"""
+
+    # Parse the folder
+    if folder is None:
+        folder = os.environ.get(CACHE_VARIABLE) or default()
+    folder = Path(folder).expanduser().resolve()
+    os.environ[CACHE_VARIABLE] = str(folder)
+
+    # Update numba's settings if it was already imported
+    config = sys.modules.get("numba.core.config")
+    if config is not None:
+        config.reload_config()
+    return folder
+
+
+def default() -> Path:
+    "Returns the default JIT cache folder in the user's cache directory"
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "wildcat" / "numba"
@@ -0,0 +1,35 @@
+"""
+Function to run independent tasks in a thread pool
+----------
+Wildcat's heavy lifting (raster IO, reprojection, and rasterization) occurs in
+GDAL, which releases the GIL. As such, independent datasets can be processed
+concurrently using threads. When only a single worker is requested, tasks run
+serially in the calling thread.
+----------
+Functions:
+    run     - Runs a function over a list of argument tuples, returning the results in order
+"""
+
+from __future__ import annotations
+
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Callable
+
+
+def run(function: Callable, args: list[tuple], max_workers: int) -> list[Any]:
+    """Runs a function over a list of argument tuples using up to max_workers
+    threads. Returns the results in the same order as the args. If a task raises
+    an error, re-raises the error for the first failed task."""
+
+    # Run serially if there is a single worker or task
+    if max_workers == 1 or len(args) < 2:
+        return [function(*arg) for arg in args]
+
+    # Otherwise, run the tasks in a thread pool
+    max_workers = min(max_workers, len(args))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(function, *arg) for arg in args]
+        return [future.result() for future in futures]
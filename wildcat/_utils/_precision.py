@@ -0,0 +1,119 @@
+"""
+Functions that convert rasters to compact data types
+----------
+By default, wildcat stores and computes most rasters as 64-bit floats. When the
+"raster_precision" (preprocess) or "watershed_precision" (assess) setting is
+"compact", rasters instead use the smallest data type that preserves their meaning.
+DEM-derived rasters and KF-factors use 32-bit floats, the dNBR uses 16-bit integers,
+burn severity classes use 8-bit unsigned integers, and EVT codes use 16-bit
+unsigned integers. Flow accumulations always remain 64-bit floats, since 32-bit
+floats cannot count more than 2^24 upstream pixels exactly. Integer data values are rounded to
+the nearest integer, and are clipped to the range of the compact data type. The
+largest (unsigned) or smallest (signed) value of an integer type is always
+reserved for NoData. Float data values that round to the NoData value are moved
+to the adjacent representable float, so they are not mistaken for NoData.
+Constant-valued rasters and masks are not converted.
+----------
+Functions:
+    compact     - Converts rasters to their compact data types
+    convert     - Converts a raster to a data type
+
+Internal:
+    DTYPES      - The compact data type of each dataset
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy as np
+
+from wildcat._utils import _constants
+
+if typing.TYPE_CHECKING:
+    from typing import Optional
+
+    from pfdf.raster import Raster
+
+    from wildcat.typing import RasterDict
+
+# The compact data type of each dataset
+DTYPES = {
+    # Preprocessed datasets
+    "dem": "float32",
+    "dnbr": "int16",
+    "severity": "uint8",
+    "kf": "float32",
+    "evt": "uint16",
+    # Watershed rasters
+    "slopes": "float32",
+    "relief": "float32",
+}
+
+
+def compact(rasters: RasterDict, names: Optional[list[str]] = None) -> list[str]:
+    """Converts rasters to their compact data types in place. Only converts the
+    listed datasets, if provided. Returns the names of the converted rasters"""
+
+    if names is None:
+        names = list(DTYPES)
+    converted = []
+    for name in names:
+        if name not in rasters:
+            continue
+        raster = convert(rasters[name], DTYPES[name])
+        if raster is not rasters[name]:
+            rasters[name] = raster
+            converted.append(name)
+    return converted
+
+
+def convert(raster: Raster, dtype: str) -> Raster:
+    """Converts a raster to a data type. Returns the input raster if it already
+    uses the data type, or if it is a mask or constant-valued raster"""
+
+    # Imported here to keep pfdf out of the export command
+    from pfdf.raster import Raster
+
+    # Skip rasters that do not require conversion
+    dtype = np.dtype(dtype)
+    if raster.dtype in [dtype, bool] or _constants.value(raster) is not None:
+        return raster
+    values = raster.values
+    nodata = raster.nodata
+    missing = raster.nodata_mask
+
+    # Floats keep the NoData value when it can be represented, and otherwise use NaN.
+    # Data values that round to NoData move to the adjacent float
+    if np.issubdtype(dtype, np.floating):
+        output = values.astype(dtype)
+        if nodata is not None and not np.isnan(nodata):
+            if dtype.type(nodata) != nodata:
+                nodata = np.nan
+            else:
+                collisions = ~missing & (output == nodata)
+                toward = np.where(values[collisions] > nodata, np.inf, -np.inf)
+                output[collisions] = np.nextafter(
+                    dtype.type(nodata), toward.astype(dtype)
+                )
+            output[missing] = nodata
+
+    # Integers are rounded and clipped to the range of values that are not NoData.
+    # Integers always use a NoData value, so that every tile of a tiled dataset
+    # shares it. Integers cannot represent NaN, so NaN values become NoData
+    else:
+        if np.issubdtype(values.dtype, np.floating):
+            missing = missing | np.isnan(values)
+        info = np.iinfo(dtype)
+        if info.min == 0:
+            min, max, nodata = 0, info.max - 1, info.max
+        else:
+            min, max, nodata = info.min + 1, info.max, info.min
+        output = np.where(missing, 0, values)
+        output = np.clip(np.rint(output), min, max).astype(dtype)
+        output[missing] = nodata
+
+    # Build the converted raster
+    output = Raster.from_array(output, nodata=nodata, spatial=raster, copy=False)
+    output.name = raster.name
+    return output
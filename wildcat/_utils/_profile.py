@@ -0,0 +1,250 @@
+"""
+Class that records a performance profile of the steps of a command
+----------
+Each command runs its steps through a Profile, which records the wall time, CPU
+time, and memory use of each step. The memory use is the peak resident set size
+(RSS) of the process at the end of the step. Tracing allocations with tracemalloc
+slows down every allocation, so the peak memory allocated while each step was
+running is only recorded when the WILDCAT_TRACE_MEMORY environment variable is
+set (to any value other than "0"). Each entry also records the shape of the
+step's input rasters and the number of stream segments, when available. When a
+command finishes, the profile is saved as "profile.json" in the command's output
+folder.
+
+Some steps return streams that are consumed by later steps, such as the features
+streamed through the export command. The time spent producing the items of a
+stream is recorded as a separate "streamed" step, and is excluded from the time
+of the step that consumes the stream.
+
+Note that CPU time only includes the current process, so excludes any work
+done by worker processes (for example, when locating basins in parallel). Also
+note that pfdf is never imported by this module. Rasters and stream segment
+networks are only detected if their pfdf module was already imported, so that
+commands that do not use pfdf (such as export) do not pay for its import.
+----------
+Classes:
+    Profile     - Records the runtime and memory use of the steps of a command
+
+Functions:
+    peak_rss    - Returns the peak resident set size of the process in MB
+    _tracing    - True if the environment variable enables tracemalloc
+    _name       - Returns the name of a step
+    _shape      - Returns the shape of the input rasters for a step
+    _segments   - Returns the number of stream segments used by a step
+    _pfdf       - Returns a pfdf class if its module was already imported
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tracemalloc
+import typing
+from time import perf_counter, process_time
+
+import wildcat
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Callable, Iterable, Iterator, Optional
+
+# The name of the saved profile
+FILENAME = "profile.json"
+
+# The environment variable that enables tracemalloc
+TRACE_VARIABLE = "WILDCAT_TRACE_MEMORY"
+
+# Marks the end of a stream
+_END = object()
+
+
+class Profile:
+    "Records the runtime and memory use of the steps of a command"
+
+    def __init__(self, command: str, trace_memory: Optional[bool] = None) -> None:
+        """Starts a profile for a command. Only traces memory allocations if
+        trace_memory=True, which defaults to the WILDCAT_TRACE_MEMORY variable"""
+
+        if trace_memory is None:
+            trace_memory = _tracing()
+        self.command = command
+        self.trace_memory = trace_memory
+        self.steps: list[dict[str, Any]] = []
+        self._streams: dict[str, dict[str, Any]] = {}
+        self._nested: list[list[float]] = []
+        self._wall = perf_counter()
+        self._cpu = process_time()
+
+    def step(self, function: Callable, *args: Any) -> Any:
+        """Runs a step of the command and records its performance. Returns the
+        output of the step"""
+
+        # Optionally trace memory allocations, or reset the peak if already tracing
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        elif self.trace_memory:
+            tracemalloc.start()
+
+        # Run the step. Always restore the tracing state
+        self._nested.append([0, 0])
+        wall, cpu = perf_counter(), process_time()
+        try:
+            output = function(*args)
+        finally:
+            wall, cpu = self._elapsed(wall, cpu)
+            allocated = None
+            if self.trace_memory:
+                _, allocated = tracemalloc.get_traced_memory()
+                allocated = allocated / 1024**2
+                if not tracing:
+                    tracemalloc.stop()
+
+        # Record the step
+        self.steps.append(
+            {
+                "step": _name(function),
+                "wall_seconds": wall,
+                "cpu_seconds": cpu,
+                "peak_rss_mb": peak_rss(),
+                "tracemalloc_peak_mb": allocated,
+                "raster_shape": _shape(args),
+                "segments": _segments(args, output),
+                "streamed": False,
+            }
+        )
+        return output
+
+    def stream(self, name: str, items: Optional[Iterable]) -> Optional[Iterator]:
+        """Records the time spent producing the items of a stream as a streamed
+        step. Streams with the same name share a step. Returns an iterator over
+        the items, or None if there is no stream"""
+
+        if items is None:
+            return None
+        if name not in self._streams:
+            self._streams[name] = {
+                "step": name,
+                "wall_seconds": 0,
+                "cpu_seconds": 0,
+                "peak_rss_mb": None,
+                "tracemalloc_peak_mb": None,
+                "raster_shape": None,
+                "segments": None,
+                "streamed": True,
+            }
+            self.steps.append(self._streams[name])
+        return self._stream(self._streams[name], iter(items))
+
+    def _stream(self, step: dict[str, Any], items: Iterator) -> Iterator:
+        "Yields the items of a stream, adding the time to produce each item to a step"
+
+        while True:
+            self._nested.append([0, 0])
+            wall, cpu = perf_counter(), process_time()
+            try:
+                item = next(items, _END)
+            finally:
+                wall, cpu = self._elapsed(wall, cpu)
+                step["wall_seconds"] += wall
+                step["cpu_seconds"] += cpu
+            if item is _END:
+                step["peak_rss_mb"] = peak_rss()
+                return
+            yield item
+
+    def _elapsed(self, wall: float, cpu: float) -> tuple[float, float]:
+        """Returns the wall and CPU time since the indicated start times, excluding
+        time spent in nested streams. Adds the time to any enclosing stream or step"""
+
+        wall = perf_counter() - wall
+        cpu = process_time() - cpu
+        nested_wall, nested_cpu = self._nested.pop()
+        if self._nested:
+            self._nested[-1][0] += wall
+            self._nested[-1][1] += cpu
+        return wall - nested_wall, cpu - nested_cpu
+
+    def save(self, folder: Path) -> Path:
+        "Saves the profile as JSON in the indicated folder. Returns the file path"
+
+        profile = {
+            "command": self.command,
+            "wildcat": wildcat.version(),
+            "wall_seconds": perf_counter() - self._wall,
+            "cpu_seconds": process_time() - self._cpu,
+            "peak_rss_mb": peak_rss(),
+            "steps": self.steps,
+        }
+        path = folder / FILENAME
+        path.write_text(json.dumps(profile, indent=4))
+        return path
+
+
+def peak_rss() -> Optional[float]:
+    "Returns the peak resident set size of the process in MB, or None on Windows"
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # Linux reports kilobytes, but macOS reports bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / 1024**2
+    return peak / 1024
+
+
+def _tracing() -> bool:
+    "True if the WILDCAT_TRACE_MEMORY environment variable enables tracemalloc"
+    return os.environ.get(TRACE_VARIABLE, "0") not in ["", "0"]
+
+
+def _name(function: Callable) -> str:
+    "Returns the name of a step, using the final component of its module name"
+
+    module = function.__module__.rsplit(".", 1)[-1]
+    return f"{module}.{function.__name__}"
+
+
+def _shape(args: tuple) -> Optional[list[int]]:
+    """Returns the shape of the input rasters for a step. Uses the DEM for dicts
+    of rasters, and otherwise the first input raster. Returns None if the step
+    has no input rasters"""
+
+    Raster = _pfdf("raster", "Raster")
+    if Raster is None:
+        return None
+    for arg in args:
+        if isinstance(arg, dict) and isinstance(arg.get("dem"), Raster):
+            arg = arg["dem"]
+        elif isinstance(arg, dict):
+            arg = next(
+                (value for value in arg.values() if isinstance(value, Raster)), None
+            )
+        if isinstance(arg, Raster):
+            return list(arg.shape)
+    return None
+
+
+def _segments(args: tuple, output: Any) -> Optional[int]:
+    """Returns the number of stream segments after a step, or None if the step
+    does not use a stream segment network"""
+
+    Segments = _pfdf("segments", "Segments")
+    if Segments is None:
+        return None
+    for value in (output,) + args:
+        if isinstance(value, Segments):
+            return value.size
+    return None
+
+
+def _pfdf(module: str, name: str) -> Optional[type]:
+    """Returns a class from a pfdf module if the module was already imported.
+    Otherwise, no object can be an instance of the class, so returns None"""
+
+    module = sys.modules.get(f"pfdf.{module}")
+    return getattr(module, name, None)
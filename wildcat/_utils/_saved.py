@@ -0,0 +1,54 @@
+"""
+Functions that locate the feature files saved in an assessment folder
+----------
+An assessment saves its segments, basins, and outlets in the file format given
+by the "assessment_format" setting. GeoJSON is the default, but the FlatGeobuf
+and GeoPackage formats are much more compact, and are faster to write and read.
+Both binary formats also include a spatial index. Commands that read saved
+results (such as export and rerunning the models) locate each file by its
+extension, so results saved in any supported format (including legacy GeoJSON
+assessments) can be read.
+----------
+Functions:
+    path        - Returns the path to a saved feature file in a given format
+    locate      - Returns the path to an existing saved feature file
+    remove      - Deletes saved feature files
+
+Internal:
+    FORMATS     - Supported assessment formats and their file extensions
+"""
+
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Optional
+
+# Supported assessment formats and their file extensions. The first is the default
+FORMATS = {"geojson": ".geojson", "flatgeobuf": ".fgb", "gpkg": ".gpkg"}
+
+
+def path(assessment: Path, name: str, format: str) -> Path:
+    "Returns the path to a saved feature file in the indicated format"
+    return assessment / f"{name}{FORMATS[format]}"
+
+
+def locate(assessment: Path, name: str) -> Optional[Path]:
+    "Returns the path to a saved feature file, or None if there is no such file"
+
+    for format in FORMATS:
+        candidate = path(assessment, name, format)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def remove(assessment: Path, name: str, keep: Optional[str] = None) -> None:
+    "Deletes saved feature files, except for the file in the optional kept format"
+
+    for format in FORMATS:
+        candidate = path(assessment, name, format)
+        if format != keep and candidate.is_file():
+            candidate.unlink()
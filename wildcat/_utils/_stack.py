@@ -0,0 +1,76 @@
+"""
+Functions that locate and describe the stack file in a preprocessed folder
+----------
+When the "raster_stack" setting is enabled, the preprocessor saves every
+preprocessed raster as a band of a single multi-band GeoTIFF. All the bands share
+one grid definition, and the description of each band is the name of its dataset.
+Since the bands of a GeoTIFF share a data type, each band is saved using a data
+type that can represent every dataset. The original data type and NoData value
+of each dataset are recorded in the tags of its band. The assessment opens the
+stack once and reads the bands as they are needed. Bands whose data type was
+promoted are converted back to the original type when loaded, so they cannot be
+memory-mapped.
+----------
+Functions:
+    path        - Returns the path to the stack file in a preprocessed folder
+    locate      - Returns the path to an existing stack file
+    bands       - Returns the dataset names of the bands in a stack file
+    remove      - Deletes a stack file
+    log_promoted    - Logs the datasets whose data type was promoted in a stack
+
+Internal:
+    FILENAME    - The name of the stack file
+"""
+
+from __future__ import annotations
+
+import typing
+
+import rasterio
+
+if typing.TYPE_CHECKING:
+    from logging import Logger
+    from pathlib import Path
+    from typing import Optional
+
+# The name of the stack file
+FILENAME = "stack.tif"
+
+
+def path(preprocessed: Path) -> Path:
+    "Returns the path to the stack file in a preprocessed folder"
+    return preprocessed / FILENAME
+
+
+def locate(preprocessed: Path) -> Optional[Path]:
+    "Returns the path to the stack file, or None if there is no such file"
+
+    stack = path(preprocessed)
+    if stack.is_file():
+        return stack
+    return None
+
+
+def bands(stack: Path) -> list[str]:
+    "Returns the dataset names of the bands in a stack file, in band order"
+
+    with rasterio.open(stack) as file:
+        return list(file.descriptions)
+
+
+def remove(preprocessed: Path) -> None:
+    "Deletes the stack file in a preprocessed folder, if it exists"
+
+    stack = path(preprocessed)
+    if stack.is_file():
+        stack.unlink()
+
+
+def log_promoted(promoted: list[str], log: Logger) -> None:
+    "Logs the datasets whose data type was promoted to the shared band type"
+
+    if promoted:
+        names = ", ".join(promoted)
+        log.debug(
+            f"    Promoted to the stack data type (cannot be memory-mapped): {names}"
+        )
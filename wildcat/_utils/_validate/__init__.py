@@ -7,6 +7,9 @@ Functions:
     assess      - Validates config settings for an assessment
     model_parameters    - Validates hazard modeling parameters
     export      - Validates config settings for an export
+    warmup      - Validates settings for the warmup command
+    serve       - Validates settings for the serve command
+    batch       - Validates settings for the batch command
 
 Internal Modules
     _core       - Utility functions to check specific criteria
@@ -15,8 +18,11 @@ Internal Modules
 
 from wildcat._utils._validate._main import (
     assess,
+    batch,
     export,
     initialize,
     model_parameters,
     preprocess,
+    serve,
+    warmup,
 )
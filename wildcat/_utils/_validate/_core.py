@@ -15,21 +15,32 @@ Paths / Datasets:
 
 String options:
     strlist             - Checks a field is a list of strings
+    string              - Checks a field is a string
     optional_string     - Checks a field is a string or None
+    loopback            - Checks a field is a loopback host name or IP address
     _option             - Checks a field is a recognized string option
     check               - Checks a field is either 'warn', 'error', or 'none'
+    assessment_format   - Checks a field is either 'geojson', 'flatgeobuf', or 'gpkg'
+    raster_compression  - Checks a field is either 'none', 'deflate', 'zstd', or 'lerc'
+    raster_layout       - Checks a field is either 'striped', 'tiled', or 'cog'
+    raster_bigtiff      - Checks a field is either 'if_needed', 'if_safer', 'yes', or 'no'
+    precision           - Checks a field is either 'double' or 'compact'
     config_style        - Checks a field is either 'none', 'empty', 'default', or 'full'
 
 Scalars:
     boolean             - Checks a field is a boolean
     scalar              - Checks a field is an int or finite float
     positive            - Checks a field is a positive scalar
+    optional_positive   - Checks a field is a positive scalar, or None
     positive_integer    - Checks a field is a positive integer
+    count               - Checks a field is an integer greater than zero
+    optional_count      - Checks a field is an integer greater than zero, or None
 
 Bounded Scalars:
     _bounded            - Checks a field is a scalar between two bounds
     ratio               - Checks a field is a scalar between 0 and 1
     angle               - Checks a field is a scalar between 0 and 360
+    port                - Checks a field is an integer between 0 and 65535
 
 Vectors:
     vector              - Checks a field is a vector of ints and/or finite floats
@@ -51,9 +62,12 @@ Misc:
 from __future__ import annotations
 
 import typing
+from ipaddress import ip_address
 from math import isinf, isnan
 from pathlib import Path
 
+from wildcat._utils import _saved
+
 if typing.TYPE_CHECKING:
     from typing import Any, Optional
 
@@ -149,6 +163,12 @@ def strlist(config: Config, name: str) -> None:
     config[name] = input
 
 
+def string(config: Config, name: str) -> None:
+    "Checks an input is a string"
+    if not isinstance(config[name], str):
+        raise TypeError(f'The "{name}" setting must be a string')
+
+
 def optional_string(config: Config, name: str) -> None:
     "Checks an input is either a string, or None"
 
@@ -157,6 +177,24 @@ def optional_string(config: Config, name: str) -> None:
         raise TypeError(f'The "{name}" setting must be a string, or None')
 
 
+def loopback(config: Config, name: str) -> None:
+    "Checks an input is localhost or a loopback IP address"
+
+    string(config, name)
+    host = config[name]
+    if host.lower() == "localhost":
+        return
+    try:
+        valid = ip_address(host).is_loopback
+    except ValueError:
+        valid = False
+    if not valid:
+        raise ValueError(
+            f'The "{name}" setting must be a loopback address (such as '
+            f'127.0.0.1, ::1, or localhost), but it is "{host}"'
+        )
+
+
 def _option(config: Config, name: str, allowed: list[str]) -> None:
     "Checks an input is an allowed string option"
 
@@ -186,6 +224,34 @@ def check(config: Config, name: str) -> None:
     _option(config, name, ["warn", "error", "none"])
 
 
+def assessment_format(config: Config, name: str) -> None:
+    "Checks an input is 'geojson', 'flatgeobuf', or 'gpkg'"
+    _option(config, name, list(_saved.FORMATS))
+
+
+def raster_compression(config: Config, name: str) -> None:
+    "Checks an input is 'none', 'deflate', 'zstd', or 'lerc'"
+    input = config[name]
+    if input is None:
+        config[name] = "none"
+    _option(config, name, ["none", "deflate", "zstd", "lerc"])
+
+
+def raster_layout(config: Config, name: str) -> None:
+    "Checks an input is 'striped', 'tiled', or 'cog'"
+    _option(config, name, ["striped", "tiled", "cog"])
+
+
+def raster_bigtiff(config: Config, name: str) -> None:
+    "Checks an input is 'if_needed', 'if_safer', 'yes', or 'no'"
+    _option(config, name, ["if_needed", "if_safer", "yes", "no"])
+
+
+def precision(config: Config, name: str) -> None:
+    "Checks an input is 'double' or 'compact'"
+    _option(config, name, ["double", "compact"])
+
+
 def config_style(config: Config, name: str) -> None:
     "Checks an input is 'none', 'empty', 'default', or 'full'"
     input = config[name]
@@ -224,6 +290,12 @@ def positive(config: Config, name: str) -> None:
         raise ValueError(f'The "{name}" setting must be positive')
 
 
+def optional_positive(config: Config, name: str) -> None:
+    "Checks an input is either a positive scalar, or None"
+    if config[name] is not None:
+        positive(config, name)
+
+
 def positive_integer(config: Config, name: str) -> None:
     "Checks an input is a positive integer"
 
@@ -232,6 +304,21 @@ def positive_integer(config: Config, name: str) -> None:
         raise ValueError(f'The "{name}" setting must be an integer')
 
 
+def count(config: Config, name: str) -> None:
+    "Checks an input is an integer greater than zero. Converts to int"
+
+    positive_integer(config, name)
+    if config[name] == 0:
+        raise ValueError(f'The "{name}" setting must be greater than 0')
+    config[name] = int(config[name])
+
+
+def optional_count(config: Config, name: str) -> None:
+    "Checks an input is either an integer greater than zero, or None"
+    if config[name] is not None:
+        count(config, name)
+
+
 #####
 # Bounded scalars
 #####
@@ -254,6 +341,14 @@ def angle(config: Config, name: str) -> None:
     _bounded(config, name, 0, 360)
 
 
+def port(config: Config, name: str) -> None:
+    "Checks a field is an integer between 0 and 65535. Converts to int"
+    _bounded(config, name, 0, 65535)
+    if config[name] % 1 != 0:
+        raise ValueError(f'The "{name}" setting must be an integer')
+    config[name] = int(config[name])
+
+
 #####
 # Vectors
 #####
@@ -11,12 +11,10 @@ Functions:
 from __future__ import annotations
 
 import typing
+from importlib.util import find_spec
 from string import ascii_letters, digits
 
-from pfdf.utils import driver
-from pyproj import CRS
-
-from wildcat._utils import _parameters
+from wildcat._utils import _extensions, _parameters
 from wildcat._utils._validate._core import aslist, optional_string
 
 if typing.TYPE_CHECKING:
@@ -53,7 +51,7 @@ def file_format(config: Config, name: str) -> None:
         raise TypeError(f'The "{name}" setting must be a string')
 
     # Get recognized driver names (both standard, and lowercased)
-    allowed = driver.vectors().index.tolist()
+    allowed = _extensions.formats()
     allowed_lower = [name.lower() for name in allowed]
 
     # Require a recognized driver
@@ -68,6 +66,13 @@ def file_format(config: Config, name: str) -> None:
     k = allowed_lower.index(input)
     config[name] = allowed[k]
 
+    # Arrow formats require pyarrow
+    if _extensions.is_arrow(config[name]) and find_spec("pyarrow") is None:
+        raise ImportError(
+            f'Exporting to {config[name]} requires the optional "pyarrow" package. '
+            "You can install it using: pip install pyarrow"
+        )
+
 
 def rename(config: Config, name: str) -> None:
     "Checks that an input is a valid renaming dict"
@@ -134,7 +139,9 @@ def crs(config: Config, name: str) -> None:
     if crs is None:
         return
 
-    # Otherwise, require a CRS object
+    # Otherwise, require a CRS object. (Imported here to keep pyproj out of startup)
+    from pyproj import CRS
+
     try:
         crs = CRS(crs)
     except Exception:
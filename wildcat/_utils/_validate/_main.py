@@ -7,6 +7,9 @@ Functions:
     assess      - Checks the config settings for an assessment
     model_parameters    - Checks hazard modeling parameters
     export      - Checks the config settings for an export
+    warmup      - Checks the settings for the warmup command
+    serve       - Checks the settings for the serve command
+    batch       - Checks the settings for the batch command
 """
 
 from __future__ import annotations
@@ -15,25 +18,36 @@ import typing
 
 from wildcat._utils._validate._core import (
     angle,
+    assessment_format,
     boolean,
     check,
     config_style,
+    count,
     durations,
     kf_fill,
     limits,
+    loopback,
+    optional_count,
     optional_path,
     optional_path_or_constant,
+    optional_positive,
     optional_string,
     path,
+    port,
     positive,
     positive_integer,
     positive_integers,
     positive_limits,
     positives,
+    precision,
+    raster_bigtiff,
+    raster_compression,
+    raster_layout,
     ratio,
     ratios,
     scalar,
     severity_thresholds,
+    string,
     strlist,
     vector,
 )
@@ -108,6 +122,17 @@ def preprocess(config: Config) -> None:
         "water": vector,
         "developed": vector,
         "excluded_evt": vector,
+        # Performance
+        "tiled": boolean,
+        "tile_size": count,
+        "max_workers": count,
+        "cache_datasets": boolean,
+        "raster_compression": raster_compression,
+        "raster_predictor": boolean,
+        "raster_layout": raster_layout,
+        "raster_bigtiff": raster_bigtiff,
+        "raster_stack": boolean,
+        "raster_precision": precision,
     }
     _validate(config, checks)
 
@@ -155,6 +180,13 @@ def assess(config: Config) -> None:
         # Basins
         "locate_basins": boolean,
         "parallelize_basins": boolean,
+        "basin_workers": optional_count,
+        # Performance
+        "cache_watershed": boolean,
+        "models_only": boolean,
+        "assessment_format": assessment_format,
+        "memory_map": boolean,
+        "watershed_precision": precision,
     }
     _validate(config, checks)
     model_parameters(config)
@@ -197,3 +229,28 @@ def export(config: Config) -> None:
         "export_crs": crs,
     }
     _validate(config, checks)
+
+
+def warmup(config: Config) -> None:
+    "Validates settings for the 'warmup' command"
+
+    checks = {"folder": optional_path}
+    _validate(config, checks)
+
+
+def serve(config: Config) -> None:
+    "Validates settings for the 'serve' command"
+
+    checks = {"host": loopback, "port": port}
+    _validate(config, checks)
+
+
+def batch(config: Config) -> None:
+    "Validates settings for the 'batch' command"
+
+    checks = {
+        "manifest": path,
+        "workers": count,
+        "max_memory_gb": optional_positive,
+    }
+    _validate(config, checks)
@@ -4,6 +4,7 @@ Custom errors raised by wildcat
 Errors:
     ConfigError         - When a configuration file cannot be read
     GeoreferencingError - When a DEM does not have valid georeferencing
+    ManifestError       - When a batch manifest cannot be read
 """
 
 
@@ -17,3 +18,7 @@ class ConfigRecordError(ConfigError):
 
 class GeoreferencingError(Exception):
     "When a DEM does not have valid georeferencing"
+
+
+class ManifestError(Exception):
+    "When a batch manifest cannot be read"
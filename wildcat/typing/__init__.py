@@ -21,6 +21,7 @@ IOFolders = tuple[Path, Path]
 Config = dict[str, Any]
 PathDict = dict[str, Path]
 RasterDict = dict
+Grid = dict[str, Any]
 
 # Hazard modeling parameter values
 Parameters = list[int | float]
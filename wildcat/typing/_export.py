@@ -5,6 +5,8 @@ These type hints are separate from the base typing namespace because they requir
 importing fiona, which can slow down fast CLI operations.
 """
 
+from typing import Iterator
+
 from fiona.crs import CRS
 
 from wildcat.typing import Config, Parameters
@@ -14,6 +16,6 @@ Schema = dict[str, dict]
 PropSchema = dict[str, str]
 PropNames = dict[str, str]
 
-# Loaded results
-Records = list[dict[str, dict]]
-Results = tuple[CRS, Schema, Records, Records, Records]
+# Loaded results. Features are streamed one at a time
+Features = Iterator[dict[str, dict]]
+Results = tuple[CRS, Schema, Features, Features | None, Features | None]